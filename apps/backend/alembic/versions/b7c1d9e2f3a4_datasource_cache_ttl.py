@@ -0,0 +1,25 @@
+"""datasource cache ttl
+
+Revision ID: b7c1d9e2f3a4
+Revises: a1b2c3d4e5f6
+Create Date: 2026-03-02 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c1d9e2f3a4"
+down_revision: Union[str, None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("datasources", sa.Column("cache_ttl", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("datasources", "cache_ttl")
@@ -0,0 +1,55 @@
+"""datasource rollups
+
+Revision ID: c3e5a7b9d1f2
+Revises: b7c1d9e2f3a4
+Create Date: 2026-03-09 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e5a7b9d1f2"
+down_revision: Union[str, None] = "b7c1d9e2f3a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "DO $$ BEGIN "
+        "CREATE TYPE rollupstatus AS ENUM ('PENDING', 'BUILDING', 'READY', 'FAILED'); "
+        "EXCEPTION WHEN duplicate_object THEN null; "
+        "END $$;"
+    )
+    op.create_table(
+        "datasource_rollups",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("datasource_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("datasources.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("dimensions", postgresql.JSONB(), nullable=False),
+        sa.Column("metrics", postgresql.JSONB(), nullable=False),
+        sa.Column("refresh_interval", sa.Integer(), nullable=True),
+        sa.Column(
+            "status",
+            postgresql.ENUM("PENDING", "BUILDING", "READY", "FAILED", name="rollupstatus", create_type=False),
+            nullable=False,
+            server_default="PENDING",
+        ),
+        sa.Column("storage_key", sa.String(300), nullable=True),
+        sa.Column("row_count", sa.Integer(), nullable=True),
+        sa.Column("built_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.UniqueConstraint("datasource_id", "name", name="uq_datasource_rollup_name"),
+    )
+    op.create_index("ix_datasource_rollups_datasource_id", "datasource_rollups", ["datasource_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("datasource_rollups")
+    op.execute("DROP TYPE IF EXISTS rollupstatus")
@@ -0,0 +1,27 @@
+"""datasource watermark
+
+Revision ID: d4f6b8c0e2a3
+Revises: c3e5a7b9d1f2
+Create Date: 2026-03-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4f6b8c0e2a3"
+down_revision: Union[str, None] = "c3e5a7b9d1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("datasources", sa.Column("watermark_field", sa.String(200), nullable=True))
+    op.add_column("datasource_rollups", sa.Column("watermark", sa.String(40), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("datasource_rollups", "watermark")
+    op.drop_column("datasources", "watermark_field")
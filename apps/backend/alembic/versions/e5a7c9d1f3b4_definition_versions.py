@@ -0,0 +1,27 @@
+"""dashboard / page / chart definition versions
+
+Revision ID: e5a7c9d1f3b4
+Revises: d4f6b8c0e2a3
+Create Date: 2026-03-12 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a7c9d1f3b4"
+down_revision: Union[str, None] = "d4f6b8c0e2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ("dashboards", "pages", "charts"):
+        op.add_column(table, sa.Column("version", sa.Integer(), nullable=False, server_default="1"))
+
+
+def downgrade() -> None:
+    for table in ("charts", "pages", "dashboards"):
+        op.drop_column(table, "version")
@@ -3,10 +3,11 @@ import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Cookie, Depends, Query, Response, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.deps import CurrentUser, require_role
+from app.core.deps import CurrentUser, bearer_scheme, require_role
 from app.db.models.enums import ApprovalStatus, Role
 from app.db.session import get_db
 from app.schemas.auth import (
@@ -112,7 +113,12 @@ async def refresh_token(
 
 
 @router.post("/logout", status_code=204)
-async def logout(response: Response):
+async def logout(
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
+):
+    await AuthService(db).logout(credentials.credentials if credentials else None)
     _clear_refresh_cookie(response)
 
 
@@ -0,0 +1,65 @@
+"""Chart API 라우터 — /api/v1/dashboards/:dashboard_id/pages/:page_id/charts/*"""
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import CurrentUser
+from app.core.disconnect import cancel_on_disconnect
+from app.core.metrics import measure_serialization
+from app.db.session import get_db
+from app.engine.wire import ARROW_MEDIA_TYPE, COLUMNAR_JSON_MEDIA_TYPE, encode, negotiate
+from app.schemas.chart import ChartDataRequest, ChartDataResponse, ChartExportRequest
+from app.schemas.common import ApiResponse
+from app.services.chart_data_service import ChartDataService
+
+router = APIRouter(prefix="/dashboards/{dashboard_id}/pages/{page_id}/charts", tags=["Charts"])
+
+
+# ── 차트 데이터 ───────────────────────────────────────────────────────────────
+
+@router.post(
+    "/{chart_id}/data",
+    response_model=ApiResponse[ChartDataResponse],
+    responses={200: {"content": {COLUMNAR_JSON_MEDIA_TYPE: {}, ARROW_MEDIA_TYPE: {}}}},
+)
+async def get_chart_data(
+    dashboard_id: uuid.UUID,
+    page_id: uuid.UUID,
+    chart_id: uuid.UUID,
+    body: ChartDataRequest,
+    request: Request,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """Accept로 응답 형식 선택 — JSON(기본) / 컬럼 우선 JSON / Arrow IPC (app.engine.wire)"""
+    data = await cancel_on_disconnect(
+        request, ChartDataService(db).get_chart_data(dashboard_id, page_id, chart_id, body, current_user)
+    )
+    media_type = negotiate(request.headers.get("accept"))
+    # 응답 모델 직렬화를 거치지 않으므로 인코딩 시간을 직접 기록 (Server-Timing serialize)
+    with measure_serialization():
+        body = encode(data, media_type)
+    return Response(body, media_type=media_type, headers={"Vary": "Accept"})
+
+
+@router.post("/{chart_id}/export")
+async def export_chart(
+    dashboard_id: uuid.UUID,
+    page_id: uuid.UUID,
+    chart_id: uuid.UUID,
+    body: ChartExportRequest,
+    request: Request,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """차트 전체 결과를 CSV/XLSX 파일로 스트리밍 다운로드"""
+    ip_address = request.client.host if request.client else None
+    export = await ChartDataService(db).export_chart(dashboard_id, page_id, chart_id, body, current_user, ip_address)
+    return StreamingResponse(
+        export.body,
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}"'},
+    )
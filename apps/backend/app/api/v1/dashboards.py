@@ -0,0 +1,31 @@
+"""Dashboard API 라우터 — /api/v1/dashboards/*"""
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import CurrentUser
+from app.core.etag import json_ok, not_modified
+from app.db.session import get_db
+from app.schemas.common import ApiResponse
+from app.schemas.dashboard import DashboardDetailResponse
+from app.services.dashboard_service import DashboardService
+
+router = APIRouter(prefix="/dashboards", tags=["Dashboards"])
+
+
+# ── 대시보드 단건 ─────────────────────────────────────────────────────────────
+
+@router.get("/{dashboard_id}", response_model=ApiResponse[DashboardDetailResponse])
+async def get_dashboard(
+    dashboard_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    """대시보드 + 페이지 목록 (캐시된 JSON을 그대로 내보내므로 응답 모델 재검증 없음, ETag 일치 시 304)"""
+    etag, data = await DashboardService(db).get_detail_json(dashboard_id, current_user, if_none_match)
+    if data is None:
+        return not_modified(etag)
+    return json_ok(data, etag)
@@ -0,0 +1,146 @@
+"""DataSource API 라우터 — /api/v1/datasources/*"""
+import uuid
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, File, Form, Query, Response, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import CurrentUser, require_role
+from app.core.redis import get_redis
+from app.db.models.enums import Role
+from app.db.session import get_db
+from app.schemas.common import ApiResponse
+from app.schemas.datasource import (
+    DataSourceResponse,
+    RollupCreateRequest,
+    RollupResponse,
+    SchemaSyncResponse,
+    WatermarkRequest,
+    WatermarkResponse,
+)
+from app.services.datasource_service import DataSourceService
+from app.jobs.handlers import enqueue_rollup_build
+from app.jobs.queue import JobQueue
+from app.services.rollup_service import RollupService
+
+router = APIRouter(prefix="/datasources", tags=["DataSources"])
+
+
+# ── 데이터 소스 생성 ──────────────────────────────────────────────────────────
+
+@router.post(
+    "/upload",
+    response_model=ApiResponse[DataSourceResponse],
+    status_code=201,
+    dependencies=[Depends(require_role(Role.ADMIN, Role.OWNER))],
+)
+async def upload_datasource(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    file: UploadFile = File(...),
+    label: str = Form(..., max_length=200),
+    source_id: str = Form(..., max_length=100, pattern=r"^[A-Za-z][A-Za-z0-9_]*$"),
+    description: Optional[str] = Form(default=None),
+    header_row: int = Form(default=1, ge=1),
+    sheet_name: Optional[str] = Form(default=None),
+):
+    data = await DataSourceService(db).create_from_upload(
+        file, label, source_id, description, header_row, sheet_name, current_user
+    )
+    return ApiResponse.ok(data)
+
+
+# ── 스키마 동기화 ─────────────────────────────────────────────────────────────
+
+@router.post(
+    "/{datasource_id}/sync",
+    response_model=ApiResponse[SchemaSyncResponse],
+    dependencies=[Depends(require_role(Role.ADMIN, Role.OWNER))],
+)
+async def sync_schema(
+    datasource_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """원본 컬럼 추가/삭제를 필드 목록에 반영합니다. (외부 DB 데이터 소스, 매일 SCHEMA_SYNC_AT에도 자동 실행)"""
+    data = await DataSourceService(db).sync_schema(datasource_id)
+    return ApiResponse.ok(data)
+
+
+# ── 증분 갱신 기준 필드 ───────────────────────────────────────────────────────
+
+@router.put(
+    "/{datasource_id}/watermark",
+    response_model=ApiResponse[WatermarkResponse],
+    dependencies=[Depends(require_role(Role.ADMIN, Role.OWNER))],
+)
+async def set_watermark(
+    datasource_id: uuid.UUID,
+    body: WatermarkRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    data = await RollupService(db).set_watermark(datasource_id, body)
+    return ApiResponse.ok(data)
+
+
+# ── 롤업 (사전 집계 테이블) ───────────────────────────────────────────────────
+
+@router.get(
+    "/{datasource_id}/rollups",
+    response_model=ApiResponse[list[RollupResponse]],
+    dependencies=[Depends(require_role(Role.ADMIN, Role.OWNER))],
+)
+async def list_rollups(
+    datasource_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    data = await RollupService(db).list_rollups(datasource_id)
+    return ApiResponse.ok(data)
+
+
+@router.post(
+    "/{datasource_id}/rollups",
+    response_model=ApiResponse[RollupResponse],
+    status_code=201,
+    dependencies=[Depends(require_role(Role.ADMIN, Role.OWNER))],
+)
+async def create_rollup(
+    datasource_id: uuid.UUID,
+    body: RollupCreateRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """롤업을 정의하고 빌드 작업을 작업 큐에 등록합니다."""
+    data = await RollupService(db).create_rollup(datasource_id, body)
+    await enqueue_rollup_build(JobQueue(get_redis()), data.id, datasource_id)
+    return ApiResponse.ok(data)
+
+
+@router.post(
+    "/{datasource_id}/rollups/{rollup_id}/refresh",
+    response_model=ApiResponse[RollupResponse],
+    status_code=202,
+    dependencies=[Depends(require_role(Role.ADMIN, Role.OWNER))],
+)
+async def refresh_rollup(
+    datasource_id: uuid.UUID,
+    rollup_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    full: bool = Query(default=False),
+):
+    """롤업 갱신 작업을 작업 큐에 등록합니다. watermark가 있으면 증분, full=true면 전체 재계산"""
+    data = await RollupService(db).request_refresh(datasource_id, rollup_id)
+    await enqueue_rollup_build(JobQueue(get_redis()), rollup_id, datasource_id, full)
+    return ApiResponse.ok(data)
+
+
+@router.delete(
+    "/{datasource_id}/rollups/{rollup_id}",
+    status_code=204,
+    dependencies=[Depends(require_role(Role.ADMIN, Role.OWNER))],
+)
+async def delete_rollup(
+    datasource_id: uuid.UUID,
+    rollup_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    await RollupService(db).delete_rollup(datasource_id, rollup_id)
+    return Response(status_code=204)
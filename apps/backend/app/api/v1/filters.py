@@ -0,0 +1,47 @@
+"""Filter API 라우터 — /api/v1/dashboards/:dashboard_id/pages/:page_id/filters/*"""
+import uuid
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import CurrentUser
+from app.core.disconnect import cancel_on_disconnect
+from app.db.session import get_db
+from app.schemas.common import ApiResponse
+from app.schemas.filter import FilterCascadeRequest, FilterCascadeResponse, FilterValuesResponse
+from app.services.filter_value_service import FilterValueService
+
+router = APIRouter(prefix="/dashboards/{dashboard_id}/pages/{page_id}/filters", tags=["Filters"])
+
+
+# ── 드롭다운 필터 값 목록 ─────────────────────────────────────────────────────
+
+@router.get("/{filter_id}/values", response_model=ApiResponse[FilterValuesResponse])
+async def list_filter_values(
+    dashboard_id: uuid.UUID,
+    page_id: uuid.UUID,
+    filter_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    q: Optional[str] = Query(default=None, max_length=200),
+    page: int = Query(default=1, ge=1),
+    limit: int = Query(default=50, ge=1, le=500),
+):
+    data = await FilterValueService(db).list_values(dashboard_id, page_id, filter_id, q, page, limit, current_user)
+    return ApiResponse.ok(data)
+
+
+# ── 연쇄 필터 ─────────────────────────────────────────────────────────────────
+
+@router.post("/cascade", response_model=ApiResponse[FilterCascadeResponse])
+async def cascade_filters(
+    dashboard_id: uuid.UUID,
+    page_id: uuid.UUID,
+    body: FilterCascadeRequest,
+    request: Request,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    data = await cancel_on_disconnect(request, FilterValueService(db).cascade(dashboard_id, page_id, body, current_user))
+    return ApiResponse.ok(data)
@@ -0,0 +1,50 @@
+"""Page API 라우터 — /api/v1/dashboards/:dashboard_id/pages/*"""
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import CurrentUser
+from app.core.etag import json_ok, not_modified
+from app.db.session import get_db
+from app.schemas.chart import PageDataRequest
+from app.schemas.common import ApiResponse
+from app.schemas.page import PageDetailResponse
+from app.services.chart_data_service import ChartDataService
+from app.services.page_service import PageService
+
+router = APIRouter(prefix="/dashboards/{dashboard_id}/pages", tags=["Pages"])
+
+
+# ── 페이지 상세 ───────────────────────────────────────────────────────────────
+
+@router.get("/{page_id}", response_model=ApiResponse[PageDetailResponse])
+async def get_page(
+    dashboard_id: uuid.UUID,
+    page_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    """페이지 + 위젯 전체 (캐시된 JSON을 그대로 내보내므로 응답 모델 재검증 없음, ETag 일치 시 304)"""
+    etag, data = await PageService(db).get_detail_json(dashboard_id, page_id, current_user, if_none_match)
+    if data is None:
+        return not_modified(etag)
+    return json_ok(data, etag)
+
+
+# ── 페이지 일괄 데이터 ────────────────────────────────────────────────────────
+
+@router.post("/{page_id}/data")
+async def get_page_data(
+    dashboard_id: uuid.UUID,
+    page_id: uuid.UUID,
+    body: PageDataRequest,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """페이지 내 모든 차트 데이터를 NDJSON으로 스트리밍 (차트별 한 줄, 완료 순서)"""
+    stream = await ChartDataService(db).render_page(dashboard_id, page_id, body, current_user)
+    return StreamingResponse(stream, media_type="application/x-ndjson")
@@ -1,6 +1,16 @@
 from fastapi import APIRouter
 
 from app.api.v1.auth import router as auth_router
+from app.api.v1.charts import router as charts_router
+from app.api.v1.dashboards import router as dashboards_router
+from app.api.v1.datasources import router as datasources_router
+from app.api.v1.filters import router as filters_router
+from app.api.v1.pages import router as pages_router
 
 api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(auth_router)
+api_router.include_router(datasources_router)
+api_router.include_router(dashboards_router)
+api_router.include_router(pages_router)
+api_router.include_router(charts_router)
+api_router.include_router(filters_router)
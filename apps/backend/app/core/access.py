@@ -0,0 +1,220 @@
+"""사용자별 데이터 소스 접근 인덱스 (user → 권한 있는 datasource id)
+
+데이터 소스 접근은 allow_all, 개별 사용자 권한(USER), 소속 그룹 권한(GROUP) 세 경로로 결정됩니다.
+allow_all과 ADMIN 이상 역할은 이미 로드된 값으로 판단하고, 나머지 두 경로는 사용자마다
+Redis SET(권한 있는 datasource_id)으로 미리 계산해 두어 차트 수와 무관하게 조회 1번으로 끝냅니다.
+
+- 인덱스가 없으면 첫 조회 때 DB에서 한 번에 계산해 저장합니다.
+- 권한 행 추가, 그룹 가입은 세션 이벤트가 flush 직전에 (사용자, 데이터 소스) 목록으로 바꿔 두었다가
+  커밋 후 인덱스가 있는 사용자에게만 SADD로 반영합니다.
+- 권한 회수(권한 행 삭제/변경, 그룹 탈퇴·삭제)는 다른 경로로 접근이 남는지 알 수 없고, 재계산과 겹치면
+  회수가 누락될 수 있으므로 영향받는 사용자의 인덱스를 지워 다음 조회에서 다시 계산합니다.
+- 변경마다 사용자별 stamp를 올리고, 재계산 결과는 시작 시점의 stamp가 그대로일 때만 저장해
+  재계산 도중 커밋된 변경을 덮어쓰지 않습니다.
+"""
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from typing import Any
+
+from redis.exceptions import RedisError
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.principal import Principal
+from app.core.redis import datasource_access_key, datasource_access_stamp_key, get_redis
+from app.db.models.datasource import DataSource, DataSourcePermission
+from app.db.models.enums import Role
+from app.db.models.user import Group, User, user_group
+
+logger = logging.getLogger(__name__)
+
+_BUILT = "_built"   # 빈 인덱스와 인덱스 없음을 구분하는 멤버
+_PENDING_KEY = "datasource_access_changes"
+
+# 인덱스가 있을 때만 권한 추가 (ARGV = ttl, ds1, ds2, ...) / 추가할 것이 없으면 인덱스 삭제
+_APPLY_SCRIPT = """
+redis.call('incr', KEYS[2])
+redis.call('expire', KEYS[2], ARGV[1])
+if #ARGV == 1 then
+    return redis.call('del', KEYS[1])
+end
+if redis.call('exists', KEYS[1]) == 1 then
+    redis.call('sadd', KEYS[1], unpack(ARGV, 2))
+end
+return 1
+"""
+
+# 재계산 결과 저장 — 재계산 중 변경(stamp 증가)이 있었으면 버림 (ARGV = stamp, ttl, member...)
+_STORE_SCRIPT = """
+if (redis.call('get', KEYS[2]) or '') ~= ARGV[1] then
+    return 0
+end
+redis.call('del', KEYS[1])
+redis.call('sadd', KEYS[1], unpack(ARGV, 3))
+redis.call('expire', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+def can_access(datasource: DataSource, user: Principal, accessible: frozenset[uuid.UUID]) -> bool:
+    return user.role in (Role.OWNER, Role.ADMIN) or datasource.allow_all or datasource.id in accessible
+
+
+async def accessible_datasource_ids(db: AsyncSession, user: Principal) -> frozenset[uuid.UUID]:
+    """개별/그룹 권한으로 접근할 수 있는 데이터 소스 id (allow_all 데이터 소스는 포함하지 않음)"""
+    redis = get_redis()
+    key = datasource_access_key(str(user.id))
+    members = await redis.smembers(key)
+    if members:
+        return frozenset(uuid.UUID(m) for m in members if m != _BUILT)
+
+    from app.repositories.datasource_repository import DataSourceRepository
+
+    stamp_key = datasource_access_stamp_key(str(user.id))
+    stamp = await redis.get(stamp_key) or ""
+    datasource_ids = await DataSourceRepository(db).list_granted_ids(user.id)
+    await redis.eval(
+        _STORE_SCRIPT, 2, key, stamp_key,
+        stamp, settings.DATASOURCE_ACCESS_INDEX_TTL, _BUILT, *(str(i) for i in datasource_ids),
+    )
+    return frozenset(datasource_ids)
+
+
+# ── 변경 감지 (SQLAlchemy 세션 이벤트) ───────────────────────────────────────
+
+_apply_tasks: set[asyncio.Task] = set()
+
+
+def _group_members(session: Session, group_ids: set[uuid.UUID]) -> dict[uuid.UUID, list[uuid.UUID]]:
+    members: dict[uuid.UUID, list[uuid.UUID]] = defaultdict(list)
+    if group_ids:
+        rows = session.execute(
+            select(user_group.c.group_id, user_group.c.user_id).where(user_group.c.group_id.in_(group_ids))
+        )
+        for group_id, user_id in rows:
+            members[group_id].append(user_id)
+    return members
+
+
+def _group_grants(session: Session, group_ids: set[uuid.UUID]) -> dict[uuid.UUID, list[uuid.UUID]]:
+    grants: dict[uuid.UUID, list[uuid.UUID]] = defaultdict(list)
+    if group_ids:
+        rows = session.execute(
+            select(DataSourcePermission.entity_id, DataSourcePermission.datasource_id).where(
+                DataSourcePermission.entity_type == "GROUP", DataSourcePermission.entity_id.in_(group_ids)
+            )
+        )
+        for group_id, datasource_id in rows:
+            grants[group_id].append(datasource_id)
+    return grants
+
+
+def _old_entity(state: Any) -> tuple[str, uuid.UUID]:
+    values = []
+    for attr in ("entity_type", "entity_id"):
+        history = state.attrs[attr].history
+        values.append(history.deleted[0] if history.deleted else getattr(state.object, attr))
+    return values[0], values[1]
+
+
+def _collect(session: Session) -> tuple[dict[uuid.UUID, set[uuid.UUID]], set[uuid.UUID]]:
+    """flush 직전 상태(DB는 아직 변경 전)에서 (사용자 → 추가된 데이터 소스, 인덱스를 지울 사용자)를 계산"""
+    added: list[tuple[str, uuid.UUID, uuid.UUID]] = []     # 추가된 권한 (entity_type, entity_id, datasource_id)
+    revoked: list[tuple[str, uuid.UUID]] = []              # 회수된 권한의 대상 (entity_type, entity_id)
+    joined: set[tuple[uuid.UUID, uuid.UUID]] = set()       # (user_id, group_id) — 양방향 관계 이력 중복 제거
+    resets: set[uuid.UUID] = set()
+
+    for obj in session.new:
+        if isinstance(obj, DataSourcePermission):
+            added.append((obj.entity_type, obj.entity_id, obj.datasource_id))
+    for obj in session.deleted:
+        if isinstance(obj, DataSourcePermission):
+            revoked.append(_old_entity(inspect(obj)))
+        elif isinstance(obj, User):
+            resets.add(obj.id)
+        elif isinstance(obj, Group):
+            revoked.append(("GROUP", obj.id))
+    for obj in session.dirty:
+        state = inspect(obj)
+        if isinstance(obj, DataSourcePermission):
+            if any(state.attrs[a].history.has_changes() for a in ("entity_type", "entity_id", "datasource_id")):
+                revoked.append(_old_entity(state))
+                added.append((obj.entity_type, obj.entity_id, obj.datasource_id))
+        elif isinstance(obj, User):
+            history = state.attrs.groups.history
+            joined.update((obj.id, g.id) for g in history.added)
+            if history.deleted:
+                resets.add(obj.id)
+        elif isinstance(obj, Group):
+            history = state.attrs.members.history
+            joined.update((u.id, obj.id) for u in history.added)
+            resets.update(u.id for u in history.deleted)
+
+    members = _group_members(session, {eid for etype, eid, *_ in [*added, *revoked] if etype == "GROUP"})
+    for entity_type, entity_id in revoked:
+        resets.update([entity_id] if entity_type == "USER" else members.get(entity_id, []))
+
+    # 같은 flush에서 생긴 가입/권한은 아직 DB에 없으므로 조회 결과에 합침
+    for user_id, group_id in joined:
+        members[group_id].append(user_id)
+    group_grants = _group_grants(session, {group_id for _, group_id in joined})
+    for entity_type, entity_id, datasource_id in added:
+        if entity_type == "GROUP":
+            group_grants[entity_id].append(datasource_id)
+
+    grants: dict[uuid.UUID, set[uuid.UUID]] = defaultdict(set)
+    for entity_type, entity_id, datasource_id in added:
+        for user_id in [entity_id] if entity_type == "USER" else members.get(entity_id, []):
+            grants[user_id].add(datasource_id)
+    for user_id, group_id in joined:
+        grants[user_id].update(group_grants.get(group_id, []))
+    return grants, resets
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_changes(session: Session, flush_context, instances) -> None:
+    with session.no_autoflush:
+        grants, resets = _collect(session)
+    if not grants and not resets:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, (defaultdict(set), set()))
+    for user_id, datasource_ids in grants.items():
+        pending[0][user_id].update(datasource_ids)
+    pending[1].update(resets)
+
+
+async def _apply(grants: dict[uuid.UUID, set[uuid.UUID]], resets: set[uuid.UUID]) -> None:
+    redis = get_redis()
+    ttl = settings.DATASOURCE_ACCESS_INDEX_TTL
+    try:
+        for user_id in resets | {u for u, ids in grants.items() if ids}:
+            datasource_ids = [] if user_id in resets else [str(i) for i in grants[user_id]]
+            await redis.eval(
+                _APPLY_SCRIPT, 2, datasource_access_key(str(user_id)), datasource_access_stamp_key(str(user_id)),
+                ttl, *datasource_ids,
+            )
+    except RedisError as exc:
+        logger.warning("데이터 소스 접근 인덱스 갱신 실패: %s", exc)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_changes(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_apply(*pending))
+    _apply_tasks.add(task)
+    task.add_done_callback(_apply_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
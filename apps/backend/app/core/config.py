@@ -27,6 +27,40 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # 토큰 검증 빠른 경로 (워커 프로세스별 클레임 캐시 + 폐기 세션 블룸 필터)
+    TOKEN_CLAIMS_CACHE_SIZE: int = 10_000      # 검증된 토큰 클레임 최대 개수 (토큰 만료 시 제거)
+    JWT_REVOCATION_BLOOM_BITS: int = 1 << 20   # 블룸 필터 크기 (128KB) — 폐기 세션 10만 개에서 오탐률 약 1%
+    JWT_REVOCATION_BLOOM_HASHES: int = 7
+    JWT_REVOCATION_SYNC_INTERVAL: int = 60     # Redis 폐기 목록으로 필터를 다시 만드는 주기 (초)
+
+    # 비밀번호 해싱 (bcrypt, 워커 프로세스별 프로세스 풀)
+    PASSWORD_HASH_WORKERS: int = 2           # 해싱 전용 프로세스 수
+    PASSWORD_HASH_MAX_PENDING: int = 32      # 실행 + 대기 중 해싱 작업 상한, 초과 시 503 AUTH_BUSY
+
+    # 인증 사용자 정보 캐시 (워커 프로세스별, 변경 시 Redis pub/sub으로 무효화)
+    PRINCIPAL_CACHE_SIZE: int = 10_000       # 최대 사용자 수 (초과 시 가장 오래 안 쓴 항목부터 제거)
+    PRINCIPAL_CACHE_TTL: float = 60.0        # 항목 유지 시간 (초) — 무효화 메시지를 놓쳤을 때의 최대 지연
+
+    # 사용자별 데이터 소스 접근 인덱스 (Redis, 권한 변경 시 갱신)
+    DATASOURCE_ACCESS_INDEX_TTL: int = 86400  # 인덱스 유지 시간 (초) — 만료되면 다음 조회에서 재계산
+
+    # 성능 지표 (/api/v1/metrics)
+    METRICS_TOKEN: str = ""                  # Prometheus 스크레이프용 Bearer 토큰 — 비어 있으면 ADMIN 이상 사용자만 조회
+
+    # 느린 쿼리 / N+1 감지 (API 요청 단위)
+    QUERY_LOG_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 500.0   # SQL 1회 실행이 이 시간 이상이면 기록
+    N_PLUS_ONE_THRESHOLD: int = 5            # 한 요청에서 같은 문장이 이 횟수 이상 실행되면 기록
+    QUERY_LOG_FILE: str = ""                 # 비어 있으면 표준 에러, 지정하면 워커별 파일 (<이름>.<pid><확장자>)
+    QUERY_LOG_MAX_BYTES: int = 10_000_000    # 파일 순환 크기
+    QUERY_LOG_BACKUP_COUNT: int = 5
+
+    # 대시보드 / 페이지 정의 직렬화 캐시 (Redis, version별 키)
+    DEFINITION_CACHE_TTL: int = 86400        # 초 — 정의가 바뀌면 version이 올라 새 키를 쓰므로 만료는 정리용
+
+    # 조건부 서식 컴파일 캐시 (워커 프로세스별, 차트 version별)
+    CONDITIONAL_FORMAT_CACHE_SIZE: int = 2_000   # 최대 차트 수 (초과 시 가장 오래 안 쓴 항목부터 제거)
+
     # SMTP
     SMTP_HOST: str = "smtp.gmail.com"
     SMTP_PORT: int = 587
@@ -35,6 +69,76 @@ class Settings(BaseSettings):
     SMTP_FROM_NAME: str = "LookFlex"
     SMTP_FROM_EMAIL: str = ""
 
+    # Chart 결과 캐시
+    CHART_CACHE_TTL: int = 300               # 데이터 소스별 cache_ttl 미지정 시 기본값 (초)
+    CHART_CACHE_MAX_ENTRIES: int = 2000      # 데이터 소스당 최대 캐시 항목 수 (초과 시 오래된 항목부터 제거)
+    CHART_CACHE_MAX_BYTES: int = 2_000_000   # 이보다 큰 결과는 캐시하지 않음
+
+    # 동일 쿼리 동시 실행 병합 (single-flight)
+    CHART_FLIGHT_LOCK_TTL: int = 60          # 리더 락 만료 (초) — 리더 워커가 죽어도 이후 자동 해제
+    CHART_FLIGHT_WAIT_TIMEOUT: float = 30.0  # 대기 워커가 리더 결과를 기다리는 최대 시간 (초), 초과 시 직접 실행
+    CHART_FLIGHT_RESULT_TTL: int = 30        # 리더 → 대기 워커 결과 전달 키 TTL (초)
+
+    # 외부 데이터 소스 커넥션 풀 (워커 프로세스별)
+    DATASOURCE_POOL_MAX_SIZE: int = 5             # connection_config.pool_max_size 미지정 시 최대 연결 수
+    DATASOURCE_POOL_QUEUE_TIMEOUT: float = 10.0   # 빈 연결 대기 최대 시간 (초), 초과 시 503 DATASOURCE_BUSY
+    DATASOURCE_POOL_IDLE_LIFETIME: int = 300      # 이 시간 이상 유휴 상태인 연결은 닫고 재연결 (초)
+    DATASOURCE_POOL_EVICT_AFTER: int = 1800       # 이 시간 동안 쓰이지 않은 풀은 통째로 정리 (초)
+
+    # 외부 데이터 소스 쿼리 동시 실행 / 우선순위 (워커 프로세스별, 데이터 소스별 슬롯 수 = 풀 최대 크기)
+    QUERY_GLOBAL_CONCURRENCY: int = 32            # 모든 데이터 소스 합산 동시 실행 쿼리 수
+    QUERY_EXPORT_SHARE: float = 0.5               # 내보내기가 쓸 수 있는 데이터 소스 슬롯 비율 (최소 1개)
+    QUERY_BACKGROUND_SHARE: float = 0.25          # 백그라운드 작업(캐시 워밍, 빌드 등)이 쓸 수 있는 슬롯 비율 (최소 1개)
+    QUERY_TIMEOUT_INTERACTIVE: float = 60.0       # 조회 쿼리 실행 제한 시간 (초), 초과 시 504 QUERY_TIMEOUT
+    QUERY_TIMEOUT_EXPORT: float = 600.0           # 내보내기 배치 1회 읽기 제한 시간 (초)
+    QUERY_TIMEOUT_BACKGROUND: float = 1800.0      # 백그라운드 작업 쿼리 실행 제한 시간 (초)
+
+    # 차트 조회 수용 제어 — 실행 전 예상 처리 행 수(EXPLAIN / dry run / 파일 행 수)를 역할별 예산과 비교, 0이면 제한 없음
+    QUERY_COST_BUDGET_VIEWER: int = 20_000_000    # VIEWER 예산 (행)
+    QUERY_COST_BUDGET_EDITOR: int = 200_000_000   # EDITOR 예산 (행)
+    QUERY_COST_BUDGET_ADMIN: int = 0              # ADMIN / OWNER 예산 (행)
+    QUERY_COST_REJECT_FACTOR: float = 5.0         # 예산의 이 배수 초과 시 422 QUERY_TOO_EXPENSIVE, 그 사이는 백그라운드 우선순위로 실행
+    QUERY_COST_BYTES_PER_ROW: int = 100           # BigQuery dry run 처리 바이트 → 행 수 환산 기준
+    QUERY_COST_ESTIMATE_TIMEOUT: float = 5.0      # 추정 제한 시간 (초), 실패/초과 시 추정 없이 실행
+    QUERY_COST_CACHE_TTL: int = 3600              # 추정 결과 캐시 (초)
+
+    # 업로드 파일(CSV/Excel) 데이터 소스 — Arrow IPC 컬럼 저장소
+    DATASOURCE_FILE_DIR: str = "data/datasources"
+    DATASOURCE_UPLOAD_MAX_BYTES: int = 512 * 1024 * 1024
+    DATASOURCE_INGEST_BLOCK_BYTES: int = 16 * 1024 * 1024  # CSV 스트리밍 파싱 블록 크기
+    DATASOURCE_INGEST_BATCH_ROWS: int = 65_536             # IPC 파일 레코드 배치 최대 행 수
+
+    # 사전 집계 테이블(롤업)
+    ROLLUP_REFRESH_INTERVAL: int = 3600        # refresh_interval 미지정 롤업의 재빌드 주기 (초)
+    ROLLUP_FULL_REFRESH_INTERVAL: int = 86400  # 증분 빌드 중에도 이 주기마다 전체 재계산 (수정/삭제 반영)
+    ROLLUP_POLL_INTERVAL: int = 60             # 재빌드 대상 롤업을 확인해 작업으로 등록하는 주기 (초)
+    ROLLUP_BUILD_LOCK_TTL: int = 1800          # 롤업 빌드 락 만료 (초) — 워커 간 중복 빌드 방지
+    ROLLUP_MAX_ROWS: int = 2_000_000           # 이보다 큰 롤업은 빌드 실패 처리 (원본 스캔과 차이가 없음)
+    DATASOURCE_WATERMARK_PROBE_INTERVAL: int = 300  # watermark 필드 최댓값 확인 주기 (초)
+
+    # 드롭다운 필터 값 인덱스 (Redis sorted set, 작업 워커에서 빌드)
+    DISTINCT_VALUES_MAX: int = 100_000                  # 필드당 저장하는 최대 값 수 (빈도 상위만 유지)
+    DISTINCT_VALUES_REFRESH_INTERVAL: int = 3600        # 갱신 주기 (초) — watermark가 있으면 변경분만 증분 반영
+    DISTINCT_VALUES_FULL_REFRESH_INTERVAL: int = 86400  # 증분 갱신 중에도 이 주기마다 전체 재집계 (수정/삭제 반영)
+    DISTINCT_VALUES_BUILD_LOCK_TTL: int = 1800          # 빌드 락 만료 (초)
+    FILTER_CASCADE_VALUES_LIMIT: int = 1000             # 연쇄 필터 응답의 드롭다운별 최대 값 수 (건수 상위)
+
+    # 차트 데이터 내보내기 (CSV/XLSX 스트리밍)
+    CHART_EXPORT_BATCH_ROWS: int = 5000      # 서버 사이드 커서에서 한 번에 가져와 인코딩하는 행 수
+
+    # 백그라운드 작업 큐 (python -m app.worker)
+    JOB_WORKER_CONCURRENCY: int = 4          # 워커 프로세스당 동시에 실행하는 작업 수
+    JOB_DATASOURCE_CONCURRENCY: int = 2      # 데이터 소스 하나에 동시에 실행되는 작업 수 (전체 워커 합산)
+    JOB_MAX_ATTEMPTS: int = 5                # 실패 시 재시도 포함 최대 실행 횟수, 초과하면 jobs:dead로 이동
+    JOB_RETRY_BASE_DELAY: float = 10.0       # 재시도 지연 기본값 (초) — 시도마다 2배, 지터 적용
+    JOB_RETRY_MAX_DELAY: float = 900.0       # 재시도 지연 상한 (초)
+    JOB_TIMEOUT: int = 1800                  # 작업 1개 실행 제한 시간 (초)
+    JOB_HEARTBEAT_TTL: int = 30              # 워커 생존 신호 TTL (초) — 만료되면 처리 중 작업을 다시 대기열로
+    JOB_DEDUPE_TTL: int = 86400              # 중복 등록 방지 키 최대 유지 시간 (초)
+    JOB_TIMEZONE: str = "Asia/Seoul"         # 일일 작업 시각 기준 시간대
+    CACHE_WARM_AT: str = "07:30"             # 즐겨찾기 대시보드/페이지 캐시 워밍 시각 (업무 시작 전)
+    SCHEMA_SYNC_AT: str = "05:00"            # 외부 DB 데이터 소스 스키마 동기화 시각
+
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost"]
 
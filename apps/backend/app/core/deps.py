@@ -1,4 +1,5 @@
 """FastAPI 공통 의존성"""
+import hmac
 import uuid
 from typing import Annotated
 
@@ -6,9 +7,10 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import decode_token
+from app.core.config import settings
+from app.core.principal import Principal, load_principal
+from app.core.tokens import verify_token
 from app.db.models.enums import Role
-from app.db.models.user import User
 from app.db.session import get_db
 
 bearer_scheme = HTTPBearer(auto_error=False)
@@ -17,34 +19,47 @@ bearer_scheme = HTTPBearer(auto_error=False)
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
-    """Authorization: Bearer <token> 에서 현재 사용자를 조회합니다."""
+) -> Principal:
+    """Authorization: Bearer <token> 에서 현재 사용자를 조회합니다.
+
+    토큰 검증과 사용자 조회 모두 워커 메모리 캐시를 먼저 보므로 대부분의 요청은 DB/Redis를 거치지 않습니다.
+    """
     if not credentials:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="인증이 필요합니다.")
 
-    user_id = decode_token(credentials.credentials, token_type="access")
-    if not user_id:
+    claims = await verify_token(credentials.credentials, token_type="access")
+    if not claims:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰입니다.")
 
-    from app.repositories.user_repository import UserRepository
-    user = await UserRepository(db).get_by_id(uuid.UUID(user_id))
+    user = await load_principal(db, uuid.UUID(claims.sub))
     if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="존재하지 않는 사용자입니다.")
 
     return user
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
 
 
 def require_role(*roles: Role):
     """최소 역할 권한 검사 의존성 팩토리"""
     _role_order = {Role.OWNER: 4, Role.ADMIN: 3, Role.EDITOR: 2, Role.VIEWER: 1}
 
-    async def _checker(current_user: CurrentUser) -> User:
+    async def _checker(current_user: CurrentUser) -> Principal:
         min_level = min(_role_order[r] for r in roles)
         if _role_order[current_user.role] < min_level:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="권한이 없습니다.")
         return current_user
 
     return _checker
+
+
+async def require_metrics_access(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> None:
+    """성능 지표 조회 권한 — METRICS_TOKEN(Prometheus 스크레이프) 또는 ADMIN 이상 사용자"""
+    token = settings.METRICS_TOKEN
+    if credentials and token and hmac.compare_digest(credentials.credentials.encode(), token.encode()):
+        return
+    await require_role(Role.ADMIN)(await get_current_user(credentials, db))
@@ -0,0 +1,34 @@
+"""클라이언트 연결이 끊기면 요청 처리 취소
+
+스트리밍 응답은 Starlette가 연결 끊김을 감지해 스트림을 취소하지만, 일반 응답은 클라이언트가 떠나도
+핸들러가 끝까지 실행됩니다. 원본 DB 쿼리를 기다리는 핸들러는 cancel_on_disconnect로 감싸
+연결이 끊기는 즉시 처리(와 진행 중인 원본 쿼리)를 취소합니다.
+"""
+import asyncio
+from typing import Awaitable, TypeVar
+
+from fastapi import HTTPException, Request
+
+T = TypeVar("T")
+
+_POLL_INTERVAL = 0.25  # 연결 상태 확인 주기 (초)
+
+
+async def cancel_on_disconnect(request: Request, awaitable: Awaitable[T]) -> T:
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=_POLL_INTERVAL)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                # 응답을 받을 클라이언트가 없으므로 로그/지표용 상태 코드 (nginx 관례)
+                raise HTTPException(
+                    status_code=499,
+                    detail={"code": "CLIENT_CLOSED_REQUEST", "message": "클라이언트 연결이 끊겨 요청을 취소했습니다."},
+                )
+    finally:
+        if not task.done():
+            task.cancel()
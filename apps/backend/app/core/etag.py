@@ -0,0 +1,72 @@
+"""정의 조회 응답의 ETag / 304 처리와 version 기준 직렬화 캐시
+
+대시보드·페이지 정의는 version과 요청 사용자별 값(즐겨찾기, 뷰 설정 등)으로 ETag를 만들고,
+If-None-Match가 일치하면 본문 없이 304를 돌려줍니다. 본문은 version별로 Redis에 캐시된 JSON 문자열을 그대로 씁니다.
+"""
+import hashlib
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import Response
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+# 브라우저가 저장하되 매번 ETag로 재검증 (사용자별 값이 섞여 있어 공유 캐시는 금지)
+_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """강한 ETag — parts의 repr이 같으면 같은 값"""
+    digest = hashlib.sha256("\x1f".join(repr(p) for p in parts).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (RFC 9110 — 약한 비교, "*"는 항상 일치)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL})
+
+
+def json_ok(data_json: str, etag: str) -> Response:
+    """ApiResponse.ok와 같은 envelope로 이미 직렬화된 data를 감싸 반환"""
+    return Response(
+        content=f'{{"success":true,"data":{data_json},"error":null}}',
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL},
+    )
+
+
+async def cached_definition(
+    key: Callable[[int], str],
+    version: int,
+    load: Callable[[], Awaitable[tuple[int, str]]],
+) -> str:
+    """version의 직렬화 결과 — 없으면 load()로 (읽은 시점의 version, JSON)을 만들어 그 version 키에 저장
+
+    조회 도중 정의가 바뀌었어도 읽은 내용은 읽은 version 키에만 저장되므로 다른 version과 섞이지 않습니다.
+    Redis 오류는 캐시 없이 진행합니다.
+    """
+    redis = get_redis()
+    try:
+        cached = await redis.get(key(version))
+    except RedisError:
+        cached = None
+    if cached:
+        return cached
+
+    loaded_version, payload = await load()
+    try:
+        await redis.set(key(loaded_version), payload, ex=settings.DEFINITION_CACHE_TTL)
+    except RedisError:
+        pass
+    return payload
@@ -0,0 +1,97 @@
+"""비밀번호 해싱(bcrypt) 프로세스 풀
+
+bcrypt는 해시/검증 1회에 CPU를 수백 ms 쓰고 GIL을 잡고 있어, 이벤트 루프에서 바로 부르면
+그동안 같은 워커의 다른 요청이 모두 멈춥니다. 여기서는 워커 프로세스마다 작은 프로세스 풀을 두고
+해싱을 넘겨, 로그인이 몰려도 다른 요청은 계속 처리되게 합니다.
+
+대기 중인 해싱 작업이 PASSWORD_HASH_MAX_PENDING을 넘으면 바로 503 AUTH_BUSY로 거절해
+대기열이 끝없이 늘어나지 않도록 합니다. 처리량/대기 시간은 Prometheus 지표(lookflex_password_hash_*)로 확인합니다.
+"""
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.metrics import (
+    PASSWORD_HASH_IN_FLIGHT,
+    PASSWORD_HASH_JOBS,
+    PASSWORD_HASH_QUEUE_SECONDS,
+    PASSWORD_HASH_RUN_SECONDS,
+)
+from app.core.security import hash_password, verify_password
+
+
+def _timed_hash(plain: str) -> tuple[str, float]:
+    started = time.perf_counter()
+    return hash_password(plain), time.perf_counter() - started
+
+
+def _timed_verify(plain: str, hashed: str) -> tuple[bool, float]:
+    started = time.perf_counter()
+    return verify_password(plain, hashed), time.perf_counter() - started
+
+
+class PasswordHasher:
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.in_flight = 0  # 실행 중 + 대기 중
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pid: Optional[int] = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        # gunicorn이 fork한 뒤 워커 프로세스마다 따로 만듦 (마스터에서 만든 풀은 쓰지 않음)
+        if self._pool is None or self._pid != os.getpid():
+            # 이벤트 루프/스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+            self._pid = os.getpid()
+        return self._pool
+
+    async def _run(self, fn, *args):
+        if self.in_flight >= self.max_pending:
+            PASSWORD_HASH_JOBS.labels("rejected").inc()
+            raise HTTPException(
+                status_code=503,
+                detail={"code": "AUTH_BUSY", "message": "로그인 요청이 많습니다. 잠시 후 다시 시도해주세요."},
+                headers={"Retry-After": "1"},
+            )
+        self.in_flight += 1
+        PASSWORD_HASH_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            result, run_seconds = await asyncio.get_running_loop().run_in_executor(self._executor(), fn, *args)
+        except BrokenProcessPool:
+            # 자식 프로세스가 죽으면 풀 전체가 못 쓰게 되므로 다음 요청에서 새로 만듦
+            PASSWORD_HASH_JOBS.labels("failed").inc()
+            self._pool = None
+            raise
+        except Exception:
+            PASSWORD_HASH_JOBS.labels("failed").inc()
+            raise
+        finally:
+            self.in_flight -= 1
+            PASSWORD_HASH_IN_FLIGHT.dec()
+        PASSWORD_HASH_JOBS.labels("completed").inc()
+        PASSWORD_HASH_RUN_SECONDS.observe(run_seconds)
+        PASSWORD_HASH_QUEUE_SECONDS.observe(max(time.perf_counter() - started - run_seconds, 0.0))
+        return result
+
+    async def hash(self, plain: str) -> str:
+        return await self._run(_timed_hash, plain)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._run(_timed_verify, plain, hashed)
+
+    def close(self) -> None:
+        if self._pool is not None and self._pid == os.getpid():
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
@@ -0,0 +1,231 @@
+"""요청 단위 성능 계측 (Prometheus)
+
+MetricsMiddleware가 요청마다 RequestStats를 컨텍스트 변수에 두면, SQLAlchemy 엔진 이벤트 / Redis 클라이언트 /
+응답 직렬화가 각자 걸린 시간과 횟수를 더합니다. 요청이 끝나면 라우트(경로 템플릿)별 히스토그램에 기록하고,
+응답에 Server-Timing 헤더(db / redis / serialize)를 붙여 브라우저 개발자 도구에서도 바로 볼 수 있게 합니다.
+요청 중 실행된 SQL 문장은 느린 쿼리 / N+1 감지(app.core.querylog)에 넘깁니다.
+
+gunicorn 워커가 여러 개이므로 PROMETHEUS_MULTIPROC_DIR이 설정되어 있으면 워커별 파일에 기록하고
+/api/v1/metrics에서 모든 워커 값을 합쳐 보여줍니다 (entrypoint.sh에서 설정).
+"""
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+import fastapi.routing
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import querylog
+from app.core.config import settings
+
+_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+_TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REQUEST_DURATION = Histogram(
+    "lookflex_http_request_duration_seconds", "요청 처리 시간 (응답 본문 전송 완료까지)",
+    ["method", "route", "status"], buckets=_TIME_BUCKETS + (30.0, 60.0),
+)
+REQUEST_DB_STATEMENTS = Histogram(
+    "lookflex_http_request_db_statements", "요청당 SQL 실행 횟수", ["route"], buckets=_COUNT_BUCKETS,
+)
+REQUEST_DB_SECONDS = Histogram(
+    "lookflex_http_request_db_seconds", "요청당 SQL 실행 시간 합계", ["route"], buckets=_TIME_BUCKETS,
+)
+REQUEST_REDIS_CALLS = Histogram(
+    "lookflex_http_request_redis_calls", "요청당 Redis 호출 횟수 (파이프라인은 1회)", ["route"], buckets=_COUNT_BUCKETS,
+)
+REQUEST_REDIS_SECONDS = Histogram(
+    "lookflex_http_request_redis_seconds", "요청당 Redis 호출 시간 합계", ["route"], buckets=_TIME_BUCKETS,
+)
+REQUEST_SERIALIZE_SECONDS = Histogram(
+    "lookflex_http_request_serialize_seconds", "요청당 응답 모델 검증/직렬화 시간", ["route"], buckets=_TIME_BUCKETS,
+)
+DB_STATEMENTS = Counter("lookflex_db_statements_total", "SQL 실행 횟수 (요청 밖 실행 포함)")
+DB_SECONDS = Counter("lookflex_db_statement_seconds_total", "SQL 실행 시간 합계 (요청 밖 실행 포함)")
+REDIS_CALLS = Counter("lookflex_redis_calls_total", "Redis 호출 횟수 (요청 밖 호출 포함)", ["command"])
+REDIS_SECONDS = Counter("lookflex_redis_call_seconds_total", "Redis 호출 시간 합계 (요청 밖 호출 포함)", ["command"])
+
+# 비밀번호 해싱 프로세스 풀 (app.core.hashing)
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "lookflex_password_hash_in_flight", "실행 + 대기 중인 해싱 작업 수", multiprocess_mode="livesum",
+)
+PASSWORD_HASH_JOBS = Counter(
+    "lookflex_password_hash_jobs_total", "해싱 작업 수 (completed / rejected: 대기열 한도 초과 / failed)", ["result"],
+)
+PASSWORD_HASH_RUN_SECONDS = Histogram(
+    "lookflex_password_hash_run_seconds", "해싱 1회 bcrypt 실행 시간", buckets=_TIME_BUCKETS,
+)
+PASSWORD_HASH_QUEUE_SECONDS = Histogram(
+    "lookflex_password_hash_queue_seconds", "해싱 1회 프로세스 풀 대기 시간", buckets=_TIME_BUCKETS,
+)
+
+# 토큰 폐기 확인 (app.core.tokens)
+TOKEN_REVOCATION_DEGRADED = Counter(
+    "lookflex_token_revocation_degraded_total",
+    "Redis 장애로 폐기 여부를 마지막 블룸 필터와 토큰 만료로 판단한 횟수 (accepted / rejected)", ["result"],
+)
+
+
+@dataclass
+class RequestStats:
+    db_statements: int = 0
+    db_seconds: float = 0.0
+    redis_calls: int = 0
+    redis_seconds: float = 0.0
+    serialize_seconds: float = 0.0
+    # 느린 쿼리 / N+1 감지용 (QUERY_LOG_ENABLED일 때만) — 원문 → [실행 횟수, 시간 합계], (원문, 초)
+    statements: dict[str, list] = field(default_factory=dict)
+    slow_statements: list[tuple[str, float]] = field(default_factory=list)
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+# ── 계측 지점 ─────────────────────────────────────────────────────────────────
+
+def record_redis_call(command: str, seconds: float) -> None:
+    REDIS_CALLS.labels(command).inc()
+    REDIS_SECONDS.labels(command).inc(seconds)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.redis_calls += 1
+        stats.redis_seconds += seconds
+
+
+@contextmanager
+def measure_serialization() -> Iterator[None]:
+    """응답 직렬화 시간 — serialize_response를 거치지 않고 본문을 직접 인코딩하는 라우트도 여기로 기록"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.serialize_seconds += time.perf_counter() - started
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """SQL 실행마다 횟수/시간 기록 (cursor 실행 단위 — executemany는 1회)"""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany) -> None:
+        seconds = time.perf_counter() - conn.info["query_started"].pop()
+        DB_STATEMENTS.inc()
+        DB_SECONDS.inc(seconds)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.db_statements += 1
+            stats.db_seconds += seconds
+            if settings.QUERY_LOG_ENABLED:
+                entry = stats.statements.setdefault(statement, [0, 0.0])
+                entry[0] += 1
+                entry[1] += seconds
+                if seconds * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+                    stats.slow_statements.append((statement, seconds))
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(context) -> None:
+        # 실패한 실행은 after_cursor_execute가 호출되지 않으므로 시작 시각만 버림
+        started = context.connection.info.get("query_started") if context.connection is not None else None
+        if started:
+            started.pop()
+
+
+def _instrument_serialization() -> None:
+    """FastAPI 응답 모델 검증/직렬화(serialize_response) 시간 측정"""
+    serialize_response = fastapi.routing.serialize_response
+    if getattr(serialize_response, "_instrumented", False):
+        return
+
+    async def timed_serialize_response(*args, **kwargs):
+        with measure_serialization():
+            return await serialize_response(*args, **kwargs)
+
+    timed_serialize_response._instrumented = True
+    # fastapi.routing 안에서 전역 이름으로 호출하므로 모듈 속성을 바꾸면 모든 라우트에 적용됨
+    fastapi.routing.serialize_response = timed_serialize_response
+
+
+_instrument_serialization()
+
+
+# ── 미들웨어 ──────────────────────────────────────────────────────────────────
+
+def _server_timing(stats: RequestStats) -> bytes:
+    return (
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.db_statements} queries", '
+        f'redis;dur={stats.redis_seconds * 1000:.1f};desc="{stats.redis_calls} calls", '
+        f"serialize;dur={stats.serialize_seconds * 1000:.1f}"
+    ).encode()
+
+
+class MetricsMiddleware:
+    """순수 ASGI 미들웨어 — 스트리밍 응답은 본문 전송이 끝난 시점까지 측정"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (b"server-timing", _server_timing(stats))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            REQUEST_DURATION.labels(scope["method"], path, str(status_code)).observe(time.perf_counter() - started)
+            REQUEST_DB_STATEMENTS.labels(path).observe(stats.db_statements)
+            REQUEST_DB_SECONDS.labels(path).observe(stats.db_seconds)
+            REQUEST_REDIS_CALLS.labels(path).observe(stats.redis_calls)
+            REQUEST_REDIS_SECONDS.labels(path).observe(stats.redis_seconds)
+            REQUEST_SERIALIZE_SECONDS.labels(path).observe(stats.serialize_seconds)
+            if stats.statements:
+                querylog.report(scope["method"], path, stats.statements, stats.slow_statements)
+
+
+# ── 노출 ──────────────────────────────────────────────────────────────────────
+
+def render_metrics() -> tuple[bytes, str]:
+    """(본문, Content-Type) — 멀티프로세스 모드면 모든 워커 값을 합산"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
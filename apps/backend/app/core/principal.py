@@ -0,0 +1,211 @@
+"""인증된 사용자 정보(Principal) 프로세스 로컬 캐시
+
+get_current_user는 요청마다 사용자 + 그룹을 DB에서 조회하는 대신, 권한 판단에 필요한
+(id, role, is_active, group_ids)만 담은 Principal을 워커 메모리의 LRU/TTL 캐시에서 꺼내 씁니다.
+
+역할 · 그룹 · 활성 상태가 ORM으로 바뀌면 세션 이벤트가 커밋 시점에 변경된 사용자를 모아
+Redis pub/sub으로 모든 워커에 무효화를 알립니다. 메시지를 놓쳐도 PRINCIPAL_CACHE_TTL이 지나면 다시 조회합니다.
+(user_group 테이블을 ORM 관계 대신 직접 INSERT/DELETE하는 코드는 invalidate_principals를 직접 호출해야 합니다.)
+"""
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from redis.exceptions import RedisError
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.redis import get_redis, principal_invalidate_channel
+from app.db.models.enums import Role
+from app.db.models.user import Group, User
+
+logger = logging.getLogger(__name__)
+
+_ALL = "*"
+_PENDING_KEY = "principal_invalidations"
+_TRACKED_ATTRS = ("role", "is_active", "groups")
+
+
+@dataclass(frozen=True)
+class Principal:
+    """요청 처리에 필요한 최소한의 사용자 정보 (ORM 객체 아님)"""
+
+    id: uuid.UUID
+    role: Role
+    is_active: bool
+    group_ids: frozenset[uuid.UUID]
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            role=user.role,
+            is_active=user.is_active,
+            group_ids=frozenset(g.id for g in user.groups),
+        )
+
+
+class PrincipalCache:
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[uuid.UUID, tuple[float, Principal]] = OrderedDict()
+        # 무효화마다 증가 — DB 조회 도중 무효화가 도착했으면 조회 결과(이미 낡았을 수 있음)를 저장하지 않음
+        self.generation = 0
+
+    def get(self, user_id: uuid.UUID) -> Optional[Principal]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return principal
+
+    def put(self, principal: Principal, generation: int) -> None:
+        if generation != self.generation:
+            return
+        self._entries[principal.id] = (time.monotonic() + self.ttl, principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids: Optional[Iterable[uuid.UUID]] = None) -> None:
+        """user_ids가 None이면 전체 삭제"""
+        self.generation += 1
+        if user_ids is None:
+            self._entries.clear()
+            return
+        for user_id in user_ids:
+            self._entries.pop(user_id, None)
+
+
+principal_cache = PrincipalCache(settings.PRINCIPAL_CACHE_SIZE, settings.PRINCIPAL_CACHE_TTL)
+
+
+async def load_principal(db: AsyncSession, user_id: uuid.UUID) -> Optional[Principal]:
+    """캐시에 없으면 사용자 + 그룹을 조회해 캐시에 넣습니다. 없는 사용자는 None (캐시하지 않음)"""
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    from app.repositories.user_repository import UserRepository
+
+    generation = principal_cache.generation
+    user = await UserRepository(db).get_by_id(user_id)
+    if user is None:
+        return None
+    principal = Principal.from_user(user)
+    principal_cache.put(principal, generation)
+    return principal
+
+
+# ── 워커 간 무효화 (Redis pub/sub) ────────────────────────────────────────────
+
+async def invalidate_principals(user_ids: Optional[Iterable[uuid.UUID]] = None) -> None:
+    """이 워커의 캐시를 바로 비우고 다른 워커에 무효화를 알립니다. user_ids가 None이면 전체"""
+    ids = None if user_ids is None else list(user_ids)
+    principal_cache.invalidate(ids)
+    await _publish(ids)
+
+
+async def _publish(user_ids: Optional[list[uuid.UUID]]) -> None:
+    message = _ALL if user_ids is None else ",".join(str(i) for i in user_ids)
+    if not message:
+        return
+    try:
+        await get_redis().publish(principal_invalidate_channel(), message)
+    except RedisError as exc:
+        # 다른 워커는 TTL이 지나면 갱신됨
+        logger.warning("사용자 캐시 무효화 전파 실패: %s", exc)
+
+
+def _apply(message: str) -> None:
+    if message == _ALL:
+        principal_cache.invalidate()
+        return
+    try:
+        principal_cache.invalidate(uuid.UUID(part) for part in message.split(",") if part)
+    except ValueError:
+        principal_cache.invalidate()
+
+
+async def listen_invalidations() -> None:
+    """무효화 구독 루프 (lifespan에서 워커별로 실행) — 연결이 끊기면 재구독하며, 그 사이 놓친 메시지에 대비해 전체를 비움"""
+    while True:
+        try:
+            async with get_redis().pubsub() as pubsub:
+                await pubsub.subscribe(principal_invalidate_channel())
+                principal_cache.invalidate()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        _apply(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("사용자 캐시 무효화 구독 오류, 재연결: %s", exc)
+            principal_cache.invalidate()
+            await asyncio.sleep(1)
+
+
+# ── 변경 감지 (SQLAlchemy 세션 이벤트) ───────────────────────────────────────
+
+_publish_tasks: set[asyncio.Task] = set()
+
+
+def _changed_user_ids(session: Session) -> set[uuid.UUID | str]:
+    """이번 flush로 Principal이 바뀌는 사용자 id (알 수 없으면 {"*"})"""
+    changed: set[uuid.UUID | str] = set()
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            changed.add(obj.id)
+        elif isinstance(obj, Group):
+            # 삭제된 그룹의 구성원이 로드되어 있지 않으면 누가 영향받는지 알 수 없으므로 전체 무효화
+            if "members" in inspect(obj).unloaded:
+                return {_ALL}
+            changed.update(u.id for u in obj.members)
+    for obj in session.dirty:
+        state = inspect(obj)
+        if isinstance(obj, User):
+            if any(state.attrs[attr].history.has_changes() for attr in _TRACKED_ATTRS):
+                changed.add(obj.id)
+        elif isinstance(obj, Group):
+            history = state.attrs.members.history
+            changed.update(u.id for u in [*history.added, *history.deleted])
+    return changed
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context) -> None:
+    changed = _changed_user_ids(session)
+    if changed:
+        session.info.setdefault(_PENDING_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changes(session: Session) -> None:
+    changed = session.info.pop(_PENDING_KEY, None)
+    if not changed:
+        return
+    user_ids = None if _ALL in changed else list(changed)
+    principal_cache.invalidate(user_ids)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_publish(user_ids))
+    _publish_tasks.add(task)
+    task.add_done_callback(_publish_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
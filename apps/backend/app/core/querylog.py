@@ -0,0 +1,105 @@
+"""느린 쿼리 / N+1 감지 로그
+
+요청 단위 계측(app.core.metrics)이 모은 SQL 실행 기록을 요청이 끝날 때 검사해,
+- 같은 문장(fingerprint 기준)이 N_PLUS_ONE_THRESHOLD번 이상 실행되었거나 (lazy 관계 반복 로딩 등)
+- 한 번 실행에 SLOW_QUERY_THRESHOLD_MS 이상 걸린 문장이 있으면
+호출 라우트와 함께 한 줄짜리 JSON으로 기록합니다.
+
+QUERY_LOG_FILE이 비어 있으면 표준 에러(gunicorn 에러 로그)로, 지정하면 워커 프로세스별 파일
+(`<이름>.<pid><확장자>`, 크기 기준 순환)로 남깁니다. 여러 프로세스가 한 파일을 순환시키면 로그가 깨지므로 pid를 붙입니다.
+"""
+import json
+import logging
+import os
+import re
+import sys
+from logging.handlers import RotatingFileHandler
+from typing import Optional
+
+from prometheus_client import Counter
+
+from app.core.config import settings
+
+logger = logging.getLogger("lookflex.querylog")
+
+SLOW_QUERIES = Counter("lookflex_slow_queries_total", "SLOW_QUERY_THRESHOLD_MS를 넘은 SQL 실행 횟수", ["route"])
+REPEATED_QUERIES = Counter(
+    "lookflex_repeated_queries_total", "한 요청에서 N_PLUS_ONE_THRESHOLD번 이상 반복된 문장 수 (N+1 의심)", ["route"]
+)
+
+_STATEMENT_PREVIEW = 1000
+# 바인드 파라미터 개수만 다른 IN 목록 ("IN ($1, $2)", "IN (%s, %s)", "IN (?, ?)")
+_IN_LIST = re.compile(r"\(\s*(?:\$\d+|%s|\?|:\w+)(?:\s*,\s*(?:\$\d+|%s|\?|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_handler_pid: Optional[int] = None
+
+
+def fingerprint(statement: str) -> str:
+    """파라미터 자리와 공백을 정규화한 문장 — 값만 다른 실행을 같은 문장으로 묶음"""
+    return _IN_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def _configure() -> None:
+    """첫 기록 시 워커 프로세스별 핸들러 설정 (fork 이후 pid 기준)"""
+    global _handler_pid
+    if _handler_pid == os.getpid():
+        return
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    if settings.QUERY_LOG_FILE:
+        stem, ext = os.path.splitext(settings.QUERY_LOG_FILE)
+        handler: logging.Handler = RotatingFileHandler(
+            f"{stem}.{os.getpid()}{ext}",
+            maxBytes=settings.QUERY_LOG_MAX_BYTES,
+            backupCount=settings.QUERY_LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    _handler_pid = os.getpid()
+
+
+def _emit(record: dict) -> None:
+    _configure()
+    logger.warning(json.dumps(record, ensure_ascii=False))
+
+
+def report(
+    method: str,
+    route: str,
+    statements: dict[str, list],
+    slow: list[tuple[str, float]],
+) -> None:
+    """statements: 원문 → [실행 횟수, 시간 합계], slow: (원문, 초) — 요청이 끝난 뒤 한 번 호출"""
+    for statement, seconds in slow:
+        SLOW_QUERIES.labels(route).inc()
+        _emit({
+            "event": "slow_query",
+            "method": method,
+            "route": route,
+            "ms": round(seconds * 1000, 1),
+            "statement": fingerprint(statement)[:_STATEMENT_PREVIEW],
+        })
+
+    # 원문은 SQLAlchemy가 캐시한 문자열이라 대부분 그대로 같지만, IN 목록 길이가 다른 경우를 위해 한 번 더 묶음
+    grouped: dict[str, list] = {}
+    for statement, (count, seconds) in statements.items():
+        entry = grouped.setdefault(fingerprint(statement), [0, 0.0])
+        entry[0] += count
+        entry[1] += seconds
+    for statement, (count, seconds) in grouped.items():
+        if count < settings.N_PLUS_ONE_THRESHOLD:
+            continue
+        REPEATED_QUERIES.labels(route).inc()
+        _emit({
+            "event": "repeated_query",
+            "method": method,
+            "route": route,
+            "count": count,
+            "total_ms": round(seconds * 1000, 1),
+            "statement": statement[:_STATEMENT_PREVIEW],
+        })
@@ -1,7 +1,11 @@
 """Redis 클라이언트 싱글턴 및 헬퍼"""
+import time
+
 import redis.asyncio as aioredis
+from redis.asyncio.client import Pipeline
 
 from app.core.config import settings
+from app.core.metrics import record_redis_call
 
 # 모듈 레벨 싱글턴 — lifespan 이벤트에서 초기화
 redis_client: aioredis.Redis | None = None
@@ -13,9 +17,32 @@ def get_redis() -> aioredis.Redis:
     return redis_client
 
 
+class _InstrumentedPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True):
+        started = time.perf_counter()
+        try:
+            return await super().execute(raise_on_error)
+        finally:
+            record_redis_call("PIPELINE", time.perf_counter() - started)
+
+
+class _InstrumentedRedis(aioredis.Redis):
+    """명령마다 호출 횟수/시간을 요청 계측(app.core.metrics)에 기록 — pub/sub 구독은 제외"""
+
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            record_redis_call(str(args[0]).upper(), time.perf_counter() - started)
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None) -> Pipeline:
+        return _InstrumentedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
 async def init_redis() -> None:
     global redis_client
-    redis_client = aioredis.from_url(
+    redis_client = _InstrumentedRedis.from_url(
         settings.REDIS_URL,
         encoding="utf-8",
         decode_responses=True,
@@ -44,5 +71,151 @@ def pw_reset_key(token: str) -> str:
     return f"pw_reset:{token}"
 
 
-def jwt_blacklist_key(jti: str) -> str:
-    return f"jwt_blacklist:{jti}"
+def jwt_blacklist_key(session_id: str) -> str:
+    """로그아웃으로 폐기된 세션 (토큰 만료 시각까지 유지)"""
+    return f"jwt_blacklist:{session_id}"
+
+
+def jwt_revoked_index_key() -> str:
+    """폐기된 세션 목록 (ZSET, score=만료 시각) — 워커별 블룸 필터 재구성용"""
+    return "jwt_revoked"
+
+
+def jwt_revoke_channel() -> str:
+    """세션 폐기 pub/sub 채널 (메시지 = session_id)"""
+    return "jwt_revoke"
+
+
+def chart_cache_key(fingerprint: str) -> str:
+    """차트 쿼리 결과 (정규화된 쿼리 fingerprint 기준)"""
+    return f"chart_cache:{fingerprint}"
+
+
+def chart_cache_index_key(datasource_id: str) -> str:
+    """데이터 소스별 캐시 키 인덱스 (ZSET, score=저장 시각) — 크기 제한 및 일괄 무효화용"""
+    return f"chart_cache_index:{datasource_id}"
+
+
+def chart_cache_stats_key(datasource_id: str) -> str:
+    """데이터 소스별 캐시 hit/miss 카운터 (HASH)"""
+    return f"chart_cache_stats:{datasource_id}"
+
+
+def chart_flight_lock_key(fingerprint: str) -> str:
+    """동일 쿼리 실행 리더 락 (값 = 리더 토큰) — 워커 간 single-flight"""
+    return f"chart_flight_lock:{fingerprint}"
+
+
+def chart_flight_result_key(fingerprint: str, token: str) -> str:
+    """리더가 대기 중인 다른 워커에게 넘겨주는 실행 결과 (짧은 TTL)"""
+    return f"chart_flight_result:{fingerprint}:{token}"
+
+
+def query_cost_key(fingerprint: str) -> str:
+    """쿼리 비용 추정 결과 (예상 처리 행 수, 추정 불가면 빈 문자열)"""
+    return f"query_cost:{fingerprint}"
+
+
+def rollup_build_lock_key(rollup_id: str) -> str:
+    """롤업 빌드 락 (값 = 빌드 토큰) — 워커 간 중복 빌드 방지"""
+    return f"rollup_build_lock:{rollup_id}"
+
+
+def datasource_watermark_key(datasource_id: str) -> str:
+    """데이터 소스 watermark 필드의 마지막 확인 값 — 값이 바뀌면 캐시 무효화 및 롤업 증분 갱신"""
+    return f"datasource_watermark:{datasource_id}"
+
+
+def distinct_values_key(datasource_id: str, field_id: str) -> str:
+    """드롭다운 필터 값 빈도 (ZSET, member = 값, score = 건수) — 빈도순 페이지 조회"""
+    return f"distinct_values:{datasource_id}:{field_id}"
+
+
+def distinct_values_lex_key(datasource_id: str, field_id: str) -> str:
+    """드롭다운 필터 값 접두어 검색용 (ZSET, score 0, member = 소문자 값 + NUL + 원래 값) — ZRANGEBYLEX"""
+    return f"distinct_values_lex:{datasource_id}:{field_id}"
+
+
+def distinct_values_meta_key(datasource_id: str, field_id: str) -> str:
+    """드롭다운 필터 값 인덱스 정보 (HASH: built_at, full_built_at, watermark, truncated)"""
+    return f"distinct_values_meta:{datasource_id}:{field_id}"
+
+
+def distinct_values_lock_key(datasource_id: str, field_id: str) -> str:
+    """드롭다운 필터 값 인덱스 빌드 락 (값 = 빌드 토큰) — 워커 간 중복 빌드 방지"""
+    return f"distinct_values_lock:{datasource_id}:{field_id}"
+
+
+def page_detail_key(page_id: str, version: int) -> str:
+    """페이지 상세(위젯 포함) 직렬화 결과 — version이 오르면 새 키를 쓰고 이전 키는 TTL로 만료"""
+    return f"page_detail:{page_id}:v{version}"
+
+
+def dashboard_detail_key(dashboard_id: str, version: int) -> str:
+    """대시보드 단건(페이지 목록 포함) 직렬화 결과 — version이 오르면 새 키를 쓰고 이전 키는 TTL로 만료"""
+    return f"dashboard_detail:{dashboard_id}:v{version}"
+
+
+def principal_invalidate_channel() -> str:
+    """사용자 Principal 캐시 무효화 pub/sub 채널 (메시지 = 쉼표로 구분한 user_id, 또는 전체 "*")"""
+    return "principal_invalidate"
+
+
+def datasource_access_key(user_id: str) -> str:
+    """사용자가 개별/그룹 권한으로 접근할 수 있는 datasource_id (SET, "_built" 포함)"""
+    return f"datasource_access:{user_id}"
+
+
+def datasource_access_stamp_key(user_id: str) -> str:
+    """접근 인덱스 변경 카운터 — 재계산 도중 변경이 있었는지 확인용"""
+    return f"datasource_access_stamp:{user_id}"
+
+
+def job_key(job_id: str) -> str:
+    """백그라운드 작업 본문 (JSON) — 대기열에는 작업 id만 들어감"""
+    return f"job:{job_id}"
+
+
+def job_ready_key() -> str:
+    """즉시 실행할 작업 id 대기열 (LIST, LPUSH → BLMOVE RIGHT)"""
+    return "jobs:ready"
+
+
+def job_delayed_key() -> str:
+    """재시도/지연 작업 (ZSET, score=실행 예정 시각) — 도래하면 jobs:ready로 이동"""
+    return "jobs:delayed"
+
+
+def job_dead_key() -> str:
+    """재시도 횟수를 모두 쓴 작업 id (LIST, 최근 것부터)"""
+    return "jobs:dead"
+
+
+def job_processing_key(worker_id: str) -> str:
+    """워커가 꺼내 실행 중인 작업 id (LIST) — 워커가 죽으면 jobs:ready로 되돌림"""
+    return f"jobs:processing:{worker_id}"
+
+
+def job_workers_key() -> str:
+    """작업 워커 id 집합 (SET) — 처리 중 목록 복구 대상 탐색용"""
+    return "jobs:workers"
+
+
+def job_worker_heartbeat_key(worker_id: str) -> str:
+    """워커 생존 신호 (TTL = JOB_HEARTBEAT_TTL)"""
+    return f"jobs:heartbeat:{worker_id}"
+
+
+def job_dedupe_key(dedupe: str) -> str:
+    """같은 작업 중복 등록 방지 (값 = 작업 id) — 작업이 끝나면 삭제"""
+    return f"job_dedupe:{dedupe}"
+
+
+def job_slots_key(datasource_id: str) -> str:
+    """데이터 소스별 동시 실행 슬롯 (ZSET, member=작업 id, score=슬롯 만료 시각)"""
+    return f"job_slots:{datasource_id}"
+
+
+def job_schedule_key(name: str, period: str) -> str:
+    """주기 작업 등록 여부 (SET NX) — 같은 주기에 워커 중 하나만 등록"""
+    return f"job_schedule:{name}:{period}"
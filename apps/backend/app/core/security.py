@@ -1,4 +1,6 @@
 """JWT 생성/검증 및 비밀번호 해싱 유틸리티"""
+import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -24,26 +26,48 @@ def verify_password(plain: str, hashed: str) -> bool:
 
 # ── JWT ───────────────────────────────────────────────────────────────────────
 
-def create_access_token(subject: str) -> str:
+@dataclass(frozen=True)
+class TokenClaims:
+    sub: str
+    type: str
+    exp: int                 # 만료 시각 (unix seconds)
+    sid: Optional[str]       # 로그인 세션 id — 로그아웃 시 이 값으로 세션의 모든 토큰을 폐기 (이전 버전 토큰에는 없음)
+
+
+def new_session_id() -> str:
+    return uuid.uuid4().hex
+
+
+def create_access_token(subject: str, session_id: Optional[str] = None) -> str:
     """Access Token (JWT, 15분)"""
     expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    payload = {"sub": subject, "exp": expire, "type": "access"}
+    payload = {"sub": subject, "exp": expire, "type": "access", "jti": uuid.uuid4().hex}
+    if session_id:
+        payload["sid"] = session_id
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
-def create_refresh_token(subject: str) -> str:
+def create_refresh_token(subject: str, session_id: str) -> str:
     """Refresh Token (JWT, 7일) — HttpOnly 쿠키에 저장"""
     expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    payload = {"sub": subject, "exp": expire, "type": "refresh"}
+    payload = {"sub": subject, "exp": expire, "type": "refresh", "jti": uuid.uuid4().hex, "sid": session_id}
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
-def decode_token(token: str, token_type: str = "access") -> Optional[str]:
-    """토큰 검증 후 subject(user_id) 반환. 유효하지 않으면 None."""
+def decode_claims(token: str) -> Optional[TokenClaims]:
+    """서명/만료 검증 후 클레임 반환. 유효하지 않으면 None."""
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        if payload.get("type") != token_type:
-            return None
-        return payload.get("sub")
     except JWTError:
         return None
+    if not payload.get("sub") or not payload.get("type") or "exp" not in payload:
+        return None
+    return TokenClaims(sub=payload["sub"], type=payload["type"], exp=int(payload["exp"]), sid=payload.get("sid"))
+
+
+def decode_token(token: str, token_type: str = "access") -> Optional[str]:
+    """토큰 검증 후 subject(user_id) 반환. 유효하지 않으면 None."""
+    claims = decode_claims(token)
+    if claims is None or claims.type != token_type:
+        return None
+    return claims.sub
@@ -0,0 +1,193 @@
+"""토큰 검증 빠른 경로 — 검증된 클레임 캐시 + 폐기된 세션 블룸 필터 (워커 프로세스별)
+
+요청마다 JWT 서명 검증(HMAC + base64/JSON 디코딩)을 반복하지 않도록, 검증을 통과한 토큰의 클레임을
+토큰 해시(sha256) 기준 LRU 캐시에 만료 시각까지 보관합니다.
+
+로그아웃하면 토큰의 세션 id(sid)를 Redis에 폐기 목록으로 남기고 pub/sub으로 알립니다.
+각 워커는 폐기된 sid를 메모리의 블룸 필터로 복제해 두고, 필터에 걸린 토큰만 Redis에서 실제 폐기 여부를
+확인합니다. 따라서 대부분의 요청은 네트워크 I/O 없이 인증이 끝납니다.
+
+- 필터는 JWT_REVOCATION_SYNC_INTERVAL마다 Redis의 폐기 목록(ZSET, score=만료 시각)으로 다시 만들어
+  만료된 sid를 비우고, 놓친 메시지를 보충합니다.
+- 구독이 끊겨 필터를 믿을 수 없는 동안에는 sid가 있는 모든 토큰을 Redis에서 확인합니다.
+- Redis 확인이 실패하면(장애) 모든 로그인 사용자를 거절하지 않도록 마지막으로 만든 필터와 토큰 만료 시각으로
+  판단하고, 이 상태를 로그와 lookflex_token_revocation_degraded_total 지표로 남깁니다.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import TOKEN_REVOCATION_DEGRADED
+from app.core.redis import get_redis, jwt_blacklist_key, jwt_revoked_index_key, jwt_revoke_channel
+from app.core.security import TokenClaims, decode_claims
+
+logger = logging.getLogger(__name__)
+
+
+# ── 검증된 클레임 캐시 ────────────────────────────────────────────────────────
+
+class ClaimsCache:
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, TokenClaims] = OrderedDict()
+
+    def get(self, digest: bytes) -> Optional[TokenClaims]:
+        claims = self._entries.get(digest)
+        if claims is None:
+            return None
+        if claims.exp <= time.time():
+            del self._entries[digest]
+            return None
+        self._entries.move_to_end(digest)
+        return claims
+
+    def put(self, digest: bytes, claims: TokenClaims) -> None:
+        self._entries[digest] = claims
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+claims_cache = ClaimsCache(settings.TOKEN_CLAIMS_CACHE_SIZE)
+
+
+# ── 폐기된 세션 블룸 필터 ──────────────────────────────────────────────────────
+
+class BloomFilter:
+    """거짓 양성만 있는 집합 — 포함되지 않는다고 하면 확실히 없음"""
+
+    def __init__(self, bits: int, hashes: int, members: Iterable[str] = ()) -> None:
+        self.bits = bits
+        self.hashes = hashes
+        self._array = bytearray((bits + 7) // 8)
+        for member in members:
+            self.add(member)
+
+    def _positions(self, member: str) -> Iterable[int]:
+        # 128비트 해시 하나를 둘로 나눠 double hashing (h1 + i * h2)
+        digest = hashlib.blake2b(member.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def add(self, member: str) -> None:
+        for pos in self._positions(member):
+            self._array[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, member: str) -> bool:
+        return all(self._array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(member))
+
+
+class RevocationFilter:
+    def __init__(self, bits: int, hashes: int) -> None:
+        self.bits = bits
+        self.hashes = hashes
+        self._bloom = BloomFilter(bits, hashes)
+        # Redis 목록으로 필터를 만든 뒤 구독이 유지되는 동안만 True — False면 필터를 믿지 않고 Redis 확인
+        self.ready = False
+
+    def add(self, session_id: str) -> None:
+        self._bloom.add(session_id)
+
+    def replace(self, session_ids: Iterable[str]) -> None:
+        self._bloom = BloomFilter(self.bits, self.hashes, session_ids)
+        self.ready = True
+
+    def might_contain(self, session_id: str) -> bool:
+        return not self.ready or session_id in self._bloom
+
+    def last_known(self, session_id: str) -> bool:
+        """ready와 무관하게 마지막으로 만든 필터(이후 받은 폐기 포함)로 본 포함 여부 — Redis 장애 시 대체 판단용"""
+        return session_id in self._bloom
+
+
+revocation_filter = RevocationFilter(settings.JWT_REVOCATION_BLOOM_BITS, settings.JWT_REVOCATION_BLOOM_HASHES)
+
+
+# ── 검증 / 폐기 ───────────────────────────────────────────────────────────────
+
+# Redis 확인 실패 후 아직 성공하지 못한 상태 — 경고 로그는 상태가 바뀔 때만 남김
+_degraded = False
+
+
+async def _is_revoked(claims: TokenClaims) -> bool:
+    global _degraded
+    try:
+        revoked = bool(await get_redis().exists(jwt_blacklist_key(claims.sid)))
+    except RedisError as exc:
+        revoked = revocation_filter.last_known(claims.sid) or claims.exp <= time.time()
+        TOKEN_REVOCATION_DEGRADED.labels("rejected" if revoked else "accepted").inc()
+        if not _degraded:
+            _degraded = True
+            logger.warning("토큰 폐기 여부 확인 실패, 마지막 폐기 필터로 판단: %s", exc)
+        return revoked
+    if _degraded:
+        _degraded = False
+        logger.info("토큰 폐기 여부 확인 복구")
+    return revoked
+
+
+async def verify_token(token: str, token_type: str = "access") -> Optional[TokenClaims]:
+    """서명/만료/종류/폐기 여부를 확인한 클레임. 유효하지 않으면 None."""
+    digest = hashlib.sha256(token.encode()).digest()
+    claims = claims_cache.get(digest)
+    if claims is None:
+        claims = decode_claims(token)
+        if claims is None:
+            return None
+        claims_cache.put(digest, claims)
+    if claims.type != token_type:
+        return None
+    if claims.sid and revocation_filter.might_contain(claims.sid) and await _is_revoked(claims):
+        return None
+    return claims
+
+
+async def revoke_session(session_id: str, expires_at: int) -> None:
+    """세션의 모든 토큰을 expires_at(unix seconds)까지 폐기하고 다른 워커에 알립니다."""
+    ttl = max(int(expires_at - time.time()), 1)
+    revocation_filter.add(session_id)
+    redis = get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.set(jwt_blacklist_key(session_id), "1", ex=ttl)
+        pipe.zadd(jwt_revoked_index_key(), {session_id: expires_at})
+        pipe.publish(jwt_revoke_channel(), session_id)
+        await pipe.execute()
+
+
+async def _reload() -> None:
+    redis = get_redis()
+    now = time.time()
+    await redis.zremrangebyscore(jwt_revoked_index_key(), "-inf", now)
+    revocation_filter.replace(await redis.zrangebyscore(jwt_revoked_index_key(), now, "+inf"))
+
+
+async def listen_revocations() -> None:
+    """폐기 구독 + 주기적 필터 재구성 루프 (lifespan에서 워커별로 실행)"""
+    interval = settings.JWT_REVOCATION_SYNC_INTERVAL
+    while True:
+        try:
+            async with get_redis().pubsub() as pubsub:
+                await pubsub.subscribe(jwt_revoke_channel())
+                # 구독 후에 목록을 읽어야 그 사이 폐기된 세션을 놓치지 않음
+                await _reload()
+                reloaded_at = time.monotonic()
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None and message["type"] == "message":
+                        revocation_filter.add(message["data"])
+                    if time.monotonic() - reloaded_at >= interval:
+                        await _reload()
+                        reloaded_at = time.monotonic()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("토큰 폐기 구독 오류, 재연결: %s", exc)
+            revocation_filter.ready = False
+            await asyncio.sleep(1)
@@ -0,0 +1,94 @@
+"""대시보드 / 페이지 / 차트 정의 버전 (SQLAlchemy 세션 이벤트)
+
+정의가 바뀌면 flush 직전에 소속 객체의 version을 올립니다. 조회 API는 이 값을 ETag와 Redis 직렬화 캐시 키로 씁니다.
+
+- 차트: 차트 행, 조건부 서식 / 규칙 변경
+- 페이지: 페이지 행, 소속 차트 추가·삭제·변경, 필터, 기본 필터 규칙, 차트 그룹 / 구성 변경
+- 대시보드: 대시보드 행, 소속 페이지 행 추가·삭제·변경 (대시보드 정의에는 페이지 목록만 있으므로 위젯 변경은 제외)
+
+버전은 `version = version + 1` SQL로 올려 동시에 수정해도 값이 겹치지 않고, eager_defaults로 UPDATE 결과를 바로 받아옵니다.
+ORM을 거치지 않는 일괄 UPDATE/DELETE는 version을 직접 올려야 합니다. (이벤트는 이 모듈을 import하면 등록됨)
+"""
+import uuid
+from typing import Any
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from app.db.models.chart import Chart, ChartGroup, ChartGroupItem
+from app.db.models.dashboard import Dashboard, Page
+from app.db.models.filter import DefaultFilterRule, Filter
+from app.db.models.formatting import ConditionalFormat, ConditionalFormatRule
+
+_PAGE_WIDGETS = (Filter, DefaultFilterRule, ChartGroup)
+
+
+def _parent_ids(obj: Any, fk: str, relationship: str) -> list[uuid.UUID]:
+    """현재 값 + 이번 flush에서 바뀌기 전 값 (다른 부모로 옮겨진 경우 양쪽 모두 갱신)
+
+    관계로만 연결되어 외래 키가 아직 비어 있으면 이미 설정된 부모 객체의 id를 씁니다.
+    (부모도 새 객체면 version이 처음부터 1이므로 건너뜀, lazy load는 하지 않음)
+    """
+    history = inspect(obj).attrs[fk].history
+    ids = [v for v in [getattr(obj, fk), *history.deleted] if v is not None]
+    parent = obj.__dict__.get(relationship)
+    if not ids and parent is not None and parent.id is not None:
+        ids.append(parent.id)
+    return ids
+
+
+def _changed_ids(session: Session) -> tuple[set[uuid.UUID], set[uuid.UUID], set[uuid.UUID]]:
+    """이번 flush로 version을 올릴 (dashboard_ids, page_ids, chart_ids)"""
+    dashboard_ids: set[uuid.UUID] = set()
+    page_ids: set[uuid.UUID] = set()
+    chart_ids: set[uuid.UUID] = set()
+    format_chart_ids: set[uuid.UUID] = set()   # 조건부 서식이 바뀐 차트 (소속 페이지는 조회 필요)
+    format_ids: set[uuid.UUID] = set()
+    group_ids: set[uuid.UUID] = set()
+
+    for obj in [*session.new, *session.dirty, *session.deleted]:
+        dirty = obj not in session.new and obj not in session.deleted
+        if dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        if isinstance(obj, Dashboard):
+            if dirty:
+                dashboard_ids.add(obj.id)
+        elif isinstance(obj, Page):
+            if dirty:
+                page_ids.add(obj.id)
+            dashboard_ids.update(_parent_ids(obj, "dashboard_id", "dashboard"))
+        elif isinstance(obj, Chart):
+            if dirty:
+                chart_ids.add(obj.id)
+            page_ids.update(_parent_ids(obj, "page_id", "page"))
+        elif isinstance(obj, _PAGE_WIDGETS):
+            page_ids.update(_parent_ids(obj, "page_id", "page"))
+        elif isinstance(obj, ConditionalFormat):
+            format_chart_ids.update(_parent_ids(obj, "chart_id", "chart"))
+        elif isinstance(obj, ConditionalFormatRule):
+            format_ids.update(_parent_ids(obj, "format_id", "format"))
+        elif isinstance(obj, ChartGroupItem):
+            group_ids.update(_parent_ids(obj, "chart_group_id", "chart_group"))
+
+    if format_ids:
+        format_chart_ids.update(
+            session.scalars(select(ConditionalFormat.chart_id).where(ConditionalFormat.id.in_(format_ids)))
+        )
+    if format_chart_ids:
+        chart_ids.update(format_chart_ids)
+        page_ids.update(session.scalars(select(Chart.page_id).where(Chart.id.in_(format_chart_ids))))
+    if group_ids:
+        page_ids.update(session.scalars(select(ChartGroup.page_id).where(ChartGroup.id.in_(group_ids))))
+    return dashboard_ids, page_ids, chart_ids
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_versions(session: Session, flush_context, instances) -> None:
+    with session.no_autoflush:
+        dashboard_ids, page_ids, chart_ids = _changed_ids(session)
+        for model, ids in ((Dashboard, dashboard_ids), (Page, page_ids), (Chart, chart_ids)):
+            if not ids:
+                continue
+            for obj in session.scalars(select(model).where(model.id.in_(ids))):
+                if obj not in session.deleted:
+                    obj.version = model.version + 1
@@ -12,11 +12,17 @@ from app.db.models.enums import (  # noqa: F401
     GroupType,
     NotificationType,
     Role,
+    RollupStatus,
     SortDir,
 )
 from app.db.models.user import Group, RegisterRequest, User, user_group  # noqa: F401
 from app.db.models.dashboard import Dashboard, DashboardFavorite, Page, PageFavorite  # noqa: F401
-from app.db.models.datasource import DataSource, DataSourceField, DataSourcePermission  # noqa: F401
+from app.db.models.datasource import (  # noqa: F401
+    DataSource,
+    DataSourceField,
+    DataSourcePermission,
+    DataSourceRollup,
+)
 from app.db.models.chart import Chart, ChartGroup, ChartGroupItem  # noqa: F401
 from app.db.models.filter import DefaultFilterRule, Filter  # noqa: F401
 from app.db.models.formatting import ConditionalFormat, ConditionalFormatRule  # noqa: F401
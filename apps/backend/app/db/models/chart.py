@@ -45,11 +45,16 @@ class Chart(Base):
     config: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, default=dict)
     # 스타일 설정 (header, body, totalsRow, border 등)
     style: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, default=dict)
+    # 정의(자신 + 하위 위젯)가 바뀔 때마다 DB에서 1씩 증가 — ETag / 직렬화 캐시 키로 사용
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
+    # version 증가(SQL 식)와 onupdate 값을 UPDATE ... RETURNING으로 바로 받아 만료되지 않게 함
+    __mapper_args__ = {"eager_defaults": True}
+
     # relationships
     page: Mapped["Page"] = relationship("Page", back_populates="charts")
     datasource: Mapped[Optional["DataSource"]] = relationship("DataSource")
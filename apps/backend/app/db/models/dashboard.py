@@ -20,7 +20,7 @@ from app.db.base import Base
 if TYPE_CHECKING:
     from app.db.models.user import User
     from app.db.models.chart import Chart
-    from app.db.models.filter import Filter
+    from app.db.models.filter import DefaultFilterRule, Filter
 
 
 class Dashboard(Base):
@@ -34,11 +34,16 @@ class Dashboard(Base):
     owner_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
+    # 정의(자신 + 하위 위젯)가 바뀔 때마다 DB에서 1씩 증가 — ETag / 직렬화 캐시 키로 사용
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
+    # version 증가(SQL 식)와 onupdate 값을 UPDATE ... RETURNING으로 바로 받아 만료되지 않게 함
+    __mapper_args__ = {"eager_defaults": True}
+
     # relationships
     owner: Mapped["User"] = relationship("User", foreign_keys=[owner_id])
     pages: Mapped[List["Page"]] = relationship(
@@ -65,11 +70,16 @@ class Page(Base):
     owner_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
+    # 정의(자신 + 하위 위젯)가 바뀔 때마다 DB에서 1씩 증가 — ETag / 직렬화 캐시 키로 사용
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
+    # version 증가(SQL 식)와 onupdate 값을 UPDATE ... RETURNING으로 바로 받아 만료되지 않게 함
+    __mapper_args__ = {"eager_defaults": True}
+
     # relationships
     dashboard: Mapped[Optional["Dashboard"]] = relationship("Dashboard", back_populates="pages")
     owner: Mapped["User"] = relationship("User", foreign_keys=[owner_id])
@@ -79,6 +89,9 @@ class Page(Base):
     filters: Mapped[List["Filter"]] = relationship(
         "Filter", back_populates="page", cascade="all, delete-orphan"
     )
+    default_filter_rules: Mapped[List["DefaultFilterRule"]] = relationship(
+        "DefaultFilterRule", back_populates="page", cascade="all, delete-orphan"
+    )
     favorites: Mapped[List["PageFavorite"]] = relationship(
         "PageFavorite", back_populates="page", cascade="all, delete-orphan"
     )
@@ -17,7 +17,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
-from app.db.models.enums import AggregateType, DSSourceType, FieldType
+from app.db.models.enums import AggregateType, DSSourceType, FieldType, RollupStatus
 
 if TYPE_CHECKING:
     from app.db.models.user import User, Group
@@ -36,6 +36,10 @@ class DataSource(Base):
     connection_config: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     # True이면 모든 사용자에게 접근 허용
     allow_all: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    # 차트 결과 캐시 TTL (초). NULL이면 CHART_CACHE_TTL 기본값, 0이면 캐시 미사용
+    cache_ttl: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # 증분 갱신 기준 필드 (DATE/DATETIME, 값이 계속 증가하는 추가 전용 컬럼). NULL이면 항상 전체 재계산
+    watermark_field: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     created_by_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
@@ -52,6 +56,9 @@ class DataSource(Base):
     permissions: Mapped[List["DataSourcePermission"]] = relationship(
         "DataSourcePermission", back_populates="datasource", cascade="all, delete-orphan"
     )
+    rollups: Mapped[List["DataSourceRollup"]] = relationship(
+        "DataSourceRollup", back_populates="datasource", cascade="all, delete-orphan"
+    )
 
 
 class DataSourceField(Base):
@@ -98,3 +105,40 @@ class DataSourcePermission(Base):
     __table_args__ = (
         UniqueConstraint("datasource_id", "entity_type", "entity_id", name="uq_ds_permission"),
     )
+
+
+class DataSourceRollup(Base):
+    """사전 집계 테이블 — 차원 조합별 지표 부분 집계를 로컬 Arrow 파일로 보관"""
+
+    __tablename__ = "datasource_rollups"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    datasource_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("datasources.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    # 차원 field_id 목록
+    dimensions: Mapped[list] = mapped_column(JSONB, nullable=False)
+    # [{"field_id": "...", "aggregate": "SUM"}, ...]
+    metrics: Mapped[list] = mapped_column(JSONB, nullable=False)
+    # 재빌드 주기 (초). NULL이면 ROLLUP_REFRESH_INTERVAL 기본값
+    refresh_interval: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    status: Mapped[RollupStatus] = mapped_column(Enum(RollupStatus), nullable=False, default=RollupStatus.PENDING)
+    # 마지막으로 빌드에 성공한 파일 (DATASOURCE_FILE_DIR 기준 상대 경로)
+    storage_key: Mapped[Optional[str]] = mapped_column(String(300), nullable=True)
+    row_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    built_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # 마지막 전체 빌드 시각 — ROLLUP_FULL_REFRESH_INTERVAL이 지나면 증분 대신 전체 재계산
+    full_built_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # 롤업에 반영된 원본 watermark 필드 최댓값 (ISO 8601) — 다음 증분 빌드의 시작점
+    watermark: Mapped[Optional[str]] = mapped_column(String(40), nullable=True)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    # relationships
+    datasource: Mapped["DataSource"] = relationship("DataSource", back_populates="rollups")
+
+    __table_args__ = (UniqueConstraint("datasource_id", "name", name="uq_datasource_rollup_name"),)
@@ -47,6 +47,13 @@ class AggregateType(str, enum.Enum):
     NONE = "NONE"
 
 
+class RollupStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    BUILDING = "BUILDING"
+    READY = "READY"
+    FAILED = "FAILED"
+
+
 class ChartType(str, enum.Enum):
     TABLE = "TABLE"
     PIVOT = "PIVOT"
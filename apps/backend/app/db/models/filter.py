@@ -75,5 +75,5 @@ class DefaultFilterRule(Base):
     value: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # relationships
-    page: Mapped["Page"] = relationship("Page")
+    page: Mapped["Page"] = relationship("Page", back_populates="default_filter_rules")
     datasource: Mapped["DataSource"] = relationship("DataSource")
@@ -0,0 +1 @@
+"""차트 데이터 쿼리 엔진 — 차트 설정을 원본 DB용 SQL로 컴파일하고 실행합니다."""
@@ -0,0 +1,113 @@
+"""차트 조회 수용 제어 — 실행 전 비용 추정으로 과도한 쿼리를 미루거나 거절
+
+결과 캐시 미스로 원본을 실제로 읽어야 하는 쿼리만 대상입니다. (롤업으로 계산 가능한 쿼리는 그 전에 롤업으로 빠짐)
+
+- 원본 DB: 옵티마이저 계획의 예상 처리 행 수 (PostgreSQL / MySQL EXPLAIN, MSSQL SHOWPLAN, BigQuery dry run)
+- 업로드 파일: 조건(필터)을 적용한 행 수
+
+요청한 사용자 역할의 예산(QUERY_COST_BUDGET_*)과 비교해
+
+- 예산 이하: 그대로 실행
+- 예산 초과 ~ 예산 × QUERY_COST_REJECT_FACTOR: 백그라운드 우선순위로 실행 — 일반 조회에 슬롯을 양보하고
+  데이터 소스 슬롯의 QUERY_BACKGROUND_SHARE까지만 사용 (업로드 파일은 대기열이 없어 그대로 실행)
+- 그 이상: 422 QUERY_TOO_EXPENSIVE
+
+추정은 참고 정보라 실패하면(드라이버 미지원, 시간 초과 등) 예산 이하로 보고 실행합니다.
+"""
+import logging
+from typing import Any, Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import query_cost_key
+from app.db.models.datasource import DataSource
+from app.db.models.enums import Role
+from app.engine import executor
+from app.engine.compiler import CompiledQuery
+from app.engine.errors import QueryEngineError
+from app.engine.governor import QueryPriority, current_priority
+from app.engine.local import filter_table, run_on_table
+from app.engine.spec import ChartQuery
+
+logger = logging.getLogger(__name__)
+
+
+def cost_budget(role: Role) -> int:
+    """역할별 예상 처리 행 수 예산 — 0이면 제한 없음"""
+    if role == Role.VIEWER:
+        return settings.QUERY_COST_BUDGET_VIEWER
+    if role == Role.EDITOR:
+        return settings.QUERY_COST_BUDGET_EDITOR
+    return settings.QUERY_COST_BUDGET_ADMIN
+
+
+def _too_expensive(estimate: float, limit: float) -> QueryEngineError:
+    return QueryEngineError(
+        "QUERY_TOO_EXPENSIVE",
+        f"예상 처리 행 수(약 {estimate:,.0f}행)가 허용 한도({limit:,.0f}행)를 넘어 실행할 수 없습니다. "
+        "필터로 범위를 좁히거나 차원을 줄여주세요.",
+        status_code=422,
+    )
+
+
+async def _estimate_cached(
+    redis: aioredis.Redis, datasource: DataSource, fingerprint: str, compiled: CompiledQuery
+) -> Optional[float]:
+    """같은 fingerprint의 추정은 QUERY_COST_CACHE_TTL 동안 재사용 (추정 불가 결과도 캐시)
+
+    Redis 오류 시 캐시 없이 매번 추정합니다.
+    """
+    key = query_cost_key(fingerprint)
+    try:
+        cached = await redis.get(key)
+    except RedisError as exc:
+        logger.warning("쿼리 비용 추정 캐시 조회 실패: %s", exc)
+        cached = None
+    if cached is not None:
+        return float(cached) if cached else None
+    estimate = await executor.estimate(datasource, compiled)
+    try:
+        await redis.set(key, "" if estimate is None else repr(estimate), ex=settings.QUERY_COST_CACHE_TTL)
+    except RedisError as exc:
+        logger.warning("쿼리 비용 추정 캐시 저장 실패: %s", exc)
+    return estimate
+
+
+async def admit_query(
+    redis: aioredis.Redis, datasource: DataSource, fingerprint: str, compiled: CompiledQuery, role: Role
+) -> QueryPriority:
+    """원본 DB 쿼리의 실행 우선순위 — 거절 대상이면 QueryEngineError"""
+    budget = cost_budget(role)
+    if not budget:
+        return current_priority()
+    estimate = await _estimate_cached(redis, datasource, fingerprint, compiled)
+    if estimate is None or estimate <= budget:
+        return current_priority()
+    limit = budget * settings.QUERY_COST_REJECT_FACTOR
+    if estimate > limit:
+        raise _too_expensive(estimate, limit)
+    logger.info(
+        "데이터 소스 %s 쿼리 예상 처리 행 수 %.0f가 %s 예산 %d 초과 — 백그라운드 우선순위로 실행",
+        datasource.id, estimate, role.value, budget,
+    )
+    return QueryPriority.BACKGROUND
+
+
+def _matched_rows(table: Any, query: ChartQuery, limit: float) -> int:
+    # 전체 행 수가 한도 이하면 조건을 평가할 필요 없음
+    if table.num_rows <= limit or not query.predicates:
+        return table.num_rows
+    return filter_table(table, query, []).num_rows
+
+
+async def admit_local(datasource: DataSource, query: ChartQuery, role: Role) -> None:
+    """업로드 파일 쿼리 — 조건을 통과하는 행 수가 거절 한도를 넘으면 QueryEngineError"""
+    budget = cost_budget(role)
+    if not budget:
+        return
+    limit = budget * settings.QUERY_COST_REJECT_FACTOR
+    rows = await run_on_table(datasource, lambda table: _matched_rows(table, query, limit))
+    if rows > limit:
+        raise _too_expensive(rows, limit)
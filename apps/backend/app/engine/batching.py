@@ -0,0 +1,113 @@
+"""여러 차트 쿼리를 최소 개수의 원본 쿼리로 병합
+
+같은 데이터 소스 + 같은 그룹 컬럼 + 같은 조건/정렬/페이지를 가진 집계 차트는
+지표만 합친 하나의 쿼리로 실행하고, 결과에서 차트별 컬럼만 잘라 돌려줍니다.
+(예: 같은 필터가 걸린 스코어카드 10개 → 쿼리 1개)
+"""
+import uuid
+from dataclasses import dataclass, field
+from typing import Hashable
+
+from app.engine.compiler import ChartResult
+from app.engine.spec import ChartQuery, QueryField
+
+
+@dataclass
+class MergeMember:
+    chart_id: uuid.UUID
+    # 병합 쿼리 columns 기준 인덱스 (차트 원래 컬럼 순서)
+    indexes: list[int]
+    with_totals: bool
+
+
+@dataclass
+class MergedQuery:
+    datasource_id: uuid.UUID
+    query: ChartQuery
+    members: list[MergeMember] = field(default_factory=list)
+
+
+def _column_key(col: QueryField) -> tuple:
+    return col.field_id, col.aggregate
+
+
+def _merge_key(datasource_id: uuid.UUID, chart_id: uuid.UUID, query: ChartQuery) -> Hashable:
+    if not query.is_grouped:
+        # 원본 행 조회는 컬럼 구성이 곧 결과 행 구성이므로 병합하지 않음
+        return ("raw", chart_id)
+    group = tuple(_column_key(c) for c in query.group_fields)
+    preds = tuple(sorted(repr(p) for p in query.predicates))
+    if not group:
+        # 차원 없는 집계(스코어카드 등)는 항상 1행 — 정렬/페이지 무관
+        return ("scalar", datasource_id, preds)
+    sort = []
+    for key in query.sort:
+        idx = query.find_column(key.field_id)
+        sort.append((_column_key(query.columns[idx]) if idx is not None else key.field_id, key.direction))
+    return ("grouped", datasource_id, group, preds, tuple(sort), query.limit, query.offset)
+
+
+def _sort_resolves_same(merged: ChartQuery, query: ChartQuery) -> bool:
+    """field_id 기준 정렬이 병합 쿼리에서도 같은 (필드, 집계) 컬럼을 가리키는지 확인"""
+    for key in query.sort:
+        a, b = merged.find_column(key.field_id), query.find_column(key.field_id)
+        if a is None or b is None or _column_key(merged.columns[a]) != _column_key(query.columns[b]):
+            return False
+    return True
+
+
+def merge_chart_queries(items: list[tuple[uuid.UUID, uuid.UUID, ChartQuery]]) -> list[MergedQuery]:
+    """(chart_id, datasource_id, ChartQuery) 목록을 병합 쿼리 목록으로 묶습니다."""
+    groups: dict[Hashable, list[MergedQuery]] = {}
+    merged_list: list[MergedQuery] = []
+
+    for chart_id, datasource_id, query in items:
+        key = _merge_key(datasource_id, chart_id, query)
+        target = None
+        for candidate in groups.get(key, []):
+            if _sort_resolves_same(candidate.query, query):
+                target = candidate
+                break
+
+        if target is None:
+            target = MergedQuery(
+                datasource_id=datasource_id,
+                query=ChartQuery(
+                    source_config=query.source_config,
+                    dimensions=list(query.dimensions),
+                    metrics=[],
+                    predicates=list(query.predicates),
+                    sort=list(query.sort),
+                    limit=query.limit,
+                    offset=query.offset,
+                    with_totals=False,
+                ),
+            )
+            groups.setdefault(key, []).append(target)
+            merged_list.append(target)
+
+        merged = target.query
+        positions = {_column_key(c): i for i, c in enumerate(merged.columns)}
+        indexes = []
+        for col in query.columns:
+            ck = _column_key(col)
+            if ck not in positions:
+                merged.metrics.append(col)
+                positions[ck] = len(merged.columns) - 1
+            indexes.append(positions[ck])
+        merged.with_totals = merged.with_totals or query.with_totals
+        target.members.append(MergeMember(chart_id=chart_id, indexes=indexes, with_totals=query.with_totals))
+
+    return merged_list
+
+
+def project_result(result: ChartResult, member: MergeMember, columns: list[QueryField]) -> ChartResult:
+    """병합 결과에서 차트 한 개의 컬럼만 잘라냅니다. columns는 차트 원래 컬럼(라벨 유지용)."""
+    idx = member.indexes
+    return ChartResult(
+        columns=columns,
+        rows=[[row[i] for i in idx] for row in result.rows],
+        totals=[result.totals[i] for i in idx] if member.with_totals and result.totals is not None else None,
+        total=result.total,
+        queried_at=result.queried_at,
+    )
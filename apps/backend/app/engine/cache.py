@@ -0,0 +1,152 @@
+"""Redis 기반 차트 결과 캐시
+
+키는 (datasource_id, 컴파일된 SQL, 바인드 값) 정규화 해시입니다. 정렬/페이지는
+SQL의 ORDER BY / LIMIT / OFFSET에 이미 포함되므로 별도로 넣지 않아도 구분됩니다.
+
+캐시는 부가 기능이라 Redis 오류 시 조회는 미스, 저장은 건너뜀으로 처리하고 원본 조회는 계속합니다.
+"""
+import hashlib
+import json
+import logging
+import time
+import uuid
+from collections import Counter
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import chart_cache_index_key, chart_cache_key, chart_cache_stats_key
+from app.db.models.datasource import DataSource
+from app.engine.compiler import ChartResult, CompiledQuery
+
+logger = logging.getLogger(__name__)
+
+# 워커별로 아직 Redis에 반영하지 않은 hit/miss 수 — (datasource_id, 필드) → 건수
+# 다음 조회의 GET과 같은 파이프라인으로 보내 조회마다 왕복을 늘리지 않음 (통계는 조회 1번만큼 늦게 반영)
+_pending_stats: Counter[tuple[str, str]] = Counter()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Unsupported type: {type(value).__name__}")
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, default=_json_default, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def query_fingerprint(datasource_id: uuid.UUID, compiled: CompiledQuery) -> str:
+    """동일한 원본 쿼리를 가리키는 요청이면 같은 값이 나오는 정규화 해시"""
+    # 바인드 값에는 타입 태그를 붙여 "1"(문자열)과 1(숫자)이 충돌하지 않도록 함
+    params = [[type(p).__name__, p] for p in compiled.params]
+    payload = _canonical([str(datasource_id), compiled.dialect, compiled.sql, params])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def cache_ttl(datasource: DataSource) -> int:
+    return settings.CHART_CACHE_TTL if datasource.cache_ttl is None else datasource.cache_ttl
+
+
+def encode_result(result: ChartResult) -> str:
+    return _canonical({
+        "rows": result.rows,
+        "totals": result.totals,
+        "total": result.total,
+        "queried_at": result.queried_at,
+    })
+
+
+def decode_result(raw: str, compiled: CompiledQuery) -> ChartResult:
+    data = json.loads(raw)
+    return ChartResult(
+        columns=compiled.columns,
+        rows=data["rows"],
+        totals=data["totals"],
+        total=data["total"],
+        queried_at=datetime.fromisoformat(data["queried_at"]),
+    )
+
+
+class ChartResultCache:
+    def __init__(self, redis: aioredis.Redis) -> None:
+        self.redis = redis
+
+    async def get(self, datasource: DataSource, fingerprint: str, compiled: CompiledQuery) -> Optional[ChartResult]:
+        if cache_ttl(datasource) <= 0:
+            return None
+        flushed = dict(_pending_stats)
+        _pending_stats.clear()
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(chart_cache_key(fingerprint))
+                for (ds_id, field), count in flushed.items():
+                    pipe.hincrby(chart_cache_stats_key(ds_id), field, count)
+                raw, *_ = await pipe.execute()
+        except RedisError as exc:
+            _pending_stats.update(flushed)
+            logger.warning("차트 캐시 조회 실패, 원본에서 조회: %s", exc)
+            return None
+        _pending_stats[(str(datasource.id), "hits" if raw else "misses")] += 1
+        if raw is None:
+            return None
+        return decode_result(raw, compiled)
+
+    async def set(self, datasource: DataSource, fingerprint: str, result: ChartResult) -> bool:
+        """결과를 저장하고 데이터 소스별 항목 수 상한을 넘으면 오래된 항목부터 제거합니다.
+
+        Redis 오류 시 저장하지 않고 False를 반환합니다.
+        """
+        ttl = cache_ttl(datasource)
+        if ttl <= 0:
+            return False
+        payload = encode_result(result)
+        if len(payload) > settings.CHART_CACHE_MAX_BYTES:
+            return False
+        try:
+            await self._store(datasource, fingerprint, payload, ttl)
+        except RedisError as exc:
+            logger.warning("차트 캐시 저장 실패: %s", exc)
+            return False
+        return True
+
+    async def _store(self, datasource: DataSource, fingerprint: str, payload: str, ttl: int) -> None:
+        key = chart_cache_key(fingerprint)
+        index_key = chart_cache_index_key(str(datasource.id))
+        now = time.time()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(key, payload, ex=ttl)
+            pipe.zadd(index_key, {key: now})
+            # TTL로 이미 만료된 키는 인덱스에서도 정리
+            pipe.zremrangebyscore(index_key, "-inf", now - ttl)
+            pipe.expire(index_key, ttl)
+            pipe.zcard(index_key)
+            *_, size = await pipe.execute()
+
+        overflow = size - settings.CHART_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            evicted = await self.redis.zpopmin(index_key, overflow)
+            if evicted:
+                await self.redis.delete(*(k for k, _ in evicted))
+
+    async def invalidate_datasource(self, datasource_id: uuid.UUID) -> int:
+        """데이터 소스 변경/동기화 시 해당 소스의 캐시를 모두 삭제합니다."""
+        index_key = chart_cache_index_key(str(datasource_id))
+        keys = await self.redis.zrange(index_key, 0, -1)
+        if keys:
+            await self.redis.delete(*keys)
+        await self.redis.delete(index_key)
+        return len(keys)
+
+    async def stats(self, datasource_id: uuid.UUID) -> dict[str, int]:
+        raw = await self.redis.hgetall(chart_cache_stats_key(str(datasource_id)))
+        entries = await self.redis.zcard(chart_cache_index_key(str(datasource_id)))
+        return {"hits": int(raw.get("hits", 0)), "misses": int(raw.get("misses", 0)), "entries": entries}
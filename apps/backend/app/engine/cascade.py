@@ -0,0 +1,155 @@
+"""연쇄 필터 — 현재 선택 값으로 같은 데이터 소스의 다른 드롭다운 값 목록 좁히기
+
+드롭다운마다 "자기 선택을 뺀 나머지 선택 + 기본 필터"를 만족하는 행의 (값, 건수)를 구합니다.
+(자기 선택까지 적용하면 이미 고른 값 외에는 다시 고를 수 없게 되므로 제외)
+
+- 원본 DB: 드롭다운별 GROUP BY를 UNION ALL로 묶은 SELECT 1개 — 왕복 1번, 차트 결과 캐시/single-flight 공유
+- 업로드 파일: 선택 조건별 마스크를 한 번만 계산해 드롭다운마다 AND 조합만 바꿔 value_counts
+
+결과는 ChartResult 행 [slot, 값, 건수] 목록입니다. slot은 CascadeQuery.targets 인덱스입니다.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from app.db.models.enums import AggregateType, FieldType
+from app.engine.columnar import require_arrow
+from app.engine.compiler import ChartResult, CompiledQuery
+from app.engine.dialects import Dialect, ParamBinder
+from app.engine.distinct import encode_value
+from app.engine.errors import QueryEngineError
+from app.engine.predicates import coerce_value, compile_arrow_predicate, compile_sql_predicate
+from app.engine.spec import Predicate, QueryField
+
+RESULT_COLUMNS = [
+    QueryField("slot", "slot", FieldType.NUMBER),
+    QueryField("value", "value", FieldType.TEXT),
+    QueryField("count", "count", FieldType.NUMBER),
+]
+
+
+@dataclass(frozen=True)
+class CascadeTarget:
+    field: QueryField
+    # 이 드롭다운 자신의 선택 조건 (CascadeQuery.selections 인덱스) — 없으면 None
+    own: Optional[int] = None
+
+
+@dataclass
+class CascadeQuery:
+    source_config: dict
+    # 항상 적용되는 조건 (페이지 기본 필터)
+    base: list[Predicate]
+    # 현재 선택 값 조건 — 드롭다운마다 자기 선택만 빼고 적용
+    selections: list[Predicate]
+    targets: list[CascadeTarget]
+    # 드롭다운별 최대 값 수 (건수 내림차순)
+    limit: int
+
+    def predicates(self, target: CascadeTarget) -> list[Predicate]:
+        return [*self.base, *(p for i, p in enumerate(self.selections) if i != target.own)]
+
+
+@dataclass
+class CompiledCascade(CompiledQuery):
+    """UNION ALL 결과 (slot, 텍스트 값, 건수)를 ChartResult로 바꾸는 컴파일 결과"""
+
+    field_types: list[FieldType] = field(default_factory=list)
+
+    def decode(self, raw_rows: list[tuple]) -> ChartResult:
+        rows = [[int(slot), _normalize(value, self.field_types[int(slot)]), int(n)] for slot, value, n in raw_rows]
+        return ChartResult(columns=self.columns, rows=rows, totals=None, total=len(rows))
+
+
+def _normalize(value: Any, field_type: FieldType) -> str:
+    """방언별 텍스트 캐스팅 결과(1.50, 2026-02-01 00:00:00 등)를 값 인덱스와 같은 표기로 맞춤"""
+    if field_type == FieldType.TEXT:
+        return str(value)
+    try:
+        return encode_value(coerce_value(value, field_type))
+    except QueryEngineError:
+        return str(value)
+
+
+def compile_cascade_query(query: CascadeQuery, dialect: Dialect) -> CompiledCascade:
+    """드롭다운별 상위 limit + 1개(잘림 판별용) GROUP BY를 UNION ALL로 묶습니다.
+
+    값 컬럼은 드롭다운마다 타입이 달라 UNION이 가능하도록 텍스트로 캐스팅합니다.
+    """
+    q = dialect.quote
+    binder = ParamBinder(dialect)
+    source = dialect.source(query.source_config)
+
+    def column(field_id: str) -> str:
+        return f"{q('src')}.{q(field_id)}"
+
+    # 건수 내림차순, 같으면 값 순 — 잘림 경계가 실행마다 바뀌지 않도록
+    order_by = f"{q('c2')} DESC, {q('c1')} ASC"
+    branches = []
+    for slot, target in enumerate(query.targets):
+        expr = column(target.field.field_id)
+        conds = [compile_sql_predicate(p, dialect, binder, column) for p in query.predicates(target)]
+        conds.append(f"{expr} IS NOT NULL")
+        inner = (
+            f"SELECT {slot} AS {q('c0')}, {dialect.as_text(expr, target.field.type)} AS {q('c1')}, "
+            f"{dialect.aggregate(AggregateType.COUNT, expr)} AS {q('c2')} "
+            f"FROM {source} WHERE {' AND '.join(conds)} GROUP BY {expr}"
+            f"{dialect.paginate(order_by, query.limit + 1, 0)}"
+        )
+        branches.append(f"SELECT {q('c0')}, {q('c1')}, {q('c2')} FROM ({inner}) {dialect.alias(f'b{slot}')}")
+
+    return CompiledCascade(
+        sql=" UNION ALL ".join(branches),
+        params=binder.params,
+        dialect=dialect.name,
+        columns=RESULT_COLUMNS,
+        total_indexes=[],
+        with_totals=False,
+        field_types=[t.field.type for t in query.targets],
+    )
+
+
+def execute_cascade_local(table: Any, query: CascadeQuery) -> ChartResult:
+    """업로드 파일 — 조건 마스크는 조건마다 1번만 계산하고 드롭다운별로 조합만 바꿉니다."""
+    pa, pc = require_arrow()
+    names = set(table.column_names)
+    for field_id in {t.field.field_id for t in query.targets} | {p.field_id for p in (*query.base, *query.selections)}:
+        if field_id not in names:
+            raise QueryEngineError("INVALID_FIELD", f"업로드된 데이터에 '{field_id}' 컬럼이 없습니다.")
+
+    def and_all(masks: list[Any]) -> Any:
+        mask = None
+        for part in masks:
+            if part is not None:
+                mask = part if mask is None else pc.and_(mask, part)
+        return mask
+
+    base = and_all([compile_arrow_predicate(p, table.column) for p in query.base])
+    selections = [compile_arrow_predicate(p, table.column) for p in query.selections]
+
+    rows: list[list[Any]] = []
+    for slot, target in enumerate(query.targets):
+        mask = and_all([base, *(m for i, m in enumerate(selections) if i != target.own)])
+        values = table.column(target.field.field_id)
+        if mask is not None:
+            values = values.filter(mask)
+        counts = pc.value_counts(values)
+        counted = pa.table({"v": counts.field("values"), "n": counts.field("counts")})
+        counted = counted.filter(pc.is_valid(counted["v"]))
+        order = pc.sort_indices(counted, sort_keys=[("n", "descending"), ("v", "ascending")])
+        top = counted.take(order.slice(0, query.limit + 1))
+        rows.extend(
+            [slot, encode_value(v), n] for v, n in zip(top["v"].to_pylist(), top["n"].to_pylist())
+        )
+    return ChartResult(columns=RESULT_COLUMNS, rows=rows, totals=None, total=len(rows))
+
+
+def split_result(result: ChartResult, query: CascadeQuery) -> list[tuple[list[tuple[str, int]], bool]]:
+    """slot별 ((값, 건수) 목록, 잘림 여부) — 건수 내림차순, 같으면 값 순"""
+    grouped: list[list[tuple[str, int]]] = [[] for _ in query.targets]
+    for slot, value, count in result.rows:
+        grouped[int(slot)].append((value, int(count)))
+    out = []
+    for values in grouped:
+        values.sort(key=lambda item: (-item[1], item[0]))
+        out.append((values[:query.limit], len(values) > query.limit))
+    return out
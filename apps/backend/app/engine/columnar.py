@@ -0,0 +1,423 @@
+"""업로드 파일(CSV/Excel) 데이터 소스의 컬럼 저장소
+
+업로드 파일은 한 번만 파싱해 DATASOURCE_FILE_DIR 아래 Arrow IPC 파일(비압축)로 저장합니다.
+IPC 파일은 메모리 맵으로 열면 복사 없이 컬럼 버퍼를 그대로 사용할 수 있어,
+이후 쿼리는 스프레드시트를 다시 읽지 않고 pyarrow.compute 벡터 연산으로 처리합니다.
+
+- CSV: 2패스 스트리밍 — 1패스에서 배치별로 컬럼 타입을 추론하고, 2패스에서 확정 타입으로 파싱해 기록
+- Excel: openpyxl read_only 모드로 1패스 순회 (셀 값의 파이썬 타입으로 추론, 배치 단위로 임시 구간 파일에 기록)
+
+CSV 적재의 메모리 사용량은 파일 크기가 아니라 블록 크기(DATASOURCE_INGEST_BLOCK_BYTES),
+Excel은 배치 행 수(DATASOURCE_INGEST_BATCH_ROWS)에 비례합니다.
+"""
+import os
+import re
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterator, Optional
+
+from app.core.config import settings
+from app.db.models.enums import DSSourceType, FieldType
+from app.engine.errors import QueryEngineError
+
+FILE_SOURCE_TYPES = {DSSourceType.CSV, DSSourceType.EXCEL}
+
+# 타입 후보 — 앞쪽일수록 좁은 타입. 첫 배치에서 성립하는 가장 좁은 타입을 고르고 이후 배치에서 넓힘
+_CANDIDATES = ("BOOLEAN", "INTEGER", "FLOAT", "DATE", "DATETIME")
+_WIDER = {"INTEGER": "FLOAT", "DATE": "DATETIME"}
+_KIND_FIELD_TYPES = {
+    "BOOLEAN": FieldType.BOOLEAN,
+    "INTEGER": FieldType.NUMBER,
+    "FLOAT": FieldType.NUMBER,
+    "DATE": FieldType.DATE,
+    "DATETIME": FieldType.DATETIME,
+}
+# CSV 불리언 표기 — 추론과 변환(ConvertOptions)이 같은 목록을 써야 추론된 컬럼이 변환에서 실패하지 않음
+_TRUE_TEXT = ["true", "True", "TRUE"]
+_FALSE_TEXT = ["false", "False", "FALSE"]
+_SAMPLE_SIZE = 1024
+_TABLE_CACHE_SIZE = 16
+
+
+def require_arrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        raise QueryEngineError(
+            "DRIVER_NOT_INSTALLED", "pyarrow가 설치되어 있지 않습니다. (pip install pyarrow)", status_code=501
+        )
+    return pa, pc
+
+
+@dataclass
+class IngestedField:
+    field_id: str
+    label: str
+    type: FieldType
+
+
+@dataclass
+class IngestResult:
+    storage_key: str
+    fields: list[IngestedField]
+    row_count: int
+
+
+# ── 경로 ──────────────────────────────────────────────────────────────────────
+
+def storage_path(storage_key: str) -> Path:
+    return Path(settings.DATASOURCE_FILE_DIR) / storage_key
+
+
+def new_storage_key(datasource_id: uuid.UUID) -> str:
+    """재업로드마다 새 파일 — 기존 파일을 메모리 맵으로 읽는 중인 워커가 있어도 안전"""
+    return f"{datasource_id}/{uuid.uuid4().hex}.arrow"
+
+
+def _field_ids(headers: list[Any]) -> list[tuple[str, str]]:
+    """헤더 텍스트 → (field_id, label). field_id는 영문/숫자/_ 로 정규화하고 중복 시 접미사 부여"""
+    result: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    for idx, raw in enumerate(headers):
+        label = str(raw).strip() if raw is not None and str(raw).strip() else f"column_{idx + 1}"
+        base = re.sub(r"[^0-9a-zA-Z_]+", "_", label).strip("_").lower() or f"column_{idx + 1}"
+        if base[0].isdigit():
+            base = f"c_{base}"
+        field_id, n = base, 2
+        while field_id in seen:
+            field_id, n = f"{base}_{n}", n + 1
+        seen.add(field_id)
+        result.append((field_id, label))
+    return result
+
+
+# ── 타입 추론 ─────────────────────────────────────────────────────────────────
+
+def _arrow_type(kind: str) -> Any:
+    pa, _ = require_arrow()
+    return {
+        "BOOLEAN": pa.bool_(),
+        "INTEGER": pa.int64(),
+        "FLOAT": pa.float64(),
+        "DATE": pa.date32(),
+        "DATETIME": pa.timestamp("us"),
+    }[kind]
+
+
+def _parses(values: Any, kind: str) -> bool:
+    pa, pc = require_arrow()
+    # 실패하는 캐스트는 배열 전체를 훑느라 느리므로 앞부분 표본으로 먼저 걸러냄
+    for sample in (values.slice(0, _SAMPLE_SIZE), values):
+        if kind == "BOOLEAN":
+            if not pc.all(pc.is_in(sample, pa.array(_TRUE_TEXT + _FALSE_TEXT))).as_py():
+                return False
+            continue
+        try:
+            pc.cast(sample, _arrow_type(kind))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            return False
+    return True
+
+
+def _infer_kind(array: Any, current: Optional[str]) -> Optional[str]:
+    """문자열 배치 하나를 보고 지금까지의 추론 타입을 갱신합니다. (벡터 연산, 행 단위 파이썬 루프 없음)
+
+    정수 → 실수, 날짜 → 일시는 좁은 타입이 성립하면 넓은 타입도 성립하므로
+    앞선 배치를 다시 볼 필요 없이 현재 배치만 검사해 넓힐 수 있습니다.
+    """
+    _, pc = require_arrow()
+    values = pc.drop_null(array)
+    if len(values) == 0 or current == "TEXT":
+        return current
+    if current is None:
+        return next((kind for kind in _CANDIDATES if _parses(values, kind)), "TEXT")
+    if _parses(values, current):
+        return current
+    wider = _WIDER.get(current)
+    return wider if wider and _parses(values, wider) else "TEXT"
+
+
+def _resolve(kind: Optional[str]) -> tuple[FieldType, Any]:
+    """추론 타입 → (FieldType, Arrow 타입). 값이 하나도 없던 컬럼은 TEXT"""
+    pa, _ = require_arrow()
+    if kind is None or kind == "TEXT":
+        return FieldType.TEXT, pa.string()
+    return _KIND_FIELD_TYPES[kind], _arrow_type(kind)
+
+
+# ── CSV ───────────────────────────────────────────────────────────────────────
+
+def _csv_reader(path: Path, header_row: int, column_types: Optional[dict] = None):
+    pa, _ = require_arrow()
+    from pyarrow import csv
+
+    return csv.open_csv(
+        path,
+        read_options=csv.ReadOptions(skip_rows=header_row - 1, block_size=settings.DATASOURCE_INGEST_BLOCK_BYTES),
+        convert_options=csv.ConvertOptions(
+            column_types=column_types,
+            strings_can_be_null=True,
+            true_values=_TRUE_TEXT,
+            false_values=_FALSE_TEXT,
+        ),
+    )
+
+
+def ingest_csv(src: Path, storage_key: str, header_row: int = 1) -> IngestResult:
+    pa, _ = require_arrow()
+    try:
+        return _ingest_csv(src, storage_key, header_row)
+    except pa.ArrowInvalid as exc:
+        storage_path(storage_key).unlink(missing_ok=True)
+        raise QueryEngineError("INVALID_FILE", f"CSV 파일을 읽을 수 없습니다: {exc}")
+
+
+def _ingest_csv(src: Path, storage_key: str, header_row: int) -> IngestResult:
+    pa, _ = require_arrow()
+
+    # 1패스: 모든 컬럼을 문자열로 읽으며 배치별로 타입 추론
+    with _csv_reader(src, header_row) as probe:
+        names = probe.schema.names
+    as_text = {name: pa.string() for name in names}
+    kinds: dict[str, Optional[str]] = dict.fromkeys(names)
+    with _csv_reader(src, header_row, as_text) as reader:
+        for batch in reader:
+            for name, column in zip(names, batch.columns):
+                kinds[name] = _infer_kind(column, kinds[name])
+
+    resolved = {name: _resolve(kinds[name]) for name in names}
+    ids = _field_ids(names)
+    schema = pa.schema([pa.field(fid, resolved[name][1]) for (fid, _), name in zip(ids, names)])
+
+    # 2패스: 확정 타입으로 파싱해 IPC 파일에 배치 단위 기록
+    dest = storage_path(storage_key)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    rows = 0
+    with _csv_reader(src, header_row, {n: resolved[n][1] for n in names}) as reader, \
+            pa.ipc.new_file(str(dest), schema) as writer:
+        for batch in reader:
+            writer.write_batch(pa.RecordBatch.from_arrays(batch.columns, schema=schema))
+            rows += batch.num_rows
+
+    fields = [IngestedField(fid, label, resolved[name][0]) for (fid, label), name in zip(ids, names)]
+    return IngestResult(storage_key=storage_key, fields=fields, row_count=rows)
+
+
+# ── Excel ─────────────────────────────────────────────────────────────────────
+
+def _python_kind(value: Any) -> str:
+    if isinstance(value, bool):
+        return "BOOLEAN"
+    if isinstance(value, int):
+        return "INTEGER"
+    if isinstance(value, float):
+        return "INTEGER" if value.is_integer() else "FLOAT"
+    if isinstance(value, datetime):
+        return "DATE" if value.time() == datetime.min.time() else "DATETIME"
+    if isinstance(value, date):
+        return "DATE"
+    return "TEXT"
+
+
+# 두 종류가 섞였을 때의 상위 타입
+_WIDEN = {
+    frozenset({"INTEGER", "FLOAT"}): "FLOAT",
+    frozenset({"DATE", "DATETIME"}): "DATETIME",
+}
+
+
+def _widen(current: Optional[str], kind: str) -> str:
+    if current is None or current == kind:
+        return kind
+    return _WIDEN.get(frozenset({current, kind}), "TEXT")
+
+
+def _excel_rows(src: Path, header_row: int, sheet_name: Optional[str]) -> Iterator[tuple]:
+    try:
+        import openpyxl
+    except ImportError:
+        raise QueryEngineError(
+            "DRIVER_NOT_INSTALLED", "openpyxl이 설치되어 있지 않습니다. (pip install openpyxl)", status_code=501
+        )
+    workbook = openpyxl.load_workbook(src, read_only=True, data_only=True)
+    try:
+        if sheet_name and sheet_name not in workbook.sheetnames:
+            raise QueryEngineError("INVALID_FILE", f"시트 '{sheet_name}'을(를) 찾을 수 없습니다.")
+        sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        yield from sheet.iter_rows(min_row=header_row, values_only=True)
+    finally:
+        workbook.close()
+
+
+def _excel_array(values: list[Any], kind: Optional[str]) -> Any:
+    """셀 값 목록 → 추론 타입의 Arrow 배열"""
+    pa, _ = require_arrow()
+    ftype, arrow_type = _resolve(kind)
+    if arrow_type == pa.string():
+        values = [None if v is None else str(v) for v in values]
+    elif arrow_type == pa.int64():
+        values = [None if v is None else int(v) for v in values]
+    elif arrow_type == pa.date32():
+        values = [v.date() if isinstance(v, datetime) else v for v in values]
+    elif ftype == FieldType.DATETIME:
+        values = [v if v is None or isinstance(v, datetime) else datetime(v.year, v.month, v.day) for v in values]
+    return pa.array(values, type=arrow_type)
+
+
+def _cast_column(array: Any, arrow_type: Any) -> Any:
+    """앞선 구간에서 좁은 타입으로 기록한 컬럼을 최종 타입으로 넓힙니다."""
+    pa, pc = require_arrow()
+    if array.type == arrow_type:
+        return array
+    if arrow_type == pa.string():
+        # 셀 값의 str() 표기를 유지 — Arrow 캐스트와 불리언/일시 표기가 다름
+        return pa.array([None if v is None else str(v) for v in array.to_pylist()], type=pa.string())
+    return pc.cast(array, arrow_type)
+
+
+def ingest_excel(src: Path, storage_key: str, header_row: int = 1, sheet_name: Optional[str] = None) -> IngestResult:
+    """xlsx는 셀 값이 이미 파이썬 타입을 가지므로 1패스로 읽으며 타입을 추론합니다.
+
+    xlsx 파싱은 파일을 두 번 읽기엔 느리므로 DATASOURCE_INGEST_BATCH_ROWS 행씩 그때까지 추론한 타입으로
+    임시 구간 파일에 기록하고, 끝에서 최종 타입으로 넓혀 합칩니다. 컬럼 타입이 넓어질 때만 새 구간을 시작하므로
+    대부분은 구간 하나를 그대로 옮기는 것으로 끝나며, 메모리 사용량은 배치 크기에 비례합니다.
+    """
+    dest = storage_path(storage_key)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    segments: list[Path] = []
+    try:
+        return _ingest_excel(src, dest, storage_key, header_row, sheet_name, segments)
+    except Exception:
+        dest.unlink(missing_ok=True)
+        raise
+    finally:
+        for segment in segments:
+            segment.unlink(missing_ok=True)
+
+
+def _ingest_excel(
+    src: Path, dest: Path, storage_key: str, header_row: int, sheet_name: Optional[str], segments: list[Path]
+) -> IngestResult:
+    pa, _ = require_arrow()
+    rows = _excel_rows(src, header_row, sheet_name)
+    headers = next(rows, None)
+    if headers is None:
+        raise QueryEngineError("INVALID_FILE", "빈 시트입니다.")
+    width = len(headers)
+    ids = _field_ids(list(headers))
+    names = [fid for fid, _ in ids]
+    kinds: list[Optional[str]] = [None] * width
+    row_count = 0
+    writer, segment_schema = None, None
+
+    def flush(chunk: list[list[Any]]) -> None:
+        nonlocal writer, segment_schema
+        arrays = [_excel_array(values, kind) for values, kind in zip(chunk, kinds)]
+        schema = pa.schema([pa.field(name, array.type) for name, array in zip(names, arrays)])
+        if schema != segment_schema:
+            if writer is not None:
+                writer.close()
+            segments.append(dest.with_name(f"{dest.name}.{len(segments)}.part"))
+            writer, segment_schema = pa.ipc.new_file(str(segments[-1]), schema), schema
+        writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+
+    # 1패스: 배치 단위로 타입을 넓혀 가며 구간 파일에 기록
+    try:
+        chunk: list[list[Any]] = [[] for _ in range(width)]
+        pending = 0
+        for row in rows:
+            if row is None or all(v is None for v in row):
+                continue
+            for idx in range(width):
+                value = row[idx] if idx < len(row) else None
+                if isinstance(value, str) and not value.strip():
+                    value = None
+                chunk[idx].append(value)
+                if value is not None and kinds[idx] != "TEXT":
+                    kinds[idx] = _widen(kinds[idx], _python_kind(value))
+            pending += 1
+            if pending == settings.DATASOURCE_INGEST_BATCH_ROWS:
+                flush(chunk)
+                row_count += pending
+                chunk, pending = [[] for _ in range(width)], 0
+        if pending or writer is None:
+            flush(chunk)
+            row_count += pending
+    finally:
+        if writer is not None:
+            writer.close()
+
+    resolved = [_resolve(kind) for kind in kinds]
+    schema = pa.schema([pa.field(name, arrow_type) for name, (_, arrow_type) in zip(names, resolved)])
+    if len(segments) == 1 and segment_schema == schema:
+        segments.pop().replace(dest)
+    else:
+        # 타입이 넓어진 경우 — 앞선 구간을 최종 타입으로 캐스트해 다시 기록
+        with pa.ipc.new_file(str(dest), schema) as out:
+            for segment in segments:
+                with pa.memory_map(str(segment), "r") as source:
+                    reader = pa.ipc.open_file(source)
+                    for i in range(reader.num_record_batches):
+                        batch = reader.get_batch(i)
+                        columns = [_cast_column(col, field.type) for col, field in zip(batch.columns, schema)]
+                        out.write_batch(pa.RecordBatch.from_arrays(columns, schema=schema))
+
+    fields = [IngestedField(fid, label, ftype) for (fid, label), (ftype, _) in zip(ids, resolved)]
+    return IngestResult(storage_key=storage_key, fields=fields, row_count=row_count)
+
+
+# ── 읽기 ──────────────────────────────────────────────────────────────────────
+
+_tables: "OrderedDict[str, Any]" = OrderedDict()
+_tables_lock = Lock()
+
+
+def open_table(storage_key: str):
+    """메모리 맵으로 연 Arrow 테이블 — 워커 프로세스별 LRU로 재사용
+
+    storage_key는 업로드마다 바뀌므로 키 자체가 버전 역할을 합니다.
+    """
+    pa, _ = require_arrow()
+    with _tables_lock:
+        table = _tables.get(storage_key)
+        if table is not None:
+            _tables.move_to_end(storage_key)
+            return table
+
+    path = storage_path(storage_key)
+    if not path.exists():
+        raise QueryEngineError("INVALID_DATASOURCE", "업로드된 데이터 파일을 찾을 수 없습니다. 파일을 다시 업로드해주세요.")
+    table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+    with _tables_lock:
+        _tables[storage_key] = table
+        while len(_tables) > _TABLE_CACHE_SIZE:
+            _tables.popitem(last=False)
+    return table
+
+
+def remove_files(datasource_id: uuid.UUID, keep: Optional[str] = None) -> None:
+    """데이터 소스의 저장 파일 정리 — keep으로 지정한 현재 파일은 남깁니다."""
+    directory = Path(settings.DATASOURCE_FILE_DIR) / str(datasource_id)
+    if not directory.is_dir():
+        return
+    for path in directory.iterdir():
+        if keep is None or path != storage_path(keep):
+            with _tables_lock:
+                _tables.pop(f"{datasource_id}/{path.name}", None)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def remove_file(storage_key: str) -> None:
+    """저장 파일 1개 삭제 (롤업 교체 등) — 이미 연 메모리 맵은 참조가 끝날 때까지 유효"""
+    with _tables_lock:
+        _tables.pop(storage_key, None)
+    storage_path(storage_key).unlink(missing_ok=True)
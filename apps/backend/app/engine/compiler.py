@@ -0,0 +1,230 @@
+"""ChartQuery → 단일 파라미터 SQL 컴파일러
+
+집계, 전체 건수, 합계 행, 정렬, 페이지네이션을 모두 원본 DB에서 계산하도록
+하나의 SELECT 문으로 묶습니다. 결과는 항상 1행 이상이며 아래 레이아웃을 따릅니다.
+
+    lf_row_count, t0..tk (합계), lf_present, c0..cn (페이지 행)
+
+페이지가 비어 있어도 LEFT JOIN 덕분에 건수/합계 행 1개는 반환됩니다.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+from app.db.models.enums import SortDir
+from app.engine.dialects import Dialect, ParamBinder
+from app.engine.errors import QueryEngineError
+from app.engine.predicates import compile_sql_predicate
+from app.engine.spec import ChartQuery, QueryField
+
+ROW_COUNT = "lf_row_count"
+PRESENT = "lf_present"
+
+
+@dataclass
+class ChartResult:
+    columns: list[QueryField]
+    rows: list[list[Any]]
+    totals: Optional[list[Any]]
+    total: int
+    queried_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+@dataclass
+class CompiledQuery:
+    sql: str
+    params: list[Any]
+    dialect: str
+    columns: list[QueryField]
+    # 합계가 계산된 컬럼 인덱스 (columns 기준)
+    total_indexes: list[int]
+    with_totals: bool
+
+    def decode(self, raw_rows: list[tuple]) -> ChartResult:
+        """드라이버가 반환한 튜플 목록을 ChartResult로 변환합니다."""
+        n_totals = len(self.total_indexes)
+        if not raw_rows:
+            return ChartResult(columns=self.columns, rows=[], totals=None, total=0)
+
+        head = raw_rows[0]
+        total = int(head[0] or 0)
+        totals: Optional[list[Any]] = None
+        if self.with_totals:
+            totals = [None] * len(self.columns)
+            for slot, col_idx in enumerate(self.total_indexes):
+                totals[col_idx] = to_jsonable(head[1 + slot])
+
+        start = 1 + n_totals
+        rows = [
+            [to_jsonable(v) for v in raw[start + 1:]]
+            for raw in raw_rows
+            if raw[start] is not None
+        ]
+        return ChartResult(columns=self.columns, rows=rows, totals=totals, total=total)
+
+
+def to_jsonable(value: Any) -> Any:
+    """Decimal 등 JSON 비호환 스칼라를 int/float로 정규화합니다."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return value
+
+
+# ── 컴파일 ────────────────────────────────────────────────────────────────────
+
+def compile_chart_query(query: ChartQuery, dialect: Dialect) -> CompiledQuery:
+    if not query.columns:
+        raise QueryEngineError("INVALID_CHART_CONFIG", "차트에 차원 또는 지표가 설정되지 않았습니다.")
+
+    q = dialect.quote
+    binder = ParamBinder(dialect)
+    source = dialect.source(query.source_config)
+    columns = query.columns
+    grouped = query.is_grouped
+
+    def column(field_id: str) -> str:
+        return f"{q('src')}.{q(field_id)}"
+
+    def select_expr(col: QueryField) -> str:
+        if grouped:
+            return dialect.aggregate(col.aggregate, column(col.field_id))
+        return column(col.field_id)
+
+    # 위치 기반 플레이스홀더(%s, ?)를 위해 WHERE 절은 SQL 등장 순서대로 매번 새로 바인딩
+    def where() -> str:
+        preds = [compile_sql_predicate(p, dialect, binder, column) for p in query.predicates]
+        return " WHERE " + " AND ".join(preds) if preds else ""
+
+    group_exprs = [column(c.field_id) for c in query.group_fields] if grouped else []
+    group_by = " GROUP BY " + ", ".join(group_exprs) if group_exprs else ""
+
+    # 1) 전체 건수
+    if grouped and not group_exprs:
+        row_count_sql = f"SELECT 1 AS {q(ROW_COUNT)}"
+    elif grouped:
+        row_count_sql = (
+            f"SELECT COUNT(*) AS {q(ROW_COUNT)} FROM "
+            f"(SELECT 1 AS {q('x')} FROM {source}{where()}{group_by}) {dialect.alias('cnt')}"
+        )
+    else:
+        row_count_sql = f"SELECT COUNT(*) AS {q(ROW_COUNT)} FROM {source}{where()}"
+
+    # 2) 합계 행 (집계 지표만, 원본 행 기준으로 재집계 — AVG/COUNT_DISTINCT도 정확)
+    total_indexes = [i for i, c in enumerate(columns) if c.is_aggregated] if query.with_totals and grouped else []
+    totals_sql = ""
+    if total_indexes:
+        total_cols = ", ".join(
+            f"{select_expr(columns[i])} AS {q(f't{slot}')}" for slot, i in enumerate(total_indexes)
+        )
+        totals_sql = f"SELECT {total_cols} FROM {source}{where()}"
+
+    # 3) 페이지 행
+    page_cols = ", ".join(f"{select_expr(c)} AS {q(f'c{i}')}" for i, c in enumerate(columns))
+    inner_order, outer_order = _order_by(query, dialect, select_expr)
+    page_sql = (
+        f"SELECT 1 AS {q(PRESENT)}, {page_cols} FROM {source}{where()}{group_by}"
+        f"{dialect.paginate(inner_order, query.limit, query.offset)}"
+    )
+
+    select_list = [f"{q('rc')}.{q(ROW_COUNT)}"]
+    select_list += [f"{q('tt')}.{q(f't{slot}')}" for slot in range(len(total_indexes))]
+    select_list += [f"{q('pg')}.{q(PRESENT)}"]
+    select_list += [f"{q('pg')}.{q(f'c{i}')}" for i in range(len(columns))]
+
+    sql = f"SELECT {', '.join(select_list)} FROM ({row_count_sql}) {dialect.alias('rc')}"
+    if totals_sql:
+        sql += f" CROSS JOIN ({totals_sql}) {dialect.alias('tt')}"
+    sql += f" LEFT JOIN ({page_sql}) {dialect.alias('pg')} ON 1 = 1"
+    sql += f" ORDER BY {outer_order}"
+
+    return CompiledQuery(
+        sql=sql,
+        params=binder.params,
+        dialect=dialect.name,
+        columns=columns,
+        total_indexes=total_indexes,
+        with_totals=query.with_totals,
+    )
+
+
+@dataclass
+class ExportQuery:
+    """내보내기용 SQL — 페이지/건수/합계 없이 정렬된 전체 행 (c0..cn)"""
+
+    sql: str
+    params: list[Any]
+    columns: list[QueryField]
+
+
+def compile_export_query(query: ChartQuery, dialect: Dialect) -> ExportQuery:
+    """서버 사이드 커서로 끝까지 읽을 단순 SELECT 문을 만듭니다."""
+    if not query.columns:
+        raise QueryEngineError("INVALID_CHART_CONFIG", "차트에 차원 또는 지표가 설정되지 않았습니다.")
+
+    q = dialect.quote
+    binder = ParamBinder(dialect)
+    grouped = query.is_grouped
+
+    def column(field_id: str) -> str:
+        return f"{q('src')}.{q(field_id)}"
+
+    def select_expr(col: QueryField) -> str:
+        if grouped:
+            return dialect.aggregate(col.aggregate, column(col.field_id))
+        return column(col.field_id)
+
+    select_list = ", ".join(f"{select_expr(c)} AS {q(f'c{i}')}" for i, c in enumerate(query.columns))
+    sql = f"SELECT {select_list} FROM {dialect.source(query.source_config)}"
+    preds = [compile_sql_predicate(p, dialect, binder, column) for p in query.predicates]
+    if preds:
+        sql += " WHERE " + " AND ".join(preds)
+    group_exprs = [column(c.field_id) for c in query.group_fields] if grouped else []
+    if group_exprs:
+        sql += " GROUP BY " + ", ".join(group_exprs)
+    keys = sort_keys(query)
+    if keys:
+        sql += " ORDER BY " + ", ".join(
+            dialect.order_nulls_last(select_expr(query.columns[idx]), d.value) for idx, d in keys
+        )
+
+    return ExportQuery(sql=sql, params=binder.params, columns=query.columns)
+
+
+def sort_keys(query: ChartQuery) -> list[tuple[int, SortDir]]:
+    """(컬럼 인덱스, 방향) 정렬 키 목록
+
+    페이지 경계가 흔들리지 않도록 지정 정렬 뒤에 나머지 그룹 컬럼을 tie-breaker로 붙입니다.
+    """
+    keys: list[tuple[int, SortDir]] = []
+    for key in query.sort:
+        idx = query.find_column(key.field_id)
+        if idx is None:
+            raise QueryEngineError("INVALID_SORT", f"정렬 필드 '{key.field_id}'가 차트에 포함되어 있지 않습니다.")
+        keys.append((idx, key.direction))
+
+    if query.is_grouped:
+        seen = {idx for idx, _ in keys}
+        for col in query.group_fields:
+            idx = query.find_column(col.field_id)
+            if idx is not None and idx not in seen:
+                keys.append((idx, SortDir.ASC))
+                seen.add(idx)
+    return keys
+
+
+def _order_by(query: ChartQuery, dialect: Dialect, select_expr: Callable[[QueryField], str]) -> tuple[str, str]:
+    """(페이지 서브쿼리용, 바깥 SELECT용) ORDER BY 절을 만듭니다.
+
+    서브쿼리 안에서는 별칭(c0..cn) 대신 SELECT 식을 씁니다. NULL 정렬 식(CASE 등) 안의 별칭은
+    MSSQL / PostgreSQL이 허용하지 않습니다. (SELECT 식에는 바인드 파라미터가 없어 반복해도 안전)
+    """
+    q = dialect.quote
+    keys = sort_keys(query)
+    if not keys:
+        # MSSQL OFFSET/FETCH는 ORDER BY가 필수
+        return "(SELECT NULL)", f"{q('pg')}.{q(PRESENT)}"
+
+    inner = ", ".join(dialect.order_nulls_last(select_expr(query.columns[idx]), d.value) for idx, d in keys)
+    outer = ", ".join(dialect.order_nulls_last(f"{q('pg')}.{q(f'c{idx}')}", d.value) for idx, d in keys)
+    return inner, outer
@@ -0,0 +1,200 @@
+"""DSSourceType별 SQL 방언 — 식별자 인용, 바인드 플레이스홀더, 페이지네이션 등"""
+from typing import Any
+
+from app.db.models.enums import AggregateType, DSSourceType, FieldType
+from app.engine.errors import QueryEngineError
+
+
+class ParamBinder:
+    """바인드 파라미터를 순서대로 수집하고 방언별 플레이스홀더를 돌려줍니다."""
+
+    def __init__(self, dialect: "Dialect") -> None:
+        self.dialect = dialect
+        self.params: list[Any] = []
+
+    def bind(self, value: Any) -> str:
+        self.params.append(value)
+        return self.dialect.placeholder(len(self.params) - 1)
+
+
+class Dialect:
+    """ANSI 기본 구현. 방언별 차이는 서브클래스에서 오버라이드합니다."""
+
+    name = "ansi"
+    text_type = "VARCHAR"
+    supports_regex = False
+    like_escape_char = "!"
+
+    # ── 식별자 / 플레이스홀더 ─────────────────────────────────────────────────
+
+    def quote(self, ident: str) -> str:
+        return '"' + ident.replace('"', '""') + '"'
+
+    def placeholder(self, index: int) -> str:
+        return "?"
+
+    # ── 원본 relation ─────────────────────────────────────────────────────────
+
+    def source(self, config: dict) -> str:
+        """connection_config의 query(서브쿼리) 또는 schema/table로 FROM 절을 만듭니다."""
+        query = (config.get("query") or "").strip().rstrip(";")
+        if query:
+            return f"({self.escape_raw_sql(query)}) {self.alias('src')}"
+        table = config.get("table")
+        if not table:
+            raise QueryEngineError("INVALID_DATASOURCE", "데이터 소스에 query 또는 table 설정이 필요합니다.")
+        schema = config.get("schema")
+        ref = f"{self.quote(schema)}.{self.quote(table)}" if schema else self.quote(table)
+        return f"{ref} {self.alias('src')}"
+
+    def escape_raw_sql(self, sql: str) -> str:
+        return sql
+
+    def alias(self, name: str) -> str:
+        return f"AS {self.quote(name)}"
+
+    # ── 표현식 ────────────────────────────────────────────────────────────────
+
+    def aggregate(self, agg: AggregateType, expr: str) -> str:
+        if agg == AggregateType.COUNT_DISTINCT:
+            return f"COUNT(DISTINCT {expr})"
+        if agg == AggregateType.NONE:
+            return expr
+        return f"{agg.value}({expr})"
+
+    def as_text(self, expr: str, field_type: FieldType) -> str:
+        if field_type == FieldType.TEXT:
+            return expr
+        return f"CAST({expr} AS {self.text_type})"
+
+    def like(self, expr: str, pattern_ph: str) -> str:
+        return f"{expr} LIKE {pattern_ph} ESCAPE '{self.like_escape_char}'"
+
+    def like_pattern(self, value: str, leading: bool, trailing: bool) -> str:
+        """CONTAINS/STARTS_WITH/ENDS_WITH 값을 이스케이프된 LIKE 패턴으로 변환합니다."""
+        escaped = like_escape(value, self.like_escape_char)
+        return ("%" if leading else "") + escaped + ("%" if trailing else "")
+
+    def regex(self, expr: str, pattern_ph: str) -> str:
+        raise QueryEngineError(
+            "UNSUPPORTED_OPERATOR", f"{self.name} 데이터 소스는 정규식(REGEX) 필터를 지원하지 않습니다."
+        )
+
+    # ── 정렬 / 페이지네이션 ───────────────────────────────────────────────────
+
+    def paginate(self, order_by: str, limit: int, offset: int) -> str:
+        return f" ORDER BY {order_by} LIMIT {int(limit)} OFFSET {int(offset)}"
+
+    def order_nulls_last(self, expr: str, direction: str) -> str:
+        """방향과 관계없이 NULL을 마지막에 두는 정렬 키 — NULLS LAST 절이 없는 방언용 CASE 식"""
+        return f"CASE WHEN {expr} IS NULL THEN 1 ELSE 0 END, {expr} {direction}"
+
+
+class PostgresDialect(Dialect):
+    name = "POSTGRESQL"
+    text_type = "TEXT"
+    supports_regex = True
+
+    def placeholder(self, index: int) -> str:
+        return f"${index + 1}"
+
+    def regex(self, expr: str, pattern_ph: str) -> str:
+        return f"{expr} ~ {pattern_ph}"
+
+    def order_nulls_last(self, expr: str, direction: str) -> str:
+        return f"{expr} {direction} NULLS LAST"
+
+
+class MySQLDialect(Dialect):
+    name = "MYSQL"
+    text_type = "CHAR"
+    supports_regex = True
+
+    def quote(self, ident: str) -> str:
+        return "`" + ident.replace("`", "``") + "`"
+
+    def placeholder(self, index: int) -> str:
+        return "%s"
+
+    def escape_raw_sql(self, sql: str) -> str:
+        # pyformat 드라이버는 리터럴 %를 %%로 이스케이프해야 합니다
+        return sql.replace("%", "%%")
+
+    def regex(self, expr: str, pattern_ph: str) -> str:
+        return f"{expr} REGEXP {pattern_ph}"
+
+    def order_nulls_last(self, expr: str, direction: str) -> str:
+        return f"{expr} IS NULL, {expr} {direction}"
+
+
+class MSSQLDialect(Dialect):
+    name = "MSSQL"
+    text_type = "NVARCHAR(MAX)"
+
+    def quote(self, ident: str) -> str:
+        return "[" + ident.replace("]", "]]") + "]"
+
+    def aggregate(self, agg: AggregateType, expr: str) -> str:
+        # 정수 컬럼 AVG가 정수로 잘리지 않도록 FLOAT 캐스팅
+        if agg == AggregateType.AVG:
+            return f"AVG(CAST({expr} AS FLOAT))"
+        return super().aggregate(agg, expr)
+
+    def paginate(self, order_by: str, limit: int, offset: int) -> str:
+        return f" ORDER BY {order_by} OFFSET {int(offset)} ROWS FETCH NEXT {int(limit)} ROWS ONLY"
+
+
+class BigQueryDialect(Dialect):
+    name = "BIGQUERY"
+    text_type = "STRING"
+    supports_regex = True
+    like_escape_char = "\\"
+
+    def quote(self, ident: str) -> str:
+        return "`" + ident.replace("`", "\\`") + "`"
+
+    def placeholder(self, index: int) -> str:
+        return f"@p{index}"
+
+    def source(self, config: dict) -> str:
+        if config.get("query") or not config.get("table"):
+            return super().source(config)
+        parts = [config.get("project_id"), config.get("dataset_id"), config["table"]]
+        ref = ".".join(p for p in parts if p)
+        return f"{self.quote(ref)} {self.alias('src')}"
+
+    def like(self, expr: str, pattern_ph: str) -> str:
+        # BigQuery LIKE는 ESCAPE 절을 지원하지 않으므로 기본 이스케이프(\\)를 사용
+        return f"{expr} LIKE {pattern_ph}"
+
+    def regex(self, expr: str, pattern_ph: str) -> str:
+        return f"REGEXP_CONTAINS({expr}, {pattern_ph})"
+
+    def order_nulls_last(self, expr: str, direction: str) -> str:
+        return f"{expr} {direction} NULLS LAST"
+
+
+_DIALECTS: dict[DSSourceType, Dialect] = {
+    DSSourceType.POSTGRESQL: PostgresDialect(),
+    DSSourceType.MYSQL: MySQLDialect(),
+    DSSourceType.MSSQL: MSSQLDialect(),
+    DSSourceType.BIGQUERY: BigQueryDialect(),
+}
+
+
+def get_dialect(source_type: DSSourceType) -> Dialect:
+    dialect = _DIALECTS.get(source_type)
+    if dialect is None:
+        raise QueryEngineError(
+            "UNSUPPORTED_SOURCE", f"{source_type.value} 데이터 소스는 SQL 푸시다운을 지원하지 않습니다."
+        )
+    return dialect
+
+
+def like_escape(value: str, escape_char: str = "!") -> str:
+    """LIKE 와일드카드(%, _)와 이스케이프 문자 자체를 이스케이프합니다."""
+    return (
+        value.replace(escape_char, escape_char * 2)
+        .replace("%", escape_char + "%")
+        .replace("_", escape_char + "_")
+    )
@@ -0,0 +1,115 @@
+"""드롭다운 필터 값 목록 — 필드별 고유 값 / 빈도 집계
+
+(데이터 소스, 필드)별로 `GROUP BY 필드` + `COUNT(필드)` 집계를 배치 단위로 끝까지 읽어 빈도 상위
+DISTINCT_VALUES_MAX개만 남깁니다. 결과 저장(Redis sorted set)과 조회는 app.services.filter_value_service가 맡습니다.
+
+데이터 소스에 watermark 필드가 있으면 since 이후 행만 집계해 기존 빈도에 더하는 증분 집계를 할 수 있습니다.
+원본이 추가 전용이라는 전제이며 수정/삭제된 행은 전체 집계에서만 반영됩니다. (롤업과 같은 규칙)
+"""
+import heapq
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Optional
+
+from app.core.config import settings
+from app.db.models.datasource import DataSource
+from app.db.models.enums import AggregateType, FilterOp
+from app.engine import executor
+from app.engine.columnar import FILE_SOURCE_TYPES
+from app.engine.compiler import compile_export_query
+from app.engine.dialects import get_dialect
+from app.engine.errors import QueryEngineError
+from app.engine.local import stream_local
+from app.engine.spec import ChartQuery, Predicate, QueryField
+
+_BATCH_ROWS = 50_000
+
+
+@dataclass
+class DistinctBuild:
+    # (값, 건수) — 건수 내림차순, 최대 DISTINCT_VALUES_MAX개
+    values: list[tuple[str, int]]
+    # 원본 고유 값 수가 상한을 넘어 빈도 하위 값이 빠졌는지
+    truncated: bool
+    # 집계에 반영된 watermark 필드 최댓값 (ISO 8601), watermark 미지정 시 None
+    watermark: Optional[str]
+    # 원본에서 읽은 그룹 수 (증분이면 변경분만)
+    fetched_rows: int
+
+
+def encode_value(value: Any) -> str:
+    """필터 값으로 그대로 되돌려 보낼 수 있는 문자열 (coerce_value가 필드 타입으로 다시 변환)"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, Decimal):
+        value = int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def build_query(datasource: DataSource, field_id: str, since: Optional[str] = None) -> ChartQuery:
+    fields = {f.field_id: f for f in datasource.fields}
+    field = fields.get(field_id)
+    if field is None:
+        raise QueryEngineError("INVALID_FIELD", f"데이터 소스에 없는 필드입니다: {field_id}")
+    query = ChartQuery(
+        source_config=datasource.connection_config or {},
+        dimensions=[QueryField(field.field_id, field.label, field.type)],
+        metrics=[QueryField(field.field_id, field.label, field.type, AggregateType.COUNT)],
+        with_totals=False,
+    )
+    wm_field = fields.get(datasource.watermark_field) if datasource.watermark_field else None
+    if wm_field is not None:
+        # 그룹별 watermark 최댓값을 같은 쿼리에서 받아 다음 증분 기준으로 사용
+        query.metrics.append(QueryField(wm_field.field_id, wm_field.label, wm_field.type, AggregateType.MAX))
+        if since is not None:
+            query.predicates.append(Predicate(wm_field.field_id, wm_field.type, FilterOp.GT, since))
+    return query
+
+
+async def collect_distinct(datasource: DataSource, field_id: str, since: Optional[str] = None) -> DistinctBuild:
+    """필드의 (값, 건수) 목록을 집계합니다. NULL은 드롭다운에서 고를 수 없으므로 제외합니다.
+
+    정렬 없이 끝까지 읽으면서 크기 DISTINCT_VALUES_MAX인 최소 힙으로 빈도 상위만 유지하므로
+    고유 값이 수천만 개여도 메모리는 상한만큼만 씁니다.
+    """
+    query = build_query(datasource, field_id, since)
+    with_watermark = len(query.metrics) > 1
+    batches: AsyncIterator[list[Any]]
+    if datasource.source_type in FILE_SOURCE_TYPES:
+        batches = stream_local(datasource, query, _BATCH_ROWS)
+    else:
+        batches = executor.stream(datasource, compile_export_query(query, get_dialect(datasource.source_type)), _BATCH_ROWS)
+
+    limit = settings.DISTINCT_VALUES_MAX
+    heap: list[tuple[int, str]] = []
+    fetched = 0
+    distinct = 0
+    watermark: Any = None
+    async with aclosing(batches):
+        async for rows in batches:
+            fetched += len(rows)
+            for row in rows:
+                if with_watermark and row[2] is not None and (watermark is None or row[2] > watermark):
+                    watermark = row[2]
+                if row[0] is None:
+                    continue
+                distinct += 1
+                item = (int(row[1] or 0), encode_value(row[0]))
+                if len(heap) < limit:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+
+    values = [(value, count) for count, value in sorted(heap, reverse=True)]
+    return DistinctBuild(
+        values=values,
+        truncated=distinct > len(values),
+        watermark=watermark.isoformat() if isinstance(watermark, (date, datetime)) else watermark,
+        fetched_rows=fetched,
+    )
@@ -0,0 +1,14 @@
+"""쿼리 엔진 예외 — 서비스 레이어에서 HTTPException으로 변환합니다."""
+
+
+class QueryEngineError(Exception):
+    """엔진 내부 오류. code/message는 API 에러 응답 형식을 그대로 따릅니다."""
+
+    def __init__(self, code: str, message: str, status_code: int = 400) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+
+    def to_detail(self) -> dict:
+        return {"code": self.code, "message": self.message}
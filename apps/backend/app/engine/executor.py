@@ -0,0 +1,114 @@
+"""컴파일된 쿼리를 외부 데이터 소스에서 실행합니다.
+
+연결은 데이터 소스별 커넥션 풀(app.engine.pools)에서 빌려 씁니다. PostgreSQL(asyncpg)은
+기본 의존성이고, MySQL / MSSQL / BigQuery 드라이버는 pyproject의 optional-dependencies로 설치합니다.
+
+모든 실행은 app.engine.governor 슬롯을 잡은 뒤 시작하고, 우선순위별 제한 시간(QUERY_TIMEOUT_*)을 넘기면
+실행을 취소하고 504 QUERY_TIMEOUT으로 끝냅니다. 호출한 요청이 취소되면(클라이언트 연결 끊김 등)
+드라이버 실행도 함께 취소됩니다. (app.engine.pools)
+
+- PostgreSQL: asyncpg가 서버에 취소 요청을 보내고 연결을 정리해 풀로 돌려줌
+- MySQL: 결과를 덜 읽은 연결은 풀에 돌려주지 않고 닫음
+- MSSQL / BigQuery: 취소 요청(SQLCancel / cancel_job) 후 드라이버 스레드가 돌아올 때까지 연결과 슬롯을 유지
+"""
+import asyncio
+import logging
+from contextlib import aclosing
+from typing import AsyncIterator, Optional
+
+from app.core.config import settings
+from app.db.models.datasource import DataSource
+from app.engine.compiler import CompiledQuery, ExportQuery
+from app.engine.errors import QueryEngineError
+from app.engine.governor import QueryPriority, current_priority, query_governor, statement_timeout
+from app.engine.pools import pool_registry
+
+logger = logging.getLogger(__name__)
+
+
+def _timed_out(seconds: float) -> QueryEngineError:
+    return QueryEngineError(
+        "QUERY_TIMEOUT", f"데이터 소스 쿼리가 제한 시간({seconds:g}초)을 넘겨 취소되었습니다.", status_code=504
+    )
+
+
+async def execute(
+    datasource: DataSource, compiled: CompiledQuery, priority: Optional[QueryPriority] = None
+) -> list[tuple]:
+    """데이터 소스 풀에서 연결을 빌려 쿼리를 1회 실행한 뒤 결과 튜플 목록을 반환합니다."""
+    priority = current_priority() if priority is None else priority
+    timeout = statement_timeout(priority)
+    try:
+        async with query_governor.slot(datasource, priority):
+            async with pool_registry.lease(datasource) as pool:
+                async with asyncio.timeout(timeout):
+                    return await pool.fetch(compiled.sql, compiled.params)
+    except QueryEngineError:
+        raise
+    except TimeoutError:
+        raise _timed_out(timeout)
+    except Exception as exc:  # 드라이버별 예외 타입이 모두 달라 한 곳에서 변환
+        raise QueryEngineError("DATASOURCE_QUERY_FAILED", f"데이터 소스 쿼리 실행 실패: {exc}", status_code=502)
+
+
+async def stream(
+    datasource: DataSource, query: ExportQuery, batch_size: int, priority: Optional[QueryPriority] = None
+) -> AsyncIterator[list[tuple]]:
+    """서버 사이드 커서로 결과를 batch_size 행씩 흘려보냅니다. (내보내기용)
+
+    제한 시간은 배치 1개를 읽는 데 적용됩니다. (소비자가 배치를 처리하는 시간은 제외)
+    슬롯은 스트림을 끝까지 읽거나 닫을 때까지 점유합니다.
+    """
+    priority = current_priority() if priority is None else priority
+    timeout = statement_timeout(priority)
+    try:
+        async with query_governor.slot(datasource, priority):
+            # 소비자가 중간에 멈춰도 커서/연결이 즉시 반환되도록 aclosing으로 감쌈
+            async with (
+                pool_registry.lease(datasource) as pool,
+                aclosing(pool.stream(query.sql, query.params, batch_size)) as batches,
+            ):
+                while True:
+                    async with asyncio.timeout(timeout):
+                        rows = await anext(batches, None)
+                    if rows is None:
+                        break
+                    yield rows
+    except QueryEngineError:
+        raise
+    except TimeoutError:
+        raise _timed_out(timeout)
+    except Exception as exc:
+        raise QueryEngineError("DATASOURCE_QUERY_FAILED", f"데이터 소스 쿼리 실행 실패: {exc}", status_code=502)
+
+
+async def describe(datasource: DataSource, sql: str) -> list[tuple[str, str]]:
+    """결과 컬럼의 (이름, 드라이버 타입명) 목록 (스키마 동기화용)"""
+    priority = current_priority()
+    timeout = statement_timeout(priority)
+    try:
+        async with query_governor.slot(datasource, priority):
+            async with pool_registry.lease(datasource) as pool:
+                async with asyncio.timeout(timeout):
+                    return await pool.describe(sql)
+    except QueryEngineError:
+        raise
+    except TimeoutError:
+        raise _timed_out(timeout)
+    except Exception as exc:
+        raise QueryEngineError("DATASOURCE_QUERY_FAILED", f"데이터 소스 쿼리 실행 실패: {exc}", status_code=502)
+
+
+async def estimate(datasource: DataSource, compiled: CompiledQuery) -> Optional[float]:
+    """실행 없이 예상 처리 행 수를 구합니다. (EXPLAIN / dry run, 수용 제어용)
+
+    추정은 참고 정보라 실패하거나 QUERY_COST_ESTIMATE_TIMEOUT을 넘기면 None을 반환하고 쿼리는 그대로 진행합니다.
+    """
+    try:
+        async with query_governor.slot(datasource, current_priority()):
+            async with pool_registry.lease(datasource) as pool:
+                async with asyncio.timeout(settings.QUERY_COST_ESTIMATE_TIMEOUT):
+                    return await pool.estimate(compiled.sql, compiled.params)
+    except Exception as exc:
+        logger.warning("데이터 소스 %s 쿼리 비용 추정 실패: %s", datasource.id, exc)
+        return None
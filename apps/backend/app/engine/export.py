@@ -0,0 +1,241 @@
+"""차트 내보내기 스트림 인코더 (CSV / XLSX)
+
+행 배치를 받아 바로 바이트로 인코딩해 돌려주므로 응답 전체를 메모리에 모으지 않습니다.
+
+XLSX는 zip 컨테이너라 보통 파일을 끝까지 만든 뒤 전송하지만, 여기서는 zipfile의
+비탐색(non-seekable) 스트림 쓰기(data descriptor)를 이용해 시트 XML을 쓰는 즉시 압축 바이트를 내보냅니다.
+문자열은 sharedStrings 없이 inlineStr로 기록하고, 시트 행 한도(1,048,576)를 넘으면 다음 시트로 넘깁니다.
+"""
+import csv
+import io
+import math
+import re
+import zipfile
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Optional
+from xml.sax.saxutils import escape
+
+XLSX_MAX_ROWS = 1_048_576
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+# XML 1.0에서 허용되지 않는 제어 문자
+_ILLEGAL_XML = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+class _Buffer(io.RawIOBase):
+    """zipfile이 쓰는 바이트를 모아 두었다가 drain()으로 꺼내는 비탐색 스트림"""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class CsvStreamWriter:
+    media_type = "text/csv; charset=utf-8"
+    extension = "csv"
+
+    def __init__(self) -> None:
+        self._text = io.StringIO()
+        self._writer = csv.writer(self._text)
+        # Excel에서 한글이 깨지지 않도록 UTF-8 BOM
+        self._pending = "\ufeff"
+
+    def header(self, labels: list[str]) -> bytes:
+        return self.write_rows([labels])
+
+    def write_rows(self, rows: list[list[Any]]) -> bytes:
+        self._writer.writerows([[_csv_value(v) for v in row] for row in rows])
+        data = self._pending + self._text.getvalue()
+        self._pending = ""
+        self._text.seek(0)
+        self._text.truncate()
+        return data.encode("utf-8")
+
+    def close(self) -> bytes:
+        return self._pending.encode("utf-8")
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return value
+
+
+class XlsxStreamWriter:
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    extension = "xlsx"
+
+    def __init__(self, sheet_title: str = "Sheet") -> None:
+        self._buffer = _Buffer()
+        self._zip = zipfile.ZipFile(self._buffer, "w", compression=zipfile.ZIP_DEFLATED)
+        self._title = _sheet_title(sheet_title)
+        self._labels: Optional[list[str]] = None
+        self._sheets = 0
+        self._sheet: Any = None
+        self._row = 0
+
+    # ── 시트 ──────────────────────────────────────────────────────────────────
+
+    def _open_sheet(self) -> None:
+        self._close_sheet()
+        self._sheets += 1
+        self._sheet = self._zip.open(f"xl/worksheets/sheet{self._sheets}.xml", "w", force_zip64=True)
+        self._sheet.write(
+            b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+        )
+        self._row = 0
+        if self._labels is not None:
+            self._write_row(self._labels)
+
+    def _close_sheet(self) -> None:
+        if self._sheet is not None:
+            self._sheet.write(b"</sheetData></worksheet>")
+            self._sheet.close()
+            self._sheet = None
+
+    def _write_row(self, values: list[Any]) -> None:
+        if self._sheet is None or self._row >= XLSX_MAX_ROWS:
+            self._open_sheet()
+        self._row += 1
+        cells = "".join(_cell(v) for v in values)
+        self._sheet.write(f'<row r="{self._row}">{cells}</row>'.encode("utf-8"))
+
+    # ── 공개 API ──────────────────────────────────────────────────────────────
+
+    def header(self, labels: list[str]) -> bytes:
+        # 시트가 넘어가도 각 시트 첫 행에 헤더를 반복
+        self._labels = [str(label) for label in labels]
+        self._open_sheet()
+        return self._buffer.drain()
+
+    def write_rows(self, rows: list[list[Any]]) -> bytes:
+        for row in rows:
+            self._write_row(row)
+        return self._buffer.drain()
+
+    def close(self) -> bytes:
+        if self._sheet is None:
+            self._open_sheet()
+        self._close_sheet()
+        for name, body in self._package_parts():
+            self._zip.writestr(name, body)
+        self._zip.close()
+        return self._buffer.drain()
+
+    def _package_parts(self) -> list[tuple[str, str]]:
+        sheet_ids = range(1, self._sheets + 1)
+        names = [self._title if i == 1 else f"{self._title[:27]} ({i})" for i in sheet_ids]
+        overrides = "".join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            f'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in sheet_ids
+        )
+        sheets = "".join(
+            f'<sheet name="{escape(name, {chr(34): "&quot;"})}" sheetId="{i}" r:id="rId{i}"/>'
+            for i, name in zip(sheet_ids, names)
+        )
+        sheet_rels = "".join(
+            f'<Relationship Id="rId{i}" '
+            f'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+            f'Target="worksheets/sheet{i}.xml"/>'
+            for i in sheet_ids
+        )
+        styles_rel = self._sheets + 1
+        return [
+            (
+                "[Content_Types].xml",
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                '<Default Extension="xml" ContentType="application/xml"/>'
+                '<Override PartName="/xl/workbook.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                '<Override PartName="/xl/styles.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+                f"{overrides}</Types>",
+            ),
+            (
+                "_rels/.rels",
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                '<Relationship Id="rId1" '
+                'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+                'Target="xl/workbook.xml"/></Relationships>',
+            ),
+            (
+                "xl/workbook.xml",
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+                f"<sheets>{sheets}</sheets></workbook>",
+            ),
+            (
+                "xl/_rels/workbook.xml.rels",
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                f"{sheet_rels}"
+                f'<Relationship Id="rId{styles_rel}" '
+                'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+                'Target="styles.xml"/></Relationships>',
+            ),
+            ("xl/styles.xml", _STYLES),
+        ]
+
+
+# 셀 스타일 인덱스: 0 기본, 1 날짜(numFmt 14), 2 일시(yyyy-mm-dd hh:mm:ss)
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd hh:mm:ss"/></numFmts>'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="3">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+
+
+def _sheet_title(title: str) -> str:
+    # 시트명: 최대 31자, []:*?/\ 불가
+    cleaned = re.sub(r"[\[\]:*?/\\]", " ", title).strip() or "Sheet"
+    return cleaned[:31]
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float, Decimal)):
+        if isinstance(value, float) and not math.isfinite(value):
+            return "<c/>"
+        return f"<c><v>{value}</v></c>"
+    if isinstance(value, datetime):
+        delta = value.replace(tzinfo=None) - _EXCEL_EPOCH
+        return f'<c s="2"><v>{delta.days + delta.seconds / 86400 + delta.microseconds / 86_400_000_000}</v></c>'
+    if isinstance(value, date):
+        return f'<c s="1"><v>{(value - _EXCEL_EPOCH.date()).days}</v></c>'
+    text = escape(_ILLEGAL_XML.sub("", str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
@@ -0,0 +1,176 @@
+"""조건부 서식 서버 평가
+
+차트의 조건부 서식(서식 order → 규칙 order)을 한 번 컴파일해 차트 version 기준으로 워커 메모리에 캐시하고,
+쿼리 결과 컬럼에 pyarrow.compute 벡터 연산(app.engine.predicates)으로 적용해 스타일 인덱스 배열을 만듭니다.
+클라이언트는 행마다 규칙을 다시 평가하지 않고 palette[인덱스]를 그대로 그리면 됩니다.
+
+- 셀(또는 행)마다 처음 매칭된 규칙의 스타일만 적용 (이미 정해진 위치는 뒤 규칙이 덮어쓰지 않음)
+- CELL: target_fields 컬럼 각각의 값으로 판단해 그 셀에 적용
+- ROW: target_fields 중 하나라도 만족하면 행 전체에 적용 (같은 셀에 셀 스타일이 있으면 셀 스타일 우선)
+
+조건부 서식이 바뀌면 차트 version이 오르므로(app.core.versioning) 캐시를 따로 무효화하지 않습니다.
+"""
+import json
+import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from app.core.config import settings
+from app.db.models.enums import CondFormatApplyTo, FilterOp
+from app.db.models.formatting import ConditionalFormat
+from app.engine.columnar import require_arrow
+from app.engine.errors import QueryEngineError
+from app.engine.predicates import ArrowMask, prepare_arrow_predicate, to_arrow_array
+from app.engine.spec import Predicate, QueryField
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Rule:
+    op: FilterOp
+    value: Any
+    second_value: Any
+    style: int       # palette 인덱스
+
+
+@dataclass(frozen=True)
+class _Format:
+    apply_to: CondFormatApplyTo
+    target_fields: tuple[str, ...]
+    rules: tuple[_Rule, ...]
+
+
+@dataclass
+class StyleIndex:
+    """결과 행에 대한 스타일 인덱스 — 값은 palette 인덱스, 매칭 없으면 None"""
+
+    palette: list[dict]
+    rows: Optional[list[Optional[int]]]               # ROW 서식 (행 순서)
+    cells: dict[int, list[Optional[int]]]             # CELL 서식 (컬럼 인덱스 → 행 순서)
+
+
+@dataclass
+class FormatProgram:
+    """차트 1개의 컴파일된 조건부 서식"""
+
+    palette: list[dict]
+    formats: list[_Format]
+    # 결과 컬럼 구성별로 준비된 규칙 — (field_id, 타입) 목록 → [(서식, [([(컬럼 인덱스, 마스크 함수)], style)])]
+    _bound: dict[tuple, list] = field(default_factory=dict)
+
+    def evaluate(self, columns: list[QueryField], rows: list[list[Any]]) -> Optional[StyleIndex]:
+        """서식이 없거나 결과가 비어 있으면 None"""
+        if not self.formats or not rows:
+            return None
+        pa, pc = require_arrow()
+        n = len(rows)
+        arrays: dict[int, Any] = {}
+
+        def column(i: int) -> Any:
+            if i not in arrays:
+                arrays[i] = to_arrow_array([row[i] for row in rows], columns[i].result_type)
+            return arrays[i]
+
+        def first_match(slots: Any, preds: list[tuple[int, ArrowMask]], style: int) -> Any:
+            mask = None
+            for i, matches in preds:
+                part = matches(column(i))
+                mask = part if mask is None else pc.or_(mask, part)
+            return pc.if_else(pc.and_(mask, pc.is_null(slots)), pa.scalar(style, pa.int32()), slots)
+
+        row_slots = None
+        cell_slots: dict[int, Any] = {}
+        for fmt, rules in self._bind(columns):
+            if fmt.apply_to == CondFormatApplyTo.ROW:
+                if row_slots is None:
+                    row_slots = pa.nulls(n, pa.int32())
+                for preds, style in rules:
+                    row_slots = first_match(row_slots, preds, style)
+            else:
+                for preds, style in rules:
+                    i = preds[0][0]
+                    slots = cell_slots.get(i)
+                    cell_slots[i] = first_match(pa.nulls(n, pa.int32()) if slots is None else slots, preds, style)
+
+        return StyleIndex(
+            palette=self.palette,
+            rows=row_slots.to_pylist() if row_slots is not None and row_slots.null_count < n else None,
+            cells={i: slots.to_pylist() for i, slots in sorted(cell_slots.items()) if slots.null_count < n},
+        )
+
+    def _bind(self, columns: list[QueryField]) -> list:
+        """target_fields를 결과 컬럼 인덱스로 바꾸고 컬럼 타입에 맞춘 마스크 함수를 준비 (컬럼 구성별로 1번)
+
+        CELL 규칙은 대상 컬럼마다 1개씩 펼쳐 두고 평가 시 컬럼별로 나눠 씁니다.
+        """
+        signature = tuple((c.field_id, c.result_type) for c in columns)
+        bound = self._bound.get(signature)
+        if bound is not None:
+            return bound
+
+        bound = []
+        for fmt in self.formats:
+            targets = [i for i, c in enumerate(columns) if c.field_id in fmt.target_fields]
+            if not targets:
+                continue
+            rules = []
+            for rule in fmt.rules:
+                preds = []
+                for i in targets:
+                    pred = Predicate(columns[i].field_id, columns[i].result_type, rule.op, rule.value, rule.second_value)
+                    try:
+                        preds.append((i, prepare_arrow_predicate(pred)))
+                    except QueryEngineError as exc:
+                        # 비교 값을 컬럼 타입으로 바꿀 수 없거나 정규식이 잘못된 규칙은 건너뜀
+                        logger.debug("조건부 서식 규칙 건너뜀 (%s): %s", rule.op.value, exc.message)
+                if not preds:
+                    continue
+                if fmt.apply_to == CondFormatApplyTo.ROW:
+                    rules.append((preds, rule.style))
+                else:
+                    rules.extend(([pred], rule.style) for pred in preds)
+            if rules:
+                bound.append((fmt, rules))
+        self._bound[signature] = bound
+        return bound
+
+
+# ── 컴파일 / 캐시 ─────────────────────────────────────────────────────────────
+
+_programs: "OrderedDict[tuple[uuid.UUID, int], FormatProgram]" = OrderedDict()
+
+
+def get_program(chart_id: uuid.UUID, version: int) -> Optional[FormatProgram]:
+    """캐시된 컴파일 결과 — 없으면 None (서식이 없는 차트도 빈 FormatProgram으로 캐시됨)"""
+    key = (chart_id, version)
+    program = _programs.get(key)
+    if program is not None:
+        _programs.move_to_end(key)
+    return program
+
+
+def compile_formats(chart_id: uuid.UUID, version: int, formats: list[ConditionalFormat]) -> FormatProgram:
+    """서식 / 규칙을 평가 순서대로 정리하고 스타일은 중복 없는 palette로 모아 캐시에 저장합니다."""
+    palette: list[dict] = []
+    palette_index: dict[str, int] = {}
+    compiled: list[_Format] = []
+    for fmt in sorted(formats, key=lambda f: f.order):
+        rules = []
+        for rule in sorted(fmt.rules, key=lambda r: r.order):
+            key = json.dumps(rule.style or {}, sort_keys=True)
+            if key not in palette_index:
+                palette_index[key] = len(palette)
+                palette.append(rule.style or {})
+            rules.append(_Rule(rule.operator, rule.value, rule.second_value, palette_index[key]))
+        if rules and fmt.target_fields:
+            compiled.append(_Format(fmt.apply_to, tuple(fmt.target_fields), tuple(rules)))
+
+    program = FormatProgram(palette=palette, formats=compiled)
+    _programs[(chart_id, version)] = program
+    _programs.move_to_end((chart_id, version))
+    while len(_programs) > settings.CONDITIONAL_FORMAT_CACHE_SIZE:
+        _programs.popitem(last=False)
+    return program
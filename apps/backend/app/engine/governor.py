@@ -0,0 +1,175 @@
+"""원본 DB 쿼리 동시 실행 관리 — 데이터 소스별 / 프로세스 전체 슬롯, 우선순위, 실행 제한 시간
+
+외부 데이터 소스 쿼리(app.engine.executor)는 실행 전에 슬롯 2개(데이터 소스 → 프로세스 전체)를 잡습니다.
+
+- 데이터 소스 슬롯 수는 커넥션 풀 최대 크기와 같아 슬롯을 잡으면 풀 대기 없이 바로 연결을 얻습니다.
+- 빈 슬롯은 우선순위가 높은(같으면 먼저 온) 대기자에게 먼저 돌아갑니다.
+  INTERACTIVE(페이지/차트 조회) > EXPORT(내보내기) > BACKGROUND(캐시 워밍, 롤업/값 인덱스 빌드 등)
+- EXPORT / BACKGROUND는 슬롯의 일부(QUERY_EXPORT_SHARE / QUERY_BACKGROUND_SHARE)까지만 쓸 수 있어
+  무거운 내보내기가 몰려도 대시보드 조회용 슬롯이 남습니다.
+
+우선순위는 호출 컨텍스트(query_priority)로 정하고, 지정하지 않으면 INTERACTIVE입니다.
+슬롯은 워커 프로세스 단위이며 여러 프로세스 합산 제한은 작업 큐의 데이터 소스 슬롯(JOB_DATASOURCE_CONCURRENCY)이 맡습니다.
+"""
+import asyncio
+import enum
+import heapq
+import itertools
+import math
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Iterator, Optional
+
+from app.core.config import settings
+from app.db.models.datasource import DataSource
+from app.engine.errors import QueryEngineError
+
+
+class QueryPriority(enum.IntEnum):
+    INTERACTIVE = 0
+    EXPORT = 1
+    BACKGROUND = 2
+
+
+_priority: ContextVar[QueryPriority] = ContextVar("query_priority", default=QueryPriority.INTERACTIVE)
+
+
+def current_priority() -> QueryPriority:
+    return _priority.get()
+
+
+@contextmanager
+def query_priority(priority: QueryPriority) -> Iterator[None]:
+    """블록 안에서(블록에서 만든 Task 포함) 실행되는 원본 쿼리의 우선순위"""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def statement_timeout(priority: QueryPriority) -> float:
+    """쿼리 1회(스트림은 배치 1회) 실행 제한 시간 (초)"""
+    if priority == QueryPriority.EXPORT:
+        return settings.QUERY_TIMEOUT_EXPORT
+    if priority == QueryPriority.BACKGROUND:
+        return settings.QUERY_TIMEOUT_BACKGROUND
+    return settings.QUERY_TIMEOUT_INTERACTIVE
+
+
+def _share(priority: QueryPriority) -> float:
+    if priority == QueryPriority.EXPORT:
+        return settings.QUERY_EXPORT_SHARE
+    if priority == QueryPriority.BACKGROUND:
+        return settings.QUERY_BACKGROUND_SHARE
+    return 1.0
+
+
+class _Gate:
+    """우선순위 대기열이 있는 세마포어"""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = [0] * len(QueryPriority)
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    def _cap(self, priority: QueryPriority) -> int:
+        return max(1, math.floor(self.limit * _share(priority)))
+
+    def _can_run(self, priority: QueryPriority) -> bool:
+        return sum(self.active) < self.limit and self.active[priority] < self._cap(priority)
+
+    async def acquire(self, priority: QueryPriority, timeout: Optional[float]) -> None:
+        if not self._waiters and self._can_run(priority):
+            self.active[priority] += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        # 앞선 대기자가 비율 상한에 걸려 있을 뿐이면 빈 슬롯을 바로 받을 수 있음
+        self._wake()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # 슬롯을 받은 직후 취소/시간 초과 — 받은 슬롯은 돌려줌
+                self.release(priority)
+            else:
+                future.cancel()
+                self._waiters = [w for w in self._waiters if w[2] is not future]
+                heapq.heapify(self._waiters)
+            raise
+
+    def release(self, priority: QueryPriority) -> None:
+        self.active[priority] -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """우선순위 순으로 훑으며 슬롯을 받을 수 있는 대기자를 깨움 (비율 상한에 걸린 대기자는 건너뜀)"""
+        pending = []
+        while self._waiters and sum(self.active) < self.limit:
+            priority, seq, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            if self.active[priority] >= self._cap(QueryPriority(priority)):
+                pending.append((priority, seq, future))
+                continue
+            self.active[priority] += 1
+            future.set_result(None)
+        for item in pending:
+            heapq.heappush(self._waiters, item)
+
+
+class QueryGovernor:
+    def __init__(self) -> None:
+        self._gates: dict[uuid.UUID, _Gate] = {}
+        self._global: Optional[_Gate] = None
+
+    def _datasource_gate(self, datasource: DataSource) -> _Gate:
+        config = datasource.connection_config or {}
+        limit = int(config.get("pool_max_size") or settings.DATASOURCE_POOL_MAX_SIZE)
+        gate = self._gates.get(datasource.id)
+        if gate is None:
+            gate = self._gates[datasource.id] = _Gate(limit)
+        elif gate.limit != limit:
+            # 풀 크기 설정 변경 — 늘어난 자리만큼 대기자를 바로 깨움
+            gate.limit = limit
+            gate._wake()
+        return gate
+
+    def _global_gate(self) -> _Gate:
+        if self._global is None:
+            self._global = _Gate(settings.QUERY_GLOBAL_CONCURRENCY)
+        return self._global
+
+    @asynccontextmanager
+    async def slot(self, datasource: DataSource, priority: QueryPriority) -> AsyncIterator[None]:
+        """데이터 소스 → 프로세스 전체 순서로 슬롯을 잡습니다. (항상 같은 순서라 교착 없음)
+
+        INTERACTIVE는 DATASOURCE_POOL_QUEUE_TIMEOUT 안에 슬롯을 못 받으면 503 DATASOURCE_BUSY,
+        EXPORT / BACKGROUND는 요청 취소 또는 작업 제한 시간까지 기다립니다.
+        """
+        timeout: Optional[float] = None
+        if priority == QueryPriority.INTERACTIVE:
+            config = datasource.connection_config or {}
+            timeout = float(config.get("pool_timeout") or settings.DATASOURCE_POOL_QUEUE_TIMEOUT)
+        gates = [self._datasource_gate(datasource), self._global_gate()]
+        held: list[_Gate] = []
+        try:
+            for gate in gates:
+                try:
+                    await gate.acquire(priority, timeout)
+                except asyncio.TimeoutError:
+                    raise QueryEngineError(
+                        "DATASOURCE_BUSY", "데이터 소스 연결이 모두 사용 중입니다. 잠시 후 다시 시도해주세요.", status_code=503
+                    )
+                held.append(gate)
+            yield
+        finally:
+            for gate in reversed(held):
+                gate.release(priority)
+
+
+# 모듈 레벨 싱글턴 — 워커 프로세스마다 하나
+query_governor = QueryGovernor()
@@ -0,0 +1,45 @@
+"""외부 DB 데이터 소스의 결과 컬럼 조회 (스키마 동기화)
+
+`SELECT * FROM <source> WHERE 1 = 0`을 드라이버에 보내 행 없이 컬럼 이름과 타입만 받고,
+드라이버별 타입명을 FieldType으로 분류합니다.
+"""
+from app.db.models.datasource import DataSource
+from app.db.models.enums import FieldType
+from app.engine import executor
+from app.engine.columnar import FILE_SOURCE_TYPES
+from app.engine.dialects import get_dialect
+from app.engine.errors import QueryEngineError
+
+# 타입명(소문자)에 포함된 단어로 분류 — 위에서부터 먼저 맞는 규칙 적용
+_TYPE_RULES: list[tuple[tuple[str, ...], FieldType]] = [
+    (
+        ("char", "text", "string", "blob", "binary", "json", "uuid", "enum", "set", "bytes", "str", "interval"),
+        FieldType.TEXT,
+    ),
+    (("bool", "bit"), FieldType.BOOLEAN),
+    (("timestamp", "datetime"), FieldType.DATETIME),
+    (("date",), FieldType.DATE),
+    (
+        ("int", "numeric", "decimal", "float", "double", "real", "money", "number", "tiny", "short", "long", "year"),
+        FieldType.NUMBER,
+    ),
+]
+
+
+def classify_type(type_name: str) -> FieldType:
+    """드라이버 타입명 → FieldType (알 수 없는 타입은 TEXT)"""
+    name = type_name.lower()
+    for words, field_type in _TYPE_RULES:
+        if any(word in name for word in words):
+            return field_type
+    return FieldType.TEXT
+
+
+async def describe_source(datasource: DataSource) -> list[tuple[str, FieldType]]:
+    """원본 컬럼의 (이름, FieldType) 목록 — 원본 순서 유지"""
+    if datasource.source_type in FILE_SOURCE_TYPES:
+        raise QueryEngineError("UNSUPPORTED_SOURCE", "업로드 파일 데이터 소스는 스키마 동기화 대상이 아닙니다.")
+    dialect = get_dialect(datasource.source_type)
+    sql = f"SELECT * FROM {dialect.source(datasource.connection_config or {})} WHERE 1 = 0"
+    columns = await executor.describe(datasource, sql)
+    return [(name, classify_type(type_name)) for name, type_name in columns]
@@ -0,0 +1,146 @@
+"""업로드 파일 데이터 소스의 ChartQuery 실행 — 메모리 맵 Arrow 테이블 벡터 연산
+
+원본 DB 컴파일러와 같은 결과(집계, 전체 건수, 합계 행, NULLS LAST 정렬, 페이지)를 내도록
+필터 → 필요한 컬럼만 선택 → group_by 집계 → 정렬 인덱스 → 페이지 슬라이스 순으로 처리합니다.
+행 단위 파이썬 루프는 최종 페이지 행을 리스트로 바꿀 때만 사용합니다.
+"""
+import asyncio
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar
+
+from app.db.models.datasource import DataSource
+from app.db.models.enums import AggregateType, SortDir
+from app.engine.columnar import open_table, require_arrow
+from app.engine.compiler import ChartResult, sort_keys
+from app.engine.errors import QueryEngineError
+from app.engine.predicates import compile_arrow_predicate
+from app.engine.spec import ChartQuery
+
+T = TypeVar("T")
+
+# AggregateType → pyarrow 집계 함수명 (group_by / 스칼라 공통)
+_AGGREGATES = {
+    AggregateType.SUM: "sum",
+    AggregateType.AVG: "mean",
+    AggregateType.MIN: "min",
+    AggregateType.MAX: "max",
+    AggregateType.COUNT: "count",
+    AggregateType.COUNT_DISTINCT: "count_distinct",
+}
+
+
+def _scalar_aggregate(column: Any, aggregate: AggregateType) -> Any:
+    _, pc = require_arrow()
+    return getattr(pc, _AGGREGATES[aggregate])(column).as_py()
+
+
+def filter_table(table: Any, query: ChartQuery, field_ids: list[str]) -> Any:
+    """조건을 적용하고 field_ids 컬럼만 남긴 테이블 (로컬 원본 / 롤업 공통)"""
+    _, pc = require_arrow()
+    names = set(table.column_names)
+    for field_id in set(field_ids) | {p.field_id for p in query.predicates}:
+        if field_id not in names:
+            raise QueryEngineError("INVALID_FIELD", f"업로드된 데이터에 '{field_id}' 컬럼이 없습니다.")
+
+    mask = None
+    for pred in query.predicates:
+        part = compile_arrow_predicate(pred, table.column)
+        mask = part if mask is None else pc.and_(mask, part)
+
+    data = table.select(list(dict.fromkeys(field_ids)))
+    return data.filter(mask) if mask is not None else data
+
+
+def order_result(arrays: list[Any], totals: Optional[list[Any]], query: ChartQuery) -> tuple[Any, Optional[list[Any]], Any]:
+    """컬럼 배열을 결과 테이블(c0..cn)로 묶고 정렬 인덱스를 계산합니다."""
+    pa, pc = require_arrow()
+    result = pa.table(arrays, names=[f"c{i}" for i in range(len(arrays))])
+
+    order = None
+    keys = sort_keys(query)
+    if keys:
+        # null_placement 기본값이 at_end — SQL 쪽 NULLS LAST와 동일
+        order = pc.sort_indices(
+            result,
+            sort_keys=[(f"c{idx}", "descending" if d == SortDir.DESC else "ascending") for idx, d in keys],
+        )
+    return result, totals, order
+
+
+def _evaluate(table: Any, query: ChartQuery) -> tuple[Any, Optional[list[Any]], Any]:
+    """(결과 테이블 c0..cn, 합계 행, 정렬 인덱스 또는 None)을 계산합니다. 페이지는 자르지 않습니다."""
+    pa, _ = require_arrow()
+    columns = query.columns
+    if not columns:
+        raise QueryEngineError("INVALID_CHART_CONFIG", "차트에 차원 또는 지표가 설정되지 않았습니다.")
+
+    data = filter_table(table, query, [c.field_id for c in columns])
+
+    totals = None
+    if query.is_grouped:
+        group_ids = list(dict.fromkeys(c.field_id for c in query.group_fields))
+        if group_ids:
+            aggs = list(dict.fromkeys((c.field_id, _AGGREGATES[c.aggregate]) for c in columns if c.is_aggregated))
+            grouped = data.group_by(group_ids).aggregate(aggs)
+            arrays = [
+                grouped[f"{c.field_id}_{_AGGREGATES[c.aggregate]}"] if c.is_aggregated else grouped[c.field_id]
+                for c in columns
+            ]
+        else:
+            # 차원 없는 집계 — 필터 결과가 비어도 1행
+            arrays = [pa.array([_scalar_aggregate(data[c.field_id], c.aggregate)]) for c in columns]
+        if query.with_totals:
+            totals = [
+                _scalar_aggregate(data[c.field_id], c.aggregate) if c.is_aggregated else None for c in columns
+            ]
+    else:
+        arrays = [data[c.field_id] for c in columns]
+        if query.with_totals:
+            totals = [None] * len(columns)
+
+    return order_result(arrays, totals, query)
+
+
+def _slice_rows(result: Any, order: Any, offset: int, limit: int) -> list[list[Any]]:
+    page = result.take(order.slice(offset, limit)) if order is not None else result.slice(offset, limit)
+    return [list(row) for row in zip(*(col.to_pylist() for col in page.columns))]
+
+
+def slice_result(result: Any, totals: Optional[list[Any]], order: Any, query: ChartQuery) -> ChartResult:
+    rows = _slice_rows(result, order, query.offset, query.limit)
+    return ChartResult(columns=query.columns, rows=rows, totals=totals, total=result.num_rows)
+
+
+def execute_local(table: Any, query: ChartQuery) -> ChartResult:
+    return slice_result(*_evaluate(table, query), query)
+
+
+def _storage_key(datasource: DataSource) -> str:
+    storage_key = (datasource.connection_config or {}).get("storage_key")
+    if not storage_key:
+        raise QueryEngineError("INVALID_DATASOURCE", "업로드된 데이터 파일이 없습니다.")
+    return storage_key
+
+
+async def run_on_table(datasource: DataSource, fn: Callable[[Any], T]) -> T:
+    """업로드 파일 테이블에 fn(table)을 실행 — 벡터 연산은 GIL을 놓으므로 스레드 풀에서 실행"""
+    storage_key = _storage_key(datasource)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, lambda: fn(open_table(storage_key)))
+
+
+async def run_local(datasource: DataSource, query: ChartQuery) -> ChartResult:
+    """업로드 파일 데이터 소스 쿼리"""
+    return await run_on_table(datasource, lambda table: execute_local(table, query))
+
+
+async def stream_local(datasource: DataSource, query: ChartQuery, batch_size: int) -> AsyncIterator[list[list[Any]]]:
+    """내보내기용 — 정렬된 전체 결과를 batch_size 행씩 파이썬 행으로 변환해 흘려보냅니다.
+
+    결과 테이블은 메모리 맵 원본을 참조하거나(원본 행 조회) 집계 결과라 작고,
+    파이썬 객체로 바꾸는 것은 배치 단위로만 합니다.
+    """
+    storage_key = _storage_key(datasource)
+    loop = asyncio.get_running_loop()
+    result, _, order = await loop.run_in_executor(None, lambda: _evaluate(open_table(storage_key), query))
+    for offset in range(0, result.num_rows, batch_size):
+        yield await loop.run_in_executor(None, _slice_rows, result, order, offset, batch_size)
@@ -0,0 +1,276 @@
+"""ORM 모델(Chart, DataSource, Filter, DefaultFilterRule) → ChartQuery / CascadeQuery 변환"""
+import calendar
+import uuid
+from datetime import date, timedelta
+from typing import Any, Iterable, Optional
+
+from app.db.models.chart import Chart
+from app.db.models.datasource import DataSource, DataSourceField
+from app.db.models.enums import AggregateType, ChartType, FilterOp, FilterType, SortDir
+from app.db.models.filter import DefaultFilterRule, Filter
+from app.engine.cascade import CascadeQuery, CascadeTarget
+from app.engine.errors import QueryEngineError
+from app.engine.spec import ChartQuery, Predicate, QueryField, SortKey
+
+# 차트 타입별 config 키 (docs/api.md §6.1 "차트 타입별 config 주요 필드")
+_DIMENSION_KEYS: dict[ChartType, tuple[str, ...]] = {
+    ChartType.TABLE: ("dimensions",),
+    ChartType.PIVOT: ("row_dimension", "col_dimension"),
+    ChartType.LINE: ("x_axis", "legend"),
+    ChartType.BAR: ("x_axis", "legend"),
+    ChartType.STACKED_BAR: ("x_axis", "series"),
+    ChartType.PIE: ("dimension",),
+    ChartType.SCORECARD: (),
+}
+_METRIC_KEYS: dict[ChartType, tuple[str, ...]] = {
+    ChartType.TABLE: ("metrics",),
+    ChartType.PIVOT: ("metrics",),
+    ChartType.LINE: ("y_axis",),
+    ChartType.BAR: ("y_axis",),
+    ChartType.STACKED_BAR: ("metrics",),
+    ChartType.PIE: ("metric",),
+    ChartType.SCORECARD: ("metric", "comparison_metric"),
+}
+
+
+def _items(value: Any) -> list[dict]:
+    """config 값(dict / list / field_id 문자열)을 dict 목록으로 정규화합니다."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [{"field_id": value}]
+    if isinstance(value, dict):
+        return [value] if value.get("field_id") else []
+    return [v for item in value for v in _items(item)]
+
+
+def _sorted_items(config: dict, keys: Iterable[str]) -> list[dict]:
+    items = [item for key in keys for item in _items(config.get(key))]
+    return sorted(items, key=lambda it: it.get("order", 0))
+
+
+def chart_fields(chart: Chart, datasource: DataSource) -> tuple[list[QueryField], list[QueryField]]:
+    """차트 설정에서 (차원, 지표) QueryField 목록을 추출합니다."""
+    config = chart.config or {}
+    fields = {f.field_id: f for f in datasource.fields}
+
+    def resolve(item: dict, is_metric: bool) -> QueryField:
+        meta: Optional[DataSourceField] = fields.get(item["field_id"])
+        if meta is None:
+            raise QueryEngineError(
+                "INVALID_FIELD", f"데이터 소스에 '{item['field_id']}' 필드가 없습니다."
+            )
+        aggregate = AggregateType.NONE
+        if is_metric:
+            raw = item.get("aggregate")
+            aggregate = AggregateType(raw) if raw else meta.default_aggregate
+        return QueryField(
+            field_id=meta.field_id,
+            label=item.get("label") or meta.label,
+            type=meta.type,
+            aggregate=aggregate,
+        )
+
+    dims = [resolve(i, False) for i in _sorted_items(config, _DIMENSION_KEYS.get(chart.type, ()))]
+    metrics = [resolve(i, True) for i in _sorted_items(config, _METRIC_KEYS.get(chart.type, ()))]
+    return dims, metrics
+
+
+# ── 필터 → Predicate ──────────────────────────────────────────────────────────
+
+def resolve_date_preset(preset: str, today: Optional[date] = None) -> Optional[tuple[date, date]]:
+    """DATE_RANGE 필터의 상대 기간 프리셋을 [시작, 종료] 날짜로 변환합니다."""
+    today = today or date.today()
+    preset = preset.upper()
+    if preset == "TODAY":
+        return today, today
+    if preset == "YESTERDAY":
+        d = today - timedelta(days=1)
+        return d, d
+    if preset.startswith("LAST_") and preset.endswith("_DAYS"):
+        try:
+            n = int(preset[len("LAST_"):-len("_DAYS")])
+        except ValueError:
+            return None
+        return today - timedelta(days=n - 1), today
+    if preset == "THIS_MONTH":
+        return today.replace(day=1), today
+    if preset == "LAST_MONTH":
+        last = today.replace(day=1) - timedelta(days=1)
+        return last.replace(day=1), last.replace(day=calendar.monthrange(last.year, last.month)[1])
+    if preset == "THIS_YEAR":
+        return today.replace(month=1, day=1), today
+    return None
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def filter_predicate(flt: Filter, value: Any, meta: DataSourceField) -> Optional[Predicate]:
+    """Filter UI 요소 + 현재 선택 값 → Predicate. 값이 비어 있으면 None(필터 미적용)."""
+    if _is_empty(value):
+        return None
+    config = flt.config or {}
+
+    if flt.type == FilterType.DROPDOWN:
+        op = FilterOp.EQ
+    elif flt.type == FilterType.TEXT_INPUT:
+        op = FilterOp(config.get("operator") or FilterOp.CONTAINS)
+    elif flt.type == FilterType.RANGE:
+        op = FilterOp(config.get("operator") or FilterOp.BETWEEN)
+    else:  # DATE_RANGE
+        if isinstance(value, str):
+            span = resolve_date_preset(value)
+            if span:
+                value = [span[0].isoformat(), span[1].isoformat()]
+        op = FilterOp.BETWEEN if isinstance(value, (list, dict)) else FilterOp.EQ
+
+    return Predicate(field_id=meta.field_id, field_type=meta.type, op=op, value=value)
+
+
+def rule_predicate(rule: DefaultFilterRule, meta: DataSourceField) -> Predicate:
+    value = rule.value
+    # JSONB 컬럼에 {"value": ...} 형태로 감싸 저장된 경우도 허용
+    if isinstance(value, dict) and set(value) == {"value"}:
+        value = value["value"]
+    return Predicate(field_id=meta.field_id, field_type=meta.type, op=rule.operator, value=value)
+
+
+def _is_page_wide(apply_to: Any) -> bool:
+    return apply_to in (None, "", "PAGE")
+
+
+def _applies_to_chart(apply_to: Any, chart_id: uuid.UUID) -> bool:
+    if _is_page_wide(apply_to):
+        return True
+    if isinstance(apply_to, (list, tuple)):
+        return str(chart_id) in {str(a) for a in apply_to}
+    return str(apply_to) == str(chart_id)
+
+
+def chart_predicates(
+    chart: Chart,
+    datasource: DataSource,
+    filters: Iterable[Filter],
+    filter_values: dict[uuid.UUID, Any],
+    default_rules: Iterable[DefaultFilterRule],
+) -> list[Predicate]:
+    """차트에 적용되는 기본 필터 규칙 + 활성 필터 값을 Predicate 목록으로 모읍니다."""
+    fields = {f.field_id: f for f in datasource.fields}
+    preds: list[Predicate] = []
+
+    for rule in default_rules:
+        if rule.datasource_id != datasource.id or not _applies_to_chart(rule.apply_to, chart.id):
+            continue
+        meta = fields.get(rule.field_id)
+        if meta is None:
+            raise QueryEngineError("INVALID_FIELD", f"기본 필터의 '{rule.field_id}' 필드가 데이터 소스에 없습니다.")
+        preds.append(rule_predicate(rule, meta))
+
+    for flt in filters:
+        if flt.datasource_id != datasource.id or not flt.field_id:
+            continue
+        config = flt.config or {}
+        if not _applies_to_chart(config.get("apply_to"), chart.id):
+            continue
+        meta = fields.get(flt.field_id)
+        if meta is None:
+            continue
+        value = filter_values[flt.id] if flt.id in filter_values else config.get("default_value")
+        pred = filter_predicate(flt, value, meta)
+        if pred is not None:
+            preds.append(pred)
+
+    return preds
+
+
+def build_chart_query(
+    chart: Chart,
+    datasource: DataSource,
+    *,
+    filters: Iterable[Filter] = (),
+    filter_values: Optional[dict[uuid.UUID, Any]] = None,
+    default_rules: Iterable[DefaultFilterRule] = (),
+    sort: Optional[SortKey] = None,
+    page: int = 1,
+    limit: Optional[int] = None,
+) -> ChartQuery:
+    config = chart.config or {}
+    dims, metrics = chart_fields(chart, datasource)
+
+    default_sort = config.get("default_sort") or {}
+    if sort is None and default_sort.get("field_id"):
+        sort = SortKey(default_sort["field_id"], SortDir(default_sort.get("direction") or SortDir.ASC))
+
+    limit = limit or config.get("rows_per_page") or 20
+    return ChartQuery(
+        source_config=datasource.connection_config or {},
+        dimensions=dims,
+        metrics=metrics,
+        predicates=chart_predicates(chart, datasource, filters, filter_values or {}, default_rules),
+        sort=[sort] if sort else [],
+        limit=limit,
+        offset=(page - 1) * limit,
+        with_totals=bool(config.get("show_totals_row", True)),
+    )
+
+
+# ── 연쇄 필터 ─────────────────────────────────────────────────────────────────
+
+def build_cascade_query(
+    datasource: DataSource,
+    *,
+    filters: Iterable[Filter],
+    filter_values: dict[uuid.UUID, Any],
+    default_rules: Iterable[DefaultFilterRule],
+    limit: int,
+) -> tuple[CascadeQuery, list[uuid.UUID]]:
+    """(CascadeQuery, targets 순서의 드롭다운 filter_id 목록)
+
+    페이지 전체에 적용되는 선택/기본 필터만 다른 드롭다운을 좁힙니다. (특정 차트에만 걸린 선택은
+    다른 차트에서는 적용되지 않으므로 드롭다운 값을 줄이면 안 됨)
+    좁힐 조건이 하나도 없는 드롭다운은 값 인덱스(7.5)와 같으므로 targets에서 뺍니다.
+    같은 선택이면 같은 SQL이 되도록 필터는 id 순, 다중 선택 값은 정렬해 캐시 fingerprint를 고정합니다.
+    """
+    fields = {f.field_id: f for f in datasource.fields}
+    base = [
+        rule_predicate(rule, fields[rule.field_id])
+        for rule in default_rules
+        if rule.datasource_id == datasource.id and _is_page_wide(rule.apply_to) and rule.field_id in fields
+    ]
+
+    selections: list[Predicate] = []
+    own: dict[uuid.UUID, int] = {}
+    dropdowns: list[Filter] = []
+    for flt in sorted(filters, key=lambda f: str(f.id)):
+        if flt.datasource_id != datasource.id or flt.field_id not in fields:
+            continue
+        config = flt.config or {}
+        if flt.type == FilterType.DROPDOWN:
+            dropdowns.append(flt)
+        if not _is_page_wide(config.get("apply_to")):
+            continue
+        value = filter_values[flt.id] if flt.id in filter_values else config.get("default_value")
+        if flt.type == FilterType.DROPDOWN and isinstance(value, list):
+            value = sorted({str(v) for v in value if v is not None})
+        pred = filter_predicate(flt, value, fields[flt.field_id])
+        if pred is not None:
+            own[flt.id] = len(selections)
+            selections.append(pred)
+
+    query = CascadeQuery(
+        source_config=datasource.connection_config or {},
+        base=base,
+        selections=selections,
+        targets=[],
+        limit=limit,
+    )
+    filter_ids = []
+    for flt in dropdowns:
+        meta = fields[flt.field_id]
+        target = CascadeTarget(QueryField(meta.field_id, meta.label, meta.type), own.get(flt.id))
+        if query.predicates(target):
+            query.targets.append(target)
+            filter_ids.append(flt.id)
+    return query, filter_ids
@@ -0,0 +1,577 @@
+"""외부 데이터 소스 커넥션 풀 레지스트리
+
+데이터 소스마다 풀을 하나씩 지연 생성하고 (datasource_id, 설정 버전)으로 관리합니다.
+connection_config가 바뀌면 다음 사용 시점에 새 풀로 교체하고 이전 풀은 닫습니다.
+
+- 데이터 소스별 최대 연결 수: connection_config.pool_max_size 또는 DATASOURCE_POOL_MAX_SIZE
+- 대기열 타임아웃: connection_config.pool_timeout 또는 DATASOURCE_POOL_QUEUE_TIMEOUT
+- 유휴 연결 재활용: DATASOURCE_POOL_IDLE_LIFETIME 이상 쉬고 있는 연결은 닫고 새로 연결
+- 오래 쓰이지 않은 풀(삭제된 소스 포함)은 DATASOURCE_POOL_EVICT_AFTER 후 정리
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.db.models.datasource import DataSource
+from app.db.models.enums import DSSourceType
+from app.engine.errors import QueryEngineError
+
+logger = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT = 10  # 초
+_SWEEP_INTERVAL = 60  # 초
+
+T = TypeVar("T")
+
+# 드라이버 호출 도중 끊긴 경우 — 취소/시간 초과, 소비자가 스트림을 중간에 닫음
+_INTERRUPTED = (asyncio.CancelledError, GeneratorExit)
+
+
+def _require(module: str, extra: str):
+    try:
+        return __import__(module, fromlist=["_"])
+    except ImportError:
+        raise QueryEngineError(
+            "DRIVER_NOT_INSTALLED",
+            f"{module} 드라이버가 설치되어 있지 않습니다. (pip install 'lookflex-backend[{extra}]')",
+            status_code=501,
+        )
+
+
+def config_version(config: Optional[dict]) -> str:
+    """connection_config 내용 기반 버전 — 값이 하나라도 바뀌면 다른 풀"""
+    raw = json.dumps(config or {}, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def _max_number(node: Any, keys: tuple[str, ...]) -> Optional[float]:
+    """JSON 실행 계획 트리에서 keys 값 중 최댓값 (MySQL은 숫자를 문자열로 주기도 함)"""
+    best: Optional[float] = None
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            for key, value in item.items():
+                if key in keys and not isinstance(value, (dict, list)):
+                    try:
+                        number = float(value)
+                    except (TypeError, ValueError):
+                        continue
+                    best = number if best is None else max(best, number)
+                else:
+                    stack.append(value)
+        elif isinstance(item, list):
+            stack.extend(item)
+    return best
+
+
+async def _cancellable(call: Awaitable[T], cancel: Callable[[], Awaitable[None]]) -> T:
+    """스레드에서 도는 드라이버 호출 — 호출자가 취소되면 cancel()로 서버 쪽 실행을 멈추게 하고
+    호출이 실제로 끝날 때까지 기다린 뒤 취소를 전달합니다.
+
+    그 전에 취소를 전달하면 스레드가 아직 쓰는 연결/슬롯을 호출자가 반납해 버립니다.
+    """
+    task = asyncio.ensure_future(call)
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        stopping = asyncio.ensure_future(cancel())
+        while not (task.done() and stopping.done()):
+            try:
+                await asyncio.wait({task, stopping})
+            except asyncio.CancelledError:
+                continue
+        if not task.cancelled():
+            task.exception()  # 취소로 생긴 드라이버 예외는 버림
+        if not stopping.cancelled() and stopping.exception() is not None:
+            logger.warning("데이터 소스 쿼리 취소 요청 실패: %s", stopping.exception())
+        raise
+
+
+def _busy() -> QueryEngineError:
+    return QueryEngineError(
+        "DATASOURCE_BUSY", "데이터 소스 연결이 모두 사용 중입니다. 잠시 후 다시 시도해주세요.", status_code=503
+    )
+
+
+# ── 드라이버별 풀 ─────────────────────────────────────────────────────────────
+
+class SourcePool:
+    """드라이버 풀 공통 인터페이스"""
+
+    def __init__(self, config: dict) -> None:
+        self.config = config
+        self.max_size = int(config.get("pool_max_size") or settings.DATASOURCE_POOL_MAX_SIZE)
+        self.queue_timeout = float(config.get("pool_timeout") or settings.DATASOURCE_POOL_QUEUE_TIMEOUT)
+        self.last_used = time.monotonic()
+        self.in_use = 0  # lease() 중인 호출 수 — 0보다 크면 유휴 정리 대상에서 제외
+
+    async def open(self) -> None:
+        raise NotImplementedError
+
+    async def fetch(self, sql: str, params: list[Any]) -> list[tuple]:
+        raise NotImplementedError
+
+    def stream(self, sql: str, params: list[Any], batch_size: int) -> AsyncIterator[list[tuple]]:
+        """서버 사이드 커서로 batch_size 행씩 읽습니다. 순회가 끝날 때까지 연결 1개를 점유합니다."""
+        raise NotImplementedError
+
+    async def describe(self, sql: str) -> list[tuple[str, str]]:
+        """결과 컬럼의 (이름, 드라이버 타입명) 목록 — 행은 읽지 않습니다."""
+        raise NotImplementedError
+
+    async def estimate(self, sql: str, params: list[Any]) -> Optional[float]:
+        """실행 없이 옵티마이저 계획으로 본 예상 처리 행 수 — 추정할 수 없으면 None
+
+        계획의 노드(조인 포함)별 예상 행 수 중 최댓값을 씁니다. 카티션 곱처럼 중간 결과가 폭증하는 쿼리는
+        최종 결과 행 수가 작아도 여기서 크게 잡힙니다.
+        """
+        return None
+
+    async def close(self) -> None:
+        raise NotImplementedError
+
+
+class PostgresPool(SourcePool):
+    async def open(self) -> None:
+        import asyncpg
+
+        config = self.config
+        self.pool = await asyncpg.create_pool(
+            host=config.get("host"),
+            port=config.get("port", 5432),
+            user=config.get("username"),
+            password=config.get("password"),
+            database=config.get("database"),
+            timeout=CONNECT_TIMEOUT,
+            min_size=0,
+            max_size=self.max_size,
+            max_inactive_connection_lifetime=settings.DATASOURCE_POOL_IDLE_LIFETIME,
+            server_settings={"search_path": config["schema"]} if config.get("schema") else None,
+        )
+
+    async def _acquire(self):
+        try:
+            return await self.pool.acquire(timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise _busy()
+
+    async def fetch(self, sql: str, params: list[Any]) -> list[tuple]:
+        conn = await self._acquire()
+        try:
+            return [tuple(r) for r in await conn.fetch(sql, *params)]
+        finally:
+            await self.pool.release(conn)
+
+    async def stream(self, sql: str, params: list[Any], batch_size: int) -> AsyncIterator[list[tuple]]:
+        conn = await self._acquire()
+        try:
+            # asyncpg 커서는 트랜잭션 안에서만 사용 가능
+            async with conn.transaction(readonly=True):
+                cursor = await conn.cursor(sql, *params)
+                while records := await cursor.fetch(batch_size):
+                    yield [tuple(r) for r in records]
+        finally:
+            await self.pool.release(conn)
+
+    async def describe(self, sql: str) -> list[tuple[str, str]]:
+        conn = await self._acquire()
+        try:
+            # prepare만 하면 서버가 결과 컬럼 타입을 알려줌 (실행 없음)
+            statement = await conn.prepare(sql)
+            return [(attr.name, attr.type.name) for attr in statement.get_attributes()]
+        finally:
+            await self.pool.release(conn)
+
+    async def estimate(self, sql: str, params: list[Any]) -> Optional[float]:
+        conn = await self._acquire()
+        try:
+            raw = await conn.fetchval(f"EXPLAIN (FORMAT JSON) {sql}", *params)
+        finally:
+            await self.pool.release(conn)
+        return _max_number(json.loads(raw) if isinstance(raw, str) else raw, ("Plan Rows",))
+
+    async def close(self) -> None:
+        await self.pool.close()
+
+
+class MySQLPool(SourcePool):
+    """aiomysql은 코루틴 안에서 프로토콜을 읽으므로 취소 즉시 멈추지만, 결과 패킷을 덜 읽은 연결은
+    상태를 알 수 없어 풀에 돌려주지 않고 닫습니다. (소켓이 닫히면 서버도 쿼리를 중단)
+    """
+
+    async def open(self) -> None:
+        self.aiomysql = aiomysql = _require("aiomysql", "mysql")
+        config = self.config
+        self.pool = await aiomysql.create_pool(
+            host=config.get("host"),
+            port=config.get("port", 3306),
+            user=config.get("username"),
+            password=config.get("password") or "",
+            db=config.get("database"),
+            connect_timeout=CONNECT_TIMEOUT,
+            minsize=0,
+            maxsize=self.max_size,
+            pool_recycle=settings.DATASOURCE_POOL_IDLE_LIFETIME,
+        )
+
+    async def _acquire(self):
+        try:
+            return await asyncio.wait_for(self.pool.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise _busy()
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[Any]:
+        conn = await self._acquire()
+        try:
+            yield conn
+        except _INTERRUPTED:
+            conn.close()
+            raise
+        finally:
+            # 닫힌 연결은 release가 유휴 목록에 넣지 않고 버림
+            self.pool.release(conn)
+
+    async def fetch(self, sql: str, params: list[Any]) -> list[tuple]:
+        async with self._connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(sql, params)
+                return list(await cur.fetchall())
+
+    async def stream(self, sql: str, params: list[Any], batch_size: int) -> AsyncIterator[list[tuple]]:
+        async with self._connection() as conn:
+            # SSCursor: 결과를 클라이언트에 모두 버퍼링하지 않고 서버에서 흘려받음
+            async with conn.cursor(self.aiomysql.SSCursor) as cur:
+                await cur.execute(sql, params)
+                while rows := await cur.fetchmany(batch_size):
+                    yield list(rows)
+
+    async def describe(self, sql: str) -> list[tuple[str, str]]:
+        from pymysql.constants import FIELD_TYPE
+
+        names = {code: name for name, code in vars(FIELD_TYPE).items() if name.isupper()}
+        async with self._connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(sql)
+                return [(col[0], names.get(col[1], "")) for col in cur.description or []]
+
+    async def estimate(self, sql: str, params: list[Any]) -> Optional[float]:
+        async with self._connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(f"EXPLAIN FORMAT=JSON {sql}", params)
+                row = await cur.fetchone()
+        if not row:
+            return None
+        return _max_number(json.loads(row[0]), ("rows_examined_per_scan", "rows_produced_per_join"))
+
+    async def close(self) -> None:
+        self.pool.close()
+        await self.pool.wait_closed()
+
+
+def _mssql_dsn(config: dict) -> str:
+    driver = config.get("driver", "ODBC Driver 18 for SQL Server")
+    return (
+        f"DRIVER={{{driver}}};SERVER={config.get('host')},{config.get('port', 1433)};"
+        f"DATABASE={config.get('database')};UID={config.get('username')};PWD={config.get('password')};"
+        f"TrustServerCertificate={'yes' if config.get('trust_server_certificate', True) else 'no'}"
+    )
+
+
+_SHOWPLAN_ROWS = re.compile(r'EstimateRows="([0-9.eE+-]+)"')
+
+
+class MSSQLPool(SourcePool):
+    """aioodbc는 pyodbc 호출을 스레드 풀에서 실행하므로 취소되어도 스레드의 실행은 계속됩니다.
+
+    취소 시 ODBC 취소 요청(SQLCancel)을 보내고 스레드가 돌아온 뒤에 연결을 닫습니다. (그때까지 슬롯 유지)
+    """
+
+    async def open(self) -> None:
+        aioodbc = _require("aioodbc", "mssql")
+        self.pool = await aioodbc.create_pool(
+            dsn=_mssql_dsn(self.config),
+            timeout=CONNECT_TIMEOUT,
+            minsize=0,
+            maxsize=self.max_size,
+            pool_recycle=settings.DATASOURCE_POOL_IDLE_LIFETIME,
+        )
+
+    async def _acquire(self):
+        try:
+            return await asyncio.wait_for(self.pool.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise _busy()
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[Any]:
+        conn = await self._acquire()
+        try:
+            yield conn
+        except _INTERRUPTED:
+            await conn.close()
+            raise
+        finally:
+            await self.pool.release(conn)
+
+    @staticmethod
+    def _call(cur: Any, call: Awaitable[T]) -> Awaitable[T]:
+        async def cancel() -> None:
+            # aioodbc 커서는 cancel을 감싸지 않아 pyodbc 커서에 직접 요청 (다른 스레드에서 호출 가능한 API)
+            cur._impl.cancel()
+
+        return _cancellable(call, cancel)
+
+    async def fetch(self, sql: str, params: list[Any]) -> list[tuple]:
+        async with self._connection() as conn:
+            async with conn.cursor() as cur:
+                await self._call(cur, cur.execute(sql, params))
+                return [tuple(r) for r in await self._call(cur, cur.fetchall())]
+
+    async def stream(self, sql: str, params: list[Any], batch_size: int) -> AsyncIterator[list[tuple]]:
+        async with self._connection() as conn:
+            # ODBC 커서는 fetchmany 단위로 서버에서 읽어옴
+            async with conn.cursor() as cur:
+                await self._call(cur, cur.execute(sql, params))
+                while rows := await self._call(cur, cur.fetchmany(batch_size)):
+                    yield [tuple(r) for r in rows]
+
+    async def describe(self, sql: str) -> list[tuple[str, str]]:
+        async with self._connection() as conn:
+            async with conn.cursor() as cur:
+                await self._call(cur, cur.execute(sql))
+                # pyodbc description의 타입은 파이썬 클래스 (str, int, Decimal, datetime, ...)
+                return [(col[0], col[1].__name__) for col in cur.description or []]
+
+    async def estimate(self, sql: str, params: list[Any]) -> Optional[float]:
+        async with self._connection() as conn:
+            async with conn.cursor() as cur:
+                # SHOWPLAN_XML이 켜진 동안에는 쿼리를 실행하지 않고 예상 실행 계획 XML만 돌려줌
+                await cur.execute("SET SHOWPLAN_XML ON")
+                try:
+                    await self._call(cur, cur.execute(sql, params))
+                    row = await self._call(cur, cur.fetchone())
+                finally:
+                    await cur.execute("SET SHOWPLAN_XML OFF")
+        if not row:
+            return None
+        rows = [float(v) for v in _SHOWPLAN_ROWS.findall(str(row[0]))]
+        return max(rows) if rows else None
+
+    async def close(self) -> None:
+        self.pool.close()
+        await self.pool.wait_closed()
+
+
+class BigQueryPool(SourcePool):
+    """BigQuery는 HTTP API라 연결 풀 대신 클라이언트 1개 재사용 + 동시 실행 수 제한
+
+    동기 클라이언트를 스레드 풀에서 호출하므로, 취소되면 작업 취소(cancel_job)를 요청하고
+    스레드가 돌아온 뒤에 동시 실행 슬롯을 돌려줍니다.
+    """
+
+    async def open(self) -> None:
+        self.bigquery = _require("google.cloud.bigquery", "bigquery")
+        self.client = self.bigquery.Client(project=self.config.get("project_id"))
+        self.slots = asyncio.Semaphore(self.max_size)
+
+    def _params(self, params: list[Any]) -> list:
+        from datetime import date, datetime
+
+        result = []
+        for idx, value in enumerate(params):
+            if isinstance(value, bool):
+                kind = "BOOL"
+            elif isinstance(value, int):
+                kind = "INT64"
+            elif isinstance(value, float):
+                kind = "FLOAT64"
+            elif isinstance(value, datetime):
+                kind = "TIMESTAMP" if value.tzinfo else "DATETIME"
+            elif isinstance(value, date):
+                kind = "DATE"
+            else:
+                kind = "STRING"
+            result.append(self.bigquery.ScalarQueryParameter(f"p{idx}", kind, value))
+        return result
+
+    async def _acquire(self) -> None:
+        try:
+            await asyncio.wait_for(self.slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise _busy()
+
+    async def _run(self, fn: Callable[..., T], *args: Any, job: Any = None) -> T:
+        """스레드 풀에서 fn 실행 — 취소되면 job 취소를 요청하고 스레드가 끝날 때까지 기다림"""
+        loop = asyncio.get_running_loop()
+
+        async def cancel() -> None:
+            if job is not None:
+                await loop.run_in_executor(None, lambda: self.client.cancel_job(job.job_id, location=job.location))
+
+        return await _cancellable(loop.run_in_executor(None, fn, *args), cancel)
+
+    async def _start(self, sql: str, job_config: Any) -> Any:
+        # 작업 생성(insert) 요청 — 이후 결과 대기는 job 기준으로 취소 가능
+        return await self._run(lambda: self.client.query(sql, job_config=job_config))
+
+    async def fetch(self, sql: str, params: list[Any]) -> list[tuple]:
+        await self._acquire()
+        try:
+            job = await self._start(sql, self.bigquery.QueryJobConfig(query_parameters=self._params(params)))
+            # google-cloud-bigquery 클라이언트는 동기 API이므로 스레드 풀에서 실행
+            return await self._run(lambda: [tuple(row.values()) for row in job.result()], job=job)
+        finally:
+            self.slots.release()
+
+    async def stream(self, sql: str, params: list[Any], batch_size: int) -> AsyncIterator[list[tuple]]:
+        await self._acquire()
+        try:
+            job = await self._start(sql, self.bigquery.QueryJobConfig(query_parameters=self._params(params)))
+            # 결과 페이지를 하나씩 요청 — 전체 결과를 메모리에 올리지 않음
+            pages = await self._run(lambda: iter(job.result(page_size=batch_size).pages), job=job)
+            while (page := await self._run(next, pages, None, job=job)) is not None:
+                yield [tuple(row.values()) for row in page]
+        finally:
+            self.slots.release()
+
+    async def describe(self, sql: str) -> list[tuple[str, str]]:
+        await self._acquire()
+        try:
+            job = await self._start(sql, None)
+            return await self._run(lambda: [(f.name, f.field_type) for f in job.result().schema], job=job)
+        finally:
+            self.slots.release()
+
+    async def estimate(self, sql: str, params: list[Any]) -> Optional[float]:
+        """dry run 처리 예정 바이트를 QUERY_COST_BYTES_PER_ROW로 나눈 행 수 (BigQuery는 계획 행 수를 주지 않음)"""
+        await self._acquire()
+        try:
+            job_config = self.bigquery.QueryJobConfig(
+                dry_run=True, use_query_cache=False, query_parameters=self._params(params)
+            )
+            # dry run은 작업을 만들지 않아 취소할 대상이 없음
+            processed = (await self._start(sql, job_config)).total_bytes_processed
+        finally:
+            self.slots.release()
+        return None if processed is None else processed / settings.QUERY_COST_BYTES_PER_ROW
+
+    async def close(self) -> None:
+        self.client.close()
+
+
+_POOL_TYPES: dict[DSSourceType, type[SourcePool]] = {
+    DSSourceType.POSTGRESQL: PostgresPool,
+    DSSourceType.MYSQL: MySQLPool,
+    DSSourceType.MSSQL: MSSQLPool,
+    DSSourceType.BIGQUERY: BigQueryPool,
+}
+
+
+# ── 레지스트리 ────────────────────────────────────────────────────────────────
+
+class PoolRegistry:
+    def __init__(self) -> None:
+        self._pools: dict[uuid.UUID, tuple[str, SourcePool]] = {}
+        self._lock = asyncio.Lock()
+        self._last_sweep = time.monotonic()
+        # 백그라운드로 닫는 중인 풀 — 태스크 참조를 유지해 GC로 중단되지 않게 함
+        self._closing: set[asyncio.Task] = set()
+
+    async def get(self, datasource: DataSource) -> SourcePool:
+        version = config_version(datasource.connection_config)
+        entry = self._pools.get(datasource.id)
+        if entry and entry[0] == version:
+            entry[1].last_used = time.monotonic()
+            self.sweep()
+            return entry[1]
+
+        async with self._lock:
+            entry = self._pools.get(datasource.id)
+            if entry and entry[0] == version:
+                return entry[1]
+
+            pool_type = _POOL_TYPES.get(datasource.source_type)
+            if pool_type is None:
+                raise QueryEngineError(
+                    "UNSUPPORTED_SOURCE", f"{datasource.source_type.value} 데이터 소스는 실행할 수 없습니다."
+                )
+            pool = pool_type(datasource.connection_config or {})
+            await pool.open()
+            self._pools[datasource.id] = (version, pool)
+
+        if entry:
+            # 설정이 바뀐 소스 — 이전 풀은 진행 중인 쿼리가 끝난 뒤 닫힘
+            logger.info("데이터 소스 %s 설정 변경으로 커넥션 풀 교체", datasource.id)
+            self._close_later(entry[1])
+        self.sweep()
+        return pool
+
+    @asynccontextmanager
+    async def lease(self, datasource: DataSource) -> AsyncIterator[SourcePool]:
+        """get()으로 받은 풀을 블록이 끝날 때까지 사용 중으로 표시합니다.
+
+        긴 내보내기/커서처럼 get() 이후 오래 풀을 쓰는 동안 sweep()이 풀을 닫지 않도록 합니다.
+        """
+        pool = await self.get(datasource)
+        pool.in_use += 1
+        try:
+            yield pool
+        finally:
+            pool.in_use -= 1
+            pool.last_used = time.monotonic()
+
+    async def evict(self, datasource_id: uuid.UUID) -> None:
+        """데이터 소스 수정/삭제 시 호출 — 해당 풀을 즉시 닫습니다."""
+        entry = self._pools.pop(datasource_id, None)
+        if entry:
+            await self._close(entry[1])
+
+    def sweep(self) -> None:
+        """DATASOURCE_POOL_EVICT_AFTER 동안 쓰이지 않은 풀을 정리합니다.
+
+        get()마다 호출되며 _SWEEP_INTERVAL에 한 번만 실제로 검사합니다. 풀은 백그라운드로 닫혀 호출자를 막지 않습니다.
+        lease() 중인 풀은 마지막 get() 이후 오래 지났어도 정리하지 않습니다.
+        """
+        now = time.monotonic()
+        if now - self._last_sweep < _SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        stale = [
+            ds_id for ds_id, (_, pool) in self._pools.items()
+            if not pool.in_use and now - pool.last_used > settings.DATASOURCE_POOL_EVICT_AFTER
+        ]
+        for ds_id in stale:
+            logger.info("데이터 소스 %s 커넥션 풀 유휴 정리", ds_id)
+            self._close_later(self._pools.pop(ds_id)[1])
+
+    async def close_all(self) -> None:
+        entries = list(self._pools.values())
+        self._pools.clear()
+        for _, pool in entries:
+            await self._close(pool)
+        if self._closing:
+            await asyncio.gather(*self._closing)
+
+    def _close_later(self, pool: SourcePool) -> None:
+        task = asyncio.create_task(self._close(pool))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close(self, pool: SourcePool) -> None:
+        try:
+            await pool.close()
+        except Exception as exc:
+            logger.warning("커넥션 풀 종료 실패: %s", exc)
+
+
+# 모듈 레벨 싱글턴 — 워커 프로세스마다 하나
+pool_registry = PoolRegistry()
@@ -0,0 +1,393 @@
+"""FilterOp 컴파일
+
+- SQL WHERE 조각 (바인드 파라미터 사용) — 원본 DB 푸시다운
+- pyarrow.compute 불리언 마스크 — 업로드 파일(컬럼 저장소) / 롤업 / 조건부 서식 벡터 연산
+
+필터(Filter), 기본 필터 규칙(DefaultFilterRule), 조건부 서식 규칙 모두 Predicate로 정규화해 이 모듈만 사용합니다.
+값 변환과 연산자별 정리(normalize)를 두 경로가 공유하고, 두 경로 모두 SQL 3값 논리와 같은 결과가 나오도록
+NULL 행은 조건을 만족하지 않는 것으로 처리합니다. 행 단위 파이썬 분기는 없습니다.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Callable
+
+from app.db.models.enums import FieldType, FilterOp
+from app.engine.columnar import require_arrow
+from app.engine.dialects import Dialect, ParamBinder
+from app.engine.errors import QueryEngineError
+from app.engine.spec import Predicate
+
+_COMPARISON = {
+    FilterOp.GT: ">",
+    FilterOp.GTE: ">=",
+    FilterOp.LT: "<",
+    FilterOp.LTE: "<=",
+}
+
+# pyarrow.compute 함수명
+_ARROW_COMPARISON = {
+    FilterOp.GT: "greater",
+    FilterOp.GTE: "greater_equal",
+    FilterOp.LT: "less",
+    FilterOp.LTE: "less_equal",
+}
+
+_LIKE_SHAPES = {
+    # op: (앞 와일드카드, 뒤 와일드카드, 부정 여부)
+    FilterOp.CONTAINS: (True, True, False),
+    FilterOp.NOT_CONTAINS: (True, True, True),
+    FilterOp.STARTS_WITH: (False, True, False),
+    FilterOp.ENDS_WITH: (True, False, False),
+}
+
+
+# ── 값 변환 ───────────────────────────────────────────────────────────────────
+
+def coerce_value(value: Any, field_type: FieldType) -> Any:
+    """JSON으로 들어온 필터 값을 필드 타입에 맞는 파이썬 값으로 변환합니다.
+
+    asyncpg 등 일부 드라이버는 바인드 파라미터 타입을 엄격하게 검사하므로
+    날짜 문자열을 date/datetime 객체로 바꿔서 넘겨야 합니다.
+    """
+    if value is None:
+        return None
+    try:
+        if field_type == FieldType.NUMBER:
+            if isinstance(value, bool):
+                return int(value)
+            if isinstance(value, (int, float)):
+                return value
+            num = Decimal(str(value).strip())
+            return int(num) if num == num.to_integral_value() else float(num)
+        if field_type == FieldType.BOOLEAN:
+            if isinstance(value, str):
+                return value.strip().lower() in ("true", "1", "y", "yes")
+            return bool(value)
+        if field_type == FieldType.DATE:
+            if isinstance(value, datetime):
+                return value.date()
+            if isinstance(value, date):
+                return value
+            return date.fromisoformat(str(value)[:10])
+        if field_type == FieldType.DATETIME:
+            if isinstance(value, datetime):
+                return value
+            if isinstance(value, date):
+                return datetime(value.year, value.month, value.day)
+            return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (ValueError, InvalidOperation):
+        raise QueryEngineError("INVALID_FILTER_VALUE", f"필터 값 '{value}'을(를) {field_type.value} 타입으로 변환할 수 없습니다.")
+    return value if isinstance(value, str) else str(value)
+
+
+def split_range(pred: Predicate) -> tuple[Any, Any]:
+    """BETWEEN 값은 [lo, hi] 배열, {min, max} 객체, value/second_value 쌍을 모두 허용합니다."""
+    value, second = pred.value, pred.second_value
+    if isinstance(value, (list, tuple)):
+        lo = value[0] if len(value) > 0 else None
+        hi = value[1] if len(value) > 1 else None
+        return lo, hi
+    if isinstance(value, dict):
+        return value.get("min", value.get("start")), value.get("max", value.get("end"))
+    return value, second
+
+
+def _is_date_only(value: Any) -> bool:
+    if isinstance(value, str):
+        return len(value) == 10
+    return isinstance(value, date) and not isinstance(value, datetime)
+
+
+def as_list(value: Any) -> list:
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+_ARROW_TYPES = {
+    FieldType.NUMBER: "float64",
+    FieldType.DATE: "date32",
+    FieldType.BOOLEAN: "bool_",
+    FieldType.TEXT: "string",
+}
+
+
+def to_arrow_array(values: list[Any], field_type: FieldType) -> Any:
+    """결과 컬럼 값 → pyarrow 배열 (조건부 서식 평가, Arrow 응답 인코딩)
+
+    드라이버 결과는 대부분 그대로 변환되고, Redis 캐시에서 복원한 결과(날짜 문자열, Decimal 문자열 등)만
+    값별로 coerce_value를 거칩니다. 변환할 수 없는 값은 NULL로 취급합니다.
+    """
+    pa, _ = require_arrow()
+    arrow_type = pa.timestamp("us") if field_type == FieldType.DATETIME else getattr(pa, _ARROW_TYPES[field_type])()
+    try:
+        return pa.array(values, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, OverflowError):
+        pass
+
+    def coerce(value: Any) -> Any:
+        try:
+            coerced = coerce_value(value, field_type)
+        except QueryEngineError:
+            return None
+        if coerced is None:
+            return None
+        if field_type == FieldType.NUMBER:
+            return float(coerced)
+        if isinstance(coerced, datetime) and coerced.tzinfo is not None:
+            return coerced.astimezone(timezone.utc).replace(tzinfo=None)
+        return coerced
+
+    return pa.array([coerce(v) for v in values], type=arrow_type)
+
+
+# ── 값 정규화 (SQL / Arrow 공통) ──────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class Operands:
+    """연산자별로 정리하고 필드 타입으로 변환까지 마친 비교 값 — 두 컴파일 경로가 같은 값을 씁니다."""
+
+    # EQ/NEQ/비교: 변환된 NULL 아닌 값, LIKE 계열: 문자열 패턴, REGEX: 패턴 1개 (비어 있으면 조건 없음)
+    values: tuple = ()
+    has_null: bool = False       # EQ/NEQ 값 목록에 NULL 포함
+    lo: Any = None               # BETWEEN 하한 (포함)
+    hi: Any = None               # BETWEEN 상한
+    hi_exclusive: bool = False   # 날짜만 지정된 DATETIME 상한 — 해당 일자 전체를 포함하도록 다음 날 0시 미만
+
+
+def normalize(pred: Predicate) -> Operands:
+    op = pred.op
+    ftype = pred.field_type
+    if op in (FilterOp.IS_NULL, FilterOp.IS_NOT_NULL):
+        return Operands()
+    if op in (FilterOp.EQ, FilterOp.NEQ):
+        values = as_list(pred.value)
+        non_null = tuple(coerce_value(v, ftype) for v in values if v is not None)
+        return Operands(values=non_null, has_null=len(non_null) != len(values))
+    if op in _LIKE_SHAPES:
+        return Operands(values=tuple(str(v) for v in as_list(pred.value) if v is not None))
+    if op == FilterOp.REGEX:
+        return Operands(values=(str(pred.value),) if pred.value is not None else ())
+    if op in _COMPARISON:
+        return Operands(values=(coerce_value(pred.value, ftype),) if pred.value is not None else ())
+    if op == FilterOp.BETWEEN:
+        lo, hi = split_range(pred)
+        exclusive = hi is not None and ftype == FieldType.DATETIME and _is_date_only(hi)
+        upper = coerce_value(hi, ftype)
+        return Operands(
+            lo=coerce_value(lo, ftype),
+            hi=upper + timedelta(days=1) if exclusive else upper,
+            hi_exclusive=exclusive,
+        )
+    raise QueryEngineError("UNSUPPORTED_OPERATOR", f"지원하지 않는 연산자입니다: {op.value}")
+
+
+# ── SQL 컴파일 ────────────────────────────────────────────────────────────────
+
+def compile_sql_predicate(
+    pred: Predicate,
+    dialect: Dialect,
+    binder: ParamBinder,
+    column: Callable[[str], str],
+) -> str:
+    """단일 Predicate를 SQL 조각으로 변환합니다. column(field_id)는 인용된 컬럼 표현식을 반환합니다."""
+    expr = column(pred.field_id)
+    op = pred.op
+    operands = normalize(pred)
+
+    if op == FilterOp.IS_NULL:
+        return f"{expr} IS NULL"
+    if op == FilterOp.IS_NOT_NULL:
+        return f"{expr} IS NOT NULL"
+
+    if op in (FilterOp.EQ, FilterOp.NEQ):
+        negate = op == FilterOp.NEQ
+        non_null = operands.values
+        parts: list[str] = []
+        if len(non_null) == 1:
+            parts.append(f"{expr} {'<>' if negate else '='} {binder.bind(non_null[0])}")
+        elif non_null:
+            phs = ", ".join(binder.bind(v) for v in non_null)
+            parts.append(f"{expr} {'NOT IN' if negate else 'IN'} ({phs})")
+        if operands.has_null:
+            parts.append(f"{expr} IS {'NOT ' if negate else ''}NULL")
+        if not parts:
+            return "1 = 1" if negate else "1 = 0"
+        return "(" + (" AND " if negate else " OR ").join(parts) + ")"
+
+    if op in _LIKE_SHAPES:
+        leading, trailing, negate = _LIKE_SHAPES[op]
+        text_expr = dialect.as_text(expr, pred.field_type)
+        likes = [
+            dialect.like(text_expr, binder.bind(dialect.like_pattern(v, leading, trailing)))
+            for v in operands.values
+        ]
+        if not likes:
+            return "1 = 1"
+        joined = " OR ".join(likes)
+        return f"NOT ({joined})" if negate else f"({joined})"
+
+    if op == FilterOp.REGEX:
+        if not operands.values:
+            return "1 = 1"
+        return dialect.regex(dialect.as_text(expr, pred.field_type), binder.bind(operands.values[0]))
+
+    if op in _COMPARISON:
+        if not operands.values:
+            return "1 = 0"   # NULL과의 비교는 항상 거짓
+        return f"{expr} {_COMPARISON[op]} {binder.bind(operands.values[0])}"
+
+    # BETWEEN
+    parts = []
+    if operands.lo is not None:
+        parts.append(f"{expr} >= {binder.bind(operands.lo)}")
+    if operands.hi is not None:
+        parts.append(f"{expr} {'<' if operands.hi_exclusive else '<='} {binder.bind(operands.hi)}")
+    return "(" + " AND ".join(parts) + ")" if parts else "1 = 1"
+
+
+# ── Arrow 컴파일 ──────────────────────────────────────────────────────────────
+#
+# prepare_arrow_predicate는 값 변환 / 값 집합 배열 / 매칭 옵션 / 정규식 검증을 한 번만 하고
+# 컬럼 배열 → 불리언 마스크 함수를 돌려줍니다. 같은 조건은 워커 안에서 캐시해 배치·요청마다 다시 만들지 않습니다.
+
+ArrowMask = Callable[[Any], Any]
+
+_PREPARED_CACHE_SIZE = 1024
+_prepared: "OrderedDict[tuple, ArrowMask]" = OrderedDict()
+_prepared_lock = Lock()   # 로컬 쿼리는 스레드 풀에서도 실행됨
+
+
+def _arrow_scalar(value: Any) -> Any:
+    # 컬럼 저장소의 DATETIME은 timezone 없는 UTC 기준 timestamp
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _is_in(arr: Any, value_set: Any) -> Any:
+    pa, pc = require_arrow()
+    if value_set.type != arr.type:
+        try:
+            value_set = value_set.cast(arr.type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            # 정수 컬럼에 소수 값 등 — 넓은 타입으로 맞춰 비교
+            arr = pc.cast(arr, value_set.type)
+    return pc.is_in(arr, value_set=value_set)
+
+
+@lru_cache(maxsize=256)
+def _regex_options(pattern: str) -> Any:
+    """정규식은 Arrow(RE2)가 커널 안에서 컴파일하므로 패턴 오류를 미리 한 번 확인해 둔 옵션을 재사용"""
+    pa, pc = require_arrow()
+    options = pc.MatchSubstringOptions(pattern)
+    try:
+        pc.call_function("match_substring_regex", [pa.array([""])], options)
+    except pa.ArrowInvalid:
+        raise QueryEngineError("INVALID_FILTER_VALUE", f"정규식 '{pattern}'이(가) 올바르지 않습니다.")
+    return options
+
+
+def _text(arr: Any) -> Any:
+    pa, pc = require_arrow()
+    return arr if pa.types.is_string(arr.type) else pc.cast(arr, pa.string())
+
+
+def _const(flag: bool) -> ArrowMask:
+    pa, _ = require_arrow()
+    return lambda arr: pa.array([flag] * len(arr), type=pa.bool_())
+
+
+def _build_arrow(op: FilterOp, operands: Operands) -> ArrowMask:
+    pa, pc = require_arrow()
+
+    if op == FilterOp.IS_NULL:
+        return pc.is_null
+    if op == FilterOp.IS_NOT_NULL:
+        return pc.is_valid
+
+    if op in (FilterOp.EQ, FilterOp.NEQ):
+        has_null = operands.has_null
+        value_set = pa.array([_arrow_scalar(v) for v in operands.values]) if operands.values else None
+        if op == FilterOp.EQ:
+            if value_set is None:
+                return pc.is_null if has_null else _const(False)
+            if has_null:
+                return lambda arr: pc.or_(_is_in(arr, value_set), pc.is_null(arr))
+            return lambda arr: _is_in(arr, value_set)
+        if value_set is None:
+            return pc.is_valid if has_null else _const(True)
+        # SQL NOT IN은 NULL 행을 제외
+        return lambda arr: pc.and_(pc.invert(_is_in(arr, value_set)), pc.is_valid(arr))
+
+    if op in _LIKE_SHAPES:
+        leading, trailing, negate = _LIKE_SHAPES[op]
+        if not operands.values:
+            return _const(True)
+        function = "match_substring" if leading and trailing else "starts_with" if trailing else "ends_with"
+        options = [pc.MatchSubstringOptions(v) for v in operands.values]
+
+        def like(arr: Any) -> Any:
+            values = _text(arr)
+            mask = None
+            for option in options:
+                part = pc.call_function(function, [values], option)
+                mask = part if mask is None else pc.or_(mask, part)
+            return pc.fill_null(pc.invert(mask) if negate else mask, False)
+
+        return like
+
+    if op == FilterOp.REGEX:
+        if not operands.values:
+            return _const(True)
+        options = _regex_options(operands.values[0])
+        return lambda arr: pc.fill_null(pc.call_function("match_substring_regex", [_text(arr)], options), False)
+
+    if op in _ARROW_COMPARISON:
+        if not operands.values:
+            return _const(False)
+        function, value = _ARROW_COMPARISON[op], _arrow_scalar(operands.values[0])
+        return lambda arr: pc.fill_null(pc.call_function(function, [arr, value]), False)
+
+    # BETWEEN
+    bounds = []
+    if operands.lo is not None:
+        bounds.append(("greater_equal", _arrow_scalar(operands.lo)))
+    if operands.hi is not None:
+        bounds.append(("less" if operands.hi_exclusive else "less_equal", _arrow_scalar(operands.hi)))
+    if not bounds:
+        return _const(True)
+
+    def between(arr: Any) -> Any:
+        mask = None
+        for function, value in bounds:
+            part = pc.call_function(function, [arr, value])
+            mask = part if mask is None else pc.and_(mask, part)
+        return pc.fill_null(mask, False)
+
+    return between
+
+
+def prepare_arrow_predicate(pred: Predicate) -> ArrowMask:
+    """컬럼 배열을 받아 NULL 없는 불리언 마스크를 돌려주는 함수 (field_id와 무관하게 캐시)"""
+    key = (pred.field_type, pred.op, repr(pred.value), repr(pred.second_value))
+    with _prepared_lock:
+        mask = _prepared.get(key)
+        if mask is not None:
+            _prepared.move_to_end(key)
+            return mask
+    mask = _build_arrow(pred.op, normalize(pred))
+    with _prepared_lock:
+        _prepared[key] = mask
+        while len(_prepared) > _PREPARED_CACHE_SIZE:
+            _prepared.popitem(last=False)
+    return mask
+
+
+def compile_arrow_predicate(pred: Predicate, column: Callable[[str], Any]) -> Any:
+    """단일 Predicate를 NULL 없는 불리언 배열로 변환합니다. column(field_id)는 pyarrow 컬럼을 반환합니다."""
+    return prepare_arrow_predicate(pred)(column(pred.field_id))
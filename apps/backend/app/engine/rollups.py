@@ -0,0 +1,353 @@
+"""사전 집계 테이블(롤업) — 빌드, 쿼리 라우팅, 로컬 실행
+
+롤업은 선언된 차원 조합별로 지표의 "부분 집계"(sum / count / min / max)를 저장한 작은 Arrow 파일입니다.
+부분 집계는 다시 합칠 수 있으므로, 차원이 롤업 차원의 부분집합이고 조건도 롤업 차원에만 걸린 차트 쿼리는
+원본 대신 롤업을 재집계해 같은 결과를 냅니다.
+
+- SUM → sum의 합, COUNT → count의 합, MIN/MAX → min/max의 min/max
+- AVG → sum의 합 / count의 합 (롤업에 SUM·COUNT 부분 집계를 함께 저장)
+- COUNT_DISTINCT는 재집계할 수 없어 롤업으로 라우팅하지 않습니다.
+
+롤업 파일은 원본 DB든 업로드 파일이든 업로드 파일 데이터 소스와 같은 컬럼 저장소(메모리 맵 IPC)에 둡니다.
+데이터 소스에 watermark 필드(DATE/DATETIME)가 지정되어 있고 롤업 차원이면 재빌드는 직전 watermark 이후 행만 집계해 병합합니다.
+"""
+import asyncio
+import os
+import uuid
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Iterable, Optional
+
+from app.core.config import settings
+from app.db.models.datasource import DataSource, DataSourceRollup
+from app.db.models.enums import AggregateType, FieldType, FilterOp, RollupStatus
+from app.engine import executor
+from app.engine.columnar import FILE_SOURCE_TYPES, open_table, require_arrow, storage_path
+from app.engine.compiler import ChartResult, compile_chart_query, compile_export_query
+from app.engine.dialects import get_dialect
+from app.engine.errors import QueryEngineError
+from app.engine.local import filter_table, order_result, slice_result, stream_local
+from app.engine.predicates import compile_arrow_predicate
+from app.engine.spec import ChartQuery, Predicate, QueryField
+
+# 지표 집계 → 필요한 부분 집계
+PARTIALS: dict[AggregateType, tuple[str, ...]] = {
+    AggregateType.SUM: ("sum",),
+    AggregateType.COUNT: ("count",),
+    AggregateType.MIN: ("min",),
+    AggregateType.MAX: ("max",),
+    AggregateType.AVG: ("sum", "count"),
+}
+# 부분 집계 → 빌드 시 원본 집계
+_PARTIAL_AGGREGATES = {
+    "sum": AggregateType.SUM,
+    "count": AggregateType.COUNT,
+    "min": AggregateType.MIN,
+    "max": AggregateType.MAX,
+}
+# 부분 집계 → 재집계 함수 (count는 합산)
+_REAGGREGATE = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+_BUILD_BATCH_ROWS = 50_000
+# 빌드 쿼리에 덧붙이는 그룹별 watermark 최댓값 컬럼 (파일에는 저장하지 않음)
+WATERMARK_COLUMN = "lf_watermark"
+
+
+def partial_column(field_id: str, partial: str) -> str:
+    return f"{field_id}__{partial}"
+
+
+def rollup_partials(metrics: Iterable[dict]) -> list[tuple[str, str]]:
+    """롤업 지표 정의 → (field_id, 부분 집계) 목록 (중복 제거, 정의 순서 유지)"""
+    result: dict[tuple[str, str], None] = {}
+    for metric in metrics:
+        for partial in PARTIALS[AggregateType(metric["aggregate"])]:
+            result[(metric["field_id"], partial)] = None
+    return list(result)
+
+
+# ── 라우팅 ────────────────────────────────────────────────────────────────────
+
+def is_servable(rollup: DataSourceRollup) -> bool:
+    # 재빌드 중에는 직전 파일로 계속 응답, 실패 시에는 원본으로 되돌림
+    return rollup.storage_key is not None and rollup.status in (RollupStatus.READY, RollupStatus.BUILDING)
+
+
+def covers(rollup: DataSourceRollup, query: ChartQuery) -> bool:
+    """롤업만으로 쿼리 결과를 정확히 재현할 수 있는지 확인합니다."""
+    if not query.is_grouped:
+        return False
+    dimensions = set(rollup.dimensions)
+    if any(c.field_id not in dimensions for c in query.group_fields):
+        return False
+    if any(p.field_id not in dimensions for p in query.predicates):
+        return False
+    available = set(rollup_partials(rollup.metrics))
+    for col in query.columns:
+        if not col.is_aggregated:
+            continue
+        needed = PARTIALS.get(col.aggregate)
+        if needed is None or any((col.field_id, p) not in available for p in needed):
+            return False
+    return True
+
+
+def match_rollup(query: ChartQuery, rollups: Iterable[DataSourceRollup]) -> Optional[DataSourceRollup]:
+    """쿼리를 처리할 수 있는 롤업 중 행 수가 가장 적은 것"""
+    candidates = [r for r in rollups if is_servable(r) and covers(r, query)]
+    return min(candidates, key=lambda r: r.row_count or 0, default=None)
+
+
+# ── 롤업 위 실행 ──────────────────────────────────────────────────────────────
+
+def execute_rollup(table: Any, query: ChartQuery) -> ChartResult:
+    pa, pc = require_arrow()
+    columns = query.columns
+    group_ids = list(dict.fromkeys(c.field_id for c in query.group_fields))
+    partial_ids = list(
+        dict.fromkeys(partial_column(c.field_id, p) for c in columns if c.is_aggregated for p in PARTIALS[c.aggregate])
+    )
+    data = filter_table(table, query, group_ids + partial_ids)
+
+    def scalar(name: str) -> Any:
+        fn = _REAGGREGATE[name.rsplit("__", 1)[1]]
+        return pa.array([getattr(pc, fn)(data[name]).as_py()], type=data[name].type)
+
+    if group_ids:
+        aggs = [(name, _REAGGREGATE[name.rsplit("__", 1)[1]]) for name in partial_ids]
+        grouped = data.group_by(group_ids).aggregate(aggs)
+
+        def partial(field_id: str, p: str) -> Any:
+            return grouped[f"{partial_column(field_id, p)}_{_REAGGREGATE[p]}"]
+
+        arrays = [_metric(c, partial) if c.is_aggregated else grouped[c.field_id] for c in columns]
+    else:
+        arrays = [_metric(c, lambda f, p: scalar(partial_column(f, p))) for c in columns]
+
+    totals = None
+    if query.with_totals:
+        totals = [
+            _metric(c, lambda f, p: scalar(partial_column(f, p)))[0].as_py() if c.is_aggregated else None
+            for c in columns
+        ]
+    return slice_result(*order_result(arrays, totals, query), query)
+
+
+def _metric(col: QueryField, partial: Any) -> Any:
+    """재집계된 부분 집계 배열로 지표 값을 계산합니다. partial(field_id, 부분 집계) → 배열"""
+    pa, pc = require_arrow()
+    if col.aggregate == AggregateType.AVG:
+        total = pc.cast(partial(col.field_id, "sum"), pa.float64())
+        count = pc.cast(partial(col.field_id, "count"), pa.float64())
+        return pc.divide(total, count)
+    if col.aggregate == AggregateType.COUNT:
+        # 조건에 맞는 그룹이 없으면 합계가 NULL — SQL COUNT처럼 0
+        return pc.fill_null(partial(col.field_id, "count"), 0)
+    return partial(col.field_id, PARTIALS[col.aggregate][0])
+
+
+async def run_rollup(rollup: DataSourceRollup, query: ChartQuery) -> ChartResult:
+    storage_key = rollup.storage_key
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(None, lambda: execute_rollup(open_table(storage_key), query))
+    if rollup.built_at is not None:
+        result.queried_at = rollup.built_at
+    return result
+
+
+# ── 빌드 ──────────────────────────────────────────────────────────────────────
+
+def build_query(datasource: DataSource, rollup: DataSourceRollup) -> ChartQuery:
+    """롤업 파일을 만들 원본 집계 쿼리 — 차원별 GROUP BY + 부분 집계"""
+    fields = {f.field_id: f for f in datasource.fields}
+    missing = [f for f in [*rollup.dimensions, *(m["field_id"] for m in rollup.metrics)] if f not in fields]
+    if missing:
+        raise QueryEngineError("INVALID_FIELD", f"데이터 소스에 없는 필드입니다: {', '.join(missing)}")
+    return ChartQuery(
+        source_config=datasource.connection_config or {},
+        dimensions=[QueryField(f, fields[f].label, fields[f].type) for f in rollup.dimensions],
+        metrics=[
+            QueryField(f, fields[f].label, fields[f].type, _PARTIAL_AGGREGATES[p])
+            for f, p in rollup_partials(rollup.metrics)
+        ],
+        with_totals=False,
+    )
+
+
+def _arrow_values(values: list[Any], field_type: FieldType) -> Any:
+    pa, _ = require_arrow()
+    if field_type == FieldType.NUMBER:
+        # 정수/실수는 배치별로 추론하고 마지막에 넓은 타입으로 통합
+        return pa.array([_number(v) for v in values])
+    if field_type == FieldType.DATE:
+        return pa.array([v.date() if isinstance(v, datetime) else v for v in values], type=pa.date32())
+    if field_type == FieldType.DATETIME:
+        return pa.array(
+            [datetime(v.year, v.month, v.day) if isinstance(v, date) and not isinstance(v, datetime) else v for v in values],
+            type=pa.timestamp("us"),
+        )
+    if field_type == FieldType.BOOLEAN:
+        return pa.array(values, type=pa.bool_())
+    return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+
+def _number(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return value
+
+
+@dataclass
+class RollupBuild:
+    storage_key: str
+    row_count: int
+    # 롤업에 반영된 원본 watermark 필드 최댓값 (ISO 8601), watermark 미지정 시 None
+    watermark: Optional[str]
+    # 이번 빌드에서 원본에서 읽은 집계 행 수 (증분 빌드면 변경분만)
+    fetched_rows: int
+    # 변경분만 병합했으면 True, 전체를 다시 집계했으면 False
+    incremental: bool
+
+
+async def build_rollup_file(
+    datasource: DataSource, rollup: DataSourceRollup, since: Optional[str] = None
+) -> RollupBuild:
+    """원본을 집계해 새 롤업 파일을 쓰고 빌드 결과를 반환합니다.
+
+    since(직전 빌드의 watermark)가 주어지고 watermark 필드가 롤업 차원이면 since 이후 그룹만 다시 집계해 교체합니다.
+    차원이 아니면 since와 같은 값으로 늦게 도착한 행을 구분할 수 없으므로(`>`는 누락, `>=`는 중복 합산) 전체 빌드합니다.
+    원본이 추가 전용(append-only)이라는 전제이며, 수정/삭제된 행은 전체 빌드에서만 반영됩니다.
+    파일은 빌드마다 새 이름으로 쓰므로, 이전 파일로 응답 중인 요청에 영향을 주지 않습니다.
+    """
+    query = build_query(datasource, rollup)
+    names = [*rollup.dimensions, *(partial_column(f, p) for f, p in rollup_partials(rollup.metrics))]
+    types = [
+        FieldType.NUMBER if c.aggregate in (AggregateType.COUNT, AggregateType.SUM) else c.type for c in query.columns
+    ]
+
+    wm_field = next((f for f in datasource.fields if f.field_id == datasource.watermark_field), None)
+    if wm_field is not None:
+        # 그룹별 watermark 최댓값을 같은 쿼리에서 함께 받아 다음 증분 기준으로 사용
+        query.metrics.append(QueryField(wm_field.field_id, wm_field.label, wm_field.type, AggregateType.MAX))
+        names.append(WATERMARK_COLUMN)
+        types.append(wm_field.type)
+
+    by_dimension = wm_field is not None and wm_field.field_id in rollup.dimensions
+    incremental = since is not None and by_dimension and rollup.storage_key is not None
+    if incremental:
+        # since와 같은 값의 그룹을 통째로 다시 집계 (같은 날짜 행이 늦게 도착해도 반영)
+        query.predicates.append(Predicate(wm_field.field_id, wm_field.type, FilterOp.GTE, since))
+
+    delta, fetched = await _collect(datasource, query, names, types)
+    watermark = _max_watermark(delta) if wm_field is not None else None
+    if wm_field is not None:
+        delta = delta.drop_columns([WATERMARK_COLUMN])
+
+    loop = asyncio.get_running_loop()
+    if incremental:
+        existing = open_table(rollup.storage_key)
+        table = await loop.run_in_executor(None, _merge, existing, delta, wm_field.field_id, since)
+        watermark = watermark or since
+    else:
+        table = delta
+    _check_size(table.num_rows)
+
+    storage_key = f"{datasource.id}/rollups/{rollup.id}-{uuid.uuid4().hex[:12]}.arrow"
+    await loop.run_in_executor(None, _write_table, table, storage_key)
+    return RollupBuild(
+        storage_key=storage_key,
+        row_count=table.num_rows,
+        watermark=watermark,
+        fetched_rows=fetched,
+        incremental=incremental,
+    )
+
+
+async def probe_watermark(datasource: DataSource) -> Optional[str]:
+    """원본 watermark 필드의 현재 최댓값 (ISO 8601) — 업로드 파일 데이터 소스는 변하지 않으므로 None"""
+    if datasource.source_type in FILE_SOURCE_TYPES or not datasource.watermark_field:
+        return None
+    field = next((f for f in datasource.fields if f.field_id == datasource.watermark_field), None)
+    if field is None:
+        return None
+    query = ChartQuery(
+        source_config=datasource.connection_config or {},
+        dimensions=[],
+        metrics=[QueryField(field.field_id, field.label, field.type, AggregateType.MAX)],
+        with_totals=False,
+    )
+    compiled = compile_chart_query(query, get_dialect(datasource.source_type))
+    result = compiled.decode(await executor.execute(datasource, compiled))
+    value = result.rows[0][0] if result.rows else None
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+def _check_size(row_count: int) -> None:
+    if row_count > settings.ROLLUP_MAX_ROWS:
+        raise QueryEngineError(
+            "ROLLUP_TOO_LARGE",
+            f"롤업 행 수가 최대치({settings.ROLLUP_MAX_ROWS:,})를 넘습니다. 차원 수를 줄여주세요.",
+        )
+
+
+async def _collect(
+    datasource: DataSource, query: ChartQuery, names: list[str], types: list[FieldType]
+) -> tuple[Any, int]:
+    """집계 쿼리 결과를 배치 단위로 읽어 Arrow 테이블로 모읍니다."""
+    pa, _ = require_arrow()
+    batches: AsyncIterator[list[Any]]
+    if datasource.source_type in FILE_SOURCE_TYPES:
+        batches = stream_local(datasource, query, _BUILD_BATCH_ROWS)
+    else:
+        export_query = compile_export_query(query, get_dialect(datasource.source_type))
+        batches = executor.stream(datasource, export_query, _BUILD_BATCH_ROWS)
+
+    loop = asyncio.get_running_loop()
+    tables = []
+    row_count = 0
+    async with aclosing(batches):
+        async for rows in batches:
+            row_count += len(rows)
+            _check_size(row_count)
+            tables.append(await loop.run_in_executor(None, _to_table, rows, names, types))
+    if not tables:
+        return _to_table([], names, types), 0
+    return pa.concat_tables(tables, promote_options="permissive"), row_count
+
+
+def _max_watermark(table: Any) -> Optional[str]:
+    _, pc = require_arrow()
+    value = pc.max(table[WATERMARK_COLUMN]).as_py()
+    return value.isoformat() if value is not None else None
+
+
+def _merge(existing: Any, delta: Any, wm_dimension: str, since: str) -> Any:
+    """기존 롤업에서 watermark 차원이 since 이후인 그룹을 지우고 변경분 집계로 교체합니다."""
+    pa, pc = require_arrow()
+    column = existing[wm_dimension]
+    older = compile_arrow_predicate(Predicate(wm_dimension, _field_type(column.type), FilterOp.LT, since), existing.column)
+    # watermark가 NULL인 그룹은 증분 조건에 걸리지 않으므로 그대로 유지
+    keep = pc.or_(older, pc.is_null(column))
+    return pa.concat_tables([existing.filter(keep), delta], promote_options="permissive")
+
+
+def _field_type(arrow_type: Any) -> FieldType:
+    pa, _ = require_arrow()
+    return FieldType.DATETIME if pa.types.is_timestamp(arrow_type) else FieldType.DATE
+
+
+def _to_table(rows: list[Any], names: list[str], types: list[FieldType]) -> Any:
+    pa, _ = require_arrow()
+    columns = list(zip(*rows)) if rows else [[] for _ in names]
+    return pa.Table.from_arrays([_arrow_values(list(v), t) for v, t in zip(columns, types)], names=names)
+
+
+def _write_table(table: Any, storage_key: str) -> None:
+    pa, _ = require_arrow()
+    dest = storage_path(storage_key)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_suffix(".tmp")
+    with pa.ipc.new_file(str(tmp), table.schema) as writer:
+        writer.write_table(table, max_chunksize=settings.DATASOURCE_INGEST_BATCH_ROWS)
+    os.replace(tmp, dest)
@@ -0,0 +1,141 @@
+"""동일 쿼리 동시 실행 병합 (single-flight)
+
+1) 프로세스 내부: fingerprint별 실행 Task를 공유 — 같은 워커의 동시 요청은 Task 하나를 함께 await
+2) 워커 간: Redis SET NX 락으로 리더를 정하고, 나머지 워커는 리더가 남긴 결과 키를 폴링
+
+실행 Task는 요청 코루틴과 분리되어 있어 리더 요청의 클라이언트가 끊겨도
+대기 중인 다른 요청은 같은 결과를 받습니다. 기다리던 요청이 모두 취소되면 Task도 취소해
+원본 쿼리를 중단합니다. (다른 워커의 대기자는 락 해제를 보고 리더를 다시 뽑음)
+대기 시간이 초과되거나 Redis를 사용할 수 없으면 각자 직접 실행하는 것으로 폴백합니다.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import chart_flight_lock_key, chart_flight_result_key
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 프로세스 내 진행 중인 실행 — fingerprint → Task
+_inflight: dict[str, asyncio.Task] = {}
+# Task별 기다리는 요청 수
+_waiters: dict[asyncio.Task, int] = {}
+
+# 락 값이 내 토큰일 때만 삭제 (다른 리더의 락을 지우지 않도록)
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_POLL_MIN = 0.05
+_POLL_MAX = 0.5
+
+# _coordinate 결과 — 내가 리더 / 대기 시간 초과로 각자 실행
+_LEAD = object()
+_ALONE = object()
+
+
+class SingleFlight(Generic[T]):
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        encode: Callable[[T], str],
+        decode: Callable[[str], T],
+    ) -> None:
+        self.redis = redis
+        self.encode = encode
+        self.decode = decode
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """key가 같은 동시 호출은 fn을 한 번만 실행하고 같은 결과를 돌려받습니다."""
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_distributed(key, fn))
+            _inflight[key] = task
+            task.add_done_callback(lambda t, k=key: _inflight.pop(k, None) if _inflight.get(k) is t else None)
+        _waiters[task] = _waiters.get(task, 0) + 1
+        try:
+            # shield: 대기 중인 요청 하나가 취소돼도 공유 Task는 계속 진행
+            return await asyncio.shield(task)
+        finally:
+            _waiters[task] -= 1
+            if not _waiters[task]:
+                del _waiters[task]
+                if not task.done():
+                    task.cancel()
+
+    async def _run_distributed(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Redis 오류는 리더 선출/결과 대기 단계에서만 폴백 사유 — fn 안에서 난 오류는 그대로 전달
+        (이미 원본을 실행한 뒤의 Redis 오류로 같은 쿼리를 한 번 더 실행하지 않도록)
+        """
+        token = uuid.uuid4().hex
+        try:
+            outcome = await self._coordinate(key, token)
+        except RedisError as exc:
+            logger.warning("single-flight Redis 오류, 직접 실행으로 폴백: %s", exc)
+            return await fn()
+        if outcome is _LEAD:
+            return await self._lead(key, token, fn)
+        if outcome is _ALONE:
+            return await fn()
+        return outcome
+
+    async def _coordinate(self, key: str, token: str) -> Any:
+        """락을 잡으면 _LEAD, 대기 시간 초과면 _ALONE, 리더 결과를 받으면 디코딩한 값"""
+        lock_key = chart_flight_lock_key(key)
+        deadline = time.monotonic() + settings.CHART_FLIGHT_WAIT_TIMEOUT
+        delay = _POLL_MIN
+        leader: str | None = None
+
+        while True:
+            if leader is None:
+                if await self.redis.set(lock_key, token, nx=True, ex=settings.CHART_FLIGHT_LOCK_TTL):
+                    return _LEAD
+                leader = await self.redis.get(lock_key)
+
+            if leader is not None:
+                result_key = chart_flight_result_key(key, leader)
+                raw = await self.redis.get(result_key)
+                if raw is None and await self.redis.get(lock_key) != leader:
+                    # 락이 풀렸는데 결과가 없으면 리더 실패 — 결과 재확인 후 리더 선출부터 다시
+                    raw = await self.redis.get(result_key)
+                    if raw is None:
+                        leader = None
+                        continue
+                if raw is not None:
+                    return self.decode(raw)
+
+            if time.monotonic() >= deadline:
+                logger.info("single-flight 대기 시간 초과, 직접 실행: %s", key)
+                return _ALONE
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _POLL_MAX)
+
+    async def _lead(self, key: str, token: str, fn: Callable[[], Awaitable[T]]) -> T:
+        lock_key = chart_flight_lock_key(key)
+        try:
+            value = await fn()
+            try:
+                # 결과 키를 먼저 쓰고 락을 풀어야 대기 워커가 결과 없이 락 해제만 보는 일이 없음
+                await self.redis.set(
+                    chart_flight_result_key(key, token), self.encode(value), ex=settings.CHART_FLIGHT_RESULT_TTL
+                )
+            except RedisError as exc:
+                logger.warning("single-flight 결과 전달 실패: %s", exc)
+            return value
+        finally:
+            try:
+                await self.redis.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+            except RedisError:
+                pass
@@ -0,0 +1,75 @@
+"""방언 독립적인 차트 쿼리 명세"""
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from app.db.models.enums import AggregateType, FieldType, FilterOp, SortDir
+
+
+@dataclass(frozen=True)
+class QueryField:
+    """SELECT 대상 컬럼 (차원 또는 지표)"""
+
+    field_id: str
+    label: str
+    type: FieldType
+    aggregate: AggregateType = AggregateType.NONE
+
+    @property
+    def is_aggregated(self) -> bool:
+        return self.aggregate != AggregateType.NONE
+
+    @property
+    def result_type(self) -> FieldType:
+        if self.aggregate in (AggregateType.COUNT, AggregateType.COUNT_DISTINCT):
+            return FieldType.NUMBER
+        return self.type
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """WHERE 절 단일 조건 — Filter / DefaultFilterRule 모두 이 형태로 정규화"""
+
+    field_id: str
+    field_type: FieldType
+    op: FilterOp
+    value: Any = None
+    second_value: Any = None
+
+
+@dataclass(frozen=True)
+class SortKey:
+    field_id: str
+    direction: SortDir = SortDir.ASC
+
+
+@dataclass
+class ChartQuery:
+    """차트 1개의 데이터 요청 — 컴파일러 입력"""
+
+    source_config: dict
+    dimensions: list[QueryField]
+    metrics: list[QueryField]
+    predicates: list[Predicate] = field(default_factory=list)
+    sort: list[SortKey] = field(default_factory=list)
+    limit: int = 20
+    offset: int = 0
+    with_totals: bool = True
+
+    @property
+    def columns(self) -> list[QueryField]:
+        return [*self.dimensions, *self.metrics]
+
+    @property
+    def is_grouped(self) -> bool:
+        """집계 지표가 하나라도 있으면 GROUP BY 쿼리, 아니면 원본 행 조회"""
+        return any(m.is_aggregated for m in self.metrics)
+
+    @property
+    def group_fields(self) -> list[QueryField]:
+        return [c for c in self.columns if not c.is_aggregated]
+
+    def find_column(self, field_id: str) -> Optional[int]:
+        for idx, col in enumerate(self.columns):
+            if col.field_id == field_id:
+                return idx
+        return None
@@ -0,0 +1,145 @@
+"""차트 데이터 응답 인코딩 — 결과 행을 Pydantic 모델을 거치지 않고 바로 바이트로 직렬화
+
+차트 데이터 조회(6.9)는 Accept 헤더로 형식을 고릅니다.
+
+- application/json (기본): ApiResponse envelope + 행 배열 rows — 기존 응답과 같은 JSON을 orjson으로 인코딩
+- application/vnd.lookflex.columnar+json: 같은 envelope에서 rows 대신 컬럼별 값 배열 values
+  (행마다 반복되는 괄호/구분자가 없어 작고, 클라이언트가 컬럼을 타입 배열로 그대로 옮길 수 있음)
+- application/vnd.apache.arrow.stream: Arrow IPC 스트림 — 컬럼 타입 그대로의 바이너리이며
+  rows 외 응답 필드(columns, totals, total, page, limit, queried_at, styles)는 스키마 메타데이터 "lookflex"에 JSON으로 담음
+
+JSON 형식의 값 표기는 Pydantic 직렬화와 같습니다. (Decimal → 문자열, UTC 일시 → ...Z, timedelta → ISO 8601 기간 등)
+페이지 일괄 조회(4.14) NDJSON 줄도 같은 인코더를 씁니다.
+"""
+import uuid
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Optional
+
+import orjson
+from pydantic_core import to_jsonable_python
+
+from app.engine.columnar import require_arrow
+from app.engine.compiler import ChartResult
+from app.engine.formatting import StyleIndex
+from app.engine.predicates import to_arrow_array
+
+JSON_MEDIA_TYPE = "application/json"
+COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.lookflex.columnar+json"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+MEDIA_TYPES = (JSON_MEDIA_TYPE, COLUMNAR_JSON_MEDIA_TYPE, ARROW_MEDIA_TYPE)
+
+# cells의 int 키 허용, 시간대가 UTC면 +00:00 대신 Z (Pydantic과 같은 표기)
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+@dataclass
+class ChartData:
+    """차트 1개의 응답 데이터 — ChartDataResponse와 같은 내용의 직렬화 전 형태"""
+
+    result: ChartResult
+    page: int
+    limit: int
+    styles: Optional[StyleIndex] = None
+
+
+def _default(value: Any) -> Any:
+    """orjson이 직접 인코딩하지 못하는 드라이버 값 — Pydantic과 같은 표기
+    (Decimal → 문자열, timedelta → ISO 8601 기간, bytes → UTF-8 문자열 등)
+    """
+    if isinstance(value, Decimal):
+        return str(value)
+    return to_jsonable_python(value)
+
+
+def dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+
+def _body(data: ChartData, **cells: Any) -> dict:
+    """ChartDataResponse 필드 순서 그대로의 dict — 셀 값 필드(rows / values)만 호출자가 채움"""
+    result = data.result
+    styles = data.styles
+    return {
+        "columns": [
+            {
+                "field_id": c.field_id,
+                "label": c.label,
+                "type": c.result_type,
+                "aggregate": c.aggregate if c.is_aggregated else None,
+            }
+            for c in result.columns
+        ],
+        **cells,
+        "totals": result.totals,
+        "total": result.total,
+        "page": data.page,
+        "limit": data.limit,
+        "queried_at": result.queried_at,
+        "styles": None if styles is None else {"palette": styles.palette, "rows": styles.rows, "cells": styles.cells},
+    }
+
+
+def _ok(body: dict) -> bytes:
+    return dumps({"success": True, "data": body, "error": None})
+
+
+def encode_json(data: ChartData) -> bytes:
+    return _ok(_body(data, rows=data.result.rows))
+
+
+def encode_columnar_json(data: ChartData) -> bytes:
+    rows = data.result.rows
+    values = [[row[i] for row in rows] for i in range(len(data.result.columns))]
+    return _ok(_body(data, values=values))
+
+
+def encode_arrow(data: ChartData) -> bytes:
+    """레코드 배치 1개짜리 IPC 스트림 — 컬럼 타입은 결과 타입(result_type) 기준"""
+    pa, _ = require_arrow()
+    result = data.result
+    arrays = [
+        to_arrow_array([row[i] for row in result.rows], c.result_type) for i, c in enumerate(result.columns)
+    ]
+    schema = pa.schema(
+        [pa.field(c.field_id, array.type) for c, array in zip(result.columns, arrays)],
+        metadata={"lookflex": dumps(_body(data))},
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(pa.record_batch(arrays, schema=schema))
+    return sink.getvalue().to_pybytes()
+
+
+def encode(data: ChartData, media_type: str) -> bytes:
+    if media_type == ARROW_MEDIA_TYPE:
+        return encode_arrow(data)
+    if media_type == COLUMNAR_JSON_MEDIA_TYPE:
+        return encode_columnar_json(data)
+    return encode_json(data)
+
+
+def encode_page_line(chart_id: uuid.UUID, data: ChartData) -> bytes:
+    """페이지 일괄 조회 NDJSON 한 줄 (PageChartData 성공 형태)"""
+    line = {"chart_id": chart_id, "success": True, "data": _body(data, rows=data.result.rows), "error": None}
+    return dumps(line) + b"\n"
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """Accept 헤더에서 q 값이 가장 높은(같으면 앞에 있는) 지원 형식 — 없거나 맞는 형식이 없으면 JSON"""
+    best, best_q = JSON_MEDIA_TYPE, 0.0
+    for part in (accept or "").split(","):
+        media_type, *params = [p.strip() for p in part.split(";")]
+        if media_type.lower() not in MEDIA_TYPES:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > best_q:
+            best, best_q = media_type.lower(), q
+    return best
@@ -0,0 +1 @@
+"""백그라운드 작업 — Redis 작업 큐, 작업 핸들러, 주기 작업 등록 (실행: python -m app.worker)"""
@@ -0,0 +1,150 @@
+"""백그라운드 작업 핸들러 — 작업 종류(kind)별 실행 함수와 등록 헬퍼
+
+핸들러는 요청 세션과 무관하게 실행되므로 필요한 만큼만 별도 세션을 열어 씁니다.
+예외를 던지면 큐가 백오프 후 재시도하고, 4xx 성격의 오류(HTTPException / QueryEngineError)는
+다시 실행해도 같은 결과이므로 워커가 바로 실패 처리합니다.
+"""
+import json
+import logging
+import uuid
+from typing import Any, Awaitable, Callable, Optional
+
+from app.db.models.enums import DSSourceType
+from app.db.session import AsyncSessionLocal
+from app.engine.columnar import FILE_SOURCE_TYPES
+from app.jobs.queue import JobQueue
+from app.repositories.datasource_repository import DataSourceRepository
+from app.repositories.filter_repository import FilterRepository
+from app.repositories.page_repository import PageRepository
+from app.services.chart_data_service import ChartDataService
+from app.services.datasource_service import DataSourceService
+from app.services.filter_value_service import build_distinct_index
+from app.services.rollup_service import build_rollup, refresh_watermark
+
+logger = logging.getLogger(__name__)
+
+WARM_FAVORITES = "warm_favorites"      # 즐겨찾기 페이지 → 페이지 x 데이터 소스별 warm_page 작업으로 분배
+WARM_PAGE = "warm_page"                # 페이지 차트(데이터 소스 1개분)를 실행해 결과 캐시 채움
+SYNC_SCHEMAS = "sync_schemas"          # 외부 DB 데이터 소스 → schema_sync 작업으로 분배
+SCHEMA_SYNC = "schema_sync"            # 데이터 소스 1개 스키마 동기화
+PROBE_WATERMARK = "probe_watermark"    # watermark 확인 → 바뀌었으면 캐시 무효화 + 롤업 증분 빌드 등록
+ROLLUP_BUILD = "rollup_build"          # 롤업 1개 빌드
+REFRESH_DISTINCT_VALUES = "refresh_distinct_values"  # 드롭다운 필터 필드 → distinct_values_build 작업으로 분배
+DISTINCT_VALUES_BUILD = "distinct_values_build"      # (데이터 소스, 필드) 1개 값 인덱스 빌드
+
+Handler = Callable[[JobQueue, dict[str, Any]], Awaitable[None]]
+
+
+# ── 등록 헬퍼 ─────────────────────────────────────────────────────────────────
+
+async def enqueue_rollup_build(
+    queue: JobQueue, rollup_id: uuid.UUID, datasource_id: uuid.UUID, full: bool = False
+) -> Optional[str]:
+    return await queue.enqueue(
+        ROLLUP_BUILD,
+        {"rollup_id": str(rollup_id), "full": full},
+        datasource_id=str(datasource_id),
+        dedupe_key=f"{ROLLUP_BUILD}:{rollup_id}:{'full' if full else 'auto'}",
+    )
+
+
+async def enqueue_distinct_build(
+    queue: JobQueue, datasource_id: uuid.UUID, field_id: str, full: bool = False
+) -> Optional[str]:
+    return await queue.enqueue(
+        DISTINCT_VALUES_BUILD,
+        {"datasource_id": str(datasource_id), "field_id": field_id, "full": full},
+        datasource_id=str(datasource_id),
+        dedupe_key=f"{DISTINCT_VALUES_BUILD}:{datasource_id}:{field_id}",
+    )
+
+
+# ── 핸들러 ────────────────────────────────────────────────────────────────────
+
+async def _warm_favorites(queue: JobQueue, payload: dict[str, Any]) -> None:
+    async with AsyncSessionLocal() as session:
+        rows = await PageRepository(session).list_favorite_charts()
+
+    # 데이터 소스 단위로 나눠야 데이터 소스별 동시 실행 제한이 적용됨
+    targets: dict[tuple[uuid.UUID, uuid.UUID, uuid.UUID], list[str]] = {}
+    for dashboard_id, page_id, chart_id, datasource_id in rows:
+        targets.setdefault((dashboard_id, page_id, datasource_id), []).append(str(chart_id))
+    for (dashboard_id, page_id, datasource_id), chart_ids in targets.items():
+        await queue.enqueue(
+            WARM_PAGE,
+            {"dashboard_id": str(dashboard_id), "page_id": str(page_id), "chart_ids": chart_ids},
+            datasource_id=str(datasource_id),
+            dedupe_key=f"{WARM_PAGE}:{page_id}:{datasource_id}",
+        )
+    logger.info("캐시 워밍 작업 %d개 등록 (차트 %d개)", len(targets), len(rows))
+
+
+async def _warm_page(queue: JobQueue, payload: dict[str, Any]) -> None:
+    async with AsyncSessionLocal() as session:
+        lines = await ChartDataService(session).warm_page(
+            uuid.UUID(payload["dashboard_id"]),
+            uuid.UUID(payload["page_id"]),
+            [uuid.UUID(c) for c in payload["chart_ids"]],
+        )
+    failed = [item for item in map(json.loads, [line async for line in lines]) if not item["success"]]
+    for item in failed:
+        logger.warning("캐시 워밍 실패 (차트 %s): %s", item["chart_id"], item["error"]["message"])
+
+
+async def _sync_schemas(queue: JobQueue, payload: dict[str, Any]) -> None:
+    external = [t for t in DSSourceType if t not in FILE_SOURCE_TYPES]
+    async with AsyncSessionLocal() as session:
+        datasource_ids = await DataSourceRepository(session).list_ids(external)
+    for datasource_id in datasource_ids:
+        await queue.enqueue(
+            SCHEMA_SYNC,
+            {"datasource_id": str(datasource_id)},
+            datasource_id=str(datasource_id),
+            dedupe_key=f"{SCHEMA_SYNC}:{datasource_id}",
+        )
+
+
+async def _schema_sync(queue: JobQueue, payload: dict[str, Any]) -> None:
+    async with AsyncSessionLocal() as session:
+        result = await DataSourceService(session).sync_schema(uuid.UUID(payload["datasource_id"]))
+    if result.added_fields or result.removed_fields:
+        logger.info(
+            "스키마 동기화 (%s): 추가 %s, 삭제 %s",
+            payload["datasource_id"], result.added_fields, result.removed_fields,
+        )
+
+
+async def _probe_watermark(queue: JobQueue, payload: dict[str, Any]) -> None:
+    datasource_id = uuid.UUID(payload["datasource_id"])
+    for rollup_id in await refresh_watermark(datasource_id):
+        await enqueue_rollup_build(queue, rollup_id, datasource_id)
+
+
+async def _rollup_build(queue: JobQueue, payload: dict[str, Any]) -> None:
+    await build_rollup(uuid.UUID(payload["rollup_id"]), full=payload.get("full", False))
+
+
+async def _refresh_distinct_values(queue: JobQueue, payload: dict[str, Any]) -> None:
+    async with AsyncSessionLocal() as session:
+        targets = await FilterRepository(session).list_dropdown_fields()
+    for datasource_id, field_id in targets:
+        await enqueue_distinct_build(queue, datasource_id, field_id)
+    logger.info("드롭다운 값 인덱스 갱신 작업 %d개 등록", len(targets))
+
+
+async def _distinct_values_build(queue: JobQueue, payload: dict[str, Any]) -> None:
+    await build_distinct_index(
+        uuid.UUID(payload["datasource_id"]), payload["field_id"], full=payload.get("full", False)
+    )
+
+
+HANDLERS: dict[str, Handler] = {
+    WARM_FAVORITES: _warm_favorites,
+    WARM_PAGE: _warm_page,
+    SYNC_SCHEMAS: _sync_schemas,
+    SCHEMA_SYNC: _schema_sync,
+    PROBE_WATERMARK: _probe_watermark,
+    ROLLUP_BUILD: _rollup_build,
+    REFRESH_DISTINCT_VALUES: _refresh_distinct_values,
+    DISTINCT_VALUES_BUILD: _distinct_values_build,
+}
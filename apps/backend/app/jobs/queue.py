@@ -0,0 +1,222 @@
+"""Redis 기반 내구성 작업 큐
+
+- 작업 본문은 job:{id}에 JSON으로 두고, 대기열에는 id만 넣습니다.
+- 워커는 BLMOVE로 jobs:ready에서 자기 처리 중 목록(jobs:processing:{worker})으로 원자적으로 옮겨 꺼내므로
+  실행 도중 프로세스가 죽어도 작업이 사라지지 않습니다. 생존 신호가 끊긴 워커의 처리 중 목록은 다른 워커가 되돌립니다.
+- 실패한 작업은 지수 백오프 + 지터만큼 jobs:delayed(ZSET)에 두었다가 다시 실행하고,
+  최대 시도 횟수를 넘기면 jobs:dead로 옮깁니다.
+- 데이터 소스에 부하를 주는 작업은 데이터 소스별 슬롯(ZSET 세마포어)을 얻어야 실행됩니다.
+"""
+import json
+import random
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.redis import (
+    job_dead_key,
+    job_dedupe_key,
+    job_delayed_key,
+    job_key,
+    job_processing_key,
+    job_ready_key,
+    job_slots_key,
+    job_worker_heartbeat_key,
+    job_workers_key,
+)
+
+_DEAD_JOB_TTL = 7 * 86400
+_DEAD_LIST_MAX = 1000
+_PROMOTE_BATCH = 100
+
+# 실행 시각이 된 지연 작업을 대기열로 이동
+_PROMOTE_SCRIPT = """
+local ids = redis.call('zrangebyscore', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, id in ipairs(ids) do
+    redis.call('zrem', KEYS[1], id)
+    redis.call('lpush', KEYS[2], id)
+end
+return #ids
+"""
+
+# 데이터 소스 슬롯 획득 — 만료된 슬롯(죽은 워커)은 먼저 정리
+_ACQUIRE_SLOT_SCRIPT = """
+redis.call('zremrangebyscore', KEYS[1], '-inf', ARGV[1])
+if redis.call('zscore', KEYS[1], ARGV[3]) or redis.call('zcard', KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call('zadd', KEYS[1], ARGV[4], ARGV[3])
+    redis.call('expire', KEYS[1], ARGV[5])
+    return 1
+end
+return 0
+"""
+
+
+@dataclass
+class Job:
+    kind: str
+    payload: dict[str, Any]
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    datasource_id: Optional[str] = None   # 지정 시 데이터 소스별 동시 실행 제한 적용
+    dedupe_key: Optional[str] = None
+    attempts: int = 0
+    max_attempts: int = settings.JOB_MAX_ATTEMPTS
+    enqueued_at: float = field(default_factory=time.time)
+    last_error: Optional[str] = None
+
+    def dumps(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False, default=str)
+
+    @classmethod
+    def loads(cls, raw: str) -> "Job":
+        return cls(**json.loads(raw))
+
+
+def retry_delay(attempts: int) -> float:
+    """attempts번 실패한 뒤의 재시도 지연 — 지수 백오프에 지터를 섞어 동시 재시도가 몰리지 않게 함"""
+    delay = min(settings.JOB_RETRY_MAX_DELAY, settings.JOB_RETRY_BASE_DELAY * 2 ** max(attempts - 1, 0))
+    return delay * random.uniform(0.5, 1.0)
+
+
+class JobQueue:
+    def __init__(self, redis: aioredis.Redis) -> None:
+        self.redis = redis
+
+    # ── 등록 ──────────────────────────────────────────────────────────────────
+
+    async def enqueue(
+        self,
+        kind: str,
+        payload: dict[str, Any],
+        *,
+        datasource_id: Optional[str] = None,
+        dedupe_key: Optional[str] = None,
+        delay: float = 0,
+    ) -> Optional[str]:
+        """작업을 등록하고 id를 반환합니다. 같은 dedupe_key 작업이 아직 끝나지 않았으면 등록하지 않고 None"""
+        job = Job(kind=kind, payload=payload, datasource_id=datasource_id, dedupe_key=dedupe_key)
+        if dedupe_key and not await self.redis.set(
+            job_dedupe_key(dedupe_key), job.id, nx=True, ex=settings.JOB_DEDUPE_TTL
+        ):
+            return None
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(job_key(job.id), job.dumps())
+            if delay > 0:
+                pipe.zadd(job_delayed_key(), {job.id: time.time() + delay})
+            else:
+                pipe.lpush(job_ready_key(), job.id)
+            await pipe.execute()
+        return job.id
+
+    async def promote_due(self) -> int:
+        return await self.redis.eval(
+            _PROMOTE_SCRIPT, 2, job_delayed_key(), job_ready_key(), time.time(), _PROMOTE_BATCH
+        )
+
+    # ── 실행 ──────────────────────────────────────────────────────────────────
+
+    async def reserve(self, worker_id: str, timeout: float) -> Optional[Job]:
+        """대기열에서 작업 하나를 꺼내 처리 중 목록으로 옮깁니다. timeout 동안 없으면 None"""
+        processing = job_processing_key(worker_id)
+        job_id = await self.redis.blmove(job_ready_key(), processing, timeout, "RIGHT", "LEFT")
+        if job_id is None:
+            return None
+        raw = await self.redis.get(job_key(job_id))
+        if raw is None:
+            await self.redis.lrem(processing, 1, job_id)
+            return None
+        return Job.loads(raw)
+
+    async def ack(self, worker_id: str, job: Job) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.lrem(job_processing_key(worker_id), 1, job.id)
+            pipe.delete(job_key(job.id))
+            if job.dedupe_key:
+                pipe.delete(job_dedupe_key(job.dedupe_key))
+            await pipe.execute()
+
+    async def defer(self, worker_id: str, job: Job, delay: float) -> None:
+        """작업을 delay초 뒤 다시 실행하도록 지연 목록으로 옮깁니다. (시도 횟수 변경 없음)"""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(job_key(job.id), job.dumps())
+            pipe.zadd(job_delayed_key(), {job.id: time.time() + delay})
+            pipe.lrem(job_processing_key(worker_id), 1, job.id)
+            await pipe.execute()
+
+    async def fail(self, worker_id: str, job: Job, error: str, permanent: bool = False) -> bool:
+        """실패를 기록하고 재시도를 예약합니다. 재시도하지 않고 jobs:dead로 옮겼으면 True"""
+        job.attempts += 1
+        job.last_error = error
+        if not permanent and job.attempts < job.max_attempts:
+            await self.defer(worker_id, job, retry_delay(job.attempts))
+            return False
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(job_key(job.id), job.dumps(), ex=_DEAD_JOB_TTL)
+            pipe.lpush(job_dead_key(), job.id)
+            pipe.ltrim(job_dead_key(), 0, _DEAD_LIST_MAX - 1)
+            pipe.lrem(job_processing_key(worker_id), 1, job.id)
+            if job.dedupe_key:
+                pipe.delete(job_dedupe_key(job.dedupe_key))
+            await pipe.execute()
+        return True
+
+    # ── 데이터 소스별 동시 실행 제한 ──────────────────────────────────────────
+
+    async def acquire_slot(self, datasource_id: str, job: Job) -> bool:
+        now = time.time()
+        # 슬롯은 작업 제한 시간이 지나면 자동 만료 — 슬롯을 쥔 워커가 죽어도 영구 점유되지 않음
+        ttl = settings.JOB_TIMEOUT + 60
+        return bool(
+            await self.redis.eval(
+                _ACQUIRE_SLOT_SCRIPT, 1, job_slots_key(datasource_id),
+                now, settings.JOB_DATASOURCE_CONCURRENCY, job.id, now + ttl, ttl,
+            )
+        )
+
+    async def release_slot(self, datasource_id: str, job: Job) -> None:
+        await self.redis.zrem(job_slots_key(datasource_id), job.id)
+
+    # ── 워커 생존 신호 / 복구 ─────────────────────────────────────────────────
+
+    async def heartbeat(self, worker_id: str) -> None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(job_worker_heartbeat_key(worker_id), "1", ex=settings.JOB_HEARTBEAT_TTL)
+            pipe.sadd(job_workers_key(), worker_id)
+            await pipe.execute()
+
+    async def unregister(self, worker_id: str) -> None:
+        """정상 종료 시 — 남은 처리 중 작업을 되돌리고 워커 목록에서 제거"""
+        await self._requeue(worker_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.delete(job_worker_heartbeat_key(worker_id))
+            pipe.srem(job_workers_key(), worker_id)
+            await pipe.execute()
+
+    async def recover(self) -> int:
+        """생존 신호가 끊긴 워커의 처리 중 작업을 대기열로 되돌리고 개수를 반환합니다."""
+        recovered = 0
+        for worker_id in await self.redis.smembers(job_workers_key()):
+            if await self.redis.exists(job_worker_heartbeat_key(worker_id)):
+                continue
+            recovered += await self._requeue(worker_id)
+            await self.redis.srem(job_workers_key(), worker_id)
+        return recovered
+
+    async def _requeue(self, worker_id: str) -> int:
+        moved = 0
+        # LMOVE는 원자적이라 여러 워커가 동시에 복구해도 작업이 중복/유실되지 않음
+        while await self.redis.lmove(job_processing_key(worker_id), job_ready_key(), "RIGHT", "LEFT"):
+            moved += 1
+        return moved
+
+    async def stats(self) -> dict[str, int]:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.llen(job_ready_key())
+            pipe.zcard(job_delayed_key())
+            pipe.llen(job_dead_key())
+            ready, delayed, dead = await pipe.execute()
+        return {"ready": ready, "delayed": delayed, "dead": dead}
@@ -0,0 +1,78 @@
+"""주기 작업 등록 — 워커마다 실행되지만 주기별 Redis 키(SET NX)로 한 번만 등록됩니다.
+
+- 매일 CACHE_WARM_AT: 즐겨찾기 대시보드/페이지 캐시 워밍 (업무 시작 전)
+- 매일 SCHEMA_SYNC_AT: 외부 DB 데이터 소스 스키마 동기화
+- ROLLUP_POLL_INTERVAL마다: 재빌드 주기가 된 롤업 빌드
+- DATASOURCE_WATERMARK_PROBE_INTERVAL마다: watermark 데이터 소스 변경 확인
+- DISTINCT_VALUES_REFRESH_INTERVAL마다: 드롭다운 필터 값 인덱스 갱신
+"""
+import time
+from datetime import datetime, timedelta, timezone, tzinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.redis import job_schedule_key
+from app.db.session import AsyncSessionLocal
+from app.jobs.handlers import (
+    PROBE_WATERMARK,
+    REFRESH_DISTINCT_VALUES,
+    SYNC_SCHEMAS,
+    WARM_FAVORITES,
+    enqueue_rollup_build,
+)
+from app.jobs.queue import JobQueue
+from app.repositories.datasource_repository import DataSourceRepository
+from app.services.rollup_service import list_due_rollups
+
+# 지정 시각 이후 이 시간 안에 워커가 떠 있을 때만 일일 작업 등록 (늦게 뜬 워커가 한낮에 워밍하지 않도록)
+_DAILY_WINDOW = timedelta(hours=1)
+
+
+def _local_timezone() -> tzinfo:
+    try:
+        return ZoneInfo(settings.JOB_TIMEZONE)
+    except ZoneInfoNotFoundError:
+        return timezone.utc
+
+
+async def _claim(redis: aioredis.Redis, name: str, period: str, ttl: int) -> bool:
+    return bool(await redis.set(job_schedule_key(name, period), "1", nx=True, ex=ttl))
+
+
+async def _daily(queue: JobQueue, kind: str, at: str, now: datetime) -> None:
+    hour, minute = (int(part) for part in at.split(":"))
+    scheduled = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if scheduled <= now < scheduled + _DAILY_WINDOW and await _claim(
+        queue.redis, kind, now.date().isoformat(), 2 * 86400
+    ):
+        await queue.enqueue(kind, {}, dedupe_key=kind)
+
+
+async def _every(queue: JobQueue, name: str, interval: int) -> bool:
+    return await _claim(queue.redis, name, str(int(time.time() // interval)), interval)
+
+
+async def tick(queue: JobQueue) -> None:
+    now = datetime.now(_local_timezone())
+    await _daily(queue, WARM_FAVORITES, settings.CACHE_WARM_AT, now)
+    await _daily(queue, SYNC_SCHEMAS, settings.SCHEMA_SYNC_AT, now)
+
+    if await _every(queue, "rollups", settings.ROLLUP_POLL_INTERVAL):
+        for rollup in await list_due_rollups():
+            await enqueue_rollup_build(queue, rollup.id, rollup.datasource_id)
+
+    if await _every(queue, PROBE_WATERMARK, settings.DATASOURCE_WATERMARK_PROBE_INTERVAL):
+        async with AsyncSessionLocal() as session:
+            datasources = await DataSourceRepository(session).list_with_watermark()
+        for datasource in datasources:
+            await queue.enqueue(
+                PROBE_WATERMARK,
+                {"datasource_id": str(datasource.id)},
+                datasource_id=str(datasource.id),
+                dedupe_key=f"{PROBE_WATERMARK}:{datasource.id}",
+            )
+
+    if await _every(queue, REFRESH_DISTINCT_VALUES, settings.DISTINCT_VALUES_REFRESH_INTERVAL):
+        await queue.enqueue(REFRESH_DISTINCT_VALUES, {}, dedupe_key=REFRESH_DISTINCT_VALUES)
@@ -1,16 +1,33 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.deps import require_metrics_access
+from app.core.hashing import password_hasher
+from app.core.metrics import MetricsMiddleware, instrument_engine, render_metrics
+from app.core.principal import listen_invalidations
 from app.core.redis import close_redis, init_redis
+from app.core.tokens import listen_revocations
+from app.core import versioning  # noqa: F401 — 정의 version 증가 세션 이벤트 등록
+from app.db.session import engine
+from app.engine.pools import pool_registry
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 주기 작업(롤업 재빌드, 캐시 워밍 등)은 별도 워커 프로세스(app.worker)에서 실행
     await init_redis()
+    listeners = [asyncio.create_task(listen_invalidations()), asyncio.create_task(listen_revocations())]
     yield
+    for listener in listeners:
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
+    await pool_registry.close_all()
+    password_hasher.close()
     await close_redis()
 
 
@@ -23,6 +40,8 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+instrument_engine(engine)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
@@ -30,6 +49,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 가장 바깥에서 측정하도록 마지막에 추가
+app.add_middleware(MetricsMiddleware)
 
 # API 라우터 등록
 from app.api.v1.router import api_router  # noqa: E402
@@ -39,3 +60,11 @@ app.include_router(api_router)
 @app.get("/api/v1/health", tags=["System"])
 async def health_check():
     return {"status": "ok", "version": "0.1.0"}
+
+
+@app.get(
+    "/api/v1/metrics", tags=["System"], include_in_schema=False, dependencies=[Depends(require_metrics_access)]
+)
+async def metrics():
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
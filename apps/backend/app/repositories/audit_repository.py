@@ -0,0 +1,25 @@
+"""AuditLog DB 레포지토리"""
+import uuid
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.enums import AuditAction
+from app.db.models.system import AuditLog
+
+
+class AuditLogRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def create(
+        self,
+        user_id: Optional[uuid.UUID],
+        action: AuditAction,
+        detail: Optional[dict] = None,
+        ip_address: Optional[str] = None,
+    ) -> AuditLog:
+        log = AuditLog(user_id=user_id, action=action, detail=detail, ip_address=ip_address)
+        self.db.add(log)
+        await self.db.flush()
+        return log
@@ -0,0 +1,46 @@
+"""Chart DB 레포지토리"""
+import uuid
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.db.models.chart import Chart
+from app.db.models.dashboard import Page
+from app.db.models.formatting import ConditionalFormat
+
+
+class ChartRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_in_page(
+        self,
+        dashboard_id: uuid.UUID,
+        page_id: uuid.UUID,
+        chart_id: uuid.UUID,
+    ) -> Optional[Chart]:
+        """URL 경로의 대시보드/페이지에 실제로 속한 차트만 반환합니다."""
+        result = await self.db.execute(
+            select(Chart)
+            .join(Page, Page.id == Chart.page_id)
+            .where(
+                Chart.id == chart_id,
+                Chart.page_id == page_id,
+                Page.dashboard_id == dashboard_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def list_conditional_formats(self, chart_ids: list[uuid.UUID]) -> list[ConditionalFormat]:
+        """여러 차트의 조건부 서식(규칙 포함)을 차트 수와 무관하게 쿼리 2번으로 로드합니다."""
+        if not chart_ids:
+            return []
+        result = await self.db.execute(
+            select(ConditionalFormat)
+            .where(ConditionalFormat.chart_id.in_(chart_ids))
+            .order_by(ConditionalFormat.chart_id, ConditionalFormat.order)
+            .options(selectinload(ConditionalFormat.rules))
+        )
+        return list(result.scalars().all())
@@ -0,0 +1,34 @@
+"""Dashboard DB 레포지토리"""
+import uuid
+from typing import Optional
+
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.db.models.dashboard import Dashboard, DashboardFavorite
+from app.db.models.user import User
+
+
+class DashboardRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_state(self, dashboard_id: uuid.UUID, user_id: uuid.UUID) -> Optional[tuple[int, str, bool]]:
+        """(version, 소유자 이름, 사용자의 즐겨찾기 여부) — 캐시된 정의에 붙일 값과 ETag 계산용"""
+        is_favorite = exists().where(
+            DashboardFavorite.dashboard_id == Dashboard.id, DashboardFavorite.user_id == user_id
+        )
+        result = await self.db.execute(
+            select(Dashboard.version, User.name, is_favorite)
+            .join(User, User.id == Dashboard.owner_id)
+            .where(Dashboard.id == dashboard_id)
+        )
+        row = result.one_or_none()
+        return tuple(row) if row else None
+
+    async def get_with_pages(self, dashboard_id: uuid.UUID) -> Optional[Dashboard]:
+        result = await self.db.execute(
+            select(Dashboard).where(Dashboard.id == dashboard_id).options(selectinload(Dashboard.pages))
+        )
+        return result.scalar_one_or_none()
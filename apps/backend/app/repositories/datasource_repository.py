@@ -0,0 +1,108 @@
+"""DataSource DB 레포지토리"""
+import uuid
+from typing import Optional
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.access import accessible_datasource_ids
+from app.core.principal import Principal
+from app.db.models.datasource import DataSource, DataSourceField, DataSourcePermission, DataSourceRollup
+from app.db.models.enums import DSSourceType, Role
+from app.db.models.user import user_group
+
+
+class DataSourceRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_with_fields(self, datasource_id: uuid.UUID) -> Optional[DataSource]:
+        result = await self.db.execute(
+            select(DataSource)
+            .where(DataSource.id == datasource_id)
+            .options(selectinload(DataSource.fields), selectinload(DataSource.rollups))
+        )
+        return result.scalar_one_or_none()
+
+    async def get_by_source_id(self, source_id: str) -> Optional[DataSource]:
+        result = await self.db.execute(select(DataSource).where(DataSource.source_id == source_id))
+        return result.scalar_one_or_none()
+
+    async def create(self, fields: list[DataSourceField], **kwargs) -> DataSource:
+        datasource = DataSource(**kwargs, fields=fields)
+        self.db.add(datasource)
+        await self.db.flush()
+        await self.db.refresh(datasource, ["created_at", "updated_at"])
+        return datasource
+
+    async def list_with_fields(self, datasource_ids: list[uuid.UUID]) -> list[DataSource]:
+        if not datasource_ids:
+            return []
+        result = await self.db.execute(
+            select(DataSource)
+            .where(DataSource.id.in_(datasource_ids))
+            .options(selectinload(DataSource.fields), selectinload(DataSource.rollups))
+        )
+        return list(result.scalars().all())
+
+    async def list_ids(self, source_types: list[DSSourceType]) -> list[uuid.UUID]:
+        result = await self.db.execute(select(DataSource.id).where(DataSource.source_type.in_(source_types)))
+        return list(result.scalars().all())
+
+    async def list_with_watermark(self) -> list[DataSource]:
+        result = await self.db.execute(
+            select(DataSource)
+            .where(DataSource.watermark_field.is_not(None))
+            .options(selectinload(DataSource.fields))
+        )
+        return list(result.scalars().all())
+
+    # ── 롤업 ────────────────────────────────────────────────────────────────
+
+    async def get_rollup(self, datasource_id: uuid.UUID, rollup_id: uuid.UUID) -> Optional[DataSourceRollup]:
+        result = await self.db.execute(
+            select(DataSourceRollup).where(
+                DataSourceRollup.id == rollup_id, DataSourceRollup.datasource_id == datasource_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def list_rollups(self, datasource_id: Optional[uuid.UUID] = None) -> list[DataSourceRollup]:
+        stmt = select(DataSourceRollup).order_by(DataSourceRollup.created_at)
+        if datasource_id is not None:
+            stmt = stmt.where(DataSourceRollup.datasource_id == datasource_id)
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def create_rollup(self, **kwargs) -> DataSourceRollup:
+        rollup = DataSourceRollup(**kwargs)
+        self.db.add(rollup)
+        await self.db.flush()
+        await self.db.refresh(rollup, ["status", "created_at", "updated_at"])
+        return rollup
+
+    async def has_access(self, datasource: DataSource, user: Principal) -> bool:
+        """allow_all, 개별 사용자 권한, 소속 그룹 권한 순으로 접근 가능 여부를 확인합니다.
+
+        권한 행은 사용자별 접근 인덱스(app.core.access)에서 확인하므로 DB 조회가 없습니다.
+        여러 데이터 소스를 확인할 때는 accessible_datasource_ids를 한 번만 불러 can_access로 확인하세요.
+        """
+        if user.role in (Role.OWNER, Role.ADMIN) or datasource.allow_all:
+            return True
+        return datasource.id in await accessible_datasource_ids(self.db, user)
+
+    async def list_granted_ids(self, user_id: uuid.UUID) -> list[uuid.UUID]:
+        """개별 권한 또는 소속 그룹 권한이 있는 데이터 소스 id (접근 인덱스 계산용)"""
+        group_ids = select(user_group.c.group_id).where(user_group.c.user_id == user_id)
+        result = await self.db.execute(
+            select(DataSourcePermission.datasource_id)
+            .where(
+                or_(
+                    (DataSourcePermission.entity_type == "USER") & (DataSourcePermission.entity_id == user_id),
+                    (DataSourcePermission.entity_type == "GROUP") & (DataSourcePermission.entity_id.in_(group_ids)),
+                )
+            )
+            .distinct()
+        )
+        return list(result.scalars().all())
@@ -0,0 +1,56 @@
+"""Filter / DefaultFilterRule DB 레포지토리"""
+import uuid
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.dashboard import Page
+from app.db.models.enums import FilterType
+from app.db.models.filter import DefaultFilterRule, Filter
+
+
+class FilterRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def list_by_page(self, page_id: uuid.UUID) -> list[Filter]:
+        result = await self.db.execute(select(Filter).where(Filter.page_id == page_id))
+        return list(result.scalars().all())
+
+    async def list_default_rules(self, page_id: uuid.UUID) -> list[DefaultFilterRule]:
+        result = await self.db.execute(
+            select(DefaultFilterRule).where(DefaultFilterRule.page_id == page_id)
+        )
+        return list(result.scalars().all())
+
+    async def get_in_page(
+        self,
+        dashboard_id: uuid.UUID,
+        page_id: uuid.UUID,
+        filter_id: uuid.UUID,
+    ) -> Optional[Filter]:
+        """URL 경로의 대시보드/페이지에 실제로 속한 필터만 반환합니다."""
+        result = await self.db.execute(
+            select(Filter)
+            .join(Page, Page.id == Filter.page_id)
+            .where(
+                Filter.id == filter_id,
+                Filter.page_id == page_id,
+                Page.dashboard_id == dashboard_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def list_dropdown_fields(self) -> list[tuple[uuid.UUID, str]]:
+        """드롭다운 필터가 참조하는 (datasource_id, field_id) 목록 (중복 제거)"""
+        result = await self.db.execute(
+            select(Filter.datasource_id, Filter.field_id)
+            .where(
+                Filter.type == FilterType.DROPDOWN,
+                Filter.datasource_id.is_not(None),
+                Filter.field_id.is_not(None),
+            )
+            .distinct()
+        )
+        return [(datasource_id, field_id) for datasource_id, field_id in result.all()]
@@ -0,0 +1,87 @@
+"""Page DB 레포지토리"""
+import uuid
+from typing import Optional
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.db.models.chart import Chart, ChartGroup
+from app.db.models.dashboard import DashboardFavorite, Page, PageFavorite
+from app.db.models.formatting import ConditionalFormat
+from app.db.models.view_config import UserViewConfig
+
+
+class PageRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_for_render(self, dashboard_id: uuid.UUID, page_id: uuid.UUID) -> Optional[Page]:
+        """차트 / 필터 / 기본 필터 규칙을 위젯 수와 무관하게 고정된 쿼리 4번으로 로드합니다.
+
+        컬렉션마다 IN 조회로 따로 읽어 JOIN을 겹칠 때 생기는 카티션 곱(차트 × 필터 × 규칙 행)을 피합니다.
+        """
+        result = await self.db.execute(
+            select(Page)
+            .where(Page.id == page_id, Page.dashboard_id == dashboard_id)
+            .options(
+                selectinload(Page.charts),
+                selectinload(Page.filters),
+                selectinload(Page.default_filter_rules),
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_version(self, dashboard_id: uuid.UUID, page_id: uuid.UUID) -> Optional[int]:
+        result = await self.db.execute(
+            select(Page.version).where(Page.id == page_id, Page.dashboard_id == dashboard_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_detail(self, dashboard_id: uuid.UUID, page_id: uuid.UUID) -> Optional[Page]:
+        """차트(조건부 서식 + 규칙) / 필터를 위젯 수와 무관하게 고정된 쿼리 5번으로 로드합니다."""
+        result = await self.db.execute(
+            select(Page)
+            .where(Page.id == page_id, Page.dashboard_id == dashboard_id)
+            .options(
+                selectinload(Page.charts)
+                .selectinload(Chart.conditional_formats)
+                .selectinload(ConditionalFormat.rules),
+                selectinload(Page.filters),
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def list_chart_groups(self, page_id: uuid.UUID) -> list[ChartGroup]:
+        result = await self.db.execute(
+            select(ChartGroup)
+            .where(ChartGroup.page_id == page_id)
+            .options(selectinload(ChartGroup.items))
+            .order_by(ChartGroup.created_at)
+        )
+        return list(result.scalars().all())
+
+    async def list_view_configs(self, page_id: uuid.UUID, user_id: uuid.UUID) -> list[tuple[uuid.UUID, dict]]:
+        """페이지 차트에 대한 사용자의 뷰 설정 (chart_id, config)"""
+        result = await self.db.execute(
+            select(UserViewConfig.chart_id, UserViewConfig.config)
+            .join(Chart, Chart.id == UserViewConfig.chart_id)
+            .where(Chart.page_id == page_id, UserViewConfig.user_id == user_id)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def list_favorite_charts(self) -> list[tuple[uuid.UUID, uuid.UUID, uuid.UUID, uuid.UUID]]:
+        """누군가 즐겨찾기한 페이지(직접 또는 대시보드 단위)의 차트 — (dashboard_id, page_id, chart_id, datasource_id)"""
+        result = await self.db.execute(
+            select(Page.dashboard_id, Page.id, Chart.id, Chart.datasource_id)
+            .join(Chart, Chart.page_id == Page.id)
+            .where(
+                Page.dashboard_id.is_not(None),
+                Chart.datasource_id.is_not(None),
+                or_(
+                    Page.id.in_(select(PageFavorite.page_id)),
+                    Page.dashboard_id.in_(select(DashboardFavorite.dashboard_id)),
+                ),
+            )
+        )
+        return [tuple(row) for row in result.all()]
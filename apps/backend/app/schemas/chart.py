@@ -0,0 +1,89 @@
+"""Chart 도메인 Pydantic 스키마"""
+import enum
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+from app.db.models.enums import AggregateType, FieldType, SortDir
+from app.schemas.common import ErrorDetail
+
+
+# ── 차트 데이터 조회 ──────────────────────────────────────────────────────────
+
+class FilterValue(BaseModel):
+    filter_id: uuid.UUID
+    value: Any = None
+
+
+class ChartSort(BaseModel):
+    field_id: str
+    direction: SortDir = SortDir.ASC
+
+
+class ChartDataRequest(BaseModel):
+    filters: list[FilterValue] = []
+    sort: Optional[ChartSort] = None
+    page: int = Field(default=1, ge=1)
+    limit: Optional[int] = Field(default=None, ge=1, le=1000)
+
+
+class ChartDataColumn(BaseModel):
+    field_id: str
+    label: str
+    type: FieldType
+    aggregate: Optional[AggregateType] = None
+
+
+class ChartDataStyles(BaseModel):
+    """조건부 서식 평가 결과 — 인덱스는 palette 기준, 매칭 없는 위치는 null"""
+
+    palette: list[dict]
+    # ROW 서식 (rows와 같은 길이), 매칭된 행이 없으면 null
+    rows: Optional[list[Optional[int]]] = None
+    # CELL 서식 — 컬럼 인덱스(columns 기준) → rows와 같은 길이의 배열, 매칭된 셀이 있는 컬럼만 포함
+    cells: dict[int, list[Optional[int]]] = {}
+
+
+class ChartDataResponse(BaseModel):
+    columns: list[ChartDataColumn]
+    rows: list[list[Any]]
+    totals: Optional[list[Any]] = None
+    total: int
+    page: int
+    limit: int
+    queried_at: datetime
+    # 차트에 조건부 서식이 없거나 결과가 비어 있으면 null
+    styles: Optional[ChartDataStyles] = None
+
+
+# ── 페이지 일괄 데이터 조회 ───────────────────────────────────────────────────
+
+class PageDataRequest(BaseModel):
+    filters: list[FilterValue] = []
+    # 생략 시 페이지의 모든 차트
+    chart_ids: Optional[list[uuid.UUID]] = None
+
+
+class PageChartData(BaseModel):
+    """NDJSON 스트림의 한 줄 — 차트 1개의 결과 또는 오류"""
+
+    chart_id: uuid.UUID
+    success: bool = True
+    data: Optional[ChartDataResponse] = None
+    error: Optional[ErrorDetail] = None
+
+
+# ── 차트 데이터 내보내기 ──────────────────────────────────────────────────────
+
+class ExportFormat(str, enum.Enum):
+    CSV = "CSV"
+    XLSX = "XLSX"
+
+
+class ChartExportRequest(BaseModel):
+    format: ExportFormat = ExportFormat.XLSX
+    filters: list[FilterValue] = []
+    sort: Optional[ChartSort] = None
+    include_headers: bool = True
@@ -0,0 +1,33 @@
+"""Dashboard 도메인 Pydantic 스키마"""
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class DashboardPageItem(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    version: int
+    name: str
+    order: int
+    width: int
+    height: int
+    thumbnail_url: Optional[str] = None
+
+
+class DashboardDetailResponse(BaseModel):
+    id: uuid.UUID
+    version: int
+    name: str
+    description: Optional[str] = None
+    is_public: bool
+    owner_id: uuid.UUID
+    # 요청마다 조회해 캐시된 정의에 붙이는 값
+    owner_name: str = ""
+    is_favorite: bool = False
+    pages: list[DashboardPageItem]
+    created_at: datetime
+    updated_at: datetime
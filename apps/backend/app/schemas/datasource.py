@@ -0,0 +1,63 @@
+"""DataSource 도메인 Pydantic 스키마"""
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.db.models.enums import AggregateType, DSSourceType, RollupStatus
+
+
+class DataSourceResponse(BaseModel):
+    id: uuid.UUID
+    label: str
+    source_id: str
+    source_type: DSSourceType
+    description: Optional[str] = None
+    field_count: int
+    created_at: datetime
+
+
+# ── 롤업 (사전 집계 테이블) ───────────────────────────────────────────────────
+
+class SchemaSyncResponse(BaseModel):
+    added_fields: list[str]
+    removed_fields: list[str]
+    message: str
+
+
+class RollupMetric(BaseModel):
+    field_id: str
+    aggregate: AggregateType
+
+
+class RollupCreateRequest(BaseModel):
+    name: str = Field(max_length=100)
+    dimensions: list[str] = Field(min_length=1)
+    metrics: list[RollupMetric] = Field(min_length=1)
+    refresh_interval: Optional[int] = Field(default=None, ge=60)
+
+
+class RollupResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    name: str
+    dimensions: list[str]
+    metrics: list[RollupMetric]
+    refresh_interval: Optional[int] = None
+    status: RollupStatus
+    row_count: Optional[int] = None
+    built_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    created_at: datetime
+
+
+# ── watermark (증분 갱신 기준 필드) ───────────────────────────────────────────
+
+class WatermarkRequest(BaseModel):
+    field_id: Optional[str] = None
+
+
+class WatermarkResponse(BaseModel):
+    field_id: Optional[str] = None
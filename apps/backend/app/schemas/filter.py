@@ -0,0 +1,49 @@
+"""Filter 도메인 Pydantic 스키마"""
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.schemas.chart import FilterValue
+
+
+# ── 드롭다운 필터 값 목록 ─────────────────────────────────────────────────────
+
+class FilterValueItem(BaseModel):
+    # 필터 값으로 그대로 보낼 수 있는 문자열 (숫자/날짜도 문자열)
+    value: str
+    count: int
+
+
+class FilterValuesResponse(BaseModel):
+    items: list[FilterValueItem]
+    # 검색어가 있으면 접두어가 일치하는 값 수
+    total: int
+    page: int
+    limit: int
+    # 값 인덱스가 아직 만들어지지 않았으면 False (백그라운드 빌드 등록 후 빈 목록 반환)
+    ready: bool = True
+    # 고유 값이 DISTINCT_VALUES_MAX를 넘어 빈도 하위 값이 빠졌는지
+    truncated: bool = False
+    built_at: Optional[datetime] = None
+
+
+# ── 연쇄 필터 ─────────────────────────────────────────────────────────────────
+
+class FilterCascadeRequest(BaseModel):
+    # 현재 페이지의 필터 선택 값 (차트 데이터 조회와 같은 형식, 생략한 필터는 기본값)
+    filters: list[FilterValue] = []
+
+
+class FilterCascadeItem(BaseModel):
+    filter_id: uuid.UUID
+    # 다른 필터 선택 값을 만족하는 값 — 건수 내림차순
+    items: list[FilterValueItem]
+    # FILTER_CASCADE_VALUES_LIMIT를 넘어 건수 하위 값이 빠졌는지
+    truncated: bool = False
+
+
+class FilterCascadeResponse(BaseModel):
+    # 좁혀진 드롭다운만 포함 (없는 드롭다운은 7.5 값 목록을 그대로 사용)
+    filters: list[FilterCascadeItem]
@@ -0,0 +1,89 @@
+"""Page 도메인 Pydantic 스키마"""
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from app.db.models.enums import ChartType, CondFormatApplyTo, FilterOp, FilterType
+
+
+# ── 페이지 상세 (위젯 포함) ───────────────────────────────────────────────────
+
+class ConditionalFormatRuleResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    order: int
+    operator: FilterOp
+    value: Any = None
+    second_value: Any = None
+    style: dict
+
+
+class ConditionalFormatResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    name: str
+    order: int
+    apply_to: CondFormatApplyTo
+    target_fields: Optional[list] = None
+    rules: list[ConditionalFormatRuleResponse]
+
+
+class PageChartResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    version: int
+    type: ChartType
+    title: str
+    datasource_id: Optional[uuid.UUID] = None
+    x: int
+    y: int
+    width: int
+    height: int
+    config: Optional[dict] = None
+    style: Optional[dict] = None
+    conditional_formats: list[ConditionalFormatResponse]
+
+
+class PageFilterResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    type: FilterType
+    title: str
+    datasource_id: Optional[uuid.UUID] = None
+    field_id: Optional[str] = None
+    x: int
+    y: int
+    width: int
+    height: int
+    config: Optional[dict] = None
+
+
+class ChartGroupResponse(BaseModel):
+    id: uuid.UUID
+    name: str
+    chart_ids: list[uuid.UUID]
+
+
+class PageDetailResponse(BaseModel):
+    id: uuid.UUID
+    version: int
+    dashboard_id: Optional[uuid.UUID] = None
+    name: str
+    width: int
+    height: int
+    order: int
+    background_color: str
+    thumbnail_url: Optional[str] = None
+    charts: list[PageChartResponse]
+    filters: list[PageFilterResponse]
+    chart_groups: list[ChartGroupResponse]
+    # 요청한 사용자의 차트별 뷰 설정 (chart_id → config) — 사용자마다 달라 페이지 캐시와 별도로 조회
+    view_configs: dict[uuid.UUID, dict] = {}
+    created_at: datetime
+    updated_at: datetime
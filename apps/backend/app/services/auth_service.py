@@ -2,6 +2,7 @@
 import random
 import secrets
 import string
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
@@ -9,15 +10,16 @@ from typing import Optional
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.hashing import password_hasher
+from app.core.principal import Principal
 from app.core.redis import email_verified_key, get_redis, otp_key, pw_reset_key
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    hash_password,
-    verify_password,
+    new_session_id,
 )
+from app.core.tokens import revoke_session, verify_token
 from app.db.models.enums import ApprovalStatus, Role
-from app.db.models.user import User
 from app.repositories.user_repository import RegisterRequestRepository, UserRepository
 from app.schemas.auth import (
     LoginRequest,
@@ -83,7 +85,7 @@ class AuthService:
         if await self.req_repo.get_by_email_pending(body.email):
             raise HTTPException(status_code=409, detail={"code": "REGISTER_REQUEST_PENDING", "message": "동일 이메일로 대기 중인 요청이 있습니다."})
 
-        hashed = hash_password(body.password)
+        hashed = await password_hasher.hash(body.password)
         req = await self.req_repo.create(
             email=body.email,
             name=body.name,
@@ -134,7 +136,7 @@ class AuthService:
         """(TokenResponse, refresh_token) 반환"""
         user = await self.user_repo.get_by_email(body.email)
 
-        if not user or not verify_password(body.password, user.hashed_password):
+        if not user or not await password_hasher.verify(body.password, user.hashed_password):
             raise HTTPException(status_code=401, detail={"code": "INVALID_CREDENTIALS", "message": "이메일 또는 비밀번호가 올바르지 않습니다."})
 
         if not user.email_verified_at:
@@ -144,8 +146,9 @@ class AuthService:
             raise HTTPException(status_code=403, detail={"code": "ACCOUNT_DISABLED", "message": "비활성화된 계정입니다."})
 
         from app.core.config import settings
-        access_token = create_access_token(str(user.id))
-        refresh_token = create_refresh_token(str(user.id))
+        session_id = new_session_id()
+        access_token = create_access_token(str(user.id), session_id)
+        refresh_token = create_refresh_token(str(user.id), session_id)
 
         return (
             TokenResponse(
@@ -158,23 +161,36 @@ class AuthService:
     # ── 토큰 갱신 ─────────────────────────────────────────────────────────────
 
     async def refresh(self, refresh_token: str) -> TokenResponse:
-        from app.core.security import decode_token
         from app.core.config import settings
 
-        user_id = decode_token(refresh_token, token_type="refresh")
-        if not user_id:
+        claims = await verify_token(refresh_token, token_type="refresh")
+        if not claims:
             raise HTTPException(status_code=401, detail={"code": "INVALID_TOKEN", "message": "유효하지 않은 토큰입니다."})
 
-        user = await self.user_repo.get_by_id(uuid.UUID(user_id))
+        user = await self.user_repo.get_by_id(uuid.UUID(claims.sub))
         if not user or not user.is_active:
             raise HTTPException(status_code=401, detail={"code": "USER_NOT_FOUND", "message": "사용자를 찾을 수 없습니다."})
 
-        access_token = create_access_token(str(user.id))
+        access_token = create_access_token(str(user.id), claims.sid)
         return TokenResponse(
             access_token=access_token,
             expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
         )
 
+    # ── 로그아웃 ──────────────────────────────────────────────────────────────
+
+    async def logout(self, access_token: Optional[str]) -> None:
+        """Access Token의 로그인 세션을 폐기 — 같은 세션의 Refresh Token으로도 더 이상 갱신할 수 없음"""
+        from app.core.config import settings
+        from app.core.security import decode_claims
+
+        claims = decode_claims(access_token) if access_token else None
+        if not claims or claims.type != "access" or not claims.sid:
+            return
+        # Refresh Token은 로그아웃 경로로 전송되지 않으므로 가능한 최대 만료 시각까지 폐기
+        expires_at = int(time.time()) + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+        await revoke_session(claims.sid, expires_at)
+
     # ── 회원가입 요청 목록 (ADMIN) ────────────────────────────────────────────
 
     async def list_register_requests(
@@ -200,7 +216,7 @@ class AuthService:
         self,
         request_id: uuid.UUID,
         body: ProcessRegisterRequest,
-        processed_by: User,
+        processed_by: Principal,
     ) -> ProcessRegisterResponse:
         req = await self.req_repo.get_by_id(request_id)
         if not req:
@@ -260,7 +276,7 @@ class AuthService:
         if not user:
             raise HTTPException(status_code=404, detail={"code": "USER_NOT_FOUND", "message": "사용자를 찾을 수 없습니다."})
 
-        user.hashed_password = hash_password(body.new_password)
+        user.hashed_password = await password_hasher.hash(body.new_password)
         await self.user_repo.save(user)
         await self.db.commit()
         await self.redis.delete(pw_reset_key(body.token))
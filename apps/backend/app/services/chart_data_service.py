@@ -0,0 +1,464 @@
+"""차트 데이터 조회 비즈니스 로직 — 집계는 원본 DB로 푸시다운, 업로드 파일은 로컬 컬럼 저장소에서 실행"""
+import asyncio
+import logging
+import resource
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Optional
+
+import anyio
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.access import accessible_datasource_ids, can_access
+from app.core.config import settings
+from app.core.metrics import measure_serialization
+from app.core.principal import Principal
+from app.core.redis import get_redis
+from app.db.models.chart import Chart
+from app.db.models.datasource import DataSource
+from app.db.models.enums import AuditAction, Role
+from app.engine import executor
+from app.engine.admission import admit_local, admit_query
+from app.engine.batching import MergedQuery, merge_chart_queries, project_result
+from app.engine.cache import ChartResultCache, decode_result, encode_result, query_fingerprint
+from app.engine.columnar import FILE_SOURCE_TYPES
+from app.engine.compiler import ChartResult, CompiledQuery, compile_chart_query, compile_export_query
+from app.engine.dialects import get_dialect
+from app.engine.errors import QueryEngineError
+from app.engine.export import CsvStreamWriter, XlsxStreamWriter
+from app.engine.formatting import FormatProgram, compile_formats, get_program
+from app.engine.governor import QueryPriority
+from app.engine.local import run_local, stream_local
+from app.engine.rollups import match_rollup, run_rollup
+from app.engine.planner import build_chart_query
+from app.engine.singleflight import SingleFlight
+from app.engine.spec import ChartQuery, QueryField, SortKey
+from app.engine.wire import ChartData, encode_page_line
+from app.db.session import AsyncSessionLocal
+from app.repositories.audit_repository import AuditLogRepository
+from app.repositories.chart_repository import ChartRepository
+from app.repositories.datasource_repository import DataSourceRepository
+from app.repositories.filter_repository import FilterRepository
+from app.repositories.page_repository import PageRepository
+from app.schemas.chart import (
+    ChartDataRequest,
+    ChartExportRequest,
+    ExportFormat,
+    PageChartData,
+    PageDataRequest,
+)
+from app.schemas.common import ErrorDetail
+
+logger = logging.getLogger(__name__)
+
+_RSS_SAMPLE_BATCHES = 16  # 내보내기 중 RSS는 이 배치 수마다 한 번 측정
+
+
+@dataclass
+class ChartExport:
+    filename: str
+    media_type: str
+    body: AsyncIterator[bytes]
+
+
+def _rss_mb() -> float:
+    """현재 프로세스 RSS (MB) — /proc이 없으면 최대 RSS로 대체"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def to_chart_data(
+    result: ChartResult,
+    page: int,
+    limit: int,
+    program: Optional[FormatProgram] = None,
+) -> ChartData:
+    styles = program.evaluate(result.columns, result.rows) if program is not None else None
+    return ChartData(result=result, page=page, limit=limit, styles=styles)
+
+
+class ChartDataService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.chart_repo = ChartRepository(db)
+        self.ds_repo = DataSourceRepository(db)
+        self.filter_repo = FilterRepository(db)
+        self.page_repo = PageRepository(db)
+        self.redis = get_redis()
+        self.cache = ChartResultCache(self.redis)
+
+    async def _load_chart(
+        self,
+        dashboard_id: uuid.UUID,
+        page_id: uuid.UUID,
+        chart_id: uuid.UUID,
+        current_user: Principal,
+    ) -> tuple[Chart, DataSource]:
+        chart = await self.chart_repo.get_in_page(dashboard_id, page_id, chart_id)
+        if not chart:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "차트를 찾을 수 없습니다."})
+        if not chart.datasource_id:
+            raise HTTPException(status_code=400, detail={"code": "NO_DATASOURCE", "message": "차트에 데이터 소스가 연결되지 않았습니다."})
+
+        datasource = await self.ds_repo.get_with_fields(chart.datasource_id)
+        if not datasource:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "데이터 소스를 찾을 수 없습니다."})
+        if not await self.ds_repo.has_access(datasource, current_user):
+            raise HTTPException(status_code=403, detail={"code": "FORBIDDEN", "message": "데이터 소스 접근 권한이 없습니다."})
+        return chart, datasource
+
+    async def _format_programs(self, charts: list[Chart]) -> dict[uuid.UUID, FormatProgram]:
+        """차트별 컴파일된 조건부 서식 — 워커 캐시에 없는 차트만 DB에서 읽어 컴파일합니다."""
+        programs: dict[uuid.UUID, FormatProgram] = {}
+        missing: list[Chart] = []
+        for chart in charts:
+            program = get_program(chart.id, chart.version)
+            if program is None:
+                missing.append(chart)
+            else:
+                programs[chart.id] = program
+        if missing:
+            formats = await self.chart_repo.list_conditional_formats([c.id for c in missing])
+            for chart in missing:
+                programs[chart.id] = compile_formats(
+                    chart.id, chart.version, [f for f in formats if f.chart_id == chart.id]
+                )
+        return programs
+
+    async def _run_query(self, datasource: DataSource, query: ChartQuery, role: Optional[Role] = None) -> ChartResult:
+        """롤업 → 로컬 컬럼 저장소 → 원본 DB 순으로 처리 가능한 곳에서 실행합니다.
+
+        role은 요청한 사용자 역할이며, 지정하면 롤업 밖의 쿼리에 역할별 비용 예산(app.engine.admission)을 적용합니다.
+        """
+        rollup = match_rollup(query, datasource.rollups)
+        if rollup is not None:
+            try:
+                return await run_rollup(rollup, query)
+            except QueryEngineError as exc:
+                # 롤업 파일 유실 등 — 결과는 원본에서도 같으므로 원본으로 진행
+                logger.warning("롤업 조회 실패, 원본으로 폴백 (%s): %s", rollup.id, exc.message)
+        if datasource.source_type in FILE_SOURCE_TYPES:
+            # 메모리 맵 파일 스캔은 워커 내부에서 충분히 빨라 Redis 캐시를 거치지 않음
+            if role is not None:
+                await admit_local(datasource, query, role)
+            return await run_local(datasource, query)
+        compiled = compile_chart_query(query, get_dialect(datasource.source_type))
+        return await self._fetch(datasource, compiled, role)
+
+    async def _fetch(self, datasource: DataSource, compiled: CompiledQuery, role: Optional[Role] = None) -> ChartResult:
+        """캐시를 먼저 확인하고, 없으면 원본 DB에서 실행한 뒤 캐시에 저장합니다.
+
+        캐시 미스 시 같은 fingerprint의 동시 요청은 워커 경계를 넘어 한 번만 실행됩니다.
+        비용 추정(role 지정 시)도 캐시 미스일 때만 합니다.
+        """
+        fingerprint = query_fingerprint(datasource.id, compiled)
+        result = await self.cache.get(datasource, fingerprint, compiled)
+        if result is not None:
+            return result
+        priority = None
+        if role is not None:
+            priority = await admit_query(self.redis, datasource, fingerprint, compiled, role)
+
+        async def run() -> ChartResult:
+            fresh = compiled.decode(await executor.execute(datasource, compiled, priority))
+            await self.cache.set(datasource, fingerprint, fresh)
+            return fresh
+
+        flight = SingleFlight(self.redis, encode_result, lambda raw: decode_result(raw, compiled))
+        return await flight.do(fingerprint, run)
+
+    # ── 차트 데이터 조회 ──────────────────────────────────────────────────────
+
+    async def get_chart_data(
+        self,
+        dashboard_id: uuid.UUID,
+        page_id: uuid.UUID,
+        chart_id: uuid.UUID,
+        body: ChartDataRequest,
+        current_user: Principal,
+    ) -> ChartData:
+        chart, datasource = await self._load_chart(dashboard_id, page_id, chart_id, current_user)
+        filters = await self.filter_repo.list_by_page(page_id)
+        default_rules = await self.filter_repo.list_default_rules(page_id)
+        programs = await self._format_programs([chart])
+
+        try:
+            query = build_chart_query(
+                chart,
+                datasource,
+                filters=filters,
+                filter_values={f.filter_id: f.value for f in body.filters},
+                default_rules=default_rules,
+                sort=SortKey(body.sort.field_id, body.sort.direction) if body.sort else None,
+                page=body.page,
+                limit=body.limit,
+            )
+            result = await self._run_query(datasource, query, current_user.role)
+        except QueryEngineError as exc:
+            raise HTTPException(status_code=exc.status_code, detail=exc.to_detail())
+
+        return to_chart_data(result, body.page, query.limit, programs[chart.id])
+
+    # ── 페이지 일괄 데이터 조회 ───────────────────────────────────────────────
+
+    async def render_page(
+        self,
+        dashboard_id: uuid.UUID,
+        page_id: uuid.UUID,
+        body: PageDataRequest,
+        current_user: Principal,
+    ) -> AsyncIterator[bytes]:
+        """페이지의 모든 차트 데이터를 병합 쿼리로 실행하고 완료 순서대로 NDJSON 줄을 내보냅니다.
+
+        DB 조회(페이지/데이터 소스/권한)는 여기서 모두 끝내고, 반환되는 스트림은
+        세션 없이 원본 쿼리 실행과 캐시만 사용합니다.
+        """
+        page = await self.page_repo.get_for_render(dashboard_id, page_id)
+        if not page:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "페이지를 찾을 수 없습니다."})
+
+        wanted = set(body.chart_ids) if body.chart_ids is not None else None
+        charts = [c for c in page.charts if wanted is None or c.id in wanted]
+        datasources = {
+            ds.id: ds
+            for ds in await self.ds_repo.list_with_fields(list({c.datasource_id for c in charts if c.datasource_id}))
+        }
+        accessible = await accessible_datasource_ids(self.db, current_user)
+        allowed = {ds_id for ds_id, ds in datasources.items() if can_access(ds, current_user, accessible)}
+        programs = await self._format_programs(charts)
+        return self._plan_page(
+            page, charts, datasources, allowed, {f.filter_id: f.value for f in body.filters}, programs,
+            current_user.role,
+        )
+
+    async def warm_page(
+        self,
+        dashboard_id: uuid.UUID,
+        page_id: uuid.UUID,
+        chart_ids: Optional[list[uuid.UUID]] = None,
+    ) -> AsyncIterator[bytes]:
+        """백그라운드 캐시 워밍용 — 필터 기본 상태로 페이지 차트를 실행해 결과 캐시를 채웁니다.
+
+        사용자 요청이 아니므로 권한 검사 없이 실행하며, 호출자는 반환된 스트림을 끝까지 소비하면 됩니다.
+        """
+        page = await self.page_repo.get_for_render(dashboard_id, page_id)
+        if not page:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "페이지를 찾을 수 없습니다."})
+
+        wanted = set(chart_ids) if chart_ids is not None else None
+        charts = [c for c in page.charts if wanted is None or c.id in wanted]
+        datasources = {
+            ds.id: ds
+            for ds in await self.ds_repo.list_with_fields(list({c.datasource_id for c in charts if c.datasource_id}))
+        }
+        # 결과 캐시만 채우면 되므로 조건부 서식은 평가하지 않음
+        return self._plan_page(page, charts, datasources, set(datasources), {}, {})
+
+    def _plan_page(
+        self,
+        page: Any,
+        charts: list[Chart],
+        datasources: dict[uuid.UUID, DataSource],
+        allowed: set[uuid.UUID],
+        filter_values: dict[uuid.UUID, Any],
+        programs: dict[uuid.UUID, FormatProgram],
+        role: Optional[Role] = None,
+    ) -> AsyncIterator[bytes]:
+        errors: list[PageChartData] = []
+        items: list[tuple[uuid.UUID, uuid.UUID, ChartQuery]] = []
+        chart_columns: dict[uuid.UUID, list[QueryField]] = {}
+        chart_limits: dict[uuid.UUID, int] = {}
+
+        for chart in charts:
+            datasource = datasources.get(chart.datasource_id) if chart.datasource_id else None
+            if datasource is None:
+                errors.append(_chart_error(chart.id, "NO_DATASOURCE", "차트에 데이터 소스가 연결되지 않았습니다."))
+                continue
+            if datasource.id not in allowed:
+                errors.append(_chart_error(chart.id, "FORBIDDEN", "데이터 소스 접근 권한이 없습니다."))
+                continue
+            try:
+                query = build_chart_query(
+                    chart,
+                    datasource,
+                    filters=page.filters,
+                    filter_values=filter_values,
+                    default_rules=page.default_filter_rules,
+                )
+            except QueryEngineError as exc:
+                errors.append(_chart_error(chart.id, exc.code, exc.message))
+                continue
+            items.append((chart.id, datasource.id, query))
+            chart_columns[chart.id] = query.columns
+            chart_limits[chart.id] = query.limit
+
+        groups = merge_chart_queries(items)
+        return self._stream_page(groups, datasources, chart_columns, chart_limits, programs, errors, role)
+
+    async def _stream_page(
+        self,
+        groups: list[MergedQuery],
+        datasources: dict[uuid.UUID, DataSource],
+        chart_columns: dict[uuid.UUID, list[QueryField]],
+        chart_limits: dict[uuid.UUID, int],
+        programs: dict[uuid.UUID, FormatProgram],
+        errors: list[PageChartData],
+        role: Optional[Role],
+    ) -> AsyncIterator[bytes]:
+        for item in errors:
+            yield item.model_dump_json().encode() + b"\n"
+
+        async def run(group: MergedQuery) -> tuple[MergedQuery, Optional[ChartResult], Optional[QueryEngineError]]:
+            datasource = datasources[group.datasource_id]
+            try:
+                return group, await self._run_query(datasource, group.query, role), None
+            except QueryEngineError as exc:
+                return group, None, exc
+
+        tasks = [asyncio.create_task(run(g)) for g in groups]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                group, result, exc = await next_done
+                for member in group.members:
+                    if exc is not None:
+                        yield _chart_error(member.chart_id, exc.code, exc.message).model_dump_json().encode() + b"\n"
+                        continue
+                    projected = project_result(result, member, chart_columns[member.chart_id])
+                    data = to_chart_data(projected, 1, chart_limits[member.chart_id], programs.get(member.chart_id))
+                    with measure_serialization():
+                        line = encode_page_line(member.chart_id, data)
+                    yield line
+        finally:
+            # 클라이언트가 스트림 도중 끊으면 남은 쿼리 취소
+            for task in tasks:
+                task.cancel()
+
+    # ── 차트 데이터 내보내기 ──────────────────────────────────────────────────
+
+    async def export_chart(
+        self,
+        dashboard_id: uuid.UUID,
+        page_id: uuid.UUID,
+        chart_id: uuid.UUID,
+        body: ChartExportRequest,
+        current_user: Principal,
+        ip_address: Optional[str],
+    ) -> ChartExport:
+        """차트 전체 결과를 CSV/XLSX 바이트 스트림으로 내보냅니다.
+
+        원본 DB는 서버 사이드 커서, 업로드 파일은 로컬 컬럼 저장소에서 배치 단위로 읽어 바로 인코딩하므로
+        결과 크기와 무관하게 메모리 사용량이 배치 크기로 제한됩니다. 페이지/limit은 적용하지 않습니다.
+        첫 배치까지는 여기서 가져와, 쿼리 오류는 응답 헤더 전송 전에 일반 오류 응답으로 반환됩니다.
+        """
+        chart, datasource = await self._load_chart(dashboard_id, page_id, chart_id, current_user)
+        filters = await self.filter_repo.list_by_page(page_id)
+        default_rules = await self.filter_repo.list_default_rules(page_id)
+        batch_size = settings.CHART_EXPORT_BATCH_ROWS
+
+        try:
+            query = build_chart_query(
+                chart,
+                datasource,
+                filters=filters,
+                filter_values={f.filter_id: f.value for f in body.filters},
+                default_rules=default_rules,
+                sort=SortKey(body.sort.field_id, body.sort.direction) if body.sort else None,
+            )
+            if datasource.source_type in FILE_SOURCE_TYPES:
+                batches = stream_local(datasource, query, batch_size)
+            else:
+                export_query = compile_export_query(query, get_dialect(datasource.source_type))
+                batches = executor.stream(datasource, export_query, batch_size, QueryPriority.EXPORT)
+            first = await anext(batches, None)
+        except QueryEngineError as exc:
+            raise HTTPException(status_code=exc.status_code, detail=exc.to_detail())
+
+        writer = CsvStreamWriter() if body.format == ExportFormat.CSV else XlsxStreamWriter(chart.title)
+        audit = {
+            "user_id": current_user.id,
+            "ip_address": ip_address,
+            "chart_id": str(chart.id),
+            "datasource_id": str(datasource.id),
+            "format": body.format.value,
+        }
+        labels = [c.label for c in query.columns] if body.include_headers else None
+        filename = f"chart_export_{datetime.now(timezone.utc):%Y%m%d}.{writer.extension}"
+        return ChartExport(
+            filename=filename,
+            media_type=writer.media_type,
+            body=_stream_export(writer, labels, first, batches, audit),
+        )
+
+
+async def _stream_export(
+    writer: CsvStreamWriter | XlsxStreamWriter,
+    labels: Optional[list[str]],
+    first: Optional[list[Any]],
+    batches: AsyncIterator[list[Any]],
+    audit: dict[str, Any],
+) -> AsyncIterator[bytes]:
+    """배치를 인코딩해 흘려보내고, 끝나면(중단 포함) 처리량/메모리 지표를 감사 로그에 남깁니다."""
+    started = time.perf_counter()
+    rows = 0
+    written = 0
+    peak_rss = _rss_mb()
+    completed = False
+    try:
+        if labels is not None:
+            chunk = writer.header(labels)
+            written += len(chunk)
+            yield chunk
+        batch, count = first, 0
+        while batch is not None:
+            chunk = writer.write_rows(batch)
+            rows += len(batch)
+            count += 1
+            if count % _RSS_SAMPLE_BATCHES == 0:
+                peak_rss = max(peak_rss, _rss_mb())
+            if chunk:
+                written += len(chunk)
+                yield chunk
+            batch = await anext(batches, None)
+        chunk = writer.close()
+        written += len(chunk)
+        yield chunk
+        completed = True
+    finally:
+        peak_rss = max(peak_rss, _rss_mb())
+        elapsed = time.perf_counter() - started
+        # 클라이언트가 연결을 끊으면 취소가 전파되므로, 커서 반환과 감사 로그 기록은 취소에서 보호
+        with anyio.CancelScope(shield=True):
+            await batches.aclose()
+            await _record_export(
+                {
+                    **audit,
+                    "rows": rows,
+                    "bytes": written,
+                    "duration_ms": round(elapsed * 1000),
+                    "rows_per_sec": round(rows / elapsed) if elapsed > 0 else rows,
+                    "peak_rss_mb": round(peak_rss, 1),
+                    "completed": completed,
+                }
+            )
+
+
+async def _record_export(detail: dict[str, Any]) -> None:
+    # 스트림이 끝날 때는 요청 세션이 이미 닫혀 있으므로 별도 세션 사용
+    user_id = detail.pop("user_id")
+    ip_address = detail.pop("ip_address")
+    async with AsyncSessionLocal() as session:
+        await AuditLogRepository(session).create(
+            user_id=user_id, action=AuditAction.EXPORT, detail=detail, ip_address=ip_address
+        )
+        await session.commit()
+
+
+def _chart_error(chart_id: uuid.UUID, code: str, message: str) -> PageChartData:
+    return PageChartData(chart_id=chart_id, success=False, error=ErrorDetail(code=code, message=message))
@@ -0,0 +1,64 @@
+"""Dashboard 비즈니스 로직 — 대시보드 단건(페이지 목록 포함) 조회
+
+정의는 version 기준 Redis 키에 직렬화해 두고, 요청마다 바뀔 수 있는 소유자 이름 / 즐겨찾기 여부만
+version과 함께 조회해 붙입니다. 셋을 합친 ETag가 같으면 본문 없이 304로 끝냅니다.
+"""
+import json
+import uuid
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.etag import cached_definition, etag_matches, make_etag
+from app.core.principal import Principal
+from app.core.redis import dashboard_detail_key
+from app.repositories.dashboard_repository import DashboardRepository
+from app.schemas.dashboard import DashboardDetailResponse, DashboardPageItem
+
+
+class DashboardService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.dashboard_repo = DashboardRepository(db)
+
+    async def get_detail_json(
+        self,
+        dashboard_id: uuid.UUID,
+        current_user: Principal,
+        if_none_match: Optional[str] = None,
+    ) -> tuple[str, Optional[str]]:
+        """(ETag, DashboardDetailResponse JSON 문자열) — If-None-Match가 일치하면 JSON 자리에 None"""
+        state = await self.dashboard_repo.get_state(dashboard_id, current_user.id)
+        if state is None:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "대시보드를 찾을 수 없습니다."})
+        version, owner_name, is_favorite = state
+
+        etag = make_etag("dashboard", dashboard_id, version, owner_name, is_favorite)
+        if etag_matches(if_none_match, etag):
+            return etag, None
+
+        async def load() -> tuple[int, str]:
+            detail = await self._load(dashboard_id)
+            return detail.version, detail.model_dump_json(exclude={"owner_name", "is_favorite"})
+
+        payload = await cached_definition(lambda v: dashboard_detail_key(str(dashboard_id), v), version, load)
+        # 캐시된 JSON은 사용자별 값을 뺀 객체이므로 마지막 "}" 앞에 붙임
+        extra = f'"owner_name":{json.dumps(owner_name, ensure_ascii=False)},"is_favorite":{json.dumps(is_favorite)}'
+        return etag, f"{payload[:-1]},{extra}}}"
+
+    async def _load(self, dashboard_id: uuid.UUID) -> DashboardDetailResponse:
+        dashboard = await self.dashboard_repo.get_with_pages(dashboard_id)
+        if not dashboard:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "대시보드를 찾을 수 없습니다."})
+        return DashboardDetailResponse(
+            id=dashboard.id,
+            version=dashboard.version,
+            name=dashboard.name,
+            description=dashboard.description,
+            is_public=dashboard.is_public,
+            owner_id=dashboard.owner_id,
+            pages=[DashboardPageItem.model_validate(p) for p in dashboard.pages],
+            created_at=dashboard.created_at,
+            updated_at=dashboard.updated_at,
+        )
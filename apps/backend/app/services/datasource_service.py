@@ -0,0 +1,177 @@
+"""DataSource 비즈니스 로직"""
+import uuid
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from fastapi import HTTPException, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.principal import Principal
+from app.db.models.datasource import DataSourceField
+from app.db.models.enums import AggregateType, DSSourceType, FieldType
+from app.engine.columnar import IngestResult, ingest_csv, ingest_excel, new_storage_key, remove_files, storage_path
+from app.engine.errors import QueryEngineError
+from app.engine.introspect import describe_source
+from app.repositories.datasource_repository import DataSourceRepository
+from app.schemas.datasource import DataSourceResponse, SchemaSyncResponse
+
+_UPLOAD_TYPES = {
+    ".csv": DSSourceType.CSV,
+    ".xlsx": DSSourceType.EXCEL,
+    ".xlsm": DSSourceType.EXCEL,
+}
+_COPY_CHUNK = 1024 * 1024
+
+
+def _stage_upload(src: BinaryIO, dest: Path) -> None:
+    """업로드 스트림을 청크 단위로 디스크에 복사 — 크기 상한 초과 시 중단"""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with open(dest, "wb") as out:
+        while chunk := src.read(_COPY_CHUNK):
+            written += len(chunk)
+            if written > settings.DATASOURCE_UPLOAD_MAX_BYTES:
+                raise _file_too_large()
+            out.write(chunk)
+
+
+def _file_too_large() -> HTTPException:
+    limit_mb = settings.DATASOURCE_UPLOAD_MAX_BYTES // (1024 * 1024)
+    return HTTPException(
+        status_code=413, detail={"code": "FILE_TOO_LARGE", "message": f"파일 크기는 {limit_mb}MB 이하여야 합니다."}
+    )
+
+
+class DataSourceService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.ds_repo = DataSourceRepository(db)
+
+    # ── 파일 업로드 ───────────────────────────────────────────────────────────
+
+    async def create_from_upload(
+        self,
+        file: UploadFile,
+        label: str,
+        source_id: str,
+        description: Optional[str],
+        header_row: int,
+        sheet_name: Optional[str],
+        current_user: Principal,
+    ) -> DataSourceResponse:
+        """업로드 파일을 컬럼 저장소로 적재하고, 추론한 필드 타입으로 데이터 소스를 생성합니다."""
+        suffix = Path(file.filename or "").suffix.lower()
+        source_type = _UPLOAD_TYPES.get(suffix)
+        if source_type is None:
+            raise HTTPException(status_code=400, detail={"code": "INVALID_FILE", "message": "csv 또는 xlsx 파일만 업로드할 수 있습니다."})
+        if file.size is not None and file.size > settings.DATASOURCE_UPLOAD_MAX_BYTES:
+            raise _file_too_large()
+        if await self.ds_repo.get_by_source_id(source_id):
+            raise HTTPException(status_code=409, detail={"code": "SOURCE_ID_ALREADY_EXISTS", "message": "이미 사용 중인 source_id입니다."})
+
+        datasource_id = uuid.uuid4()
+        storage_key = new_storage_key(datasource_id)
+        staged = storage_path(storage_key).with_suffix(suffix)
+        try:
+            await run_in_threadpool(_stage_upload, file.file, staged)
+            if source_type == DSSourceType.CSV:
+                ingested = await run_in_threadpool(ingest_csv, staged, storage_key, header_row)
+            else:
+                ingested = await run_in_threadpool(ingest_excel, staged, storage_key, header_row, sheet_name)
+        except QueryEngineError as exc:
+            remove_files(datasource_id)
+            raise HTTPException(status_code=exc.status_code, detail=exc.to_detail())
+        except Exception:
+            remove_files(datasource_id)
+            raise
+        finally:
+            staged.unlink(missing_ok=True)
+
+        try:
+            datasource = await self.ds_repo.create(
+                id=datasource_id,
+                label=label,
+                source_id=source_id,
+                source_type=source_type,
+                description=description,
+                connection_config={
+                    "storage_key": ingested.storage_key,
+                    "filename": file.filename,
+                    "row_count": ingested.row_count,
+                    "header_row": header_row,
+                    "sheet_name": sheet_name,
+                },
+                created_by_id=current_user.id,
+                fields=_fields_from(ingested),
+            )
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            remove_files(datasource_id)
+            raise
+
+        return DataSourceResponse(
+            id=datasource.id,
+            label=datasource.label,
+            source_id=datasource.source_id,
+            source_type=datasource.source_type,
+            description=datasource.description,
+            field_count=len(ingested.fields),
+            created_at=datasource.created_at,
+        )
+
+    # ── 스키마 동기화 ─────────────────────────────────────────────────────────
+
+    async def sync_schema(self, datasource_id: uuid.UUID) -> SchemaSyncResponse:
+        """원본 컬럼과 필드 목록을 비교해 새 컬럼은 필드로 추가하고, 사라진 컬럼의 필드는 삭제합니다.
+
+        기존 필드의 라벨/타입/서식 등 사용자가 편집한 값은 유지합니다.
+        """
+        datasource = await self.ds_repo.get_with_fields(datasource_id)
+        if not datasource:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "데이터 소스를 찾을 수 없습니다."})
+        try:
+            columns = await describe_source(datasource)
+        except QueryEngineError as exc:
+            raise HTTPException(status_code=exc.status_code, detail=exc.to_detail())
+
+        current = {f.field_id: f for f in datasource.fields}
+        source_names = {name for name, _ in columns}
+        added = [(name, field_type) for name, field_type in columns if name not in current]
+        removed = [f for f in datasource.fields if f.field_id not in source_names]
+
+        next_order = max((f.order for f in datasource.fields), default=-1) + 1
+        for offset, (name, field_type) in enumerate(added):
+            datasource.fields.append(
+                DataSourceField(
+                    field_id=name,
+                    label=name,
+                    type=field_type,
+                    default_aggregate=AggregateType.SUM if field_type == FieldType.NUMBER else AggregateType.NONE,
+                    order=next_order + offset,
+                )
+            )
+        for field in removed:
+            datasource.fields.remove(field)
+        await self.db.commit()
+
+        return SchemaSyncResponse(
+            added_fields=[name for name, _ in added],
+            removed_fields=[f.field_id for f in removed],
+            message="스키마 동기화 완료",
+        )
+
+
+def _fields_from(ingested: IngestResult) -> list[DataSourceField]:
+    return [
+        DataSourceField(
+            field_id=f.field_id,
+            label=f.label,
+            type=f.type,
+            default_aggregate=AggregateType.SUM if f.type == FieldType.NUMBER else AggregateType.NONE,
+            order=idx,
+        )
+        for idx, f in enumerate(ingested.fields)
+    ]
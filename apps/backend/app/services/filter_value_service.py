@@ -0,0 +1,386 @@
+"""드롭다운 필터 값 목록 — Redis sorted set 인덱스 조회와 백그라운드 빌드, 연쇄 필터
+
+(데이터 소스, 필드)마다 원본을 집계한 값 목록을 Redis에 두고, 드롭다운을 열 때는 원본 대신 이 인덱스만 읽습니다.
+
+- distinct_values: member = 값, score = 건수 — 검색어 없이 열면 빈도순 페이지 (ZREVRANGE)
+- distinct_values_lex: member = 소문자 값 + NUL + 원래 값, score 0 — 대소문자 무시 접두어 검색 (ZRANGEBYLEX)
+- distinct_values_meta: 빌드 시각, watermark, truncated
+
+전체 빌드는 임시 키에 쓴 뒤 RENAME으로 한 번에 교체하므로 조회 중인 요청은 빌드 도중 상태를 보지 않습니다.
+watermark가 있는 데이터 소스는 직전 watermark 이후 변경분만 집계해 건수에 더하고,
+DISTINCT_VALUES_FULL_REFRESH_INTERVAL마다 전체를 다시 집계해 수정/삭제를 반영합니다.
+
+연쇄 필터(cascade)는 현재 선택 값으로 다른 드롭다운을 좁힌 값 목록이라 인덱스로 만들 수 없으므로
+데이터 소스별로 원본 쿼리 1개를 실행하고, 외부 DB 결과는 선택 값 fingerprint 기준 차트 결과 캐시에 둡니다.
+"""
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import redis.asyncio as aioredis
+from fastapi import HTTPException
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.access import accessible_datasource_ids, can_access
+from app.core.config import settings
+from app.core.principal import Principal
+from app.core.redis import (
+    distinct_values_key,
+    distinct_values_lex_key,
+    distinct_values_lock_key,
+    distinct_values_meta_key,
+    get_redis,
+)
+from app.db.models.datasource import DataSource
+from app.db.models.enums import FilterType
+from app.db.session import AsyncSessionLocal
+from app.engine.cache import ChartResultCache, decode_result, encode_result, query_fingerprint
+from app.engine.cascade import CascadeQuery, compile_cascade_query, execute_cascade_local, split_result
+from app.engine.columnar import FILE_SOURCE_TYPES
+from app.engine.compiler import ChartResult, CompiledQuery
+from app.engine.dialects import get_dialect
+from app.engine.distinct import DistinctBuild, collect_distinct
+from app.engine.errors import QueryEngineError
+from app.engine.executor import execute
+from app.engine.local import run_on_table
+from app.engine.planner import build_cascade_query
+from app.engine.singleflight import SingleFlight
+from app.repositories.datasource_repository import DataSourceRepository
+from app.repositories.filter_repository import FilterRepository
+from app.repositories.page_repository import PageRepository
+from app.schemas.filter import (
+    FilterCascadeItem,
+    FilterCascadeRequest,
+    FilterCascadeResponse,
+    FilterValueItem,
+    FilterValuesResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+_LEX_SEP = "\x00"
+_LEX_MAX = chr(0x10FFFF)   # UTF-8로 가장 큰 문자 — 접두어 범위의 상한
+_WRITE_CHUNK = 5000
+
+# 락 값이 내 토큰일 때만 삭제 (만료 후 다른 워커가 잡은 락을 지우지 않도록)
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _lex_member(value: str) -> str:
+    return f"{value.lower()}{_LEX_SEP}{value}"
+
+
+def _source_key(datasource: DataSource) -> str:
+    """업로드 파일은 재업로드마다 저장 파일이 바뀌므로 인덱스가 어느 파일로 만들어졌는지 기록"""
+    if datasource.source_type in FILE_SOURCE_TYPES:
+        return (datasource.connection_config or {}).get("storage_key") or ""
+    return ""
+
+
+def _index_ttl() -> int:
+    # 드롭다운 필터가 삭제되어 더 이상 갱신되지 않는 인덱스는 자동 만료
+    return 2 * max(settings.DISTINCT_VALUES_FULL_REFRESH_INTERVAL, settings.DISTINCT_VALUES_REFRESH_INTERVAL)
+
+
+class FilterValueService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.filter_repo = FilterRepository(db)
+        self.ds_repo = DataSourceRepository(db)
+        self.page_repo = PageRepository(db)
+        self.redis = get_redis()
+        self.cache = ChartResultCache(self.redis)
+
+    async def list_values(
+        self,
+        dashboard_id: uuid.UUID,
+        page_id: uuid.UUID,
+        filter_id: uuid.UUID,
+        q: Optional[str],
+        page: int,
+        limit: int,
+        current_user: Principal,
+    ) -> FilterValuesResponse:
+        """드롭다운 필터의 값 목록 — 검색어(q)가 있으면 대소문자 무시 접두어 일치 값을 가나다순으로, 없으면 빈도순으로
+
+        인덱스가 없으면 업로드 파일 데이터 소스는 바로 집계하고(로컬 컬럼 저장소라 빠름, 재업로드 시에도 다시 집계),
+        외부 DB는 빌드 작업만 등록한 뒤 ready=False로 빈 목록을 반환합니다.
+        """
+        flt = await self.filter_repo.get_in_page(dashboard_id, page_id, filter_id)
+        if not flt:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "필터를 찾을 수 없습니다."})
+        if flt.type != FilterType.DROPDOWN or not flt.datasource_id or not flt.field_id:
+            raise HTTPException(
+                status_code=400,
+                detail={"code": "INVALID_FILTER", "message": "데이터 소스 필드가 지정된 드롭다운 필터만 값 목록을 조회할 수 있습니다."},
+            )
+        datasource = await self.ds_repo.get_with_fields(flt.datasource_id)
+        if not datasource:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "데이터 소스를 찾을 수 없습니다."})
+        if not await self.ds_repo.has_access(datasource, current_user):
+            raise HTTPException(status_code=403, detail={"code": "FORBIDDEN", "message": "데이터 소스 접근 권한이 없습니다."})
+
+        ds_id = str(datasource.id)
+        meta = await self.redis.hgetall(distinct_values_meta_key(ds_id, flt.field_id))
+        if not meta or meta.get("source_key", "") != _source_key(datasource):
+            if datasource.source_type in FILE_SOURCE_TYPES:
+                try:
+                    await build_distinct_index(datasource.id, flt.field_id)
+                except QueryEngineError as exc:
+                    raise HTTPException(status_code=exc.status_code, detail=exc.to_detail())
+                meta = await self.redis.hgetall(distinct_values_meta_key(ds_id, flt.field_id))
+            else:
+                # handlers가 서비스 모듈을 import하므로 지연 import
+                from app.jobs.handlers import enqueue_distinct_build
+                from app.jobs.queue import JobQueue
+
+                await enqueue_distinct_build(JobQueue(self.redis), datasource.id, flt.field_id)
+        if not meta:
+            return FilterValuesResponse(items=[], total=0, page=page, limit=limit, ready=False)
+
+        items, total = await read_values(self.redis, ds_id, flt.field_id, q, (page - 1) * limit, limit)
+        return FilterValuesResponse(
+            items=items,
+            total=total,
+            page=page,
+            limit=limit,
+            truncated=meta.get("truncated") == "1",
+            built_at=datetime.fromisoformat(meta["built_at"]),
+        )
+
+    # ── 연쇄 필터 ─────────────────────────────────────────────────────────────
+
+    async def cascade(
+        self,
+        dashboard_id: uuid.UUID,
+        page_id: uuid.UUID,
+        body: FilterCascadeRequest,
+        current_user: Principal,
+    ) -> FilterCascadeResponse:
+        """현재 선택 값으로 페이지 드롭다운들의 값 목록을 좁힙니다. (데이터 소스별 원본 쿼리 1개)
+
+        접근 권한이 없는 데이터 소스의 드롭다운은 결과에서 뺍니다.
+        """
+        if await self.page_repo.get_version(dashboard_id, page_id) is None:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "페이지를 찾을 수 없습니다."})
+        filters = await self.filter_repo.list_by_page(page_id)
+        default_rules = await self.filter_repo.list_default_rules(page_id)
+        ds_ids = list({f.datasource_id for f in filters if f.type == FilterType.DROPDOWN and f.datasource_id})
+        accessible = await accessible_datasource_ids(self.db, current_user)
+        datasources = [
+            ds for ds in await self.ds_repo.list_with_fields(ds_ids) if can_access(ds, current_user, accessible)
+        ]
+
+        filter_values = {f.filter_id: f.value for f in body.filters}
+        plans: list[tuple[DataSource, CascadeQuery, list[uuid.UUID]]] = []
+        try:
+            for datasource in datasources:
+                query, filter_ids = build_cascade_query(
+                    datasource,
+                    filters=filters,
+                    filter_values=filter_values,
+                    default_rules=default_rules,
+                    limit=settings.FILTER_CASCADE_VALUES_LIMIT,
+                )
+                if query.targets:
+                    plans.append((datasource, query, filter_ids))
+            results = await asyncio.gather(*(self._run_cascade(ds, query) for ds, query, _ in plans))
+        except QueryEngineError as exc:
+            raise HTTPException(status_code=exc.status_code, detail=exc.to_detail())
+
+        items: list[FilterCascadeItem] = []
+        for (_, query, filter_ids), result in zip(plans, results):
+            for filter_id, (values, truncated) in zip(filter_ids, split_result(result, query)):
+                items.append(FilterCascadeItem(
+                    filter_id=filter_id,
+                    items=[FilterValueItem(value=v, count=n) for v, n in values],
+                    truncated=truncated,
+                ))
+        return FilterCascadeResponse(filters=items)
+
+    async def _run_cascade(self, datasource: DataSource, query: CascadeQuery) -> ChartResult:
+        if datasource.source_type in FILE_SOURCE_TYPES:
+            # 업로드 파일은 차트 조회와 같이 Redis 캐시를 거치지 않음
+            return await run_on_table(datasource, lambda table: execute_cascade_local(table, query))
+        compiled = compile_cascade_query(query, get_dialect(datasource.source_type))
+        return await self._fetch(datasource, compiled)
+
+    async def _fetch(self, datasource: DataSource, compiled: CompiledQuery) -> ChartResult:
+        """차트 데이터 조회와 같은 결과 캐시 + single-flight — 데이터 소스 캐시 무효화도 함께 적용"""
+        fingerprint = query_fingerprint(datasource.id, compiled)
+        result = await self.cache.get(datasource, fingerprint, compiled)
+        if result is not None:
+            return result
+
+        async def run() -> ChartResult:
+            fresh = compiled.decode(await execute(datasource, compiled))
+            await self.cache.set(datasource, fingerprint, fresh)
+            return fresh
+
+        flight = SingleFlight(self.redis, encode_result, lambda raw: decode_result(raw, compiled))
+        return await flight.do(fingerprint, run)
+
+
+async def read_values(
+    redis: aioredis.Redis,
+    datasource_id: str,
+    field_id: str,
+    q: Optional[str],
+    offset: int,
+    limit: int,
+) -> tuple[list[FilterValueItem], int]:
+    """(값 목록, 전체 수) — 파이프라인 1번 (+ 검색 시 건수 조회 1번)"""
+    count_key = distinct_values_key(datasource_id, field_id)
+    if not q:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.zcard(count_key)
+            pipe.zrevrange(count_key, offset, offset + limit - 1, withscores=True)
+            total, rows = await pipe.execute()
+        return [FilterValueItem(value=value, count=int(score)) for value, score in rows], total
+
+    lex_key = distinct_values_lex_key(datasource_id, field_id)
+    prefix = q.lower()
+    lo, hi = f"[{prefix}", f"[{prefix}{_LEX_MAX}"
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.zlexcount(lex_key, lo, hi)
+        pipe.zrangebylex(lex_key, lo, hi, start=offset, num=limit)
+        total, members = await pipe.execute()
+    values = [member.split(_LEX_SEP, 1)[1] for member in members]
+    scores = await redis.zmscore(count_key, values) if values else []
+    return [FilterValueItem(value=v, count=int(s or 0)) for v, s in zip(values, scores)], total
+
+
+# ── 백그라운드 빌드 ───────────────────────────────────────────────────────────
+
+async def build_distinct_index(datasource_id: uuid.UUID, field_id: str, full: bool = False) -> None:
+    """(데이터 소스, 필드) 값 인덱스를 만들거나 갱신합니다. 다른 워커가 빌드 중이면 건너뜁니다.
+
+    watermark 필드가 그대로이고 직전 전체 빌드가 DISTINCT_VALUES_FULL_REFRESH_INTERVAL 이내면 증분,
+    그 외(또는 full=True)는 전체 집계입니다.
+    """
+    redis = get_redis()
+    ds_id = str(datasource_id)
+    lock_key = distinct_values_lock_key(ds_id, field_id)
+    token = uuid.uuid4().hex
+    if not await redis.set(lock_key, token, nx=True, ex=settings.DISTINCT_VALUES_BUILD_LOCK_TTL):
+        return
+
+    try:
+        async with AsyncSessionLocal() as session:
+            datasource = await DataSourceRepository(session).get_with_fields(datasource_id)
+        if datasource is None:
+            return
+
+        meta = await redis.hgetall(distinct_values_meta_key(ds_id, field_id))
+        since = None
+        if (
+            not full
+            and meta.get("watermark")
+            and meta.get("watermark_field") == datasource.watermark_field
+            and meta.get("source_key", "") == _source_key(datasource)
+        ):
+            full_built_at = datetime.fromisoformat(meta["full_built_at"])
+            if datetime.now(timezone.utc) - full_built_at < timedelta(seconds=settings.DISTINCT_VALUES_FULL_REFRESH_INTERVAL):
+                since = meta["watermark"]
+
+        build = await collect_distinct(datasource, field_id, since)
+        if since is None:
+            await _replace(redis, ds_id, field_id, build, datasource)
+        else:
+            await _merge(redis, ds_id, field_id, build, since, meta)
+        logger.info(
+            "드롭다운 값 인덱스 빌드 (%s.%s): %s, 원본 %d그룹 → %d개%s",
+            ds_id, field_id, "증분" if since else "전체", build.fetched_rows, len(build.values),
+            " (상한 초과)" if build.truncated else "",
+        )
+    finally:
+        try:
+            await redis.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+        except RedisError:
+            pass
+
+
+async def _replace(
+    redis: aioredis.Redis, ds_id: str, field_id: str, build: DistinctBuild, datasource: DataSource
+) -> None:
+    count_key = distinct_values_key(ds_id, field_id)
+    lex_key = distinct_values_lex_key(ds_id, field_id)
+    suffix = uuid.uuid4().hex[:12]
+    tmp_count, tmp_lex = f"{count_key}:{suffix}", f"{lex_key}:{suffix}"
+
+    for start in range(0, len(build.values), _WRITE_CHUNK):
+        chunk = build.values[start:start + _WRITE_CHUNK]
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.zadd(tmp_count, dict(chunk))
+            pipe.zadd(tmp_lex, {_lex_member(value): 0 for value, _ in chunk})
+            pipe.expire(tmp_count, settings.DISTINCT_VALUES_BUILD_LOCK_TTL)
+            pipe.expire(tmp_lex, settings.DISTINCT_VALUES_BUILD_LOCK_TTL)
+            await pipe.execute()
+
+    now = datetime.now(timezone.utc).isoformat()
+    ttl = _index_ttl()
+    async with redis.pipeline(transaction=True) as pipe:
+        if build.values:
+            pipe.rename(tmp_count, count_key)
+            pipe.rename(tmp_lex, lex_key)
+            pipe.expire(count_key, ttl)
+            pipe.expire(lex_key, ttl)
+        else:
+            pipe.delete(count_key, lex_key)
+        meta_key = distinct_values_meta_key(ds_id, field_id)
+        pipe.delete(meta_key)
+        pipe.hset(meta_key, mapping={
+            "built_at": now,
+            "full_built_at": now,
+            "watermark": build.watermark or "",
+            "watermark_field": datasource.watermark_field or "",
+            "source_key": _source_key(datasource),
+            "truncated": "1" if build.truncated else "0",
+        })
+        pipe.expire(meta_key, ttl)
+        await pipe.execute()
+
+
+async def _merge(
+    redis: aioredis.Redis, ds_id: str, field_id: str, build: DistinctBuild, since: str, meta: dict[str, str]
+) -> None:
+    """변경분 건수를 더하고 새 값을 추가한 뒤, 상한을 넘으면 빈도 하위 값부터 제거합니다."""
+    count_key = distinct_values_key(ds_id, field_id)
+    lex_key = distinct_values_lex_key(ds_id, field_id)
+    for start in range(0, len(build.values), _WRITE_CHUNK):
+        chunk = build.values[start:start + _WRITE_CHUNK]
+        async with redis.pipeline(transaction=False) as pipe:
+            for value, count in chunk:
+                pipe.zincrby(count_key, count, value)
+            pipe.zadd(lex_key, {_lex_member(value): 0 for value, _ in chunk}, nx=True)
+            await pipe.execute()
+
+    truncated = meta.get("truncated") == "1" or build.truncated
+    excess = await redis.zcard(count_key) - settings.DISTINCT_VALUES_MAX
+    if excess > 0:
+        removed = await redis.zrange(count_key, 0, excess - 1)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(count_key, *removed)
+            pipe.zrem(lex_key, *(_lex_member(value) for value in removed))
+            await pipe.execute()
+        truncated = True
+
+    ttl = _index_ttl()
+    async with redis.pipeline(transaction=True) as pipe:
+        meta_key = distinct_values_meta_key(ds_id, field_id)
+        pipe.hset(meta_key, mapping={
+            "built_at": datetime.now(timezone.utc).isoformat(),
+            "watermark": build.watermark or since,
+            "truncated": "1" if truncated else "0",
+        })
+        for key in (count_key, lex_key, meta_key):
+            pipe.expire(key, ttl)
+        await pipe.execute()
@@ -0,0 +1,84 @@
+"""Page 비즈니스 로직 — 페이지 상세(위젯 포함) 조회
+
+위젯이 많은 페이지(차트 60개, 서식 규칙 300개 등)도 고정된 쿼리 수로 로드하고, 직렬화한 JSON을
+페이지 version 기준 Redis 키에 캐시해 다음 요청은 version 조회 1번 + Redis 1번으로 끝냅니다.
+사용자별 뷰 설정만 매번 따로 조회해 캐시된 JSON에 붙이며, 둘을 합친 ETag가 같으면 본문 없이 304로 끝냅니다.
+
+위젯이 바뀌면 페이지 version이 함께 오르므로(app.core.versioning) 캐시 키와 ETag가 자동으로 바뀝니다.
+"""
+import json
+import uuid
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.etag import cached_definition, etag_matches, make_etag
+from app.core.principal import Principal
+from app.core.redis import page_detail_key
+from app.repositories.page_repository import PageRepository
+from app.schemas.page import (
+    ChartGroupResponse,
+    PageChartResponse,
+    PageDetailResponse,
+    PageFilterResponse,
+)
+
+
+class PageService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.page_repo = PageRepository(db)
+
+    async def get_detail_json(
+        self,
+        dashboard_id: uuid.UUID,
+        page_id: uuid.UUID,
+        current_user: Principal,
+        if_none_match: Optional[str] = None,
+    ) -> tuple[str, Optional[str]]:
+        """(ETag, PageDetailResponse JSON 문자열) — If-None-Match가 일치하면 JSON 자리에 None"""
+        version = await self.page_repo.get_version(dashboard_id, page_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "페이지를 찾을 수 없습니다."})
+
+        view_configs = json.dumps(
+            {str(chart_id): config for chart_id, config in await self.page_repo.list_view_configs(page_id, current_user.id)},
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        etag = make_etag("page", page_id, version, view_configs)
+        if etag_matches(if_none_match, etag):
+            return etag, None
+
+        async def load() -> tuple[int, str]:
+            detail = await self._load(dashboard_id, page_id)
+            return detail.version, detail.model_dump_json(exclude={"view_configs"})
+
+        payload = await cached_definition(lambda v: page_detail_key(str(page_id), v), version, load)
+        # 캐시된 JSON은 view_configs를 뺀 객체이므로 마지막 "}" 앞에 붙임
+        return etag, f'{payload[:-1]},"view_configs":{view_configs}}}'
+
+    async def _load(self, dashboard_id: uuid.UUID, page_id: uuid.UUID) -> PageDetailResponse:
+        page = await self.page_repo.get_detail(dashboard_id, page_id)
+        if not page:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "페이지를 찾을 수 없습니다."})
+        groups = await self.page_repo.list_chart_groups(page_id)
+        return PageDetailResponse(
+            id=page.id,
+            version=page.version,
+            dashboard_id=page.dashboard_id,
+            name=page.name,
+            width=page.width,
+            height=page.height,
+            order=page.order,
+            background_color=page.background_color,
+            thumbnail_url=page.thumbnail_url,
+            charts=[PageChartResponse.model_validate(c) for c in sorted(page.charts, key=lambda c: (c.y, c.x))],
+            filters=[PageFilterResponse.model_validate(f) for f in sorted(page.filters, key=lambda f: (f.y, f.x))],
+            chart_groups=[
+                ChartGroupResponse(id=g.id, name=g.name, chart_ids=[item.chart_id for item in g.items]) for g in groups
+            ],
+            created_at=page.created_at,
+            updated_at=page.updated_at,
+        )
@@ -0,0 +1,222 @@
+"""DataSource 롤업(사전 집계 테이블) · watermark 관리 및 백그라운드 갱신"""
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import (
+    datasource_watermark_key,
+    get_redis,
+    rollup_build_lock_key,
+)
+from app.db.models.datasource import DataSource, DataSourceRollup
+from app.db.models.enums import AggregateType, FieldType, RollupStatus
+from app.db.session import AsyncSessionLocal
+from app.engine.cache import ChartResultCache
+from app.engine.columnar import remove_file
+from app.engine.errors import QueryEngineError
+from app.engine.rollups import PARTIALS, build_rollup_file, probe_watermark
+from app.repositories.datasource_repository import DataSourceRepository
+from app.schemas.datasource import RollupCreateRequest, RollupResponse, WatermarkRequest, WatermarkResponse
+
+logger = logging.getLogger(__name__)
+
+# 락 값이 내 토큰일 때만 삭제 (만료 후 다른 워커가 잡은 락을 지우지 않도록)
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _invalid(message: str) -> HTTPException:
+    return HTTPException(status_code=400, detail={"code": "INVALID_ROLLUP", "message": message})
+
+
+class RollupService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.ds_repo = DataSourceRepository(db)
+
+    async def _get_datasource(self, datasource_id: uuid.UUID) -> DataSource:
+        datasource = await self.ds_repo.get_with_fields(datasource_id)
+        if not datasource:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "데이터 소스를 찾을 수 없습니다."})
+        return datasource
+
+    async def _get_rollup(self, datasource_id: uuid.UUID, rollup_id: uuid.UUID) -> DataSourceRollup:
+        rollup = await self.ds_repo.get_rollup(datasource_id, rollup_id)
+        if not rollup:
+            raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": "롤업을 찾을 수 없습니다."})
+        return rollup
+
+    async def set_watermark(self, datasource_id: uuid.UUID, body: WatermarkRequest) -> WatermarkResponse:
+        """증분 갱신 기준 필드를 지정합니다. 기준이 바뀌면 롤업은 다음 빌드에서 전체 재계산합니다."""
+        datasource = await self._get_datasource(datasource_id)
+        if body.field_id is not None:
+            field = next((f for f in datasource.fields if f.field_id == body.field_id), None)
+            if field is None or field.type not in (FieldType.DATE, FieldType.DATETIME):
+                raise HTTPException(
+                    status_code=400,
+                    detail={"code": "INVALID_WATERMARK", "message": "watermark는 DATE 또는 DATETIME 필드만 지정할 수 있습니다."},
+                )
+        if datasource.watermark_field != body.field_id:
+            datasource.watermark_field = body.field_id
+            for rollup in datasource.rollups:
+                rollup.watermark = None
+            await self.db.commit()
+            await get_redis().delete(datasource_watermark_key(str(datasource.id)))
+        return WatermarkResponse(field_id=datasource.watermark_field)
+
+    async def list_rollups(self, datasource_id: uuid.UUID) -> list[RollupResponse]:
+        datasource = await self._get_datasource(datasource_id)
+        return [RollupResponse.model_validate(r) for r in sorted(datasource.rollups, key=lambda r: r.created_at)]
+
+    async def create_rollup(self, datasource_id: uuid.UUID, body: RollupCreateRequest) -> RollupResponse:
+        """롤업 정의를 저장합니다. 빌드는 백그라운드에서 진행되며 끝나기 전까지는 원본에서 조회합니다."""
+        datasource = await self._get_datasource(datasource_id)
+        fields = {f.field_id: f for f in datasource.fields}
+
+        dimensions = list(dict.fromkeys(body.dimensions))
+        for field_id in [*dimensions, *(m.field_id for m in body.metrics)]:
+            if field_id not in fields:
+                raise _invalid(f"데이터 소스에 '{field_id}' 필드가 없습니다.")
+        for metric in body.metrics:
+            if metric.aggregate not in PARTIALS:
+                raise _invalid(f"롤업 지표에는 {metric.aggregate.value} 집계를 사용할 수 없습니다.")
+            if metric.aggregate in (AggregateType.SUM, AggregateType.AVG) and fields[metric.field_id].type != FieldType.NUMBER:
+                raise _invalid(f"'{metric.field_id}' 필드는 숫자가 아니어서 {metric.aggregate.value} 집계를 할 수 없습니다.")
+        if any(r.name == body.name for r in datasource.rollups):
+            raise HTTPException(status_code=409, detail={"code": "ROLLUP_NAME_ALREADY_EXISTS", "message": "이미 사용 중인 롤업 이름입니다."})
+
+        rollup = await self.ds_repo.create_rollup(
+            datasource_id=datasource.id,
+            name=body.name,
+            dimensions=dimensions,
+            metrics=[{"field_id": m.field_id, "aggregate": m.aggregate.value} for m in body.metrics],
+            refresh_interval=body.refresh_interval,
+        )
+        await self.db.commit()
+        return RollupResponse.model_validate(rollup)
+
+    async def request_refresh(self, datasource_id: uuid.UUID, rollup_id: uuid.UUID) -> RollupResponse:
+        rollup = await self._get_rollup(datasource_id, rollup_id)
+        return RollupResponse.model_validate(rollup)
+
+    async def delete_rollup(self, datasource_id: uuid.UUID, rollup_id: uuid.UUID) -> None:
+        rollup = await self._get_rollup(datasource_id, rollup_id)
+        storage_key = rollup.storage_key
+        await self.db.delete(rollup)
+        await self.db.commit()
+        if storage_key:
+            remove_file(storage_key)
+
+
+# ── 백그라운드 빌드 ───────────────────────────────────────────────────────────
+
+async def build_rollup(rollup_id: uuid.UUID, full: bool = False) -> None:
+    """롤업 1개를 빌드합니다. 다른 워커가 빌드 중이면 건너뜁니다.
+
+    데이터 소스에 watermark 필드가 있고 직전 전체 빌드가 ROLLUP_FULL_REFRESH_INTERVAL 이내면 변경분만 집계해 병합하며,
+    full=True이면 항상 전체 재계산합니다. 요청 세션과 무관하게 실행되므로 별도 세션을 사용합니다.
+    """
+    redis = get_redis()
+    lock_key = rollup_build_lock_key(str(rollup_id))
+    token = uuid.uuid4().hex
+    if not await redis.set(lock_key, token, nx=True, ex=settings.ROLLUP_BUILD_LOCK_TTL):
+        return
+
+    try:
+        async with AsyncSessionLocal() as session:
+            await _build(session, rollup_id, full)
+    finally:
+        try:
+            await redis.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+        except RedisError:
+            pass
+
+
+async def _build(session: AsyncSession, rollup_id: uuid.UUID, full: bool) -> None:
+    repo = DataSourceRepository(session)
+    rollup = await session.get(DataSourceRollup, rollup_id)
+    if rollup is None:
+        return
+    datasource = await repo.get_with_fields(rollup.datasource_id)
+    rollup.status = RollupStatus.BUILDING
+    await session.commit()
+
+    previous = rollup.storage_key
+    now = datetime.now(timezone.utc)
+    since = None
+    if (
+        not full
+        and datasource.watermark_field
+        and rollup.full_built_at is not None
+        and now - rollup.full_built_at < timedelta(seconds=settings.ROLLUP_FULL_REFRESH_INTERVAL)
+    ):
+        since = rollup.watermark
+    try:
+        build = await build_rollup_file(datasource, rollup, since=since)
+    except Exception as exc:
+        message = exc.message if isinstance(exc, QueryEngineError) else str(exc)
+        logger.warning("롤업 빌드 실패 (%s): %s", rollup_id, message)
+        rollup.status = RollupStatus.FAILED
+        rollup.last_error = message
+        await session.commit()
+        return
+
+    rollup.storage_key = build.storage_key
+    rollup.row_count = build.row_count
+    rollup.watermark = build.watermark
+    rollup.built_at = datetime.now(timezone.utc)
+    if not build.incremental:
+        rollup.full_built_at = rollup.built_at
+    rollup.status = RollupStatus.READY
+    rollup.last_error = None
+    await session.commit()
+    logger.info(
+        "롤업 빌드 완료 (%s): %s, 원본 %d행 → 롤업 %d행",
+        rollup_id, "증분" if build.incremental else "전체", build.fetched_rows, build.row_count,
+    )
+    if previous and previous != build.storage_key:
+        remove_file(previous)
+
+
+def _is_due(rollup: DataSourceRollup, now: datetime) -> bool:
+    if rollup.status == RollupStatus.PENDING:
+        return True
+    # updated_at = 마지막 빌드 시도 시각 (성공/실패/중단 모두) — 실패도 같은 주기로 재시도
+    interval = rollup.refresh_interval or settings.ROLLUP_REFRESH_INTERVAL
+    return rollup.updated_at + timedelta(seconds=interval) <= now
+
+
+async def list_due_rollups() -> list[DataSourceRollup]:
+    """재빌드 주기가 지났거나 아직 한 번도 빌드되지 않은 롤업"""
+    async with AsyncSessionLocal() as session:
+        rollups = await DataSourceRepository(session).list_rollups()
+    now = datetime.now(timezone.utc)
+    return [r for r in rollups if _is_due(r, now)]
+
+
+async def refresh_watermark(datasource_id: uuid.UUID) -> list[uuid.UUID]:
+    """원본 watermark 최댓값을 확인합니다. 지난 확인 이후 바뀌었으면 차트 캐시를 비우고
+    증분 갱신할 롤업 id 목록을, 그대로면 빈 목록을 반환합니다.
+    """
+    async with AsyncSessionLocal() as session:
+        datasource = await DataSourceRepository(session).get_with_fields(datasource_id)
+    if datasource is None:
+        return []
+    latest = await probe_watermark(datasource)
+    if latest is None:
+        return []
+    redis = get_redis()
+    previous = await redis.set(datasource_watermark_key(str(datasource.id)), latest, get=True)
+    if previous is None or previous == latest:
+        return []
+    await ChartResultCache(redis).invalidate_datasource(datasource.id)
+    return [r.id for r in datasource.rollups]
@@ -0,0 +1,128 @@
+"""백그라운드 작업 워커 — `python -m app.worker`
+
+API 서버(app.main)와 같은 설정/DB/Redis를 쓰는 별도 프로세스로, Redis 작업 큐에서 작업을 꺼내 실행하고
+주기 작업(캐시 워밍, 스키마 동기화, 롤업 재빌드, watermark 확인, 드롭다운 값 인덱스 갱신)을 등록합니다.
+여러 개를 띄워도 작업은 한 번씩만 실행됩니다. SIGTERM/SIGINT를 받으면 실행 중인 작업을 마치고 종료합니다.
+"""
+import asyncio
+import logging
+import os
+import signal
+import socket
+from contextlib import suppress
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.redis import close_redis, get_redis, init_redis
+from app.core import versioning  # noqa: F401 — 정의 version 증가 세션 이벤트 등록
+from app.db.session import engine
+from app.engine.errors import QueryEngineError
+from app.engine.governor import QueryPriority, query_priority
+from app.engine.pools import pool_registry
+from app.jobs import scheduler
+from app.jobs.handlers import HANDLERS
+from app.jobs.queue import Job, JobQueue
+
+logger = logging.getLogger("app.worker")
+
+_RESERVE_TIMEOUT = 1.0      # 대기열 블로킹 대기 (초) — 종료 신호 확인 주기
+_MAINTAIN_INTERVAL = 5.0    # 생존 신호 / 지연 작업 이동 / 주기 작업 등록 주기 (초)
+_SLOT_RETRY_DELAY = 5.0     # 데이터 소스 슬롯이 모두 사용 중일 때 다시 시도하기까지 (초)
+
+
+def _is_permanent(exc: Exception) -> bool:
+    """다시 실행해도 결과가 같은 오류 (잘못된 설정, 없는 대상 등)"""
+    if isinstance(exc, HTTPException):
+        return exc.status_code < 500
+    if isinstance(exc, QueryEngineError):
+        return exc.status_code < 500
+    return False
+
+
+def _error_message(exc: Exception) -> str:
+    if isinstance(exc, QueryEngineError):
+        return f"{exc.code}: {exc.message}"
+    if isinstance(exc, HTTPException) and isinstance(exc.detail, dict):
+        return f"{exc.detail.get('code')}: {exc.detail.get('message')}"
+    return f"{type(exc).__name__}: {exc}"
+
+
+async def run_job(queue: JobQueue, worker_id: str, job: Job) -> None:
+    handler = HANDLERS.get(job.kind)
+    if handler is None:
+        await queue.fail(worker_id, job, f"알 수 없는 작업 종류: {job.kind}", permanent=True)
+        return
+    if job.datasource_id and not await queue.acquire_slot(job.datasource_id, job):
+        await queue.defer(worker_id, job, _SLOT_RETRY_DELAY)
+        return
+
+    try:
+        # 작업이 보내는 원본 쿼리는 사용자 조회/내보내기보다 뒤에 실행
+        with query_priority(QueryPriority.BACKGROUND):
+            await asyncio.wait_for(handler(queue, job.payload), timeout=settings.JOB_TIMEOUT)
+    except Exception as exc:
+        message = _error_message(exc)
+        dead = await queue.fail(worker_id, job, message, permanent=_is_permanent(exc))
+        log = logger.error if dead else logger.warning
+        log("작업 실패 (%s %s, %d회차%s): %s", job.kind, job.id, job.attempts, ", 중단" if dead else "", message)
+    else:
+        await queue.ack(worker_id, job)
+    finally:
+        if job.datasource_id:
+            await queue.release_slot(job.datasource_id, job)
+
+
+async def _consume(queue: JobQueue, worker_id: str, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        try:
+            job = await queue.reserve(worker_id, _RESERVE_TIMEOUT)
+            if job is not None:
+                await run_job(queue, worker_id, job)
+        except Exception:
+            logger.exception("작업 큐 오류")
+            await asyncio.sleep(_RESERVE_TIMEOUT)
+
+
+async def _maintain(queue: JobQueue, worker_id: str, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        try:
+            await queue.heartbeat(worker_id)
+            await queue.promote_due()
+            if recovered := await queue.recover():
+                logger.warning("응답 없는 워커의 작업 %d개를 대기열로 되돌림", recovered)
+            await scheduler.tick(queue)
+        except Exception:
+            logger.exception("작업 스케줄러 오류")
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(stop.wait(), timeout=_MAINTAIN_INTERVAL)
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    await init_redis()
+    queue = JobQueue(get_redis())
+    worker_id = f"{socket.gethostname()}-{os.getpid()}"
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    await queue.heartbeat(worker_id)
+    logger.info("작업 워커 시작 (%s, 동시 실행 %d): %s", worker_id, settings.JOB_WORKER_CONCURRENCY, await queue.stats())
+    try:
+        await asyncio.gather(
+            _maintain(queue, worker_id, stop),
+            *(_consume(queue, worker_id, stop) for _ in range(settings.JOB_WORKER_CONCURRENCY)),
+        )
+    finally:
+        await queue.unregister(worker_id)
+        await pool_registry.close_all()
+        await close_redis()
+        await engine.dispose()
+        logger.info("작업 워커 종료 (%s)", worker_id)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
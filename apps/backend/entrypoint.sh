@@ -4,6 +4,11 @@ set -e
 echo "Running Alembic migrations..."
 alembic upgrade head
 
+# gunicorn 워커별 Prometheus 지표 파일 디렉터리 (재시작 시 이전 값 삭제)
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 echo "Starting FastAPI server..."
 exec gunicorn app.main:app \
     -w 2 \
@@ -0,0 +1,79 @@
+"""공용 픽스처 — SQLite 방언 / 샘플 데이터 / fakeredis"""
+import re
+import sqlite3
+from datetime import date
+
+import fakeredis
+import pyarrow as pa
+import pytest
+
+from app.engine import cache, singleflight
+from app.engine.dialects import Dialect
+
+
+class SQLiteDialect(Dialect):
+    """테스트용 — ANSI 기본 방언에 REGEXP(파이썬 re)만 더함"""
+
+    name = "SQLITE"
+    text_type = "TEXT"
+    supports_regex = True
+
+    def regex(self, expr: str, pattern_ph: str) -> str:
+        return f"{expr} REGEXP {pattern_ph}"
+
+
+# (id, region, amount, day)
+ROWS = [
+    (1, "Seoul", 10, date(2024, 1, 1)),
+    (2, "Seoul", None, date(2024, 1, 2)),
+    (3, "Busan", 5, None),
+    (4, None, 7, date(2024, 1, 3)),
+    (5, "busan", 3, date(2024, 1, 2)),
+    (6, "50%_off", 2.5, date(2024, 1, 5)),
+    (7, "Busan", 1, date(2024, 1, 4)),
+]
+
+
+@pytest.fixture
+def sqlite_db():
+    sqlite3.register_adapter(date, date.isoformat)
+    db = sqlite3.connect(":memory:")
+    db.create_function("REGEXP", 2, lambda pattern, value: value is not None and re.search(pattern, value) is not None)
+    # SQL 표준처럼 LIKE 대소문자 구분 (PostgreSQL / Arrow와 같은 결과)
+    db.execute("PRAGMA case_sensitive_like = ON")
+    db.execute('CREATE TABLE "t" ("id" INTEGER, "region" TEXT, "amount" REAL, "day" TEXT)')
+    db.executemany('INSERT INTO "t" VALUES (?, ?, ?, ?)', ROWS)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def arrow_table():
+    ids, regions, amounts, days = zip(*ROWS)
+    return pa.table({
+        "id": pa.array(ids, type=pa.int64()),
+        "region": pa.array(regions, type=pa.string()),
+        "amount": pa.array(amounts, type=pa.float64()),
+        "day": pa.array(days, type=pa.date32()),
+    })
+
+
+@pytest.fixture
+def dialect():
+    return SQLiteDialect()
+
+
+@pytest.fixture
+async def redis():
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    yield client
+    await client.flushall()
+    await client.aclose()
+
+
+@pytest.fixture(autouse=True)
+def _reset_module_state():
+    cache._pending_stats.clear()
+    singleflight._inflight.clear()
+    singleflight._waiters.clear()
+    yield
@@ -0,0 +1,51 @@
+"""업로드 파일 수용 제어 — 조건을 적용한 행 수로 판단"""
+import uuid
+from types import SimpleNamespace
+
+import pyarrow as pa
+import pytest
+
+from app.core.config import settings
+from app.db.models.enums import AggregateType, FieldType, FilterOp, Role
+from app.engine.admission import admit_local
+from app.engine.columnar import storage_path
+from app.engine.errors import QueryEngineError
+from app.engine.spec import ChartQuery, Predicate, QueryField
+
+
+@pytest.fixture
+def datasource(arrow_table, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "DATASOURCE_FILE_DIR", str(tmp_path))
+    # 예산 1행 × 3배 = 3행 초과 시 거절 (샘플 데이터는 7행)
+    monkeypatch.setattr(settings, "QUERY_COST_BUDGET_VIEWER", 1)
+    monkeypatch.setattr(settings, "QUERY_COST_REJECT_FACTOR", 3.0)
+    storage_key = f"{uuid.uuid4()}/source.arrow"
+    path = storage_path(storage_key)
+    path.parent.mkdir(parents=True)
+    with pa.ipc.new_file(str(path), arrow_table.schema) as writer:
+        writer.write_table(arrow_table)
+    return SimpleNamespace(id=uuid.uuid4(), connection_config={"storage_key": storage_key})
+
+
+def _query(*predicates: Predicate) -> ChartQuery:
+    return ChartQuery(
+        source_config={},
+        dimensions=[QueryField("region", "지역", FieldType.TEXT)],
+        metrics=[QueryField("amount", "금액", FieldType.NUMBER, AggregateType.SUM)],
+        predicates=list(predicates),
+    )
+
+
+async def test_unfiltered_query_over_the_limit_is_rejected(datasource):
+    with pytest.raises(QueryEngineError) as exc_info:
+        await admit_local(datasource, _query(), Role.VIEWER)
+    assert exc_info.value.code == "QUERY_TOO_EXPENSIVE"
+
+
+async def test_filters_bring_the_query_under_the_limit(datasource):
+    # 필터로 범위를 좁히라는 안내대로 하면 통과해야 함
+    await admit_local(datasource, _query(Predicate("region", FieldType.TEXT, FilterOp.EQ, "Busan")), Role.VIEWER)
+
+
+async def test_unlimited_roles_skip_the_check(datasource):
+    await admit_local(datasource, _query(), Role.ADMIN)
@@ -0,0 +1,127 @@
+"""차트 결과 캐시 (fakeredis)"""
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+
+from app.core.config import settings
+from app.core.redis import chart_cache_key
+from app.db.models.enums import AggregateType, FieldType
+from app.engine.cache import ChartResultCache, decode_result, encode_result, query_fingerprint
+from app.engine.compiler import ChartResult, compile_chart_query
+from app.engine.spec import ChartQuery, QueryField
+
+QUERY = ChartQuery(
+    source_config={"table": "t"},
+    dimensions=[QueryField("region", "지역", FieldType.TEXT)],
+    metrics=[QueryField("amount", "금액", FieldType.NUMBER, AggregateType.SUM)],
+)
+
+
+@pytest.fixture
+def compiled(dialect):
+    return compile_chart_query(QUERY, dialect)
+
+
+@pytest.fixture
+def datasource():
+    return SimpleNamespace(id=uuid.uuid4(), cache_ttl=None)
+
+
+@pytest.fixture
+def unavailable_redis():
+    # 연결할 수 없는 Redis — 모든 명령이 ConnectionError(RedisError)
+    return fakeredis.FakeAsyncRedis(connected=False, decode_responses=True)
+
+
+def _result(compiled) -> ChartResult:
+    return ChartResult(
+        columns=compiled.columns,
+        rows=[["Busan", 6], ["Seoul", 10.5]],
+        totals=[None, 16.5],
+        total=2,
+        queried_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_fingerprint_distinguishes_param_types(datasource, compiled):
+    compiled.params.append(1)
+    as_number = query_fingerprint(datasource.id, compiled)
+    compiled.params[-1] = "1"
+    as_text = query_fingerprint(datasource.id, compiled)
+    assert as_number != as_text
+    assert query_fingerprint(datasource.id, compiled) == as_text
+    assert query_fingerprint(uuid.uuid4(), compiled) != as_text
+
+
+def test_result_round_trip(compiled):
+    result = _result(compiled)
+    decoded = decode_result(encode_result(result), compiled)
+    assert (decoded.rows, decoded.totals, decoded.total, decoded.queried_at) == (
+        result.rows, result.totals, result.total, result.queried_at
+    )
+
+
+async def test_get_after_set(redis, datasource, compiled):
+    cache = ChartResultCache(redis)
+    fingerprint = query_fingerprint(datasource.id, compiled)
+    assert await cache.get(datasource, fingerprint, compiled) is None
+    assert await cache.set(datasource, fingerprint, _result(compiled))
+    cached = await cache.get(datasource, fingerprint, compiled)
+    assert cached.rows == _result(compiled).rows
+    assert await redis.ttl(chart_cache_key(fingerprint)) <= settings.CHART_CACHE_TTL
+
+
+async def test_stats_are_flushed_with_the_next_lookup(redis, datasource, compiled):
+    cache = ChartResultCache(redis)
+    await cache.get(datasource, "a", compiled)
+    await cache.set(datasource, "a", _result(compiled))
+    await cache.get(datasource, "a", compiled)
+    # 마지막 조회의 hit은 다음 조회 때 반영
+    assert await cache.stats(datasource.id) == {"hits": 0, "misses": 1, "entries": 1}
+    await cache.get(datasource, "b", compiled)
+    assert await cache.stats(datasource.id) == {"hits": 1, "misses": 1, "entries": 1}
+
+
+async def test_disabled_cache_ttl(redis, compiled):
+    cache = ChartResultCache(redis)
+    datasource = SimpleNamespace(id=uuid.uuid4(), cache_ttl=0)
+    assert not await cache.set(datasource, "a", _result(compiled))
+    assert await cache.get(datasource, "a", compiled) is None
+    assert await redis.dbsize() == 0
+
+
+async def test_oldest_entries_are_evicted(redis, datasource, compiled, monkeypatch):
+    monkeypatch.setattr(settings, "CHART_CACHE_MAX_ENTRIES", 2)
+    cache = ChartResultCache(redis)
+    for fingerprint in ("a", "b", "c"):
+        await cache.set(datasource, fingerprint, _result(compiled))
+        await asyncio.sleep(0.01)
+    assert await cache.get(datasource, "a", compiled) is None
+    assert await cache.get(datasource, "c", compiled) is not None
+    assert (await cache.stats(datasource.id))["entries"] == 2
+
+
+async def test_oversized_results_are_not_stored(redis, datasource, compiled, monkeypatch):
+    monkeypatch.setattr(settings, "CHART_CACHE_MAX_BYTES", 10)
+    assert not await ChartResultCache(redis).set(datasource, "a", _result(compiled))
+
+
+async def test_invalidate_datasource(redis, datasource, compiled):
+    cache = ChartResultCache(redis)
+    other = SimpleNamespace(id=uuid.uuid4(), cache_ttl=None)
+    await cache.set(datasource, "a", _result(compiled))
+    await cache.set(datasource, "b", _result(compiled))
+    await cache.set(other, "c", _result(compiled))
+    assert await cache.invalidate_datasource(datasource.id) == 2
+    assert await cache.get(datasource, "a", compiled) is None
+    assert await cache.get(other, "c", compiled) is not None
+
+
+async def test_cache_fails_open_when_redis_is_unavailable(unavailable_redis, datasource, compiled):
+    cache = ChartResultCache(unavailable_redis)
+    assert await cache.get(datasource, "a", compiled) is None
+    assert not await cache.set(datasource, "a", _result(compiled))
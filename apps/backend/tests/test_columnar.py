@@ -0,0 +1,94 @@
+"""업로드 파일 적재 — CSV / Excel 타입 추론"""
+import uuid
+from datetime import date, datetime
+
+import pytest
+
+from app.core.config import settings
+from app.db.models.enums import FieldType
+from app.engine.columnar import ingest_csv, ingest_excel, new_storage_key, open_table, storage_path
+
+
+@pytest.fixture(autouse=True)
+def _file_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "DATASOURCE_FILE_DIR", str(tmp_path / "files"))
+
+
+def _ingest(tmp_path, text: str):
+    src = tmp_path / "upload.csv"
+    src.write_text(text)
+    result = ingest_csv(src, new_storage_key(uuid.uuid4()))
+    return {f.field_id: f.type for f in result.fields}, open_table(result.storage_key)
+
+
+def test_infers_column_types(tmp_path):
+    types, table = _ingest(
+        tmp_path,
+        "name,count,price,day,at,active\n"
+        "a,1,1.5,2024-01-01,2024-01-01 10:00:00,true\n"
+        "b,,2,2024-01-02,2024-01-02 11:30:00,FALSE\n",
+    )
+    assert types == {
+        "name": FieldType.TEXT,
+        "count": FieldType.NUMBER,
+        "price": FieldType.NUMBER,
+        "day": FieldType.DATE,
+        "at": FieldType.DATETIME,
+        "active": FieldType.BOOLEAN,
+    }
+    assert table["active"].to_pylist() == [True, False]
+    assert table["count"].to_pylist() == [1, None]
+
+
+def test_mixed_case_booleans_fall_back_to_text(tmp_path):
+    # 변환기(ConvertOptions)가 받지 않는 표기는 불리언으로 추론하지 않음 — INVALID_FILE 대신 TEXT
+    types, table = _ingest(tmp_path, "flag\ntRue\nfalse\n")
+    assert types == {"flag": FieldType.TEXT}
+    assert table["flag"].to_pylist() == ["tRue", "false"]
+
+
+def _ingest_excel(tmp_path, rows: list[tuple]):
+    openpyxl = pytest.importorskip("openpyxl")
+    workbook = openpyxl.Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    src = tmp_path / "upload.xlsx"
+    workbook.save(src)
+    result = ingest_excel(src, new_storage_key(uuid.uuid4()))
+    return result, open_table(result.storage_key)
+
+
+@pytest.mark.parametrize("batch_rows", [2, 65_536])
+def test_excel_types_widen_across_batches(tmp_path, monkeypatch, batch_rows):
+    # 배치가 작으면 타입이 넓어질 때마다 구간이 나뉘고, 끝에서 최종 타입으로 합쳐짐
+    monkeypatch.setattr(settings, "DATASOURCE_INGEST_BATCH_ROWS", batch_rows)
+    result, table = _ingest_excel(tmp_path, [
+        ("count", "day", "flag", "note", "empty"),
+        (1, date(2024, 1, 1), True, 1, None),
+        (2, date(2024, 1, 2), False, None, None),
+        (None, None, None, None, None),
+        (3.5, datetime(2024, 1, 3, 9, 30), True, "n/a", None),
+        (4, date(2024, 1, 4), None, 2, None),
+    ])
+    assert {f.field_id: f.type for f in result.fields} == {
+        "count": FieldType.NUMBER,
+        "day": FieldType.DATETIME,
+        "flag": FieldType.BOOLEAN,
+        "note": FieldType.TEXT,
+        "empty": FieldType.TEXT,
+    }
+    # 빈 행은 건너뜀
+    assert result.row_count == table.num_rows == 4
+    assert table["count"].to_pylist() == [1, 2, 3.5, 4]
+    assert table["day"].to_pylist()[2:] == [datetime(2024, 1, 3, 9, 30), datetime(2024, 1, 4)]
+    assert table["note"].to_pylist() == ["1", None, "n/a", "2"]
+    # 임시 구간 파일은 남지 않음
+    assert [p.name for p in storage_path(result.storage_key).parent.iterdir()] == [
+        storage_path(result.storage_key).name
+    ]
+
+
+def test_excel_header_only_sheet(tmp_path):
+    result, table = _ingest_excel(tmp_path, [("a", "b")])
+    assert result.row_count == table.num_rows == 0
+    assert table.column_names == ["a", "b"]
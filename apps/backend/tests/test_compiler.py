@@ -0,0 +1,144 @@
+"""SQL 컴파일러 (SQLite 실행) / 업로드 파일 로컬 실행 — 같은 ChartQuery는 같은 결과"""
+import pytest
+
+from app.db.models.enums import AggregateType, FieldType, FilterOp, SortDir
+from app.engine.compiler import compile_chart_query, compile_export_query
+from app.engine.dialects import MSSQLDialect, MySQLDialect, PostgresDialect
+from app.engine.errors import QueryEngineError
+from app.engine.local import execute_local
+from app.engine.spec import ChartQuery, Predicate, QueryField, SortKey
+
+REGION = QueryField("region", "지역", FieldType.TEXT)
+DAY = QueryField("day", "일자", FieldType.DATE)
+ID = QueryField("id", "ID", FieldType.NUMBER)
+AMOUNT = QueryField("amount", "금액", FieldType.NUMBER)
+
+
+def _metric(aggregate: AggregateType) -> QueryField:
+    return QueryField("amount", "금액", FieldType.NUMBER, aggregate)
+
+
+def _query(**kwargs) -> ChartQuery:
+    return ChartQuery(source_config={"table": "t"}, **kwargs)
+
+
+def _run_sql(db, dialect, query: ChartQuery):
+    compiled = compile_chart_query(query, dialect)
+    return compiled.decode(db.execute(compiled.sql, compiled.params).fetchall())
+
+
+def _normalize(rows):
+    # SQLite는 날짜를 ISO 문자열로 돌려주므로 비교 전에 맞춤
+    return [[v.isoformat() if hasattr(v, "isoformat") else v for v in row] for row in rows]
+
+
+QUERIES = {
+    "grouped": _query(
+        dimensions=[REGION],
+        metrics=[_metric(AggregateType.SUM), _metric(AggregateType.AVG), _metric(AggregateType.COUNT)],
+    ),
+    "grouped-sorted-desc": _query(
+        dimensions=[REGION],
+        metrics=[_metric(AggregateType.SUM)],
+        sort=[SortKey("amount", SortDir.DESC)],
+    ),
+    "grouped-filtered": _query(
+        dimensions=[REGION],
+        metrics=[_metric(AggregateType.MAX), _metric(AggregateType.COUNT_DISTINCT)],
+        predicates=[Predicate("amount", FieldType.NUMBER, FilterOp.GTE, 3)],
+    ),
+    "no-dimension": _query(dimensions=[], metrics=[_metric(AggregateType.SUM), _metric(AggregateType.MIN)]),
+    "no-dimension-empty": _query(
+        dimensions=[],
+        metrics=[_metric(AggregateType.COUNT)],
+        predicates=[Predicate("region", FieldType.TEXT, FilterOp.EQ, "Nowhere")],
+    ),
+    "raw-rows-paged": _query(
+        dimensions=[ID, REGION], metrics=[AMOUNT], sort=[SortKey("id", SortDir.DESC)], limit=3, offset=2
+    ),
+    "raw-rows-nulls-last-asc": _query(dimensions=[DAY, ID], metrics=[], sort=[SortKey("day"), SortKey("id")]),
+    "raw-rows-nulls-last-desc": _query(
+        dimensions=[DAY, ID], metrics=[], sort=[SortKey("day", SortDir.DESC), SortKey("id")]
+    ),
+    "page-past-end": _query(dimensions=[REGION], metrics=[_metric(AggregateType.SUM)], offset=100),
+}
+
+
+@pytest.mark.parametrize("name", QUERIES)
+def test_sql_and_local_results_match(sqlite_db, arrow_table, dialect, name):
+    query = QUERIES[name]
+    sql = _run_sql(sqlite_db, dialect, query)
+    local = execute_local(arrow_table, query)
+    assert sql.total == local.total
+    assert _normalize(sql.rows) == _normalize(local.rows)
+    assert sql.totals == local.totals
+
+
+def test_grouped_result_layout(sqlite_db, dialect):
+    result = _run_sql(sqlite_db, dialect, QUERIES["grouped"])
+    # 지정 정렬이 없으면 그룹 컬럼 오름차순, NULL 그룹은 마지막
+    assert result.rows == [
+        ["50%_off", 2.5, 2.5, 1],
+        ["Busan", 6, 3.0, 2],
+        ["Seoul", 10, 10.0, 1],
+        ["busan", 3, 3.0, 1],
+        [None, 7, 7.0, 1],
+    ]
+    assert result.total == 5
+    assert result.totals == [None, 28.5, 28.5 / 6, 6]
+
+
+def test_empty_page_still_returns_count_and_totals(sqlite_db, dialect):
+    result = _run_sql(sqlite_db, dialect, QUERIES["page-past-end"])
+    assert result.rows == []
+    assert result.total == 5
+    assert result.totals == [None, 28.5]
+
+
+def test_without_totals(sqlite_db, dialect):
+    query = _query(dimensions=[REGION], metrics=[_metric(AggregateType.SUM)], with_totals=False)
+    assert _run_sql(sqlite_db, dialect, query).totals is None
+
+
+def test_export_query_returns_all_rows_sorted(sqlite_db, dialect):
+    export = compile_export_query(QUERIES["raw-rows-nulls-last-desc"], dialect)
+    days = [row[0] for row in sqlite_db.execute(export.sql, export.params)]
+    assert days == ["2024-01-05", "2024-01-04", "2024-01-03", "2024-01-02", "2024-01-02", "2024-01-01", None]
+
+
+def test_filter_values_are_bound_not_inlined(dialect):
+    query = _query(
+        dimensions=[REGION],
+        metrics=[_metric(AggregateType.SUM)],
+        predicates=[Predicate("region", FieldType.TEXT, FilterOp.EQ, "x' OR 1=1 --")],
+    )
+    compiled = compile_chart_query(query, dialect)
+    assert "OR 1=1" not in compiled.sql
+    # WHERE 절은 건수 / 합계 / 페이지 서브쿼리마다 한 번씩 바인딩
+    assert compiled.params == ["x' OR 1=1 --"] * 3
+
+
+@pytest.mark.parametrize(
+    ("dialect_cls", "expected"),
+    [
+        (PostgresDialect, '"src"."day" ASC NULLS LAST'),
+        (MySQLDialect, "`src`.`day` IS NULL, `src`.`day` ASC"),
+        (MSSQLDialect, "CASE WHEN [src].[day] IS NULL THEN 1 ELSE 0 END, [src].[day] ASC"),
+    ],
+)
+def test_nulls_last_per_dialect(dialect_cls, expected):
+    export = compile_export_query(_query(dimensions=[DAY], metrics=[], sort=[SortKey("day")]), dialect_cls())
+    assert export.sql.endswith(f"ORDER BY {expected}")
+
+
+def test_unknown_sort_field_is_rejected(dialect):
+    query = _query(dimensions=[REGION], metrics=[], sort=[SortKey("missing")])
+    with pytest.raises(QueryEngineError) as exc:
+        compile_chart_query(query, dialect)
+    assert exc.value.code == "INVALID_SORT"
+
+
+def test_empty_chart_is_rejected(dialect):
+    with pytest.raises(QueryEngineError) as exc:
+        compile_chart_query(_query(dimensions=[], metrics=[]), dialect)
+    assert exc.value.code == "INVALID_CHART_CONFIG"
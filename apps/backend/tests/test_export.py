@@ -0,0 +1,56 @@
+"""차트 내보내기 스트림 — 중단 시 정리와 감사 로그"""
+import asyncio
+
+import anyio
+import pytest
+
+from app.engine.export import CsvStreamWriter
+from app.services import chart_data_service
+from app.services.chart_data_service import _stream_export
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    details = []
+
+    async def record(detail):
+        await asyncio.sleep(0)  # 실제 기록처럼 await 지점이 있어야 취소 보호 여부가 드러남
+        details.append(detail)
+
+    monkeypatch.setattr(chart_data_service, "_record_export", record)
+    return details
+
+
+async def test_completed_export_is_audited(recorded):
+    async def batches():
+        yield [[2, "b"]]
+
+    chunks = [c async for c in _stream_export(CsvStreamWriter(), ["id", "name"], [[1, "a"]], batches(), {})]
+    assert b"".join(chunks).decode("utf-8-sig") == "id,name\r\n1,a\r\n2,b\r\n"
+    assert [(d["rows"], d["completed"]) for d in recorded] == [(2, True)]
+
+
+async def test_cancelled_export_closes_cursor_and_is_audited(recorded):
+    # 클라이언트 연결 끊김 — StreamingResponse처럼 소비 중인 작업의 취소 범위를 취소
+    closed = []
+
+    async def batches():
+        try:
+            yield [[2, "b"]]
+            await asyncio.Event().wait()  # 다음 배치를 기다리는 느린 커서
+        finally:
+            closed.append(True)
+
+    received = []
+    async with anyio.create_task_group() as tg:
+        async def consume():
+            async for chunk in _stream_export(CsvStreamWriter(), None, [[1, "a"]], batches(), {}):
+                received.append(chunk)
+                if len(received) == 2:
+                    tg.cancel_scope.cancel()
+
+        tg.start_soon(consume)
+
+    assert len(received) == 2
+    assert closed == [True]
+    assert [(d["rows"], d["completed"]) for d in recorded] == [(2, False)]
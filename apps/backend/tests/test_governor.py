@@ -0,0 +1,109 @@
+"""쿼리 슬롯 게이트 — 우선순위 순서 / 비율 상한 / 대기 취소"""
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.engine.errors import QueryEngineError
+from app.engine.governor import QueryGovernor, QueryPriority, _Gate
+
+INTERACTIVE, EXPORT, BACKGROUND = QueryPriority.INTERACTIVE, QueryPriority.EXPORT, QueryPriority.BACKGROUND
+
+
+async def _waiter(gate: _Gate, priority: QueryPriority, order: list, name: str) -> None:
+    await gate.acquire(priority, None)
+    order.append(name)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_free_slots_go_to_higher_priority_first():
+    gate = _Gate(1)
+    await gate.acquire(INTERACTIVE, None)
+    order: list[str] = []
+    tasks = [
+        asyncio.create_task(_waiter(gate, priority, order, name))
+        for priority, name in [(BACKGROUND, "bg"), (EXPORT, "export"), (INTERACTIVE, "i1"), (INTERACTIVE, "i2")]
+    ]
+    await _settle()
+    assert order == []
+    # 슬롯 주인이 차례로 반납 — INTERACTIVE 둘은 먼저 온 순서, 그 뒤 EXPORT → BACKGROUND
+    for holder in (INTERACTIVE, INTERACTIVE, INTERACTIVE, EXPORT):
+        gate.release(holder)
+        await _settle()
+    assert order == ["i1", "i2", "export", "bg"]
+    await asyncio.gather(*tasks)
+    assert gate.active == [0, 0, 1]
+
+
+async def test_share_caps_background_but_not_interactive(monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_BACKGROUND_SHARE", 0.5)
+    gate = _Gate(4)
+    for _ in range(2):
+        await gate.acquire(BACKGROUND, None)
+    # BACKGROUND는 4 × 0.5 = 2개까지 — 세 번째는 빈 슬롯이 있어도 대기
+    third = asyncio.create_task(gate.acquire(BACKGROUND, None))
+    await _settle()
+    assert not third.done()
+    # 상한에 걸린 대기자 뒤에 온 INTERACTIVE는 바로 실행
+    await asyncio.wait_for(gate.acquire(INTERACTIVE, None), 0.1)
+    assert gate.active == [1, 0, 2]
+    gate.release(BACKGROUND)
+    await asyncio.wait_for(third, 0.1)
+    assert gate.active == [1, 0, 2]
+
+
+async def test_timeout_removes_waiter():
+    gate = _Gate(1)
+    await gate.acquire(INTERACTIVE, None)
+    with pytest.raises(asyncio.TimeoutError):
+        await gate.acquire(INTERACTIVE, 0.01)
+    assert gate._waiters == []
+    gate.release(INTERACTIVE)
+    assert gate.active == [0, 0, 0]
+
+
+async def test_cancelled_waiter_does_not_leak_slot():
+    gate = _Gate(1)
+    await gate.acquire(INTERACTIVE, None)
+    waiter = asyncio.create_task(gate.acquire(INTERACTIVE, None))
+    await _settle()
+    # 슬롯을 넘겨받는 것과 같은 틱에 취소 — 받은 슬롯은 돌려줘야 함
+    gate.release(INTERACTIVE)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert gate.active == [0, 0, 0]
+    await asyncio.wait_for(gate.acquire(INTERACTIVE, None), 0.1)
+
+
+async def test_slot_busy_raises_datasource_busy():
+    governor = QueryGovernor()
+    datasource = SimpleNamespace(id=uuid.uuid4(), connection_config={"pool_max_size": 1, "pool_timeout": 0.01})
+    async with governor.slot(datasource, INTERACTIVE):
+        with pytest.raises(QueryEngineError) as exc:
+            async with governor.slot(datasource, INTERACTIVE):
+                pass
+    assert exc.value.code == "DATASOURCE_BUSY"
+    assert exc.value.status_code == 503
+    # 실패한 획득도, 정상 종료도 슬롯을 남기지 않음
+    assert governor._datasource_gate(datasource).active == [0, 0, 0]
+    assert governor._global_gate().active == [0, 0, 0]
+
+
+async def test_raising_pool_size_wakes_waiters():
+    governor = QueryGovernor()
+    datasource = SimpleNamespace(id=uuid.uuid4(), connection_config={"pool_max_size": 1})
+    gate = governor._datasource_gate(datasource)
+    await gate.acquire(INTERACTIVE, None)
+    waiter = asyncio.create_task(gate.acquire(INTERACTIVE, None))
+    await _settle()
+    assert not waiter.done()
+    datasource.connection_config = {"pool_max_size": 2}
+    governor._datasource_gate(datasource)
+    await asyncio.wait_for(waiter, 0.1)
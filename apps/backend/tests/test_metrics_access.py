@@ -0,0 +1,25 @@
+"""성능 지표 엔드포인트 접근 제어"""
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.main import app
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def test_metrics_require_credentials(client):
+    assert (await client.get("/api/v1/metrics")).status_code == 401
+    response = await client.get("/api/v1/metrics", headers={"Authorization": "Bearer wrong"})
+    assert response.status_code == 401
+
+
+async def test_metrics_accept_scrape_token(client):
+    response = await client.get("/api/v1/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert "lookflex_http_request_duration_seconds" in response.text
@@ -0,0 +1,63 @@
+"""커넥션 풀 레지스트리 — 유휴 정리"""
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.db.models.enums import DSSourceType
+from app.engine import pools
+from app.engine.pools import PoolRegistry, SourcePool
+
+
+class FakePool(SourcePool):
+    closed = False
+
+    async def open(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def _fake_pools(monkeypatch):
+    monkeypatch.setitem(pools._POOL_TYPES, DSSourceType.POSTGRESQL, FakePool)
+
+
+def _datasource():
+    return SimpleNamespace(id=uuid.uuid4(), source_type=DSSourceType.POSTGRESQL, connection_config={})
+
+
+def _expire(registry: PoolRegistry, pool: SourcePool) -> None:
+    # 마지막 사용과 마지막 검사를 충분히 과거로 돌림
+    pool.last_used -= settings.DATASOURCE_POOL_EVICT_AFTER + 1
+    registry._last_sweep -= pools._SWEEP_INTERVAL + 1
+
+
+async def test_idle_pools_are_swept():
+    registry = PoolRegistry()
+    datasource = _datasource()
+    pool = await registry.get(datasource)
+    _expire(registry, pool)
+    registry.sweep()
+    await asyncio.gather(*registry._closing)
+    assert pool.closed
+    assert await registry.get(datasource) is not pool
+
+
+async def test_leased_pools_are_not_swept():
+    # 긴 내보내기처럼 get() 이후 오래 쓰는 풀은 last_used가 오래됐어도 닫지 않음
+    registry = PoolRegistry()
+    datasource = _datasource()
+    async with registry.lease(datasource) as pool:
+        _expire(registry, pool)
+        registry.sweep()
+        assert not pool.closed
+        assert await registry.get(datasource) is pool
+    # 반납 시점부터 다시 유휴 시간을 셈
+    assert pool.in_use == 0
+    registry._last_sweep -= pools._SWEEP_INTERVAL + 1
+    registry.sweep()
+    assert not pool.closed
@@ -0,0 +1,94 @@
+"""SQL / Arrow 필터 컴파일 결과 일치 — 같은 Predicate는 두 경로에서 같은 행을 골라야 함"""
+from datetime import date
+
+import pytest
+
+from app.db.models.enums import FieldType, FilterOp
+from app.engine.dialects import ParamBinder
+from app.engine.errors import QueryEngineError
+from app.engine.predicates import coerce_value, compile_arrow_predicate, compile_sql_predicate, to_arrow_array
+from app.engine.spec import Predicate
+
+TEXT, NUMBER, DATE = FieldType.TEXT, FieldType.NUMBER, FieldType.DATE
+
+CASES = [
+    Predicate("region", TEXT, FilterOp.EQ, "Seoul"),
+    Predicate("region", TEXT, FilterOp.EQ, ["Seoul", "Busan"]),
+    Predicate("region", TEXT, FilterOp.EQ, ["Seoul", None]),
+    Predicate("region", TEXT, FilterOp.EQ, []),
+    Predicate("region", TEXT, FilterOp.NEQ, "Seoul"),
+    Predicate("region", TEXT, FilterOp.NEQ, ["Seoul", None]),
+    Predicate("region", TEXT, FilterOp.NEQ, [None]),
+    Predicate("region", TEXT, FilterOp.IS_NULL),
+    Predicate("region", TEXT, FilterOp.IS_NOT_NULL),
+    Predicate("region", TEXT, FilterOp.CONTAINS, "usa"),
+    Predicate("region", TEXT, FilterOp.CONTAINS, ["eou", "usa"]),
+    Predicate("region", TEXT, FilterOp.CONTAINS, "%_"),
+    Predicate("region", TEXT, FilterOp.NOT_CONTAINS, "usa"),
+    Predicate("region", TEXT, FilterOp.STARTS_WITH, "B"),
+    Predicate("region", TEXT, FilterOp.ENDS_WITH, "an"),
+    Predicate("region", TEXT, FilterOp.REGEX, "^[A-Z].*n$"),
+    Predicate("amount", NUMBER, FilterOp.EQ, "10"),
+    Predicate("amount", NUMBER, FilterOp.EQ, [2.5, 7]),
+    Predicate("amount", NUMBER, FilterOp.NEQ, 10),
+    Predicate("amount", NUMBER, FilterOp.GT, 5),
+    Predicate("amount", NUMBER, FilterOp.GTE, "5"),
+    Predicate("amount", NUMBER, FilterOp.LT, 3),
+    Predicate("amount", NUMBER, FilterOp.LTE, 3),
+    Predicate("amount", NUMBER, FilterOp.GT, None),
+    Predicate("amount", NUMBER, FilterOp.BETWEEN, [3, 7]),
+    Predicate("amount", NUMBER, FilterOp.BETWEEN, {"min": 5}),
+    Predicate("amount", NUMBER, FilterOp.BETWEEN, 1, 2.5),
+    Predicate("amount", NUMBER, FilterOp.BETWEEN, [None, None]),
+    Predicate("amount", NUMBER, FilterOp.CONTAINS, "5"),
+    Predicate("day", DATE, FilterOp.EQ, "2024-01-02"),
+    Predicate("day", DATE, FilterOp.GTE, "2024-01-03"),
+    Predicate("day", DATE, FilterOp.BETWEEN, ["2024-01-02", "2024-01-04"]),
+]
+
+
+def _sql_ids(db, dialect, pred: Predicate) -> list[int]:
+    binder = ParamBinder(dialect)
+    where = compile_sql_predicate(pred, dialect, binder, lambda f: dialect.quote(f))
+    return [r[0] for r in db.execute(f'SELECT "id" FROM "t" WHERE {where} ORDER BY "id"', binder.params)]
+
+
+def _arrow_ids(table, pred: Predicate) -> list[int]:
+    return table.filter(compile_arrow_predicate(pred, table.column))["id"].to_pylist()
+
+
+@pytest.mark.parametrize("pred", CASES, ids=lambda p: f"{p.field_id}-{p.op.value}-{p.value!r}")
+def test_sql_and_arrow_select_same_rows(sqlite_db, arrow_table, dialect, pred):
+    assert _arrow_ids(arrow_table, pred) == _sql_ids(sqlite_db, dialect, pred)
+
+
+def test_null_rows_never_match_negated_conditions(arrow_table):
+    # SQL 3값 논리 — region이 NULL인 행(4)은 NEQ / NOT_CONTAINS 어느 쪽에도 들지 않음
+    for op in (FilterOp.NEQ, FilterOp.NOT_CONTAINS):
+        assert 4 not in _arrow_ids(arrow_table, Predicate("region", TEXT, op, "Seoul"))
+
+
+def test_like_wildcards_are_escaped(arrow_table, sqlite_db, dialect):
+    pred = Predicate("region", TEXT, FilterOp.STARTS_WITH, "50%_")
+    assert _sql_ids(sqlite_db, dialect, pred) == _arrow_ids(arrow_table, pred) == [6]
+
+
+def test_invalid_regex_is_rejected(arrow_table):
+    with pytest.raises(QueryEngineError) as exc:
+        compile_arrow_predicate(Predicate("region", TEXT, FilterOp.REGEX, "("), arrow_table.column)
+    assert exc.value.code == "INVALID_FILTER_VALUE"
+
+
+def test_coerce_value():
+    assert coerce_value("3", NUMBER) == 3
+    assert coerce_value("2.50", NUMBER) == 2.5
+    assert coerce_value("yes", FieldType.BOOLEAN) is True
+    assert coerce_value("2024-01-02T10:00:00", DATE) == date(2024, 1, 2)
+    with pytest.raises(QueryEngineError):
+        coerce_value("abc", NUMBER)
+
+
+def test_to_arrow_array_coerces_cached_values():
+    # Redis 캐시에서 복원한 값(문자열)도 타입 배열로 변환하고, 변환할 수 없는 값은 NULL
+    assert to_arrow_array(["1.5", 2, "x", None], NUMBER).to_pylist() == [1.5, 2.0, None, None]
+    assert to_arrow_array(["2024-01-02", None], DATE).to_pylist() == [date(2024, 1, 2), None]
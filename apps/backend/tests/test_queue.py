@@ -0,0 +1,122 @@
+"""Redis 작업 큐 — 재시도 / dead-letter / 워커 복구 (fakeredis)
+
+지연 작업 승격(promote_due)과 데이터 소스 슬롯(acquire_slot)은 Lua 스크립트라 fakeredis(lupa 미설치)에서 제외합니다.
+"""
+import time
+
+from app.core.config import settings
+from app.core.redis import (
+    job_dead_key,
+    job_delayed_key,
+    job_key,
+    job_processing_key,
+    job_ready_key,
+    job_worker_heartbeat_key,
+)
+from app.jobs.queue import Job, JobQueue, retry_delay
+
+
+async def _reserve(queue: JobQueue, worker_id: str = "w1") -> Job:
+    job = await queue.reserve(worker_id, timeout=0.1)
+    assert job is not None
+    return job
+
+
+async def test_enqueue_reserve_ack(redis):
+    queue = JobQueue(redis)
+    job_id = await queue.enqueue("sync", {"datasource_id": "d1"})
+    job = await _reserve(queue)
+    assert (job.id, job.kind, job.payload) == (job_id, "sync", {"datasource_id": "d1"})
+    # 처리 중 목록으로 옮겨져 있다가 ack 시 본문과 함께 제거
+    assert await redis.lrange(job_processing_key("w1"), 0, -1) == [job_id]
+    await queue.ack("w1", job)
+    assert await redis.llen(job_processing_key("w1")) == 0
+    assert not await redis.exists(job_key(job_id))
+    assert await queue.reserve("w1", timeout=0.1) is None
+
+
+async def test_jobs_are_reserved_in_fifo_order(redis):
+    queue = JobQueue(redis)
+    ids = [await queue.enqueue("sync", {"n": n}) for n in range(3)]
+    assert [(await _reserve(queue)).id for _ in ids] == ids
+
+
+async def test_dedupe_key_blocks_until_done(redis):
+    queue = JobQueue(redis)
+    first = await queue.enqueue("sync", {}, dedupe_key="sync:d1")
+    assert await queue.enqueue("sync", {}, dedupe_key="sync:d1") is None
+    await queue.ack("w1", await _reserve(queue))
+    assert await queue.enqueue("sync", {}, dedupe_key="sync:d1") not in (None, first)
+
+
+async def test_delayed_enqueue(redis):
+    queue = JobQueue(redis)
+    job_id = await queue.enqueue("sync", {}, delay=60)
+    assert await redis.llen(job_ready_key()) == 0
+    assert await redis.zscore(job_delayed_key(), job_id) > time.time()
+
+
+async def test_failure_is_retried_with_backoff(redis):
+    queue = JobQueue(redis)
+    job_id = await queue.enqueue("sync", {})
+    job = await _reserve(queue)
+    before = time.time()
+    assert not await queue.fail("w1", job, "timeout")
+    # 처리 중 목록에서 지연 목록으로, 시도 횟수와 오류는 본문에 기록
+    assert await redis.llen(job_processing_key("w1")) == 0
+    due = await redis.zscore(job_delayed_key(), job_id)
+    assert before + settings.JOB_RETRY_BASE_DELAY * 0.5 <= due <= time.time() + settings.JOB_RETRY_BASE_DELAY
+    stored = Job.loads(await redis.get(job_key(job_id)))
+    assert (stored.attempts, stored.last_error) == (1, "timeout")
+
+
+async def test_exhausted_attempts_move_to_dead_letter(redis):
+    queue = JobQueue(redis)
+    job_id = await queue.enqueue("sync", {}, dedupe_key="sync:d1")
+    job = await _reserve(queue)
+    job.attempts = job.max_attempts - 1
+    assert await queue.fail("w1", job, "still failing")
+    assert await redis.lrange(job_dead_key(), 0, -1) == [job_id]
+    assert await redis.zcard(job_delayed_key()) == 0
+    assert 0 < await redis.ttl(job_key(job_id))
+    # dead-letter로 옮긴 작업은 중복 방지 키를 풀어 다시 등록할 수 있음
+    assert await queue.enqueue("sync", {}, dedupe_key="sync:d1") is not None
+    assert await queue.stats() == {"ready": 1, "delayed": 0, "dead": 1}
+
+
+async def test_permanent_failure_skips_retry(redis):
+    queue = JobQueue(redis)
+    await queue.enqueue("sync", {})
+    assert await queue.fail("w1", await _reserve(queue), "invalid payload", permanent=True)
+    assert await queue.stats() == {"ready": 0, "delayed": 0, "dead": 1}
+
+
+async def test_recover_requeues_jobs_of_dead_workers(redis):
+    queue = JobQueue(redis)
+    for worker_id in ("alive", "dead"):
+        await queue.heartbeat(worker_id)
+        await queue.enqueue("sync", {"worker": worker_id})
+        await _reserve(queue, worker_id)
+    # dead 워커의 생존 신호 만료
+    await redis.delete(job_worker_heartbeat_key("dead"))
+    assert await queue.recover() == 1
+    assert await redis.llen(job_processing_key("dead")) == 0
+    assert await redis.llen(job_processing_key("alive")) == 1
+    assert (await _reserve(queue, "alive")).payload == {"worker": "dead"}
+    # 한 번 복구한 워커는 목록에서 빠져 다시 세지 않음
+    assert await queue.recover() == 0
+
+
+async def test_unregister_returns_in_flight_jobs(redis):
+    queue = JobQueue(redis)
+    await queue.heartbeat("w1")
+    job_id = await queue.enqueue("sync", {})
+    await _reserve(queue)
+    await queue.unregister("w1")
+    assert await redis.lrange(job_ready_key(), 0, -1) == [job_id]
+
+
+def test_retry_delay_is_capped_exponential_backoff():
+    for attempts in range(1, 12):
+        expected = min(settings.JOB_RETRY_MAX_DELAY, settings.JOB_RETRY_BASE_DELAY * 2 ** (attempts - 1))
+        assert expected * 0.5 <= retry_delay(attempts) <= expected
@@ -0,0 +1,176 @@
+"""롤업 재집계 / 증분 병합 — 롤업 결과는 원본 로컬 실행 결과와 같아야 함"""
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+import pyarrow as pa
+import pytest
+
+from app.core.config import settings
+from app.db.models.enums import AggregateType, DSSourceType, FieldType, FilterOp, SortDir
+from app.engine.columnar import open_table, storage_path
+from app.engine.local import execute_local
+from app.engine.predicates import compile_arrow_predicate
+from app.engine.rollups import (
+    PARTIALS,
+    _merge,
+    build_rollup_file,
+    covers,
+    execute_rollup,
+    partial_column,
+    rollup_partials,
+)
+from app.engine.spec import ChartQuery, Predicate, QueryField, SortKey
+
+ROLLUP = SimpleNamespace(
+    dimensions=["region", "day"],
+    metrics=[
+        {"field_id": "amount", "aggregate": "SUM"},
+        {"field_id": "amount", "aggregate": "AVG"},
+        {"field_id": "amount", "aggregate": "MIN"},
+        {"field_id": "amount", "aggregate": "MAX"},
+        {"field_id": "amount", "aggregate": "COUNT"},
+    ],
+)
+
+
+def _metric(aggregate: AggregateType) -> QueryField:
+    return QueryField("amount", "금액", FieldType.NUMBER, aggregate)
+
+
+def _build(table) -> pa.Table:
+    """build_rollup_file과 같은 레이아웃의 롤업 테이블 (차원 + 부분 집계 컬럼)"""
+    partials = rollup_partials(ROLLUP.metrics)
+    query = ChartQuery(
+        source_config={},
+        dimensions=[QueryField(d, d, FieldType.TEXT) for d in ROLLUP.dimensions],
+        metrics=[_metric(AggregateType(p.upper())) for _, p in partials],
+        with_totals=False,
+        limit=10_000,
+    )
+    result = execute_local(table, query)
+    names = [*ROLLUP.dimensions, *(partial_column(f, p) for f, p in partials)]
+    columns = list(zip(*result.rows))
+    return pa.table({
+        "region": pa.array(columns[0], type=pa.string()),
+        "day": pa.array(columns[1], type=pa.date32()),
+        **{name: pa.array(values, type=pa.float64()) for name, values in zip(names[2:], columns[2:])},
+    })
+
+
+QUERIES = {
+    "by-region": ChartQuery(
+        source_config={},
+        dimensions=[QueryField("region", "지역", FieldType.TEXT)],
+        metrics=[_metric(agg) for agg in PARTIALS],
+    ),
+    "by-day-sorted": ChartQuery(
+        source_config={},
+        dimensions=[QueryField("day", "일자", FieldType.DATE)],
+        metrics=[_metric(AggregateType.SUM)],
+        sort=[SortKey("amount", SortDir.DESC)],
+    ),
+    "filtered-on-dimension": ChartQuery(
+        source_config={},
+        dimensions=[QueryField("region", "지역", FieldType.TEXT)],
+        metrics=[_metric(AggregateType.COUNT), _metric(AggregateType.AVG)],
+        predicates=[Predicate("day", FieldType.DATE, FilterOp.GTE, "2024-01-02")],
+    ),
+    "no-dimension": ChartQuery(
+        source_config={}, dimensions=[], metrics=[_metric(AggregateType.SUM), _metric(AggregateType.COUNT)]
+    ),
+    "no-matching-rows": ChartQuery(
+        source_config={},
+        dimensions=[],
+        metrics=[_metric(AggregateType.COUNT)],
+        predicates=[Predicate("region", FieldType.TEXT, FilterOp.EQ, "Nowhere")],
+    ),
+}
+
+
+@pytest.mark.parametrize("name", QUERIES)
+def test_rollup_matches_source(arrow_table, name):
+    query = QUERIES[name]
+    assert covers(ROLLUP, query)
+    expected = execute_local(arrow_table, query)
+    actual = execute_rollup(_build(arrow_table), query)
+    assert actual.rows == expected.rows
+    assert actual.total == expected.total
+    assert actual.totals == expected.totals
+
+
+def test_covers_rejects_unservable_queries():
+    region = QueryField("region", "지역", FieldType.TEXT)
+    cases = [
+        # COUNT_DISTINCT는 부분 집계로 재현 불가
+        ChartQuery(source_config={}, dimensions=[region], metrics=[_metric(AggregateType.COUNT_DISTINCT)]),
+        # 롤업에 없는 차원
+        ChartQuery(
+            source_config={}, dimensions=[QueryField("id", "ID", FieldType.NUMBER)], metrics=[_metric(AggregateType.SUM)]
+        ),
+        # 롤업 차원이 아닌 필드에 조건
+        ChartQuery(
+            source_config={},
+            dimensions=[region],
+            metrics=[_metric(AggregateType.SUM)],
+            predicates=[Predicate("amount", FieldType.NUMBER, FilterOp.GT, 1)],
+        ),
+        # 집계 없는 원본 행 조회
+        ChartQuery(source_config={}, dimensions=[region], metrics=[]),
+    ]
+    assert not any(covers(ROLLUP, query) for query in cases)
+
+
+def test_merge_replaces_groups_from_watermark_dimension(arrow_table):
+    # watermark가 차원(day)이면 since 이후 그룹은 변경분으로 통째로 교체 — 중복 합산 없음
+    since = "2024-01-02"
+    delta = arrow_table.filter(
+        compile_arrow_predicate(Predicate("day", FieldType.DATE, FilterOp.GTE, since), arrow_table.column)
+    )
+    merged = _merge(_build(arrow_table), _build(delta), "day", since)
+    query = QUERIES["by-day-sorted"]
+    assert execute_rollup(merged, query).rows == execute_local(arrow_table, query).rows
+
+
+def _write_source(table: pa.Table) -> str:
+    storage_key = f"{uuid.uuid4()}/source.arrow"
+    path = storage_path(storage_key)
+    path.parent.mkdir(parents=True)
+    with pa.ipc.new_file(str(path), table.schema) as writer:
+        writer.write_table(table)
+    return storage_key
+
+
+@pytest.mark.parametrize("dimensions", [["region", "day"], ["region"]])
+async def test_build_with_late_rows_at_the_watermark(arrow_table, tmp_path, monkeypatch, dimensions):
+    # 직전 watermark와 같은 날짜의 행이 나중에 들어와도 롤업에 빠짐없이 반영되어야 함
+    monkeypatch.setattr(settings, "DATASOURCE_FILE_DIR", str(tmp_path))
+    datasource = SimpleNamespace(
+        id=uuid.uuid4(),
+        source_type=DSSourceType.CSV,
+        connection_config={"storage_key": _write_source(arrow_table)},
+        watermark_field="day",
+        fields=[
+            SimpleNamespace(field_id="region", label="지역", type=FieldType.TEXT),
+            SimpleNamespace(field_id="day", label="일자", type=FieldType.DATE),
+            SimpleNamespace(field_id="amount", label="금액", type=FieldType.NUMBER),
+        ],
+    )
+    rollup = SimpleNamespace(id=uuid.uuid4(), dimensions=dimensions, metrics=ROLLUP.metrics, storage_key=None)
+    first = await build_rollup_file(datasource, rollup)
+    assert (first.incremental, first.watermark) == (False, "2024-01-05")
+
+    late = pa.table({
+        "id": pa.array([8], type=pa.int64()),
+        "region": pa.array(["Seoul"]),
+        "amount": pa.array([100.0]),
+        "day": pa.array([date(2024, 1, 5)], type=pa.date32()),
+    })
+    grown = pa.concat_tables([arrow_table, late])
+    datasource.connection_config = {"storage_key": _write_source(grown)}
+    rollup.storage_key = first.storage_key
+    second = await build_rollup_file(datasource, rollup, since=first.watermark)
+    # watermark가 차원이 아니면 같은 값으로 늦게 온 행을 구분할 수 없어 전체 빌드
+    assert second.incremental == ("day" in dimensions)
+    query = QUERIES["by-region"]
+    assert execute_rollup(open_table(second.storage_key), query).rows == execute_local(grown, query).rows
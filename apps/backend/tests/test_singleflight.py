@@ -0,0 +1,128 @@
+"""동일 쿼리 동시 실행 병합 (fakeredis)"""
+import asyncio
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.config import settings
+from app.core.redis import chart_flight_lock_key, chart_flight_result_key
+from app.engine.singleflight import SingleFlight
+
+
+@pytest.fixture
+def unavailable_redis():
+    # 연결할 수 없는 Redis — 모든 명령이 ConnectionError(RedisError)
+    return fakeredis.FakeAsyncRedis(connected=False, decode_responses=True)
+
+
+def _flight(redis) -> SingleFlight[str]:
+    return SingleFlight(redis, encode=lambda v: v, decode=lambda raw: raw)
+
+
+async def test_concurrent_calls_share_one_execution(redis):
+    calls = 0
+    release = asyncio.Event()
+
+    async def fn() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "result"
+
+    flight = _flight(redis)
+    waiters = [asyncio.create_task(flight.do("k", fn)) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    release.set()
+    assert await asyncio.gather(*waiters) == ["result"] * 5
+    assert calls == 1
+
+
+async def test_leader_publishes_result_for_other_workers(redis):
+    async def fn() -> str:
+        return "result"
+
+    await _flight(redis).do("k", fn)
+    keys = await redis.keys(chart_flight_result_key("k", "*"))
+    assert [await redis.get(key) for key in keys] == ["result"]
+
+
+async def test_waits_for_leader_in_another_worker(redis):
+    # 다른 워커가 락을 쥐고 있다가 결과를 남기면 fn을 실행하지 않고 그 결과를 받음
+    await redis.set(chart_flight_lock_key("k"), "other")
+
+    async def publish():
+        await asyncio.sleep(0.1)
+        await redis.set(chart_flight_result_key("k", "other"), "from-leader")
+
+    async def fn() -> str:
+        raise AssertionError("리더가 있으면 실행하지 않음")
+
+    publisher = asyncio.create_task(publish())
+    assert await _flight(redis).do("k", fn) == "from-leader"
+    await publisher
+
+
+async def test_leader_failure_elects_new_leader(redis):
+    # 락이 결과 없이 풀리면(리더 실패) 대기자가 리더가 되어 직접 실행
+    await redis.set(chart_flight_lock_key("k"), "other")
+
+    async def fail_leader():
+        await asyncio.sleep(0.1)
+        await redis.delete(chart_flight_lock_key("k"))
+
+    async def fn() -> str:
+        return "mine"
+
+    failer = asyncio.create_task(fail_leader())
+    assert await _flight(redis).do("k", fn) == "mine"
+    await failer
+
+
+async def test_wait_timeout_runs_alone(redis, monkeypatch):
+    monkeypatch.setattr(settings, "CHART_FLIGHT_WAIT_TIMEOUT", 0.1)
+    await redis.set(chart_flight_lock_key("k"), "other")
+
+    async def fn() -> str:
+        return "mine"
+
+    assert await _flight(redis).do("k", fn) == "mine"
+
+
+async def test_errors_from_fn_propagate_without_rerun(redis):
+    # 리더로 실행한 fn 안에서 난 Redis 오류는 폴백 사유가 아님 — 다시 실행하지 않고 그대로 전달
+    calls = 0
+
+    async def fn() -> str:
+        nonlocal calls
+        calls += 1
+        raise RedisConnectionError("source query used Redis and failed")
+
+    with pytest.raises(RedisConnectionError):
+        await _flight(redis).do("k", fn)
+    assert calls == 1
+
+
+async def test_redis_unavailable_runs_directly(unavailable_redis):
+    async def fn() -> str:
+        return "direct"
+
+    assert await _flight(unavailable_redis).do("k", fn) == "direct"
+
+
+async def test_cancelling_every_waiter_cancels_execution(redis):
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def fn() -> str:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "never"
+
+    waiter = asyncio.create_task(_flight(redis).do("k", fn))
+    await started.wait()
+    waiter.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
@@ -0,0 +1,48 @@
+"""토큰 폐기 확인 — 블룸 필터와 Redis 장애 시 대체 판단 (fakeredis)"""
+import time
+
+import fakeredis
+import pytest
+
+from app.core import tokens
+from app.core.security import TokenClaims, create_access_token, new_session_id
+from app.core.tokens import RevocationFilter, revoke_session, verify_token
+
+
+@pytest.fixture
+def revocation_filter(monkeypatch):
+    bloom = RevocationFilter(bits=1 << 12, hashes=3)
+    monkeypatch.setattr(tokens, "revocation_filter", bloom)
+    monkeypatch.setattr(tokens, "_degraded", False)
+    return bloom
+
+
+def _use_redis(monkeypatch, client) -> None:
+    monkeypatch.setattr(tokens, "get_redis", lambda: client)
+
+
+async def test_revoked_session_is_rejected(redis, revocation_filter, monkeypatch):
+    _use_redis(monkeypatch, redis)
+    sid = new_session_id()
+    token = create_access_token("user-1", sid)
+    assert (await verify_token(token)).sub == "user-1"
+    await revoke_session(sid, int(time.time()) + 60)
+    assert await verify_token(token) is None
+
+
+async def test_redis_outage_falls_back_to_last_filter(revocation_filter, monkeypatch):
+    # 필터를 한 번 만든 뒤 구독이 끊겨 ready=False가 된 상태에서 Redis까지 장애
+    revoked, active = new_session_id(), new_session_id()
+    revocation_filter.replace([revoked])
+    revocation_filter.ready = False
+    _use_redis(monkeypatch, fakeredis.FakeAsyncRedis(connected=False, decode_responses=True))
+
+    assert (await verify_token(create_access_token("user-1", active))).sub == "user-1"
+    assert await verify_token(create_access_token("user-1", revoked)) is None
+    assert tokens._degraded
+
+
+async def test_degraded_check_rejects_expired_claims(revocation_filter, monkeypatch):
+    _use_redis(monkeypatch, fakeredis.FakeAsyncRedis(connected=False, decode_responses=True))
+    claims = TokenClaims(sub="user-1", type="access", exp=int(time.time()) - 1, sid=new_session_id())
+    assert await tokens._is_revoked(claims)
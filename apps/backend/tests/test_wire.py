@@ -0,0 +1,142 @@
+"""차트 데이터 응답 인코딩 — JSON은 Pydantic 응답과 같은 바이트, Arrow는 같은 값"""
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pyarrow as pa
+import pytest
+
+from app.db.models.enums import AggregateType, FieldType
+from app.engine.compiler import ChartResult
+from app.engine.formatting import StyleIndex
+from app.engine.spec import QueryField
+from app.engine.wire import (
+    ARROW_MEDIA_TYPE,
+    COLUMNAR_JSON_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    ChartData,
+    dumps,
+    encode,
+    encode_arrow,
+    encode_columnar_json,
+    encode_json,
+    encode_page_line,
+    negotiate,
+)
+from app.schemas.chart import ChartDataColumn, ChartDataResponse, ChartDataStyles, PageChartData
+from app.schemas.common import ApiResponse
+
+COLUMNS = [
+    QueryField("region", "지역", FieldType.TEXT),
+    QueryField("day", "일자", FieldType.DATE),
+    QueryField("amount", "금액", FieldType.NUMBER, AggregateType.SUM),
+    QueryField("orders", "주문 수", FieldType.TEXT, AggregateType.COUNT),
+]
+
+
+@pytest.fixture
+def data() -> ChartData:
+    result = ChartResult(
+        columns=COLUMNS,
+        rows=[["Seoul", date(2024, 1, 1), 10.5, 3], [None, None, None, 0]],
+        totals=[None, None, 10.5, 3],
+        total=2,
+        queried_at=datetime(2024, 1, 2, 3, 4, 5, 600000, tzinfo=timezone.utc),
+    )
+    styles = StyleIndex(palette=[{"background": "#ff0000"}], rows=[0, None], cells={2: [None, 0]})
+    return ChartData(result=result, page=1, limit=20, styles=styles)
+
+
+def _model(data: ChartData) -> ChartDataResponse:
+    result, styles = data.result, data.styles
+    return ChartDataResponse(
+        columns=[
+            ChartDataColumn(
+                field_id=c.field_id,
+                label=c.label,
+                type=c.result_type,
+                aggregate=c.aggregate if c.is_aggregated else None,
+            )
+            for c in result.columns
+        ],
+        rows=result.rows,
+        totals=result.totals,
+        total=result.total,
+        page=data.page,
+        limit=data.limit,
+        queried_at=result.queried_at,
+        styles=ChartDataStyles(palette=styles.palette, rows=styles.rows, cells=styles.cells) if styles else None,
+    )
+
+
+def test_json_matches_pydantic_response(data):
+    assert encode_json(data) == ApiResponse.ok(_model(data)).model_dump_json().encode()
+
+
+def test_json_without_styles(data):
+    data.styles = None
+    assert encode_json(data) == ApiResponse.ok(_model(data)).model_dump_json().encode()
+
+
+def test_page_line_matches_pydantic(data):
+    chart_id = uuid.uuid4()
+    line = encode_page_line(chart_id, data)
+    assert line.endswith(b"\n")
+    assert line[:-1] == PageChartData(chart_id=chart_id, data=_model(data)).model_dump_json().encode()
+
+
+def test_driver_values_match_pydantic():
+    values = [Decimal("1.50"), timedelta(hours=1, seconds=3), b"raw", uuid.UUID(int=1), datetime(2024, 1, 1)]
+    expected = ApiResponse.ok(values).model_dump_json().encode()
+    assert dumps({"success": True, "data": values, "error": None}) == expected
+
+
+def test_columnar_json_transposes_rows(data):
+    body = json.loads(encode_columnar_json(data))["data"]
+    assert "rows" not in body
+    assert body["values"] == [["Seoul", None], ["2024-01-01", None], [10.5, None], [3, 0]]
+    assert body["styles"]["cells"] == {"2": [None, 0]}
+
+
+def test_arrow_stream_round_trip(data):
+    table = pa.ipc.open_stream(encode_arrow(data)).read_all()
+    assert table.column_names == ["region", "day", "amount", "orders"]
+    # COUNT 지표는 원본 필드 타입과 무관하게 숫자 컬럼
+    assert [f.type for f in table.schema] == [pa.string(), pa.date32(), pa.float64(), pa.float64()]
+    assert table.to_pylist()[0] == {"region": "Seoul", "day": date(2024, 1, 1), "amount": 10.5, "orders": 3.0}
+    meta = json.loads(table.schema.metadata[b"lookflex"])
+    assert meta["total"] == 2 and meta["styles"]["rows"] == [0, None]
+    assert "rows" not in meta
+
+
+def test_arrow_coerces_values_restored_from_cache(data):
+    # Redis 캐시에서 복원한 결과는 날짜가 문자열
+    data.result.rows = [["Seoul", "2024-01-01", "10.5", 3]]
+    table = pa.ipc.open_stream(encode_arrow(data)).read_all()
+    assert table.to_pylist()[0]["day"] == date(2024, 1, 1)
+    assert table.to_pylist()[0]["amount"] == 10.5
+
+
+def test_encode_dispatches_on_media_type(data):
+    assert encode(data, JSON_MEDIA_TYPE) == encode_json(data)
+    assert encode(data, COLUMNAR_JSON_MEDIA_TYPE) == encode_columnar_json(data)
+    assert encode(data, ARROW_MEDIA_TYPE) == encode_arrow(data)
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, JSON_MEDIA_TYPE),
+        ("*/*", JSON_MEDIA_TYPE),
+        ("text/html", JSON_MEDIA_TYPE),
+        (ARROW_MEDIA_TYPE, ARROW_MEDIA_TYPE),
+        ("Application/Vnd.Apache.Arrow.Stream", ARROW_MEDIA_TYPE),
+        (f"{JSON_MEDIA_TYPE};q=0.5, {COLUMNAR_JSON_MEDIA_TYPE}", COLUMNAR_JSON_MEDIA_TYPE),
+        (f"{ARROW_MEDIA_TYPE};q=0.9, {JSON_MEDIA_TYPE};q=0.9", ARROW_MEDIA_TYPE),
+        (f"{ARROW_MEDIA_TYPE};q=0, {JSON_MEDIA_TYPE};q=0.1", JSON_MEDIA_TYPE),
+        (f"{ARROW_MEDIA_TYPE};q=abc", JSON_MEDIA_TYPE),
+    ],
+)
+def test_negotiate(accept, expected):
+    assert negotiate(accept) == expected